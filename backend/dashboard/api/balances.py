@@ -1,7 +1,9 @@
 """
 Wallet balance API endpoints.
 
-Fetches on-chain balances for Solana and Arbitrum wallets.
+Fetches on-chain balances for Solana and Arbitrum wallets and the
+Hyperliquid clearinghouse via the shared BalanceService (concurrent reads,
+pooled clients, short per-address cache).
 """
 
 from typing import Optional, Dict, Any
@@ -11,17 +13,19 @@ from pydantic import BaseModel
 
 from backend.dashboard.auth import get_current_user, User
 from shared.db.database import get_db, Database
-from shared.chain.solana import SolanaClient
-from shared.chain.arbitrum import ArbitrumClient
 from shared.utils.logger import get_logger
-from bot.venues.hyperliquid.trader import HyperliquidTrader
+from backend.dashboard.balance_service import (
+    USDC_MINT_SOLANA,
+    ArbitrumBalance,
+    SolanaBalance,
+    get_balance_service,
+)
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/balances", tags=["balances"])
 
 
 # Token constants
-USDC_MINT_SOLANA = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # Mainnet USDC
 USDC_CONTRACT_ARBITRUM = "0xaf88d065e77c8cC2239327C5EDb3A432268e5831"  # Native USDC on Arbitrum
 
 
@@ -54,73 +58,59 @@ class BalancesResponse(BaseModel):
     min_required_usdc_arbitrum: float = 10.0  # Minimum USDC on Arbitrum
 
 
-async def _get_solana_balances(address: str) -> Optional[ChainBalance]:
-    """Fetch Solana balances for an address."""
-    try:
-        async with SolanaClient() as client:
-            # Get SOL balance
-            sol_balance = await client.get_balance(address)
-            
-            # Get USDC balance
-            usdc_balance = await client.get_token_balance(USDC_MINT_SOLANA, address)
-            
-            return ChainBalance(
-                address=address,
-                native_balance=sol_balance,
-                native_symbol="SOL",
-                tokens=[
-                    TokenBalance(
-                        token=USDC_MINT_SOLANA,
-                        symbol="USDC",
-                        balance=usdc_balance,
-                        decimals=6,
-                        usd_value=usdc_balance  # 1 USDC = $1
-                    )
-                ]
+def _solana_chain_balance(address: str, balance: Optional[SolanaBalance]) -> Optional[ChainBalance]:
+    if balance is None:
+        return None
+    return ChainBalance(
+        address=address,
+        native_balance=balance.sol,
+        native_symbol="SOL",
+        tokens=[
+            TokenBalance(
+                token=USDC_MINT_SOLANA,
+                symbol="USDC",
+                balance=balance.usdc,
+                decimals=6,
+                usd_value=balance.usdc  # 1 USDC = $1
             )
-    except Exception as e:
-        logger.error(f"Failed to fetch Solana balances: {e}")
+        ]
+    )
+
+
+def _arbitrum_chain_balance(address: str, balance: Optional[ArbitrumBalance]) -> Optional[ChainBalance]:
+    if balance is None:
         return None
+    return ChainBalance(
+        address=address,
+        native_balance=balance.eth,
+        native_symbol="ETH",
+        tokens=[
+            TokenBalance(
+                token=USDC_CONTRACT_ARBITRUM,
+                symbol="USDC",
+                balance=balance.usdc,
+                decimals=6,
+                usd_value=balance.usdc
+            )
+        ]
+    )
+
+
+async def _get_solana_balances(address: str) -> Optional[ChainBalance]:
+    """Fetch Solana balances for an address."""
+    balance = await get_balance_service().get_solana(address)
+    return _solana_chain_balance(address, balance)
 
 
 async def _get_arbitrum_balances(address: str) -> Optional[ChainBalance]:
     """Fetch Arbitrum balances for an address."""
-    try:
-        async with ArbitrumClient() as client:
-            # Get ETH balance
-            eth_balance = await client.get_balance(address)
-            
-            # Read USDC ERC-20 balance
-            usdc_balance = float(await client.get_usdc_balance(address))
-            
-            return ChainBalance(
-                address=address,
-                native_balance=float(eth_balance),
-                native_symbol="ETH",
-                tokens=[
-                    TokenBalance(
-                        token=USDC_CONTRACT_ARBITRUM,
-                        symbol="USDC",
-                        balance=usdc_balance,
-                        decimals=6,
-                        usd_value=usdc_balance
-                    )
-                ]
-            )
-    except Exception as e:
-        logger.error(f"Failed to fetch Arbitrum balances: {e}")
-        return None
+    balance = await get_balance_service().get_arbitrum(address)
+    return _arbitrum_chain_balance(address, balance)
 
 
 async def _get_hl_clearinghouse_balance(evm_address: str) -> Optional[float]:
     """Fetch Hyperliquid clearinghouse USDC balance."""
-    try:
-        trader = HyperliquidTrader(wallet_address=evm_address)
-        balance = await trader.get_deposited_balance()
-        return balance if balance > 0 else 0.0
-    except Exception as e:
-        logger.error(f"Failed to fetch HL clearinghouse balance: {e}")
-        return None
+    return await get_balance_service().get_hl_clearinghouse(evm_address)
 
 
 def _check_sufficient_funds(
@@ -185,17 +175,11 @@ async def get_balances(
     solana_address = row.get("server_solana_address") or row.get("solana_address")
     evm_address = row.get("server_evm_address") or row.get("evm_address")
     
-    # Fetch balances
-    solana_balance = None
-    arbitrum_balance = None
-    hl_clearinghouse = None
-
-    if solana_address:
-        solana_balance = await _get_solana_balances(solana_address)
-
-    if evm_address:
-        arbitrum_balance = await _get_arbitrum_balances(evm_address)
-        hl_clearinghouse = await _get_hl_clearinghouse_balance(evm_address)
+    # Fetch all venues concurrently
+    balances = await get_balance_service().get_all(solana_address, evm_address)
+    solana_balance = _solana_chain_balance(solana_address, balances.solana)
+    arbitrum_balance = _arbitrum_chain_balance(evm_address, balances.arbitrum)
+    hl_clearinghouse = balances.hl_clearinghouse
     
     # Check if sufficient funds (Solana + HL clearinghouse)
     has_sufficient, reason = _check_sufficient_funds(solana_balance, hl_clearinghouse)
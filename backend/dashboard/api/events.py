@@ -6,36 +6,188 @@ Provides live streaming of:
 - Funding rate updates
 - Bot status changes
 - Balance updates
+
+Reconnecting clients send their last event id (``Last-Event-ID`` header, or
+``last_event_id`` for clients that open a fresh EventSource) and receive
+only the events they missed from the per-user event log, or a compact
+snapshot when those are no longer all logged. A subscriber that fell behind
+and had events dropped is caught up the same way.
+
+Position updates are merged per connection and sent as keyframes or
+field-level deltas (see ``position_stream``).
 """
 
 import asyncio
-from typing import AsyncGenerator
+from datetime import datetime
+from typing import AsyncGenerator, List, Optional
 
-from fastapi import APIRouter, Request, Depends, HTTPException
+from fastapi import APIRouter, Request, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
 from backend.dashboard.auth import get_current_user, User
-from backend.dashboard.events_manager import event_manager, Event
+from backend.dashboard.events_manager import event_manager, Event, EventType, Subscription
+from backend.dashboard.position_stream import PositionStreamCoalescer
+from shared.common.events import SnapshotEvent
+from shared.db.database import get_db, Database
 
 router = APIRouter(prefix="/events", tags=["events"])
 
 
+def _parse_event_id(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+async def _snapshot(user_id: str, db: Database, position_ids: List[str]) -> Event:
+    """Compact resync state: the user's open positions and the current seq."""
+    from backend.dashboard.api.positions import _list_positions_from_db
+
+    # Read the seq first: anything logged after it arrives on the live stream
+    seq = await event_manager.current_seq(user_id)
+    try:
+        positions = await _list_positions_from_db(user_id, db)
+    except Exception:
+        positions = []
+    if position_ids:
+        positions = [p for p in positions if p.position_id in position_ids]
+
+    snapshot = SnapshotEvent(
+        seq=seq or 0,
+        timestamp=datetime.utcnow().isoformat(),
+        data={"positions": [p.model_dump(mode="json") for p in positions]},
+    )
+    return Event(
+        type=EventType.SNAPSHOT,
+        data=snapshot.data,
+        timestamp=snapshot.timestamp,
+        seq=snapshot.seq if seq else None,
+    )
+
+
+async def _stream(
+    request: Request,
+    subscription: Subscription,
+    coalescer: PositionStreamCoalescer,
+    user_id: str,
+    db: Database,
+    position_ids: List[str],
+    last_seq: int,
+    backlog: List[Event],
+) -> AsyncGenerator[str, None]:
+    """
+    SSE chunks for one connection.
+
+    Waits on the subscription until the next event or the coalescer's next
+    window close (no fixed polling). Position updates go through the
+    coalescer; any other user event first flushes held updates so SSE ids
+    stay in order and a resume point never skips a held update.
+    """
+    seen_seq = last_seq
+    seen_drops = 0
+
+    def accept(event: Event) -> List[str]:
+        nonlocal seen_seq
+        if event.seq is not None:
+            if event.seq <= seen_seq:
+                return []  # Already sent in a catch-up
+            seen_seq = event.seq
+        if coalescer.add(event):
+            return []
+        chunks = []
+        if event.seq is not None:
+            chunks = [frame.to_sse() for frame in coalescer.flush(force=True)]
+        if event.type == EventType.SNAPSHOT:
+            coalescer.reset()
+        elif event.type == EventType.POSITION_CLOSED:
+            coalescer.forget(event.data.get("position_id"))
+        chunks.append(event.to_sse())
+        return chunks
+
+    # Resume point as a real message (an id-only frame dispatches nothing,
+    # so the client would never read it); the backlog moves it forward
+    yield Event(
+        type=EventType.CONNECTED,
+        data={"last_event_id": seen_seq},
+        timestamp=datetime.utcnow().isoformat(),
+        seq=seen_seq,
+    ).to_sse()
+    for event in backlog:
+        for chunk in accept(event):
+            yield chunk
+    for frame in coalescer.flush(force=True):
+        yield frame.to_sse()
+
+    while True:
+        # Check if client disconnected
+        if await request.is_disconnected():
+            break
+
+        # Events were dropped while this client lagged: refill from the log
+        if subscription.dropped > seen_drops:
+            seen_drops = subscription.dropped
+            for event in await _catch_up(user_id, seen_seq, db, position_ids):
+                for chunk in accept(event):
+                    yield chunk
+
+        timeout = coalescer.next_flush_in()
+        try:
+            if timeout is None:
+                event = await subscription.get()
+            else:
+                event = await asyncio.wait_for(subscription.get(), timeout)
+        except asyncio.TimeoutError:
+            event = None
+
+        if event is not None:
+            for chunk in accept(event):
+                yield chunk
+        for frame in coalescer.flush():
+            yield frame.to_sse()
+
+
+async def _catch_up(
+    user_id: str, last_seq: int, db: Database, position_ids: List[str]
+) -> List[Event]:
+    """Missed events after ``last_seq``, or a snapshot if they can't be replayed."""
+    missed = await event_manager.replay(user_id, last_seq, position_ids)
+    if missed is None:
+        return [await _snapshot(user_id, db, position_ids)]
+    return missed
+
+
 @router.get("/stream")
 async def event_stream(
     request: Request,
-    user: User = Depends(get_current_user)
+    positions: Optional[str] = Query(
+        None, description="Comma-separated position IDs to narrow the stream to"
+    ),
+    last_event_id: Optional[str] = Query(
+        None, description="Resume after this event id (alternative to the Last-Event-ID header)"
+    ),
+    user: User = Depends(get_current_user),
+    db: Database = Depends(get_db),
 ):
     """
     SSE endpoint for real-time events.
     
-    Connects to the event stream and receives live updates:
+    Connects to the event stream and receives the user's live updates
+    (or only those of ``positions``) plus global broadcasts:
     - position_opened: New position created
     - position_closed: Position closed with PnL
-    - position_update: PnL or health factor changes
+    - position_update: Full position state (keyframe)
+    - position_delta: Changed fields since the last frame, as
+      ``{"position_id", "ops": [{"op", "path", "value"}]}``
     - rate_update: Funding rates updated
     - bot_status: Bot paused/resumed/connected
     - balance_update: Wallet balance changes
+    - snapshot: Resync state when missed events can't be replayed
+    - connected: First message; its id is the client's resume point
     - ping: Keepalive every 30 seconds
+
+    User events carry an SSE ``id`` (their seq); on reconnect only newer
+    events are sent.
     
     Example JavaScript usage:
         const eventSource = new EventSource('/api/v1/events/stream');
@@ -50,31 +202,42 @@ async def event_stream(
     # Ensure event manager is running
     await event_manager.start()
     
-    # Subscribe to events
-    queue = await event_manager.subscribe()
+    # Subscribe before reading the log so nothing falls between the two
+    position_ids = [p for p in (positions or "").split(",") if p]
+    subscription = await event_manager.subscribe(
+        user_id=user.user_id, position_ids=position_ids
+    )
+
+    last_seq = _parse_event_id(request.headers.get("last-event-id") or last_event_id)
+    if last_seq is not None:
+        backlog = await _catch_up(user.user_id, last_seq, db, position_ids)
+    else:
+        # Fresh connection: the client loads state via REST; the stream
+        # opens with a "connected" event carrying the resume point
+        last_seq = await event_manager.current_seq(user.user_id) or 0
+        backlog = []
     
+    from backend.dashboard.config import get_dashboard_settings
+    settings = get_dashboard_settings()
+    coalescer = PositionStreamCoalescer(
+        window=settings.sse_position_window,
+        keyframe_interval=settings.sse_keyframe_interval,
+    )
+
     async def generate() -> AsyncGenerator[str, None]:
         """Generate SSE stream."""
         try:
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():
-                    break
-                
-                # Get event from queue (with timeout for periodic checks)
-                try:
-                    event: Event = await asyncio.wait_for(queue.get(), timeout=1.0)
-                    yield event.to_sse()
-                except asyncio.TimeoutError:
-                    # No event, check connection and continue
-                    continue
-                
+            async for chunk in _stream(
+                request, subscription, coalescer, user.user_id, db,
+                position_ids, last_seq, backlog,
+            ):
+                yield chunk
         except asyncio.CancelledError:
             # Client disconnected
             pass
         finally:
             # Unsubscribe when done
-            await event_manager.unsubscribe(queue)
+            await event_manager.unsubscribe(subscription)
     
     return StreamingResponse(
         generate(),
@@ -93,10 +256,10 @@ async def get_event_status(user: User = Depends(get_current_user)):
     Get event system status.
     
     Returns:
-        Current subscriber count and system health
+        Current subscriber count, backpressure counters and system health
     """
     return {
         "status": "healthy",
-        "subscribers": event_manager.get_subscriber_count(),
+        **event_manager.get_stats(),
         "streaming": True
     }
@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from backend.dashboard.auth import get_current_user, User
+from bot.core.preflight_cache import get_preflight_cache
 from shared.db.database import get_db, Database
 from shared.redis_client import get_redis
 from shared.utils.logger import get_logger
@@ -451,6 +452,8 @@ async def _execute_deposit_job(
         except Exception:
             pass
     finally:
+        # Balances changed (or may have): cached preflight checks are stale
+        get_preflight_cache().invalidate_user(user_id)
         try:
             redis = await get_redis()
             await redis.delete(lock_key)
@@ -507,6 +510,8 @@ async def _execute_withdraw_job(
         except Exception:
             pass
     finally:
+        # Balances changed (or may have): cached preflight checks are stale
+        get_preflight_cache().invalidate_user(user_id)
         try:
             redis = await get_redis()
             await redis.delete(lock_key)
@@ -580,6 +585,8 @@ async def _execute_wallet_transfer_job(
         except Exception:
             pass
     finally:
+        # Balances changed (or may have): cached preflight checks are stale
+        get_preflight_cache().invalidate_user(user_id)
         try:
             redis = await get_redis()
             await redis.delete(lock_key)
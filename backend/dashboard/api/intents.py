@@ -4,6 +4,7 @@ Users create intents specifying desired position parameters and entry criteria.
 The IntentScanner service polls these intents and executes when conditions are met.
 """
 
+import asyncio
 import json
 import logging
 import uuid
@@ -14,8 +15,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from backend.dashboard.auth import require_viewer, require_operator
+from backend.dashboard.dependencies import get_intent_scanner
 from backend.dashboard.api.balances import (
-    _get_solana_balances, _get_arbitrum_balances, _check_sufficient_funds,
+    _get_solana_balances, _get_hl_clearinghouse_balance, _check_sufficient_funds,
 )
 from shared.common.schemas import User
 from shared.db.database import get_db
@@ -117,10 +119,15 @@ async def create_intent(
     solana_addr = user_row.get("solana_address")
     evm_addr = user_row.get("evm_address")
 
-    solana_bal = await _get_solana_balances(solana_addr) if solana_addr else None
-    arb_bal = await _get_arbitrum_balances(evm_addr) if evm_addr else None
+    async def none():
+        return None
 
-    has_funds, reason = _check_sufficient_funds(solana_bal, arb_bal)
+    solana_bal, hl_balance = await asyncio.gather(
+        _get_solana_balances(solana_addr) if solana_addr else none(),
+        _get_hl_clearinghouse_balance(evm_addr) if evm_addr else none(),
+    )
+
+    has_funds, reason = _check_sufficient_funds(solana_bal, hl_balance)
     if not has_funds:
         raise HTTPException(400, f"Insufficient funds: {reason}")
 
@@ -154,6 +161,22 @@ async def create_intent(
         ),
     )
 
+    scanner = get_intent_scanner()
+    if scanner is not None:
+        scanner.on_intent_created({
+            "id": intent_id,
+            "user_id": user.user_id,
+            "asset": request.asset,
+            "leverage": request.leverage,
+            "size_usd": request.size_usd,
+            "min_funding_rate": request.min_funding_rate,
+            "max_funding_volatility": request.max_funding_volatility,
+            "max_entry_price": request.max_entry_price,
+            "status": "pending",
+            "expires_at": expires_at,
+            "created_at": datetime.utcnow(),
+        })
+
     logger.info("Intent %s created for user %s: %s $%.0f @ %.1fx",
                 intent_id, user.user_id, request.asset, request.size_usd, request.leverage)
 
@@ -240,6 +263,10 @@ async def cancel_intent(
         (intent_id,),
     )
 
+    scanner = get_intent_scanner()
+    if scanner is not None:
+        scanner.on_intent_cancelled(intent_id)
+
     logger.info("Intent %s cancelled by user %s", intent_id, user.user_id)
     return {"success": True, "message": "Intent cancelled"}
 
@@ -247,6 +247,7 @@ async def run_preflight(
     """
     from bot.venues.user_context import UserTradingContext
     from bot.core.position_manager import PositionManager
+    from bot.core.preflight_cache import get_preflight_cache
 
     try:
         ctx = await UserTradingContext.from_user_id(user.user_id, db)
@@ -256,7 +257,8 @@ async def run_preflight(
 
     try:
         async with ctx:
-            pm = PositionManager.from_user_context(ctx)
+            # Passed checks are kept for the open that usually follows
+            pm = PositionManager.from_user_context(ctx, preflight_cache=get_preflight_cache())
             await pm.__aenter__()
             try:
                 opportunity, _asset, _protocol = _build_opportunity(
@@ -450,19 +452,20 @@ async def _execute_position_direct(
     """
     from bot.venues.user_context import UserTradingContext
     from bot.core.position_manager import PositionManager
+    from bot.core.preflight_cache import get_preflight_cache
 
     # Resolve user's wallets
     ctx = await UserTradingContext.from_user_id(user_id, db)
 
     async with ctx:
-        # Create per-user position manager
-        pm = PositionManager.from_user_context(ctx)
+        # Create per-user position manager (reuses a recent /preflight run)
+        pm = PositionManager.from_user_context(ctx, preflight_cache=get_preflight_cache())
         await pm.__aenter__()
 
         try:
             opportunity, _asset, _protocol = _build_opportunity(job_id, request)
 
-            # Run preflight checks
+            # Run preflight checks (still-valid passed checks are reused)
             preflight = await pm.run_preflight_checks(opportunity)
             if not preflight.passed:
                 errors = "; ".join(preflight.errors)
@@ -1,17 +1,21 @@
 """Rates API endpoints for fetching Asgard SOL/USDC and Hyperliquid rates."""
 
 from fastapi import APIRouter, Query, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 from bot.venues.asgard.client import AsgardClient
+from bot.venues.client_registry import get_client_registry
 from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
+from backend.dashboard.cache import cached
+from backend.dashboard.dependencies import get_market_snapshots
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["rates"])
 
 
 @router.get("/rates")
+@cached(ttl_seconds=5.0, tags=("rates",))
 async def get_rates(
     leverage: float = Query(3.0, ge=1.1, le=4.0, description="Desired leverage multiplier (1.1x - 4x)")
 ) -> Dict[str, Any]:
@@ -47,11 +51,22 @@ async def get_rates(
         }
     """
     try:
+        # Prefer the shared market snapshot over per-request venue calls
+        markets = funding_rates = None
+        snapshots = get_market_snapshots()
+        if snapshots is not None:
+            try:
+                snapshot = await snapshots.get()
+                markets = dict(snapshot.asgard_markets) or None
+                funding_rates = dict(snapshot.funding_rates) or None
+            except Exception as e:
+                logger.warning(f"Market snapshot unavailable, fetching directly: {e}")
+
         # Fetch Asgard rates for SOL/USDC
-        asgard_rates, asgard_details = await _fetch_asgard_rates(leverage)
+        asgard_rates, asgard_details = await _fetch_asgard_rates(leverage, markets)
         
         # Fetch Hyperliquid funding rates (public)
-        hl_rates = await _fetch_hyperliquid_rates(leverage)
+        hl_rates = await _fetch_hyperliquid_rates(leverage, funding_rates)
         
         # Calculate combined delta-neutral APY
         # Asgard: Positive = you earn on long SOL position
@@ -81,9 +96,15 @@ async def get_rates(
         raise HTTPException(status_code=500, detail="Failed to fetch rates")
 
 
-async def _fetch_asgard_rates(leverage: float) -> tuple[Dict[str, float], Dict[str, Dict[str, float]]]:
+async def _fetch_asgard_rates(
+    leverage: float,
+    markets: Optional[Dict[str, Any]] = None,
+) -> tuple[Dict[str, float], Dict[str, Dict[str, float]]]:
     """
     Fetch Asgard SOL/USDC market rates at specified leverage.
+
+    ``markets`` may be passed from the shared market snapshot; otherwise
+    Asgard ``/markets`` is fetched directly.
     
     For SOL/USDC delta-neutral:
     - Deposit SOL (Token A) → earn lending APY
@@ -97,56 +118,57 @@ async def _fetch_asgard_rates(leverage: float) -> tuple[Dict[str, float], Dict[s
     asgard_details: Dict[str, Dict[str, float]] = {}
     
     try:
-        async with AsgardClient() as client:
-            markets = await client.get_markets()
+        if markets is None:
+            async with AsgardClient(pool=get_client_registry().pools["asgard"]) as client:
+                markets = await client.get_markets()
+        
+        # Only support SOL/USDC strategy
+        if "SOL/USDC" not in markets.get("strategies", {}):
+            logger.warning("SOL/USDC strategy not found in Asgard markets")
+            return {}, {}
+        
+        strategy_data = markets["strategies"]["SOL/USDC"]
+        
+        for source in strategy_data.get("liquiditySources", []):
+            protocol = source.get("lendingProtocol")
+            protocol_name = {0: "marginfi", 1: "kamino", 2: "solend", 3: "drift"}.get(protocol)
+            
+            if not protocol_name:
+                continue
             
-            # Only support SOL/USDC strategy
-            if "SOL/USDC" not in markets.get("strategies", {}):
-                logger.warning("SOL/USDC strategy not found in Asgard markets")
-                return {}, {}
+            # Get raw rates (API returns decimals, e.g., 0.05 = 5%)
+            lending_apy = source.get("tokenALendingApyRate", 0)
+            borrowing_apy = source.get("tokenBBorrowingApyRate", 0)
             
-            strategy_data = markets["strategies"]["SOL/USDC"]
+            # For delta-neutral SOL/USDC:
+            # - Earn: Lending APY on SOL * leverage (collateral + borrowed amount)
+            # - Pay: Borrowing APY on USDC * (leverage - 1)
+            # Net APY = (Lending * leverage) - (Borrowing * (leverage - 1))
+            #
+            # Example at 3x leverage with $1000 collateral:
+            # - Deposit $1000 SOL, borrow $2000 USDC, swap to SOL
+            # - Total lent: $3000 SOL earning lending_apy
+            # - Total borrowed: $2000 USDC paying borrowing_apy
+            # - Net = (0.04 * 3) - (0.05 * 2) = 0.12 - 0.10 = +2%
+            net_apy_decimal = (lending_apy * leverage) - (borrowing_apy * (leverage - 1))
             
-            for source in strategy_data.get("liquiditySources", []):
-                protocol = source.get("lendingProtocol")
-                protocol_name = {0: "marginfi", 1: "kamino", 2: "solend", 3: "drift"}.get(protocol)
-                
-                if not protocol_name:
-                    continue
-                
-                # Get raw rates (API returns decimals, e.g., 0.05 = 5%)
-                lending_apy = source.get("tokenALendingApyRate", 0)
-                borrowing_apy = source.get("tokenBBorrowingApyRate", 0)
-                
-                # For delta-neutral SOL/USDC:
-                # - Earn: Lending APY on SOL * leverage (collateral + borrowed amount)
-                # - Pay: Borrowing APY on USDC * (leverage - 1)
-                # Net APY = (Lending * leverage) - (Borrowing * (leverage - 1))
-                #
-                # Example at 3x leverage with $1000 collateral:
-                # - Deposit $1000 SOL, borrow $2000 USDC, swap to SOL
-                # - Total lent: $3000 SOL earning lending_apy
-                # - Total borrowed: $2000 USDC paying borrowing_apy
-                # - Net = (0.04 * 3) - (0.05 * 2) = 0.12 - 0.10 = +2%
-                net_apy_decimal = (lending_apy * leverage) - (borrowing_apy * (leverage - 1))
-                
-                # Convert to percentage for display
-                asgard_rates[protocol_name] = round(net_apy_decimal * 100, 2)
-                
-                # Store detailed breakdown for the best protocol
-                asgard_details[protocol_name] = {
-                    "base_lending_apy": round(lending_apy * 100, 2),
-                    "lending_apy": round(lending_apy * leverage * 100, 2),
-                    "base_borrowing_apy": round(borrowing_apy * 100, 2),
-                    "borrowing_apy": round(borrowing_apy * (leverage - 1) * 100, 2),
-                    "net_apy": round(net_apy_decimal * 100, 2),
-                }
-                
-                logger.debug(
-                    f"SOL/USDC {protocol_name}: lend={lending_apy*100:.2f}%, "
-                    f"borrow={borrowing_apy*100:.2f}%, net={net_apy_decimal*100:.2f}% @ {leverage}x"
-                )
-                        
+            # Convert to percentage for display
+            asgard_rates[protocol_name] = round(net_apy_decimal * 100, 2)
+            
+            # Store detailed breakdown for the best protocol
+            asgard_details[protocol_name] = {
+                "base_lending_apy": round(lending_apy * 100, 2),
+                "lending_apy": round(lending_apy * leverage * 100, 2),
+                "base_borrowing_apy": round(borrowing_apy * 100, 2),
+                "borrowing_apy": round(borrowing_apy * (leverage - 1) * 100, 2),
+                "net_apy": round(net_apy_decimal * 100, 2),
+            }
+            
+            logger.debug(
+                f"SOL/USDC {protocol_name}: lend={lending_apy*100:.2f}%, "
+                f"borrow={borrowing_apy*100:.2f}%, net={net_apy_decimal*100:.2f}% @ {leverage}x"
+            )
+                    
         logger.info(f"Fetched Asgard SOL/USDC rates: {asgard_rates}")
         
     except Exception as e:
@@ -155,33 +177,41 @@ async def _fetch_asgard_rates(leverage: float) -> tuple[Dict[str, float], Dict[s
     return asgard_rates, asgard_details
 
 
-async def _fetch_hyperliquid_rates(leverage: float) -> Dict[str, float]:
-    """Fetch Hyperliquid SOL-PERP funding rates at specified leverage."""
+async def _fetch_hyperliquid_rates(
+    leverage: float,
+    funding_rates: Optional[Dict[str, Any]] = None,
+) -> Dict[str, float]:
+    """Fetch Hyperliquid SOL-PERP funding rates at specified leverage.
+
+    ``funding_rates`` may be passed from the shared market snapshot.
+    """
     try:
-        async with HyperliquidFundingOracle() as oracle:
-            # Get current funding rates for all coins
-            funding_rates = await oracle.get_current_funding_rates()
+        if funding_rates is None:
+            client = get_client_registry().hyperliquid_client()
+            async with HyperliquidFundingOracle(client) as oracle:
+                # Get current funding rates for all coins
+                funding_rates = await oracle.get_current_funding_rates()
+        
+        # Get SOL funding rate
+        sol_rate = funding_rates.get("SOL")
+        if sol_rate:
+            # Scale by leverage
+            # funding_rate is hourly (e.g., -0.000007 = -0.0007%)
+            # annualized_rate is already calculated (hourly * 24 * 365)
+            return {
+                "funding_rate": round(sol_rate.funding_rate * 100, 6),  # Hourly %
+                "predicted": round(sol_rate.funding_rate * 100, 6),  # Use current as predicted
+                "base_annualized": round(sol_rate.annualized_rate * 100, 2),  # Annualized % (no leverage)
+                "annualized": round(sol_rate.annualized_rate * leverage * 100, 2),  # Annualized % at leverage
+            }
+        else:
+            logger.warning("SOL funding rate not found in response")
+            return {
+                "funding_rate": 0.0,
+                "predicted": 0.0,
+                "annualized": 0.0,
+            }
             
-            # Get SOL funding rate
-            sol_rate = funding_rates.get("SOL")
-            if sol_rate:
-                # Scale by leverage
-                # funding_rate is hourly (e.g., -0.000007 = -0.0007%)
-                # annualized_rate is already calculated (hourly * 24 * 365)
-                return {
-                    "funding_rate": round(sol_rate.funding_rate * 100, 6),  # Hourly %
-                    "predicted": round(sol_rate.funding_rate * 100, 6),  # Use current as predicted
-                    "base_annualized": round(sol_rate.annualized_rate * 100, 2),  # Annualized % (no leverage)
-                    "annualized": round(sol_rate.annualized_rate * leverage * 100, 2),  # Annualized % at leverage
-                }
-            else:
-                logger.warning("SOL funding rate not found in response")
-                return {
-                    "funding_rate": 0.0,
-                    "predicted": 0.0,
-                    "annualized": 0.0,
-                }
-                
     except Exception as e:
         logger.error(f"Failed to fetch Hyperliquid rates: {e}")
         return {
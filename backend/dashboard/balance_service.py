@@ -0,0 +1,320 @@
+"""
+Wallet balance aggregation for the dashboard.
+
+Reads a user's Solana, Arbitrum and Hyperliquid clearinghouse balances
+concurrently over the process-wide ``VenueClientRegistry`` pools (no
+connection setup per request), with a short per-address cache:
+
+- Fresh (younger than ``ttl``): served from memory.
+- Stale (younger than ``stale_ttl``): served immediately while a single
+  background refresh runs (stale-while-revalidate).
+- Missing or expired: fetched, with concurrent requests for the same
+  address sharing one in-flight fetch.
+
+Failed fetches are never cached; a stale value keeps being served until
+it expires.
+
+Solana and Arbitrum fetches started in the same event-loop tick (e.g.
+``get_solana_many`` / ``get_arbitrum_many`` over every user) are coalesced
+into one batched ``get_balances`` read per chain, so a multi-user sweep costs
+one round trip per 100 Solana accounts (getMultipleAccounts) or per 2000
+Arbitrum reads (Multicall3), not two per user.
+
+Usage:
+    service = get_balance_service()
+    balances = await service.get_all(solana_address, evm_address)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from shared.chain.arbitrum import NATIVE_USDC_ARBITRUM, ArbitrumClient
+from shared.chain.solana import SolanaClient
+from shared.utils.logger import get_logger
+from bot.venues.client_registry import get_client_registry
+from bot.venues.hyperliquid.client import HyperliquidClient
+from bot.venues.hyperliquid.trader import HyperliquidTrader
+
+logger = get_logger(__name__)
+
+USDC_MINT_SOLANA = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # Mainnet USDC
+
+
+@dataclass(frozen=True)
+class SolanaBalance:
+    """SOL and USDC balances for one Solana address."""
+    sol: float
+    usdc: float
+
+
+@dataclass(frozen=True)
+class ArbitrumBalance:
+    """ETH and USDC balances for one Arbitrum address."""
+    eth: float
+    usdc: float
+
+
+@dataclass(frozen=True)
+class WalletBalances:
+    """Balances across all venues; ``None`` where unavailable."""
+    solana: Optional[SolanaBalance] = None
+    arbitrum: Optional[ArbitrumBalance] = None
+    hl_clearinghouse: Optional[float] = None
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fetched_at: float
+
+
+class BalanceService:
+    """
+    Concurrent, cached balance reads over pooled venue clients.
+
+    Args:
+        ttl: Seconds a balance is served without refreshing.
+        stale_ttl: Seconds a balance may be served while a background
+            refresh runs; older entries are refetched inline.
+        solana_client / arbitrum_client / hl_client: Optional clients
+            (otherwise pooled facades from the client registry, created
+            lazily and reused).
+    """
+
+    DEFAULT_TTL = 10.0
+    DEFAULT_STALE_TTL = 120.0
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        stale_ttl: Optional[float] = None,
+        solana_client: Optional[SolanaClient] = None,
+        arbitrum_client: Optional[ArbitrumClient] = None,
+        hl_client: Optional[HyperliquidClient] = None,
+    ):
+        self.ttl = ttl if ttl is not None else self.DEFAULT_TTL
+        self.stale_ttl = max(
+            stale_ttl if stale_ttl is not None else self.DEFAULT_STALE_TTL, self.ttl
+        )
+        self._solana_client = solana_client
+        self._arbitrum_client = arbitrum_client
+        self._hl_client = hl_client
+
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._batches: Dict[str, Dict[str, asyncio.Future]] = {}
+
+        # Counters
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Public reads
+    # ------------------------------------------------------------------
+
+    async def get_all(
+        self,
+        solana_address: Optional[str],
+        evm_address: Optional[str],
+    ) -> WalletBalances:
+        """Read every venue concurrently; missing addresses yield ``None``."""
+
+        async def none():
+            return None
+
+        solana, arbitrum, hl = await asyncio.gather(
+            self.get_solana(solana_address) if solana_address else none(),
+            self.get_arbitrum(evm_address) if evm_address else none(),
+            self.get_hl_clearinghouse(evm_address) if evm_address else none(),
+        )
+        return WalletBalances(solana=solana, arbitrum=arbitrum, hl_clearinghouse=hl)
+
+    async def get_solana(self, address: str) -> Optional[SolanaBalance]:
+        return await self._cached("solana", address, lambda: self._fetch_solana(address))
+
+    async def get_solana_many(self, addresses: Iterable[str]) -> Dict[str, Optional[SolanaBalance]]:
+        """Solana balances for many addresses (uncached ones in one batched read)."""
+        addresses = list(dict.fromkeys(addresses))
+        results = await asyncio.gather(*(self.get_solana(a) for a in addresses))
+        return dict(zip(addresses, results))
+
+    async def get_arbitrum(self, address: str) -> Optional[ArbitrumBalance]:
+        return await self._cached("arbitrum", address, lambda: self._fetch_arbitrum(address))
+
+    async def get_arbitrum_many(self, addresses: Iterable[str]) -> Dict[str, Optional[ArbitrumBalance]]:
+        """Arbitrum balances for many addresses (uncached ones in one Multicall3 sweep)."""
+        addresses = list(dict.fromkeys(addresses))
+        results = await asyncio.gather(*(self.get_arbitrum(a) for a in addresses))
+        return dict(zip(addresses, results))
+
+    async def get_hl_clearinghouse(self, address: str) -> Optional[float]:
+        return await self._cached("hyperliquid", address, lambda: self._fetch_hl(address))
+
+    def invalidate(self, address: Optional[str] = None) -> None:
+        """Drop cached balances for one address (any venue), or everything."""
+        if address is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[1] == address]:
+            del self._entries[key]
+
+    async def close(self) -> None:
+        """Close client facades (registry pools stay open)."""
+        for client in (self._solana_client, self._arbitrum_client, self._hl_client):
+            if client is None:
+                continue
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing balance client: {e}")
+        self._solana_client = None
+        self._arbitrum_client = None
+        self._hl_client = None
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    async def _cached(
+        self,
+        venue: str,
+        address: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        key = (venue, address)
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                self.hits += 1
+                return entry.value
+            if age < self.stale_ttl:
+                self.stale_hits += 1
+                self._refresh(key, fetch)
+                return entry.value
+
+        self.misses += 1
+        # Shield so one cancelled request doesn't cancel the shared fetch
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def _refresh(self, key: Tuple[str, str], fetch) -> asyncio.Future:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(key, fetch))
+            self._inflight[key] = future
+        return future
+
+    async def _run(self, key: Tuple[str, str], fetch) -> Any:
+        venue, address = key
+        try:
+            value = await fetch()
+        except Exception as e:
+            logger.error(f"Failed to fetch {venue} balances for {address}: {e}")
+            return None
+        finally:
+            self._inflight.pop(key, None)
+
+        self._entries[key] = _Entry(value=value, fetched_at=time.monotonic())
+        return value
+
+    # ------------------------------------------------------------------
+    # Venue fetches
+    # ------------------------------------------------------------------
+
+    async def _fetch_solana(self, address: str) -> SolanaBalance:
+        return await self._join_batch("solana", address, self._read_solana)
+
+    async def _fetch_arbitrum(self, address: str) -> ArbitrumBalance:
+        return await self._join_batch("arbitrum", address, self._read_arbitrum)
+
+    async def _join_batch(
+        self,
+        venue: str,
+        address: str,
+        read: Callable[[list], Awaitable[Dict[str, Any]]],
+    ) -> Any:
+        """Join the current tick's batched read for ``venue`` (starting one if needed)."""
+        batch = self._batches.get(venue)
+        if batch is None:
+            batch = self._batches[venue] = {}
+            asyncio.ensure_future(self._flush_batch(venue, read))
+        future = batch.get(address)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            batch[address] = future
+        return await asyncio.shield(future)
+
+    async def _flush_batch(self, venue: str, read) -> None:
+        await asyncio.sleep(0)  # Let this tick's callers join the batch
+        batch = self._batches.pop(venue, {})
+        try:
+            balances = await read(list(batch))
+            for address, future in batch.items():
+                if future.done():
+                    continue
+                value = balances.get(address)
+                if value is None:
+                    value = ValueError(f"No {venue} balance returned for {address}")
+                if isinstance(value, Exception):  # This address's reads failed
+                    future.set_exception(value)
+                else:
+                    future.set_result(value)
+        except Exception as e:
+            # Never leave a caller waiting on an unsettled future
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _read_solana(self, addresses: list) -> Dict[str, SolanaBalance]:
+        if self._solana_client is None:
+            self._solana_client = get_client_registry().solana_client()
+        balances = await self._solana_client.get_balances(addresses, [USDC_MINT_SOLANA])
+        return {
+            address: SolanaBalance(
+                sol=float(balance.sol), usdc=float(balance.tokens[USDC_MINT_SOLANA])
+            )
+            for address, balance in balances.items()
+        }
+
+    async def _read_arbitrum(self, addresses: list) -> Dict[str, Any]:
+        if self._arbitrum_client is None:
+            self._arbitrum_client = get_client_registry().arbitrum_client()
+        balances = await self._arbitrum_client.get_balances(addresses)
+        result = {}
+        for address, balance in balances.items():
+            usdc = balance.tokens[NATIVE_USDC_ARBITRUM]
+            if balance.eth is None or usdc is None:
+                result[address] = RuntimeError("Multicall3 balance read failed")
+            else:
+                result[address] = ArbitrumBalance(eth=float(balance.eth), usdc=float(usdc))
+        return result
+
+    async def _fetch_hl(self, address: str) -> float:
+        if self._hl_client is None:
+            self._hl_client = get_client_registry().hyperliquid_client()
+        trader = HyperliquidTrader(wallet_address=address, client=self._hl_client)
+        balance = await trader.get_deposited_balance()
+        return balance if balance > 0 else 0.0
+
+
+# Module-level singleton shared by all balance endpoints
+_balance_service: Optional[BalanceService] = None
+
+
+def get_balance_service() -> BalanceService:
+    """Return the process-wide balance service."""
+    global _balance_service
+    if _balance_service is None:
+        _balance_service = BalanceService()
+    return _balance_service
+
+
+async def close_balance_service() -> None:
+    """Close pooled clients and drop the process-wide service."""
+    global _balance_service
+    if _balance_service is not None:
+        await _balance_service.close()
+        _balance_service = None
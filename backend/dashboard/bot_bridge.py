@@ -1,13 +1,18 @@
 """
 Bridge between Dashboard and DeltaNeutralBot.
 Implements stale-data caching for availability over consistency.
+
+Positions and pause state are pushed by the bot over the internal WebSocket
+feed (``/internal/events``); HTTP polling only runs while that socket is down.
 """
 
 import asyncio
+import json
 import time
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import httpx
+import websockets
 
 from shared.common.schemas import BotStats, PositionSummary, PositionDetail, PauseState
 
@@ -27,8 +32,15 @@ class BotBridge:
     - Returns fresh data if available
     - Returns cached data if bot slow (< 2s timeout)
     - Raises exception if no cached data available
+    
+    While the event feed is connected, positions and pause state are served
+    from the pushed state and never expire.
     """
     
+    POLL_INTERVAL = 5.0  # seconds between HTTP polls while the feed is down
+    FEED_RECONNECT_MIN = 1.0
+    FEED_RECONNECT_MAX = 30.0
+    
     def __init__(self, bot_api_url: str = "http://bot:8000", internal_token: str = None):
         self._api_url = bot_api_url
         self._internal_token = internal_token
@@ -43,11 +55,24 @@ class BotBridge:
         self._cache_ttl = 5.0  # 5 seconds
         self._lock = asyncio.Lock()
         self._background_task: Optional[asyncio.Task] = None
+        
+        # Pushed state from the event feed: position_id -> (user_id, summary)
+        self._feed_connected = False
+        self._feed_positions: Dict[str, Tuple[Optional[str], PositionSummary]] = {}
+        self._feed_pause_state: Optional[PauseState] = None
+        
+        # Counters
+        self.feed_events = 0
+        self.polls = 0
+    
+    @property
+    def feed_connected(self) -> bool:
+        return self._feed_connected
     
     async def start(self):
-        """Start background cache refresh."""
+        """Start the event feed (with polling fallback)."""
         self._background_task = asyncio.create_task(self._background_refresh())
-        logger.info("BotBridge started with background refresh")
+        logger.info("BotBridge started with event feed")
     
     async def stop(self):
         """Stop background tasks."""
@@ -60,16 +85,104 @@ class BotBridge:
         await self._client.aclose()
     
     async def _background_refresh(self):
-        """Keep cache warm even without requests."""
+        """Keep cache warm: follow the event feed, poll only while it is down."""
+        retry_in = self.FEED_RECONNECT_MIN
         while True:
-            await asyncio.sleep(5.0)
-            try:
-                await self.get_positions()
-                await self.get_pause_state()
-            except BotUnavailableError:
-                logger.warning("Background refresh: bot unavailable")
-            except Exception as e:
-                logger.error(f"Background refresh failed: {e}")
+            if await self._run_feed():
+                retry_in = self.FEED_RECONNECT_MIN
+            await self._poll_until(time.monotonic() + retry_in)
+            retry_in = min(retry_in * 2, self.FEED_RECONNECT_MAX)
+    
+    async def _poll_until(self, deadline: float):
+        """Poll over HTTP until ``deadline`` (at least once)."""
+        while True:
+            await self._poll()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(self.POLL_INTERVAL, remaining))
+    
+    async def _poll(self):
+        self.polls += 1
+        try:
+            await self.get_positions()
+            await self.get_pause_state()
+        except BotUnavailableError:
+            logger.warning("Background refresh: bot unavailable")
+        except Exception as e:
+            logger.error(f"Background refresh failed: {e}")
+    
+    def _feed_url(self) -> str:
+        return self._api_url.replace("http", "ws", 1).rstrip("/") + "/internal/events"
+    
+    async def _run_feed(self) -> bool:
+        """
+        Follow the bot event feed until it drops.
+        
+        Returns:
+            True if a snapshot was received (the connection was usable).
+        """
+        synced = False
+        try:
+            async with websockets.connect(
+                self._feed_url(),
+                extra_headers={"Authorization": f"Bearer {self._internal_token}"},
+                open_timeout=5.0,
+            ) as ws:
+                async for raw in ws:
+                    self._apply_feed_message(json.loads(raw))
+                    if not synced and self._feed_connected:
+                        synced = True
+                        logger.info("Bot event feed connected")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Bot event feed unavailable: {e}")
+        finally:
+            if self._feed_connected:
+                self._feed_connected = False
+                # Hand the pushed state to the TTL cache for stale fallback
+                self._set_cached("positions_all", self._feed_view(None))
+                if self._feed_pause_state is not None:
+                    self._set_cached("pause_state", self._feed_pause_state)
+                logger.warning("Bot event feed disconnected, polling")
+        return synced
+    
+    def _apply_feed_message(self, message: Dict[str, Any]):
+        """Apply one event feed message to the pushed state."""
+        event_type = message.get("type")
+        data = message.get("data") or {}
+        
+        if event_type == "snapshot":
+            self._feed_positions = {
+                entry["position"]["position_id"]: (
+                    entry.get("user_id"), PositionSummary(**entry["position"])
+                )
+                for entry in data.get("positions", [])
+            }
+            pause_state = data.get("pause_state")
+            self._feed_pause_state = PauseState(**pause_state) if pause_state else None
+            self._feed_connected = True
+        elif event_type in ("position_opened", "position_updated"):
+            summary = PositionSummary(**data["position"])
+            self._feed_positions[summary.position_id] = (data.get("user_id"), summary)
+        elif event_type == "position_closed":
+            self._feed_positions.pop(data["position_id"], None)
+        elif event_type in ("pause_state", "circuit_breaker"):
+            self._feed_pause_state = PauseState(**data)
+            if event_type == "circuit_breaker":
+                logger.warning(f"Bot circuit breaker: {self._feed_pause_state.reason}")
+        else:
+            return
+        self.feed_events += 1
+    
+    def _feed_view(self, user_id: Optional[str]) -> Dict[str, PositionSummary]:
+        """Pushed positions, optionally for one user."""
+        return {
+            pos_id: summary
+            for pos_id, (owner, summary) in self._feed_positions.items()
+            if not user_id or owner == user_id
+        }
     
     def _is_cache_fresh(self, key: str) -> bool:
         """Check if cache entry is still fresh."""
@@ -128,6 +241,9 @@ class BotBridge:
         """
         cache_key = f"positions_{user_id or 'all'}"
         
+        if self._feed_connected:
+            return self._feed_view(user_id)
+        
         # Fast path: return cached data if fresh
         cached = self._get_cached(cache_key)
         if cached is not None:
@@ -196,6 +312,9 @@ class BotBridge:
         """Get current pause state."""
         cache_key = "pause_state"
         
+        if self._feed_connected and self._feed_pause_state is not None:
+            return self._feed_pause_state
+        
         cached = self._get_cached(cache_key)
         if cached:
             return cached
@@ -203,6 +322,8 @@ class BotBridge:
         response = await self._request("GET", "/internal/pause-state")
         state = PauseState(**response.json())
         self._set_cached(cache_key, state)
+        if self._feed_connected:
+            self._feed_pause_state = state
         return state
     
     async def pause(self, api_key: str, reason: str, scope: str) -> bool:
@@ -303,3 +424,6 @@ class BotBridge:
             self._cache_timestamp.pop(key, None)
         else:
             self._cache_timestamp.clear()
+        if key in (None, "pause_state"):
+            # Read through to the bot until the feed pushes the new state
+            self._feed_pause_state = None
@@ -1,22 +1,98 @@
 """
-Redis-backed cache for dashboard.
+Two-tier cache for dashboard.
 
-Replaces in-memory TimedCache with Redis GET/SET + TTL.
-Same interface so callers don't change.
+L1 is a bounded in-process LRU holding already-decoded values; L2 is Redis
+(GET/SET + TTL) shared by every worker. Same interface as before so callers
+don't change.
+
+- Per-key single-flight: concurrent misses for one key share a single
+  upstream call.
+- Probabilistic early refresh (XFetch): as an entry nears expiry, a hit may
+  trigger one background recompute, weighted by how long the value took to
+  compute, so hot keys are refreshed before they expire instead of stampeding.
+- Tags: ``set(..., tags=...)`` records the key in a Redis set per tag;
+  ``invalidate_tags()`` drops every tagged key in one pipelined round-trip.
+- Redis errors degrade to L1-only caching instead of failing the request.
+
+L1 entries live no longer than their L2 TTL, so an invalidation in another
+worker is seen here within one TTL at most.
 """
 
-import json
+import asyncio
 import functools
-from typing import Optional, Callable, Any
+import json
+import logging
+import math
+import random
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 CACHE_PREFIX = "cache:"
+TAG_PREFIX = f"{CACHE_PREFIX}tag:"
+
+DEFAULT_MAX_ENTRIES = 1024
+DELETE_BATCH = 500  # keys per DEL during invalidation
+TAG_TTL = 3600  # seconds; outlives any member (deleting expired members is harmless)
+
+# Every cache in this process, for process-wide L1 invalidation
+_local_caches: "weakref.WeakSet[TimedCache]" = weakref.WeakSet()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "delta", "tags")
+
+    def __init__(self, value: Any, expires_at: float, delta: float, tags: Tuple[str, ...]):
+        self.value = value
+        self.expires_at = expires_at
+        self.delta = delta  # seconds the value took to compute
+        self.tags = tags
 
 
 class TimedCache:
-    """Redis-backed timed cache with TTL."""
+    """
+    Two-tier (in-process LRU + Redis) timed cache with TTL.
 
-    def __init__(self, ttl_seconds: float = 5.0):
+    Args:
+        ttl_seconds: Lifetime of an entry in both tiers.
+        max_entries: L1 capacity; least recently used entries are evicted.
+        tags: Tags applied to every entry set through this cache.
+        beta: Early-refresh eagerness (0 disables, >1 refreshes earlier).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 5.0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        tags: Iterable[str] = (),
+        beta: float = 1.0,
+    ):
         self.ttl = int(ttl_seconds) or 1
+        self.max_entries = max_entries
+        self.tags = tuple(tags)
+        self.beta = beta
+        self._l1: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Bumped on invalidation so loads started before it are not stored
+        self._generation = 0
+        self._random = random.random
+        _local_caches.add(self)
+
+        # Counters
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.early_refreshes = 0
+        self.evictions = 0
+        self.loads = 0
+        self.load_errors = 0
+        self.l2_errors = 0
+        self.l2_seconds = 0.0
+        self.load_seconds = 0.0
 
     async def _get_redis(self):
         from shared.redis_client import get_redis
@@ -25,53 +101,255 @@ class TimedCache:
     def _key(self, key: str) -> str:
         return f"{CACHE_PREFIX}{key}"
 
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
     async def get(self, key: str) -> Optional[Any]:
         """Get cached value if fresh."""
-        redis = await self._get_redis()
-        raw = await redis.get(self._key(key))
-        if raw is None:
-            return None
-        try:
-            return json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            return raw
+        entry = await self._lookup(key)
+        return entry.value if entry is not None else None
 
-    async def set(self, key: str, value: Any) -> None:
-        """Set cache value with TTL."""
-        redis = await self._get_redis()
-        await redis.set(self._key(key), json.dumps(value, default=str), ex=self.ttl)
+    async def set(
+        self, key: str, value: Any, tags: Iterable[str] = (), delta: float = 0.0
+    ) -> None:
+        """Set cache value with TTL in both tiers, recording it under ``tags``."""
+        tags = tuple(dict.fromkeys((*self.tags, *tags)))
+        payload = json.dumps({"v": value, "d": delta, "t": tags}, default=str)
+        # Keep L1 identical to what an L2 read would return
+        self._store(key, json.loads(payload)["v"], time.monotonic() + self.ttl, delta, tags)
+
+        full_key = self._key(key)
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False)
+            pipe.set(full_key, payload, ex=self.ttl)
+            for tag in tags:
+                pipe.sadd(f"{TAG_PREFIX}{tag}", full_key)
+                pipe.expire(f"{TAG_PREFIX}{tag}", max(self.ttl, TAG_TTL))
+            await pipe.execute()
+        except Exception as e:
+            self.l2_errors += 1
+            logger.debug(f"Cache L2 set failed for {key}: {e}")
 
     async def get_or_set(self, key: str, factory: Callable, *args, **kwargs) -> Any:
-        """Get from cache or set using factory."""
-        cached = await self.get(key)
-        if cached is not None:
-            return cached
+        """
+        Get from cache or set using factory.
 
-        value = await factory(*args, **kwargs)
-        await self.set(key, value)
-        return value
+        Only one ``factory`` call per key runs at a time; concurrent callers
+        wait for it. A hit close to expiry may start a background refresh.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        entry = await self._lookup(key)
+        if entry is not None:
+            if self._should_refresh_early(entry):
+                self.early_refreshes += 1
+                self._load(key, factory, args, kwargs)
+            return entry.value
+
+        return await asyncio.shield(self._load(key, factory, args, kwargs))
 
     async def invalidate(self, key: Optional[str] = None) -> None:
         """Invalidate cache entry or all entries with prefix."""
-        redis = await self._get_redis()
         if key:
-            await redis.delete(self._key(key))
+            self._l1.pop(key, None)
+            self._inflight.pop(key, None)
+            self._generation += 1
         else:
-            # Invalidate all cache keys (scan and delete)
-            async for k in redis.scan_iter(match=f"{CACHE_PREFIX}*", count=100):
-                await redis.delete(k)
+            for cache in list(_local_caches):
+                cache._reset()
 
+        try:
+            redis = await self._get_redis()
+            if key:
+                await redis.delete(self._key(key))
+                return
+            # Invalidate all cache keys (scan and delete in batches)
+            batch = []
+            async for k in redis.scan_iter(match=f"{CACHE_PREFIX}*", count=DELETE_BATCH):
+                batch.append(k)
+                if len(batch) >= DELETE_BATCH:
+                    await redis.delete(*batch)
+                    batch = []
+            if batch:
+                await redis.delete(*batch)
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache invalidation failed: {e}")
 
-def cached(ttl_seconds: float = 5.0):
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Drop every entry recorded under any of ``tags``, in all caches.
+
+        Returns:
+            Number of Redis keys deleted.
+        """
+        wanted = set(tags)
+        for cache in list(_local_caches):
+            if wanted.intersection(cache.tags):
+                cache._reset()
+                continue
+            for key in [k for k, e in cache._l1.items() if wanted.intersection(e.tags)]:
+                del cache._l1[key]
+
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False)
+            for tag in tags:
+                pipe.smembers(f"{TAG_PREFIX}{tag}")
+            members = set().union(*await pipe.execute()) if tags else set()
+
+            keys = [*members, *(f"{TAG_PREFIX}{tag}" for tag in tags)]
+            pipe = redis.pipeline(transaction=False)
+            for i in range(0, len(keys), DELETE_BATCH):
+                pipe.delete(*keys[i:i + DELETE_BATCH])
+            deleted = await pipe.execute()
+        except Exception as e:
+            self.l2_errors += 1
+            logger.warning(f"Cache tag invalidation failed for {tags}: {e}")
+            return 0
+        return sum(deleted)
+
+    def clear_local(self) -> None:
+        """Drop this cache's L1 entries (Redis is untouched)."""
+        self._reset()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/latency counters."""
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        l2_reads = self.l2_hits + self.misses
+        return {
+            "l1_entries": len(self._l1),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "hit_rate": (self.l1_hits + self.l2_hits) / lookups if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "early_refreshes": self.early_refreshes,
+            "evictions": self.evictions,
+            "loads": self.loads,
+            "load_errors": self.load_errors,
+            "l2_errors": self.l2_errors,
+            "avg_l2_ms": 1000 * self.l2_seconds / l2_reads if l2_reads else 0.0,
+            "avg_load_ms": 1000 * self.load_seconds / self.loads if self.loads else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._l1.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    async def _lookup(self, key: str) -> Optional[_Entry]:
+        entry = self._l1.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            if entry.expires_at > now:
+                self._l1.move_to_end(key)
+                self.l1_hits += 1
+                return entry
+            del self._l1[key]
+
+        start = time.monotonic()
+        try:
+            redis = await self._get_redis()
+            pipe = redis.pipeline(transaction=False)
+            pipe.get(self._key(key))
+            pipe.pttl(self._key(key))
+            raw, pttl = await pipe.execute()
+        except Exception as e:
+            self.l2_errors += 1
+            self.misses += 1
+            logger.debug(f"Cache L2 get failed for {key}: {e}")
+            return None
+        finally:
+            self.l2_seconds += time.monotonic() - start
+
+        if raw is None:
+            self.misses += 1
+            return None
+        try:
+            envelope = json.loads(raw)
+            value, delta, tags = envelope["v"], envelope.get("d", 0.0), tuple(envelope.get("t", ()))
+        except (json.JSONDecodeError, TypeError, KeyError):
+            self.misses += 1
+            return None
+
+        self.l2_hits += 1
+        ttl = pttl / 1000 if pttl and pttl > 0 else self.ttl
+        return self._store(key, value, time.monotonic() + ttl, delta, tags)
+
+    def _store(
+        self, key: str, value: Any, expires_at: float, delta: float, tags: Tuple[str, ...]
+    ) -> _Entry:
+        entry = _Entry(value, expires_at, delta, tags)
+        self._l1[key] = entry
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.max_entries:
+            self._l1.popitem(last=False)
+            self.evictions += 1
+        return entry
+
+    def _should_refresh_early(self, entry: _Entry) -> bool:
+        if self.beta <= 0 or entry.delta <= 0:
+            return False
+        # XFetch: refresh with probability rising as expiry approaches
+        gap = -entry.delta * self.beta * math.log(max(self._random(), 1e-12))
+        return time.monotonic() + gap >= entry.expires_at
+
+    def _load(self, key: str, factory: Callable, args: tuple, kwargs: dict) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compute(key, factory, args, kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._load_done, key))
+        return task
+
+    async def _compute(self, key: str, factory: Callable, args: tuple, kwargs: dict) -> Any:
+        generation = self._generation
+        start = time.monotonic()
+        value = await factory(*args, **kwargs)
+        delta = time.monotonic() - start
+        self.loads += 1
+        self.load_seconds += delta
+        if value is not None and generation == self._generation:
+            await self.set(key, value, delta=delta)
+        return value
+
+    def _load_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.load_errors += 1
+
+
+def clear_local_caches() -> None:
+    """Drop every in-process (L1) entry in this process."""
+    for cache in list(_local_caches):
+        cache.clear_local()
+
+
+def cached(
+    ttl_seconds: float = 5.0,
+    tags: Iterable[str] = (),
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+):
     """
-    Decorator to cache async function results in Redis.
+    Decorator to cache async function results in memory and Redis.
 
     Usage:
-        @cached(ttl_seconds=10)
+        @cached(ttl_seconds=10, tags=("rates",))
         async def get_expensive_data():
             return await fetch_from_api()
     """
-    cache = TimedCache(ttl_seconds)
+    cache = TimedCache(ttl_seconds, max_entries=max_entries, tags=tags)
 
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
@@ -82,15 +360,7 @@ def cached(ttl_seconds: float = 5.0):
             key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
             cache_key = ":".join(key_parts)
 
-            # Try to get from cache
-            cached_value = await cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-            await cache.set(cache_key, result)
-            return result
+            return await cache.get_or_set(cache_key, func, *args, **kwargs)
 
         # Attach cache for external invalidation
         wrapper.cache = cache
@@ -77,6 +77,10 @@ class DashboardSettings(BaseSettings):
     # Cache
     cache_ttl: float = Field(default=5.0, alias="CACHE_TTL")
 
+    # Event stream: position updates merged per window, keyframe every interval
+    sse_position_window: float = Field(default=1.0, alias="SSE_POSITION_WINDOW")
+    sse_keyframe_interval: float = Field(default=60.0, alias="SSE_KEYFRAME_INTERVAL")
+
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
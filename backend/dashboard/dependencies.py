@@ -7,6 +7,7 @@ from fastapi import HTTPException
 from backend.dashboard.bot_bridge import BotBridge
 from bot.core.position_monitor import PositionMonitorService
 from bot.core.intent_scanner import IntentScanner
+from bot.core.market_snapshot import MarketSnapshotService
 
 # Global bot bridge instance (set during lifespan)
 _bot_bridge: Optional[BotBridge] = None
@@ -17,6 +18,9 @@ _position_monitor: Optional[PositionMonitorService] = None
 # Global intent scanner instance (set during lifespan)
 _intent_scanner: Optional[IntentScanner] = None
 
+# Global market snapshot service (set during lifespan)
+_market_snapshots: Optional[MarketSnapshotService] = None
+
 
 def set_bot_bridge(bridge: BotBridge):
     """Set the global bot bridge instance."""
@@ -56,3 +60,14 @@ def set_intent_scanner(scanner: IntentScanner):
 def get_intent_scanner() -> Optional[IntentScanner]:
     """Get the global intent scanner instance."""
     return _intent_scanner
+
+
+def set_market_snapshots(snapshots: MarketSnapshotService):
+    """Set the global market snapshot service."""
+    global _market_snapshots
+    _market_snapshots = snapshots
+
+
+def get_market_snapshots() -> Optional[MarketSnapshotService]:
+    """Get the global market snapshot service."""
+    return _market_snapshots
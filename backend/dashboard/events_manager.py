@@ -3,12 +3,34 @@ Event manager for real-time updates via Server-Sent Events (SSE).
 
 Uses Redis pub/sub so all server instances see all events.
 Provides publish/subscribe pattern for broadcasting events to connected clients.
+
+Routing:
+- Events are published to ``events:user:<user_id>`` (user-scoped events) or
+  ``events:broadcast`` (rates, bot status). Each instance subscribes only to
+  the user channels of its connected users.
+- Locally, subscriptions listen on topics: the broadcast topic, a user topic
+  (all of that user's events) and per-position topics (one position's events).
+
+Fan-out is lock-free and never awaits: every event is serialized once and
+offered to each subscriber with ``put_nowait`` semantics. A subscriber that
+falls behind coalesces state-style events (a newer position/rate/balance
+update replaces the pending one) and, when still full, drops its oldest
+pending event, so one slow SSE client never delays anyone else.
+
+Catch-up:
+- Every user event is also appended to a bounded per-user Redis Stream
+  (``events:log:<user_id>``) under a monotonic per-user ``seq``, atomically
+  with its publish. The ``seq`` travels in the payload and as the SSE ``id``.
+- ``replay(user_id, last_seq)`` returns exactly the events a reconnecting
+  client missed, or None when they are no longer all in the log (trimmed,
+  expired, too many); callers then fall back to a compact snapshot.
 """
 
 import asyncio
 import json
-from typing import Dict, Optional, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Any, Set
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
@@ -18,6 +40,46 @@ logger = get_logger(__name__)
 
 EVENTS_CHANNEL_PREFIX = "events:"
 EVENTS_BROADCAST_CHANNEL = "events:broadcast"
+EVENTS_USER_CHANNEL_PREFIX = "events:user:"
+EVENTS_LOG_PREFIX = "events:log:"
+EVENTS_SEQ_PREFIX = "events:seq:"
+
+EVENT_LOG_MAXLEN = 1000  # Approximate entries kept per user
+EVENT_LOG_TTL = 7 * 24 * 3600  # Logs of inactive users expire
+REPLAY_MAX = 500  # Larger gaps are cheaper to resync with a snapshot
+
+# Assign the next seq, log the event and publish it in one step, so log and
+# live stream agree on ordering. The seq is spliced into the JSON payload.
+# If the seq key was lost while the log survived, seq resumes after the last
+# logged entry (XADD rejects IDs at or below it).
+EVENT_LOG_SCRIPT = """
+local seq = redis.call('INCR', KEYS[2])
+if seq == 1 then
+  local last = redis.call('XREVRANGE', KEYS[1], '+', '-', 'COUNT', 1)[1]
+  if last then
+    seq = tonumber(string.match(last[1], '^(%d+)')) + 1
+    redis.call('SET', KEYS[2], seq)
+  end
+end
+local payload = '{"seq": ' .. seq .. ', ' .. string.sub(ARGV[1], 2)
+redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[2], seq .. '-0', 'event', payload)
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('PUBLISH', ARGV[4], payload)
+return seq
+"""
+
+BROADCAST_TOPIC = "broadcast"
+
+
+def user_topic(user_id: str) -> str:
+    """Local topic for all of one user's events."""
+    return f"user:{user_id}"
+
+
+def position_topic(user_id: str, position_id: str) -> str:
+    """Local topic for one position's events (scoped to its owner)."""
+    return f"position:{user_id}:{position_id}"
 
 
 class EventType(Enum):
@@ -25,11 +87,26 @@ class EventType(Enum):
     POSITION_OPENED = "position_opened"
     POSITION_CLOSED = "position_closed"
     POSITION_UPDATE = "position_update"
+    POSITION_DELTA = "position_delta"
     RATE_UPDATE = "rate_update"
     BOT_STATUS = "bot_status"
     BALANCE_UPDATE = "balance_update"
     ERROR = "error"
     PING = "ping"
+    SNAPSHOT = "snapshot"
+    CONNECTED = "connected"
+
+
+# Events where only the latest pending one per key matters (key: data field or None)
+COALESCE_FIELDS: Dict[EventType, Optional[str]] = {
+    EventType.POSITION_UPDATE: "position_id",
+    EventType.RATE_UPDATE: None,
+    EventType.BALANCE_UPDATE: None,
+    EventType.BOT_STATUS: None,
+    EventType.PING: None,
+}
+# Coalesced events that may carry partial state: merge instead of replacing
+COALESCE_MERGE = {EventType.POSITION_UPDATE}
 
 
 @dataclass
@@ -38,33 +115,120 @@ class Event:
     type: EventType
     data: Dict[str, Any]
     timestamp: str
+    seq: Optional[int] = None
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _sse: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def to_sse(self) -> str:
-        """Convert to SSE format."""
-        payload = json.dumps({
-            'type': self.type.value,
-            'data': self.data,
-            'timestamp': self.timestamp
-        })
-        return f"data: {payload}\n\n"
+        """Convert to SSE format (serialized once, shared by all subscribers)."""
+        if self._sse is None:
+            event_id = f"id: {self.seq}\n" if self.seq is not None else ""
+            self._sse = f"{event_id}data: {self.to_json()}\n\n"
+        return self._sse
 
     def to_json(self) -> str:
         """Serialize for Redis pub/sub."""
-        return json.dumps({
-            'type': self.type.value,
-            'data': self.data,
-            'timestamp': self.timestamp,
-        })
+        if self._json is None:
+            payload = {'seq': self.seq} if self.seq is not None else {}
+            payload.update({
+                'type': self.type.value,
+                'data': self.data,
+                'timestamp': self.timestamp,
+            })
+            self._json = json.dumps(payload, default=str)
+        return self._json
 
     @classmethod
     def from_json(cls, raw: str) -> "Event":
-        """Deserialize from Redis pub/sub."""
+        """Deserialize from Redis pub/sub (the raw payload is reused for SSE)."""
         d = json.loads(raw)
-        return cls(
+        event = cls(
             type=EventType(d["type"]),
             data=d["data"],
             timestamp=d["timestamp"],
+            seq=d.get("seq"),
         )
+        event._json = raw
+        return event
+
+    @property
+    def coalesce_key(self) -> Optional[tuple]:
+        """Key under which a newer event replaces a pending one (None: never)."""
+        if self.type not in COALESCE_FIELDS:
+            return None
+        field_name = COALESCE_FIELDS[self.type]
+        if field_name is None:
+            return (self.type,)
+        value = self.data.get(field_name)
+        return (self.type, value) if value is not None else None
+
+
+class Subscription:
+    """
+    One subscriber's bounded pending-event buffer.
+
+    ``offer`` never blocks: a coalescible event replaces its pending
+    predecessor; otherwise, when full, the oldest pending event is dropped
+    (coalescible ones first).
+    """
+
+    def __init__(self, sub_id: str, user_id: Optional[str], topics: Set[str], maxsize: int = 100):
+        self.id = sub_id
+        self.user_id = user_id
+        self.topics = topics
+        self.maxsize = maxsize
+        self._pending: "OrderedDict[Any, Event]" = OrderedDict()
+        self._ready = asyncio.Event()
+        self._seq = 0
+
+        # Counters
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        return not self._pending
+
+    def offer(self, event: Event) -> None:
+        """Queue ``event`` without waiting (coalescing or dropping if needed)."""
+        key = event.coalesce_key
+        if key is not None and key in self._pending:
+            # Latest state wins; it takes the newer position in the stream
+            previous = self._pending.pop(key)
+            if event.type in COALESCE_MERGE:
+                event = Event(
+                    type=event.type,
+                    data={**previous.data, **event.data},
+                    timestamp=event.timestamp,
+                    seq=event.seq,
+                )
+            self.coalesced += 1
+        elif len(self._pending) >= self.maxsize:
+            victim = next((k for k, e in self._pending.items() if e.coalesce_key is not None), None)
+            if victim is None:
+                victim = next(iter(self._pending))
+            del self._pending[victim]
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning(f"Subscriber {self.id} falling behind, dropping events")
+
+        if key is None:
+            self._seq += 1
+            key = self._seq
+        self._pending[key] = event
+        self._ready.set()
+
+    async def get(self) -> Event:
+        """Wait for and return the oldest pending event."""
+        while not self._pending:
+            self._ready.clear()
+            await self._ready.wait()
+        _, event = self._pending.popitem(last=False)
+        self.delivered += 1
+        return event
 
 
 class EventManager:
@@ -74,14 +238,20 @@ class EventManager:
     Singleton pattern - one event manager per process.
 
     Usage:
-        async for event in event_manager.subscribe():
+        subscription = await event_manager.subscribe(user_id=user.user_id)
+        while True:
+            event = await subscription.get()
             yield event.to_sse()
 
-        await event_manager.publish(EventType.POSITION_OPENED, {...})
+        await event_manager.publish(EventType.POSITION_OPENED, {...}, user_id=user_id)
     """
 
     _instance: Optional['EventManager'] = None
 
+    SUBSCRIBER_BUFFER = 100
+    RECONNECT_MIN = 0.5
+    RECONNECT_MAX = 30.0
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
@@ -92,9 +262,11 @@ class EventManager:
         if self._initialized:
             return
 
-        self._subscribers: Dict[str, asyncio.Queue] = {}
+        self._subscribers: Dict[str, Subscription] = {}
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._user_channels: Dict[str, int] = {}  # channel -> local subscriptions
         self._subscriber_counter = 0
-        self._lock = asyncio.Lock()
+        self._pubsub = None
         self._initialized = True
 
         # Background tasks
@@ -124,30 +296,80 @@ class EventManager:
                     pass
 
         # Clear all subscribers
-        async with self._lock:
-            self._subscribers.clear()
+        self._subscribers.clear()
+        self._topics.clear()
+        self._user_channels.clear()
 
         logger.info("EventManager stopped")
 
     async def _redis_listener(self):
-        """Listen for events on Redis pub/sub and fan-out to local subscribers."""
+        """Listen on the broadcast and active user channels; fan out locally."""
         from shared.redis_client import get_redis
+        backoff = self.RECONNECT_MIN
+        while True:
+            pubsub = None
+            try:
+                redis = await get_redis()
+                pubsub = redis.pubsub()
+                await self._subscribe_channels(pubsub)
+                self._pubsub = pubsub
+                backoff = self.RECONNECT_MIN
+
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        try:
+                            event = Event.from_json(message["data"])
+                            self._fanout(event, message["channel"])
+                        except Exception as e:
+                            logger.error(f"Failed to process Redis event: {e}")
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                logger.error(f"Redis listener error: {e}")
+            finally:
+                self._pubsub = None
+                if pubsub is not None:
+                    await self._close_pubsub(pubsub)
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.RECONNECT_MAX)
+
+    async def _subscribe_channels(self, pubsub):
+        """
+        Subscribe a fresh pubsub to the broadcast and active user channels.
+
+        ``_acquire_channel``/``_release_channel`` calls made meanwhile only
+        update ``_user_channels`` (no pubsub yet), so loop until it matches
+        what was sent; there is no await between the final check and the
+        caller setting ``_pubsub``.
+        """
+        sent = set(self._user_channels)
+        await pubsub.subscribe(EVENTS_BROADCAST_CHANNEL, *sent)
+        while True:
+            pending = [c for c in self._user_channels if c not in sent]
+            dropped = [c for c in sent if c not in self._user_channels]
+            if not pending and not dropped:
+                return
+            if pending:
+                sent.update(pending)
+                await pubsub.subscribe(*pending)
+            if dropped:
+                sent.difference_update(dropped)
+                await pubsub.unsubscribe(*dropped)
+
+    @staticmethod
+    async def _close_pubsub(pubsub):
+        """Release a pubsub's connection back to the pool (best-effort)."""
         try:
-            redis = await get_redis()
-            pubsub = redis.pubsub()
-            await pubsub.subscribe(EVENTS_BROADCAST_CHANNEL)
-
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        event = Event.from_json(message["data"])
-                        await self._fanout(event)
-                    except Exception as e:
-                        logger.error(f"Failed to process Redis event: {e}")
-        except asyncio.CancelledError:
-            return
+            await pubsub.unsubscribe()
+        except Exception:
+            pass
+        try:
+            # aclose() is redis-py >= 5.0.1; reset() before that
+            close = getattr(pubsub, "aclose", None) or pubsub.reset
+            await close()
         except Exception as e:
-            logger.error(f"Redis listener error: {e}")
+            logger.warning(f"Failed to close Redis pubsub: {e}")
 
     async def _ping_loop(self):
         """Send ping events every 30 seconds to keep connections alive."""
@@ -160,86 +382,224 @@ class EventManager:
                     data={"message": "keepalive"},
                     timestamp=datetime.utcnow().isoformat(),
                 )
-                await self._fanout(event)
+                event.to_sse()
+                for subscription in tuple(self._subscribers.values()):
+                    subscription.offer(event)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Ping error: {e}")
 
-    async def subscribe(self) -> asyncio.Queue:
-        """Subscribe to events. Returns Queue that receives Event objects."""
-        async with self._lock:
-            self._subscriber_counter += 1
-            subscriber_id = f"sub_{self._subscriber_counter}"
-            queue = asyncio.Queue(maxsize=100)  # Backpressure
-            self._subscribers[subscriber_id] = queue
+    async def subscribe(
+        self,
+        user_id: Optional[str] = None,
+        position_ids: Iterable[str] = (),
+    ) -> Subscription:
+        """
+        Subscribe to events.
+
+        Args:
+            user_id: Receive this user's events (plus broadcasts).
+            position_ids: Narrow the user's events to these positions
+                (broadcasts still included). Requires ``user_id``.
+
+        Returns:
+            Subscription whose ``get()`` returns Event objects.
+        """
+        position_ids = list(position_ids)
+        if position_ids and user_id is None:
+            raise ValueError("position subscriptions require a user_id")
+
+        topics = {BROADCAST_TOPIC}
+        if position_ids:
+            topics.update(position_topic(user_id, pid) for pid in position_ids)
+        elif user_id is not None:
+            topics.add(user_topic(user_id))
+
+        self._subscriber_counter += 1
+        subscription = Subscription(
+            f"sub_{self._subscriber_counter}", user_id, topics, self.SUBSCRIBER_BUFFER
+        )
+        self._subscribers[subscription.id] = subscription
+        for topic in topics:
+            self._topics.setdefault(topic, set()).add(subscription)
+        if user_id is not None:
+            await self._acquire_channel(EVENTS_USER_CHANNEL_PREFIX + user_id)
 
-        logger.debug(f"New subscriber: {subscriber_id} (total: {len(self._subscribers)})")
+        logger.debug(f"New subscriber: {subscription.id} (total: {len(self._subscribers)})")
 
         # Send initial connection event
-        await queue.put(Event(
+        subscription.offer(Event(
             type=EventType.BOT_STATUS,
             data={"status": "connected", "message": "Event stream connected"},
             timestamp=datetime.utcnow().isoformat()
         ))
 
-        return queue
-
-    async def unsubscribe(self, queue: asyncio.Queue):
-        """Unsubscribe a queue."""
-        async with self._lock:
-            to_remove = None
-            for sub_id, sub_queue in self._subscribers.items():
-                if sub_queue is queue:
-                    to_remove = sub_id
-                    break
+        return subscription
 
-            if to_remove:
-                del self._subscribers[to_remove]
-                logger.debug(f"Subscriber removed: {to_remove} (total: {len(self._subscribers)})")
+    async def unsubscribe(self, subscription: Subscription):
+        """Unsubscribe a subscription."""
+        if self._subscribers.pop(subscription.id, None) is None:
+            return
+        for topic in subscription.topics:
+            members = self._topics.get(topic)
+            if members is not None:
+                members.discard(subscription)
+                if not members:
+                    del self._topics[topic]
+        if subscription.user_id is not None:
+            await self._release_channel(EVENTS_USER_CHANNEL_PREFIX + subscription.user_id)
+        logger.debug(f"Subscriber removed: {subscription.id} (total: {len(self._subscribers)})")
+
+    async def _acquire_channel(self, channel: str):
+        self._user_channels[channel] = self._user_channels.get(channel, 0) + 1
+        if self._user_channels[channel] == 1 and self._pubsub is not None:
+            try:
+                await self._pubsub.subscribe(channel)
+            except Exception as e:
+                # The listener resubscribes every active channel on reconnect
+                logger.warning(f"Redis subscribe to {channel} failed: {e}")
 
-    async def publish(self, event_type: EventType, data: Dict[str, Any]):
-        """Publish an event via Redis pub/sub (all instances receive it)."""
+    async def _release_channel(self, channel: str):
+        count = self._user_channels.get(channel, 0) - 1
+        if count > 0:
+            self._user_channels[channel] = count
+            return
+        self._user_channels.pop(channel, None)
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(channel)
+            except Exception as e:
+                logger.warning(f"Redis unsubscribe from {channel} failed: {e}")
+
+    async def publish(
+        self,
+        event_type: EventType,
+        data: Dict[str, Any],
+        user_id: Optional[str] = None,
+    ):
+        """
+        Publish an event via Redis pub/sub (all instances receive it).
+
+        Args:
+            event_type: Event type
+            data: Event payload
+            user_id: Deliver only to this user's subscribers; broadcast if None
+        """
         event = Event(
             type=event_type,
             data=data,
             timestamp=datetime.utcnow().isoformat()
         )
+        channel = EVENTS_USER_CHANNEL_PREFIX + user_id if user_id else EVENTS_BROADCAST_CHANNEL
 
         try:
             from shared.redis_client import get_redis
             redis = await get_redis()
-            await redis.publish(EVENTS_BROADCAST_CHANNEL, event.to_json())
+            if user_id and event_type != EventType.PING:
+                await redis.eval(
+                    EVENT_LOG_SCRIPT, 2,
+                    EVENTS_LOG_PREFIX + user_id, EVENTS_SEQ_PREFIX + user_id,
+                    event.to_json(), EVENT_LOG_MAXLEN, EVENT_LOG_TTL, channel,
+                )
+            else:
+                await redis.publish(channel, event.to_json())
         except Exception as e:
             # Fall back to local fanout if Redis is unavailable
             logger.warning(f"Redis publish failed, falling back to local: {e}")
-            await self._fanout(event)
+            self._fanout(event, channel)
 
         if event_type != EventType.PING:
-            logger.debug(f"Published {event_type.value} to {len(self._subscribers)} subscribers")
+            logger.debug(f"Published {event_type.value} to {channel}")
+
+    def _fanout(self, event: Event, channel: str = EVENTS_BROADCAST_CHANNEL):
+        """Offer an event to the local subscribers of its channel (never blocks)."""
+        if channel.startswith(EVENTS_USER_CHANNEL_PREFIX):
+            user_id = channel[len(EVENTS_USER_CHANNEL_PREFIX):]
+            recipients = set(self._topics.get(user_topic(user_id), ()))
+            position_id = event.data.get("position_id")
+            if position_id is not None:
+                recipients.update(self._topics.get(position_topic(user_id, str(position_id)), ()))
+        else:
+            recipients = self._topics.get(BROADCAST_TOPIC, ())
+
+        if not recipients:
+            return
+        event.to_sse()  # Serialize once before any subscriber reads it
+        for subscription in tuple(recipients):
+            subscription.offer(event)
+
+    async def current_seq(self, user_id: str) -> Optional[int]:
+        """Latest logged seq for a user (0 if none; None if Redis is unavailable)."""
+        try:
+            from shared.redis_client import get_redis
+            redis = await get_redis()
+            return int(await redis.get(EVENTS_SEQ_PREFIX + user_id) or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read event seq for {user_id}: {e}")
+            return None
+
+    async def replay(
+        self,
+        user_id: str,
+        last_seq: int,
+        position_ids: Iterable[str] = (),
+    ) -> Optional[List[Event]]:
+        """
+        Events logged for a user after ``last_seq``.
+
+        Args:
+            user_id: User whose log to read
+            last_seq: Last seq the client received
+            position_ids: Only return events for these positions
+
+        Returns:
+            The missed events in order, or None if they cannot all be
+            replayed (caller should send a snapshot instead)
+        """
+        current = await self.current_seq(user_id)
+        if current is None or last_seq > current:
+            return None  # Redis down, or the log was reset since
+        if last_seq == current:
+            return []
+        if current - last_seq > REPLAY_MAX:
+            return None
 
-    async def _fanout(self, event: Event):
-        """Fan out an event to all local subscribers."""
-        async with self._lock:
-            dead_subscribers = []
+        try:
+            from shared.redis_client import get_redis
+            redis = await get_redis()
+            entries = await redis.xrange(
+                EVENTS_LOG_PREFIX + user_id, min=f"{last_seq + 1}-0", max="+", count=REPLAY_MAX,
+            )
+        except Exception as e:
+            logger.warning(f"Event replay failed for {user_id}: {e}")
+            return None
 
-            for sub_id, queue in self._subscribers.items():
-                try:
-                    await asyncio.wait_for(queue.put(event), timeout=0.1)
-                except asyncio.TimeoutError:
-                    logger.warning(f"Subscriber {sub_id} queue full, dropping event")
-                except Exception as e:
-                    logger.error(f"Failed to send to subscriber {sub_id}: {e}")
-                    dead_subscribers.append(sub_id)
+        events = [Event.from_json(fields["event"]) for _, fields in entries]
+        if not events or events[0].seq != last_seq + 1:
+            return None  # The oldest missed events were trimmed
 
-            for sub_id in dead_subscribers:
-                del self._subscribers[sub_id]
-                logger.info(f"Removed dead subscriber: {sub_id}")
+        position_ids = set(position_ids)
+        if position_ids:
+            events = [e for e in events if str(e.data.get("position_id")) in position_ids]
+        return events
 
     def get_subscriber_count(self) -> int:
         """Get number of active subscribers."""
         return len(self._subscribers)
 
+    def get_stats(self) -> Dict[str, int]:
+        """Subscriber, topic and backpressure counters for the status endpoint."""
+        subscriptions = list(self._subscribers.values())
+        return {
+            "subscribers": len(subscriptions),
+            "topics": len(self._topics),
+            "user_channels": len(self._user_channels),
+            "pending": sum(s.qsize() for s in subscriptions),
+            "coalesced": sum(s.coalesced for s in subscriptions),
+            "dropped": sum(s.dropped for s in subscriptions),
+        }
+
 
 # Global event manager instance
 event_manager = EventManager()
@@ -248,24 +608,28 @@ event_manager = EventManager()
 # Helper functions for common events
 
 async def publish_position_opened(position_data: Dict[str, Any]):
-    """Publish position opened event."""
-    await event_manager.publish(EventType.POSITION_OPENED, position_data)
+    """Publish position opened event (to its owner, from ``user_id``)."""
+    await event_manager.publish(
+        EventType.POSITION_OPENED, position_data, user_id=position_data.get("user_id")
+    )
 
 
 async def publish_position_closed(position_id: str, pnl_data: Dict[str, Any]):
-    """Publish position closed event."""
+    """Publish position closed event (to its owner, from ``user_id``)."""
     await event_manager.publish(EventType.POSITION_CLOSED, {
         "position_id": position_id,
         **pnl_data
-    })
+    }, user_id=pnl_data.get("user_id"))
 
 
-async def publish_position_update(position_id: str, update_data: Dict[str, Any]):
+async def publish_position_update(
+    position_id: str, update_data: Dict[str, Any], user_id: Optional[str] = None
+):
     """Publish position update (PnL, health, etc)."""
     await event_manager.publish(EventType.POSITION_UPDATE, {
         "position_id": position_id,
         **update_data
-    })
+    }, user_id=user_id or update_data.get("user_id"))
 
 
 async def publish_rate_update(rates_data: Dict[str, Any]):
@@ -281,14 +645,18 @@ async def publish_bot_status(status: str, message: str = None):
     })
 
 
-async def publish_balance_update(balance_data: Dict[str, Any]):
+async def publish_balance_update(balance_data: Dict[str, Any], user_id: Optional[str] = None):
     """Publish wallet balance update."""
-    await event_manager.publish(EventType.BALANCE_UPDATE, balance_data)
+    await event_manager.publish(
+        EventType.BALANCE_UPDATE, balance_data, user_id=user_id or balance_data.get("user_id")
+    )
 
 
-async def publish_error(error_message: str, context: Dict[str, Any] = None):
+async def publish_error(
+    error_message: str, context: Dict[str, Any] = None, user_id: Optional[str] = None
+):
     """Publish error event."""
     await event_manager.publish(EventType.ERROR, {
         "message": error_message,
         "context": context or {}
-    })
+    }, user_id=user_id)
@@ -29,13 +29,15 @@ from backend.dashboard.dependencies import (
     set_bot_bridge, get_bot_bridge,
     set_position_monitor, get_position_monitor,
     set_intent_scanner, get_intent_scanner,
+    set_market_snapshots, get_market_snapshots,
 )
-from backend.dashboard.events_manager import event_manager
+from backend.dashboard.events_manager import event_manager, publish_position_update
 from shared.db.database import get_db, init_db
 from shared.db.migrations import run_migrations
 from bot.core.errors import register_exception_handlers
 from bot.core.position_monitor import PositionMonitorService
 from bot.core.intent_scanner import IntentScanner
+from bot.core.market_snapshot import MarketSnapshotService
 
 # Import API routers
 from backend.dashboard.api import status, positions, control, rates, settings as settings_api
@@ -74,6 +76,15 @@ async def _recover_stuck_jobs(db) -> int:
     return count
 
 
+# ---------------------------------------------------------------------------
+# Event publishing
+# ---------------------------------------------------------------------------
+
+async def _publish_position_update(user_id: str, position_id: str, updates: dict) -> None:
+    """Monitor callback: stream a position's changed live state to its owner."""
+    await publish_position_update(position_id, updates, user_id=user_id)
+
+
 # ---------------------------------------------------------------------------
 # Distributed lock helpers
 # ---------------------------------------------------------------------------
@@ -157,20 +168,53 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Bot bridge not available: {e}")
 
+    # Persist Hyperliquid funding history so restarts only fetch the tail
+    from bot.venues.hyperliquid.funding_cache import get_funding_history_cache
+    get_funding_history_cache().attach_db(db)
+
+    # Start shared market-data snapshot (one venue poll per tick for all consumers)
+    logger.info("Starting market snapshot service...")
+    market_snapshots = None
+    try:
+        market_snapshots = MarketSnapshotService()
+        await market_snapshots.start()
+        set_market_snapshots(market_snapshots)
+        logger.info("Market snapshot service started")
+    except Exception as e:
+        market_snapshots = None
+        logger.warning(f"Market snapshot service not started: {e}")
+
+    # Shared Hyperliquid websocket feed: mids, asset contexts, books and
+    # user fills are read from its store; REST is the fallback when stale
+    from bot.venues.hyperliquid.market_data import get_market_data_feed
+    market_data = get_market_data_feed()
+    try:
+        await market_data.start()
+        logger.info("Hyperliquid market data feed started")
+    except Exception as e:
+        logger.warning(f"Hyperliquid market data feed not started: {e}")
+
     # Start position monitor service (with distributed lock)
     logger.info("Starting position monitor service...")
     try:
-        monitor = PositionMonitorService(db=db)
+        monitor = PositionMonitorService(
+            db=db, concurrent=True, market_snapshots=market_snapshots,
+            market_data=market_data,
+            on_position_update=_publish_position_update,
+        )
         await monitor.start()
         set_position_monitor(monitor)
         logger.info("Position monitor service started")
     except Exception as e:
         logger.warning(f"Position monitor not started: {e}")
 
-    # Start intent scanner service (with distributed lock)
+    # Start intent scanner service (with distributed lock); the websocket
+    # stream fires intents as soon as prices/funding cross, polling is fallback
     logger.info("Starting intent scanner service...")
     try:
-        scanner = IntentScanner(db=db)
+        scanner = IntentScanner(
+            db=db, market_snapshots=market_snapshots, market_stream=market_data.ws,
+        )
         await scanner.start()
         set_intent_scanner(scanner)
         logger.info("Intent scanner service started")
@@ -202,6 +246,21 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Stop the market data feed (after its consumers)
+    try:
+        from bot.venues.hyperliquid.market_data import close_market_data_feed
+        await close_market_data_feed()
+    except Exception:
+        pass
+
+    # Stop market snapshot service (after its consumers)
+    try:
+        snapshots = get_market_snapshots()
+        if snapshots:
+            await snapshots.stop()
+    except Exception:
+        pass
+
     try:
         bridge = get_bot_bridge()
         if bridge:
@@ -209,6 +268,19 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Close balance clients, then the pooled venue connections they borrow
+    try:
+        from backend.dashboard.balance_service import close_balance_service
+        await close_balance_service()
+    except Exception:
+        pass
+
+    try:
+        from bot.venues.client_registry import close_client_registry
+        await close_client_registry()
+    except Exception:
+        pass
+
     # Stop event manager
     try:
         await event_manager.stop()
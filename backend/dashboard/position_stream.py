@@ -0,0 +1,185 @@
+"""
+Coalescing, delta-compressed position updates for one event stream.
+
+Each SSE connection owns a ``PositionStreamCoalescer``. ``position_update``
+events are not forwarded as they arrive:
+
+- Updates for the same position within ``window`` seconds are merged into
+  one pending state.
+- When the window closes, the client gets either a keyframe (the full
+  merged state, as a regular ``position_update``) or, if it already holds a
+  frame for that position, a ``position_delta`` carrying only the fields
+  that changed as JSON-patch-style operations against that frame.
+- A keyframe is re-sent every ``keyframe_interval`` seconds per position so
+  clients self-heal from any missed or misapplied delta.
+
+Positions whose merged state did not change produce no frame at all.
+
+Usage:
+    coalescer = PositionStreamCoalescer(window=1.0, keyframe_interval=60.0)
+    if coalescer.add(event):            # position_update: held back
+        ...
+    frames = coalescer.flush()          # once coalescer.next_flush_in() == 0
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from backend.dashboard.events_manager import Event, EventType
+
+DEFAULT_WINDOW = 1.0  # seconds
+DEFAULT_KEYFRAME_INTERVAL = 60.0  # seconds
+
+_MISSING = object()
+
+
+def diff_ops(previous: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """JSON-patch-style operations turning ``previous`` into ``current`` (top level)."""
+    ops = []
+    for key, value in current.items():
+        old = previous.get(key, _MISSING)
+        if old is _MISSING:
+            ops.append({"op": "add", "path": f"/{key}", "value": value})
+        elif old != value:
+            ops.append({"op": "replace", "path": f"/{key}", "value": value})
+    for key in previous:
+        if key not in current:
+            ops.append({"op": "remove", "path": f"/{key}"})
+    return ops
+
+
+class _Pending:
+    __slots__ = ("data", "seq", "timestamp", "due")
+
+    def __init__(self, due: float):
+        self.data: Dict[str, Any] = {}
+        self.seq: Optional[int] = None
+        self.timestamp = ""
+        self.due = due
+
+
+class PositionStreamCoalescer:
+    """
+    Per-subscriber merge window and frame cache for position updates.
+
+    Args:
+        window: Seconds updates for one position are merged before sending.
+        keyframe_interval: Seconds after which a position's next frame is a
+            full keyframe instead of a delta.
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        keyframe_interval: float = DEFAULT_KEYFRAME_INTERVAL,
+        clock=time.monotonic,
+    ):
+        self.window = window
+        self.keyframe_interval = keyframe_interval
+        self._clock = clock
+        self._pending: Dict[str, _Pending] = {}
+        # Last state the client saw per position, and when it got a keyframe
+        self._frames: Dict[str, Dict[str, Any]] = {}
+        self._keyframe_at: Dict[str, float] = {}
+
+        # Counters
+        self.merged = 0
+        self.keyframes = 0
+        self.deltas = 0
+        self.unchanged = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, event: Event) -> bool:
+        """
+        Hold back a position update for the merge window.
+
+        Returns:
+            False if ``event`` is not a position update (send it as is).
+        """
+        position_id = event.data.get("position_id")
+        if event.type != EventType.POSITION_UPDATE or position_id is None:
+            return False
+
+        position_id = str(position_id)
+        pending = self._pending.get(position_id)
+        if pending is None:
+            pending = self._pending[position_id] = _Pending(self._clock() + self.window)
+        else:
+            self.merged += 1
+        pending.data.update(event.data)
+        pending.timestamp = event.timestamp
+        if event.seq is not None:
+            pending.seq = max(pending.seq or 0, event.seq)
+        return True
+
+    def next_flush_in(self) -> Optional[float]:
+        """Seconds until the earliest window closes (None if nothing pending)."""
+        if not self._pending:
+            return None
+        due = min(p.due for p in self._pending.values())
+        return max(0.0, due - self._clock())
+
+    def flush(self, force: bool = False) -> List[Event]:
+        """
+        Frames for every position whose window closed (all pending if ``force``).
+
+        Returns:
+            Keyframe / delta events in seq order.
+        """
+        now = self._clock()
+        ready = [
+            position_id for position_id, pending in self._pending.items()
+            if force or pending.due <= now
+        ]
+        frames = []
+        for position_id in ready:
+            frame = self._frame(position_id, self._pending.pop(position_id), now)
+            if frame is not None:
+                frames.append(frame)
+        frames.sort(key=lambda e: e.seq or 0)
+        return frames
+
+    def reset(self) -> None:
+        """Forget every frame (the client resynced from a snapshot)."""
+        self._frames.clear()
+        self._keyframe_at.clear()
+
+    def forget(self, position_id: str) -> None:
+        """Drop a position's frame state (e.g. once it is closed)."""
+        position_id = str(position_id)
+        self._pending.pop(position_id, None)
+        self._frames.pop(position_id, None)
+        self._keyframe_at.pop(position_id, None)
+
+    def _frame(self, position_id: str, pending: _Pending, now: float) -> Optional[Event]:
+        previous = self._frames.get(position_id)
+        keyframe_due = now - self._keyframe_at.get(position_id, float("-inf")) >= self.keyframe_interval
+        state = pending.data if previous is None else {**previous, **pending.data}
+
+        if previous is None or keyframe_due:
+            self._frames[position_id] = state
+            self._keyframe_at[position_id] = now
+            self.keyframes += 1
+            return Event(
+                type=EventType.POSITION_UPDATE,
+                data=state,
+                timestamp=pending.timestamp,
+                seq=pending.seq,
+            )
+
+        ops = diff_ops(previous, state)
+        if not ops:
+            self.unchanged += 1
+            return None
+        self._frames[position_id] = state
+        self.deltas += 1
+        return Event(
+            type=EventType.POSITION_DELTA,
+            data={"position_id": position_id, "ops": ops},
+            timestamp=pending.timestamp,
+            seq=pending.seq,
+        )
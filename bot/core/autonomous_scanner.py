@@ -6,8 +6,9 @@ trading enabled. Runs alongside (not replacing) the IntentScanner which
 handles manually-created intents.
 
 Each scan cycle:
-1. Fetch global market data once (funding rates, protocol rates)
-2. Query all users with ``enabled = TRUE`` in ``user_strategy_config``
+1. Query all users with ``enabled = TRUE`` in ``user_strategy_config``
+2. Fetch global market data once (funding rates, plus funding volatility
+   for the assets those users have enabled, from a rolling NumPy store)
 3. For each user (with PG advisory lock per N11):
    a. Check: paused? cooldown? balance? position count?
    b. Evaluate opportunity against user's entry thresholds
@@ -18,7 +19,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from shared.config.strategy_defaults import (
     SYSTEM_MIN_COOLDOWN_MINUTES,
@@ -37,12 +38,18 @@ class AutonomousScanner:
     MAX_ERRORS_BEFORE_BACKOFF = 5
     BACKOFF_INTERVAL = 300
 
-    def __init__(self, db, user_risk_manager=None):
+    def __init__(self, db, user_risk_manager=None, market_snapshots=None):
         self.db = db
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._consecutive_errors = 0
         self._user_risk_manager = user_risk_manager
+        # Optional MarketSnapshotService shared with the monitor/dashboard
+        self._market_snapshots = market_snapshots
+        # Long-lived HL client so each cycle reuses one HTTP session
+        self._hl_client = None
+        # Rolling funding-history matrix; only the hourly tail is fetched
+        self._funding_store = None
 
     async def start(self):
         if self._running:
@@ -59,6 +66,12 @@ class AutonomousScanner:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        if self._hl_client is not None:
+            try:
+                await self._hl_client.close()
+            except Exception:
+                pass
+            self._hl_client = None
         logger.info("AutonomousScanner stopped")
 
     # ------------------------------------------------------------------
@@ -86,18 +99,23 @@ class AutonomousScanner:
     async def _scan_cycle(self):
         """Single autonomous scan cycle."""
 
-        # 1. Fetch global market data once
-        market_data = await self._fetch_market_data()
-        if market_data is None:
-            logger.debug("No market data available, skipping cycle")
-            return
-
-        # 2. Get all enabled, non-paused users with their strategy configs
+        # 1. Get all enabled, non-paused users with their strategy configs
         users = await self._get_enabled_users()
         if not users:
             logger.debug("No enabled autonomous users")
             return
 
+        # 2. Fetch global market data once, for the assets users trade
+        assets = {
+            asset
+            for user_row in users
+            for asset in (user_row.get("assets") or ["SOL"])
+        }
+        market_data = await self._fetch_market_data(assets)
+        if market_data is None:
+            logger.debug("No market data available, skipping cycle")
+            return
+
         logger.info("Autonomous scan: %d enabled users, evaluating...", len(users))
 
         # 3. Evaluate each user
@@ -114,24 +132,39 @@ class AutonomousScanner:
     # Market data
     # ------------------------------------------------------------------
 
-    async def _fetch_market_data(self) -> Optional[Dict[str, Any]]:
-        """Fetch global market data for opportunity evaluation."""
+    async def _fetch_market_data(
+        self, assets: Optional[Set[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch global market data for opportunity evaluation.
+
+        Volatility is only computed for ``assets`` (the union of enabled
+        users' assets) that Hyperliquid actually lists.
+        """
         try:
-            from bot.venues.hyperliquid.client import HyperliquidClient
+            from bot.venues.client_registry import get_client_registry
             from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
-            from bot.venues.asgard.market_data import AsgardMarketData
+            from bot.venues.hyperliquid.funding_store import FundingHistoryStore
 
-            hl_client = HyperliquidClient()
-            oracle = HyperliquidFundingOracle(hl_client)
-            asgard = AsgardMarketData()
+            if self._hl_client is None:
+                self._hl_client = get_client_registry().hyperliquid_client()
+            if self._funding_store is None:
+                self._funding_store = FundingHistoryStore(self._hl_client)
 
-            funding_rates = await oracle.get_current_funding_rates()
-            volatilities = {}
-            for coin in funding_rates:
-                try:
-                    volatilities[coin] = await oracle.calculate_funding_volatility(coin)
-                except Exception:
-                    volatilities[coin] = 1.0  # Default to high volatility
+            if self._market_snapshots is not None:
+                snapshot = await self._market_snapshots.get()
+                funding_rates = dict(snapshot.funding_rates)
+            else:
+                oracle = HyperliquidFundingOracle(self._hl_client)
+                funding_rates = await oracle.get_current_funding_rates()
+
+            tracked = sorted(
+                coin for coin in funding_rates
+                if assets is None or coin in assets
+            )
+            await self._funding_store.sync(tracked)
+            computed = self._funding_store.volatilities(tracked)
+            # Default to high volatility when a coin has no history
+            volatilities = {coin: computed.get(coin, 1.0) for coin in tracked}
 
             return {
                 "funding_rates": funding_rates,
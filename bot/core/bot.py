@@ -46,7 +46,7 @@ from shared.config.assets import Asset
 from shared.config.settings import get_settings
 from bot.core.kill_switch import KillSwitchMonitor, KillSwitchTrigger
 from bot.core.opportunity_detector import OpportunityDetector
-from bot.core.pause_controller import PauseController, PauseScope, CircuitBreakerType
+from bot.core.pause_controller import PauseController, PauseScope, PauseState, CircuitBreakerType
 from bot.core.position_manager import PositionManager
 from bot.core.position_sizer import PositionSizer
 from bot.core.risk_engine import RiskEngine, ExitDecision, ExitReason
@@ -173,6 +173,8 @@ class DeltaNeutralBot:
         self._opportunity_callbacks: List[Callable[[ArbitrageOpportunity], None]] = []
         self._position_opened_callbacks: List[Callable[[CombinedPosition], None]] = []
         self._position_closed_callbacks: List[Callable[[CombinedPosition, str], None]] = []
+        self._position_updated_callbacks: List[Callable[[CombinedPosition], None]] = []
+        self._pause_state_callbacks: List[Callable[[PauseState], None]] = []
         
         logger.info("DeltaNeutralBot initialized")
     
@@ -215,6 +217,10 @@ class DeltaNeutralBot:
             import secrets
             api_key = f"temp_{secrets.token_hex(16)}"
         self._pause_controller = PauseController(admin_api_key=api_key)
+        self._pause_controller.add_pause_callback(self._notify_pause_state)
+        self._pause_controller.add_resume_callback(
+            lambda: self._notify_pause_state(self._pause_controller.get_pause_state())
+        )
         
         # Initialize position manager (with async context)
         self._position_manager = PositionManager(
@@ -246,6 +252,10 @@ class DeltaNeutralBot:
             hyperliquid_oracle=hyperliquid_oracle,
         )
         
+        # Push position and pause-state changes to the internal event feed
+        from bot.core.internal_api import attach_event_feed
+        attach_event_feed(self)
+        
         # Setup signal handlers
         self._setup_signal_handlers()
         
@@ -570,6 +580,21 @@ class DeltaNeutralBot:
             
             # Execute exit
             await self._execute_exit(position, exit_decision.reason.value)
+            return
+        
+        for callback in self._position_updated_callbacks:
+            try:
+                callback(position)
+            except Exception as e:
+                logger.error(f"Position updated callback error: {e}")
+    
+    def _notify_pause_state(self, state: PauseState):
+        """Forward pause controller changes (admin or circuit breaker)."""
+        for callback in self._pause_state_callbacks:
+            try:
+                callback(state)
+            except Exception as e:
+                logger.error(f"Pause state callback error: {e}")
     
     async def _scan_cycle(self):
         """Single scanning cycle."""
@@ -784,6 +809,14 @@ class DeltaNeutralBot:
         """Add callback for position closed."""
         self._position_closed_callbacks.append(callback)
     
+    def add_position_updated_callback(self, callback: Callable[[CombinedPosition], None]):
+        """Add callback for each monitored position that stays open."""
+        self._position_updated_callbacks.append(callback)
+    
+    def add_pause_state_callback(self, callback: Callable[[PauseState], None]):
+        """Add callback for pause, resume and circuit breaker changes."""
+        self._pause_state_callbacks.append(callback)
+    
     async def pause(self, api_key: str, reason: str, scope: PauseScope = PauseScope.ALL):
         """Pause bot operations."""
         return self._pause_controller.pause(api_key, reason, scope)
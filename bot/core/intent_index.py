@@ -0,0 +1,245 @@
+"""
+Threshold index over open position intents.
+
+Every scannable intent carries three entry thresholds — a funding rate
+ceiling (``min_funding_rate``, the least negative rate the user accepts),
+a ``max_funding_volatility`` and an optional ``max_entry_price``. Each
+threshold is an "at least X" condition on the intent side:
+
+    current_rate <= funding_threshold
+    volatility   <= max_funding_volatility
+    price        <= max_entry_price
+
+so for a given market value the passing intents are exactly a suffix of
+the intents sorted by that threshold. ``IntentIndex`` keeps one sorted
+list per asset and criterion; matching bisects each list (O(log n)),
+walks only the shortest passing suffix and checks the remaining two
+thresholds per candidate. Evaluation cost is bounded by the number of
+intents that can trigger, not by the number of open intents.
+
+The index is kept in sync incrementally (``add``/``remove`` on create,
+cancel, expiry and execution) and can be rebuilt from rows with
+``replace``. Expiry is tracked in a min-heap so ``pop_expired`` only
+touches intents that are actually due.
+
+Usage:
+    index = IntentIndex()
+    index.replace(rows)
+    if index.has_funding_candidates("SOL", rate):
+        for intent in index.match("SOL", rate, price, volatility):
+            ...
+"""
+import heapq
+import math
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_MAX_FUNDING_VOLATILITY = 0.50
+
+
+def _parse_datetime(val) -> Optional[datetime]:
+    """Parse a datetime string from the database."""
+    if val is None:
+        return None
+    if isinstance(val, datetime):
+        return val
+    try:
+        return datetime.fromisoformat(str(val))
+    except (ValueError, TypeError):
+        return None
+
+
+@dataclass
+class IndexedIntent:
+    """An open intent and its normalised entry thresholds."""
+    id: str
+    asset: str
+    row: Dict[str, Any]
+    funding_threshold: float  # Passes when current_rate <= this (and < 0)
+    max_volatility: float
+    max_price: float  # +inf when no price limit
+    expires_at: Optional[datetime]
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "IndexedIntent":
+        min_rate = row.get("min_funding_rate")
+        # Funding must be negative regardless of the user's threshold
+        funding_threshold = 0.0 if min_rate is None else min(float(min_rate), 0.0)
+        max_price = row.get("max_entry_price")
+        return cls(
+            id=row["id"],
+            asset=row["asset"],
+            row=dict(row),
+            funding_threshold=funding_threshold,
+            max_volatility=float(
+                row.get("max_funding_volatility") or DEFAULT_MAX_FUNDING_VOLATILITY
+            ),
+            max_price=math.inf if max_price is None else float(max_price),
+            expires_at=_parse_datetime(row.get("expires_at")),
+        )
+
+    def passes(self, rate: float, price: Optional[float], volatility: float) -> bool:
+        if not rate < 0 or rate > self.funding_threshold:
+            return False
+        if volatility > self.max_volatility:
+            return False
+        if self.max_price != math.inf and (price is None or price > self.max_price):
+            return False
+        return True
+
+
+class _Thresholds:
+    """(threshold, intent_id) pairs sorted ascending."""
+
+    def __init__(self):
+        self._items: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, threshold: float, intent_id: str) -> None:
+        insort(self._items, (threshold, intent_id))
+
+    def remove(self, threshold: float, intent_id: str) -> None:
+        i = bisect_left(self._items, (threshold, intent_id))
+        if i < len(self._items) and self._items[i] == (threshold, intent_id):
+            del self._items[i]
+
+    def start(self, value: float) -> int:
+        """Index of the first threshold >= value."""
+        return bisect_left(self._items, (value, ""))
+
+    def ids_from(self, start: int) -> Iterator[str]:
+        for i in range(start, len(self._items)):
+            yield self._items[i][1]
+
+
+class _AssetIndex:
+    def __init__(self):
+        self.funding = _Thresholds()
+        self.volatility = _Thresholds()
+        self.price = _Thresholds()
+
+    def add(self, intent: IndexedIntent) -> None:
+        self.funding.add(intent.funding_threshold, intent.id)
+        self.volatility.add(intent.max_volatility, intent.id)
+        self.price.add(intent.max_price, intent.id)
+
+    def remove(self, intent: IndexedIntent) -> None:
+        self.funding.remove(intent.funding_threshold, intent.id)
+        self.volatility.remove(intent.max_volatility, intent.id)
+        self.price.remove(intent.max_price, intent.id)
+
+
+class IntentIndex:
+    """Per-asset sorted threshold indexes over open intents."""
+
+    def __init__(self):
+        self._intents: Dict[str, IndexedIntent] = {}
+        self._assets: Dict[str, _AssetIndex] = {}
+        self._expiry: List[Tuple[datetime, str]] = []
+
+        # Counters
+        self.evaluated = 0  # Candidates whose thresholds were checked
+        self.matched = 0
+
+    def __len__(self) -> int:
+        return len(self._intents)
+
+    def __contains__(self, intent_id: str) -> bool:
+        return intent_id in self._intents
+
+    def get(self, intent_id: str) -> Optional[IndexedIntent]:
+        return self._intents.get(intent_id)
+
+    def assets(self) -> List[str]:
+        """Assets with at least one open intent."""
+        return [asset for asset, idx in self._assets.items() if len(idx.funding)]
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def add(self, row: Dict[str, Any]) -> IndexedIntent:
+        """Index an intent row (replacing any previous version of it)."""
+        self.remove(row["id"])
+        intent = IndexedIntent.from_row(row)
+        self._intents[intent.id] = intent
+        self._assets.setdefault(intent.asset, _AssetIndex()).add(intent)
+        if intent.expires_at is not None:
+            heapq.heappush(self._expiry, (intent.expires_at, intent.id))
+        return intent
+
+    def remove(self, intent_id: str) -> Optional[IndexedIntent]:
+        """Drop an intent (cancelled, expired, executed or failed)."""
+        intent = self._intents.pop(intent_id, None)
+        if intent is not None:
+            self._assets[intent.asset].remove(intent)
+        # Expiry heap entries are discarded lazily in pop_expired
+        return intent
+
+    def replace(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the whole index from the current set of open intents."""
+        self._intents.clear()
+        self._assets.clear()
+        self._expiry = []
+        for row in rows:
+            self.add(row)
+
+    def pop_expired(self, now: datetime) -> List[str]:
+        """Remove and return intents whose expiry is at or before ``now``."""
+        expired = []
+        while self._expiry and self._expiry[0][0] < now:
+            expires_at, intent_id = heapq.heappop(self._expiry)
+            intent = self._intents.get(intent_id)
+            if intent is None or intent.expires_at != expires_at:
+                continue  # Stale heap entry
+            self.remove(intent_id)
+            expired.append(intent_id)
+        return expired
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def has_funding_candidates(self, asset: str, rate: Optional[float]) -> bool:
+        """Whether any intent on ``asset`` accepts this funding rate."""
+        idx = self._assets.get(asset)
+        if idx is None or rate is None or not rate < 0:
+            return False
+        return idx.funding.start(rate) < len(idx.funding)
+
+    def match(
+        self,
+        asset: str,
+        rate: Optional[float],
+        price: Optional[float],
+        volatility: float,
+    ) -> List[IndexedIntent]:
+        """
+        Intents on ``asset`` whose thresholds are all satisfied.
+
+        Only the shortest of the three passing suffixes is walked.
+        """
+        if not self.has_funding_candidates(asset, rate):
+            return []
+        idx = self._assets[asset]
+
+        suffixes = [
+            (idx.funding, idx.funding.start(rate)),
+            (idx.volatility, idx.volatility.start(volatility)),
+            # Without a price only unlimited intents (+inf) can pass
+            (idx.price, idx.price.start(math.inf if price is None else price)),
+        ]
+        thresholds, start = min(suffixes, key=lambda s: len(s[0]) - s[1])
+
+        matched = []
+        for intent_id in thresholds.ids_from(start):
+            intent = self._intents[intent_id]
+            self.evaluated += 1
+            if intent.passes(rate, price, volatility):
+                matched.append(intent)
+        self.matched += len(matched)
+        return matched
@@ -12,11 +12,24 @@ Entry criteria checked per intent:
 3. Entry price: current price must be below max_entry_price if specified.
 4. Expiry: intent must not have expired.
 
+Open intents live in an in-memory IntentIndex (per-asset sorted
+thresholds), loaded once and kept in sync incrementally: the intents API
+calls ``on_intent_created``/``on_intent_cancelled``, each cycle picks up
+new ``pending`` rows created elsewhere, and a full reload runs every
+RESYNC_INTERVAL seconds as a safety net.
+
+With a ``market_stream`` (HyperliquidWebSocket) the scanner also runs in
+trigger mode: it subscribes to ``allMids`` and ``activeAssetCtx`` for every
+indexed asset and re-matches an asset as soon as its mid or funding rate
+changes, so an intent fires within milliseconds of its condition becoming
+true. The polling cycle below keeps running as the fallback.
+
 Runs every SCAN_INTERVAL seconds:
-1. Fetch all pending/active intents from DB
-2. Expire any past-due intents
-3. For each remaining intent, check entry criteria
-4. Execute position when all criteria pass
+1. Sync the index (new pending intents, periodic full reload)
+2. Expire past-due intents (expiry heap; only due intents are touched)
+3. Read one shared market snapshot (funding + mids) for the tick
+4. Match each asset's funding/price/volatility against the index
+5. Confirm and execute only the intents whose thresholds were crossed
 
 Usage:
     scanner = IntentScanner(db=db)
@@ -27,11 +40,13 @@ Usage:
 import asyncio
 import json
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from bot.venues.user_context import UserTradingContext
+from bot.core.intent_index import IndexedIntent, IntentIndex, _parse_datetime
 from bot.core.position_manager import PositionManager
 
 logger = logging.getLogger(__name__)
@@ -53,12 +68,40 @@ class IntentScanner:
     SCAN_INTERVAL = 60  # seconds between scans
     MAX_ERRORS_BEFORE_BACKOFF = 5
     BACKOFF_INTERVAL = 180  # seconds to wait after too many errors
+    RESYNC_INTERVAL = 600  # seconds between full index reloads
+    VOLATILITY_TTL = 300  # seconds a per-asset funding volatility is reused
+
+    INTENT_COLUMNS = (
+        "id, user_id, asset, leverage, size_usd, min_funding_rate, "
+        "max_funding_volatility, max_entry_price, status, expires_at, created_at"
+    )
 
-    def __init__(self, db):
+    def __init__(self, db, market_snapshots=None, market_stream=None):
         self.db = db
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._consecutive_errors = 0
+        # Optional MarketSnapshotService: funding and mids read once per tick
+        self._market_snapshots = market_snapshots
+        # Long-lived HL client shared by every intent check
+        self._hl_client = None
+
+        # Open intents indexed by entry thresholds
+        self.index = IntentIndex()
+        self._last_resync: Optional[float] = None
+        self._volatility: Dict[str, Tuple[float, float]] = {}  # asset -> (value, at)
+        # Intents currently being confirmed/executed (poll and stream share it)
+        self._executing: Set[str] = set()
+
+        # Trigger mode: optional HyperliquidWebSocket with live mids/funding
+        self._stream = market_stream
+        self._live_mids: Dict[str, float] = {}
+        self._live_funding: Dict[str, float] = {}
+        self._dirty_assets: Dict[str, float] = {}  # asset -> first update (monotonic)
+        self._wake = asyncio.Event()
+        self._trigger_task: Optional[asyncio.Task] = None
+        self._executions: Set[asyncio.Task] = set()
+        self.stream_triggers = 0
 
     async def start(self):
         """Start the scanner loop as a background task."""
@@ -68,17 +111,38 @@ class IntentScanner:
 
         self._running = True
         self._task = asyncio.create_task(self._run_loop())
-        logger.info("IntentScanner started (interval=%ds)", self.SCAN_INTERVAL)
+        if self._stream is not None:
+            self._stream.add_listener(self._on_stream_message)
+            await self._ensure_subscriptions()
+            await self._stream.start()
+            self._trigger_task = asyncio.create_task(self._trigger_loop())
+        logger.info(
+            "IntentScanner started (interval=%ds, trigger=%s)",
+            self.SCAN_INTERVAL, "stream" if self._stream is not None else "poll",
+        )
 
     async def stop(self):
         """Stop the scanner loop."""
         self._running = False
-        if self._task:
-            self._task.cancel()
+        tasks = [t for t in (self._task, self._trigger_task) if t is not None]
+        tasks.extend(self._executions)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
             try:
-                await self._task
+                await task
             except asyncio.CancelledError:
                 pass
+        self._trigger_task = None
+        if self._stream is not None:
+            # The stream itself belongs to whoever created it
+            self._stream.remove_listener(self._on_stream_message)
+        if self._hl_client is not None:
+            try:
+                await self._hl_client.close()
+            except Exception:
+                pass
+            self._hl_client = None
         logger.info("IntentScanner stopped")
 
     async def _run_loop(self):
@@ -110,33 +174,296 @@ class IntentScanner:
         """
         Single scan cycle.
 
-        1. Fetch all scannable intents (pending + active)
+        1. Sync the intent index with the DB
         2. Expire any past-due intents
-        3. Activate pending intents
-        4. Check criteria and execute if ready
+        3. Match the tick's market data against the index
+        4. Confirm criteria and execute the intents that triggered
         """
-        rows = await self.db.fetchall(
-            """SELECT * FROM position_intents
-               WHERE status IN ('pending', 'active')
-               ORDER BY created_at ASC"""
-        )
+        await self._sync_index()
 
-        if not rows:
+        if not len(self.index):
             logger.debug("No scannable intents")
             return
 
-        logger.info("Scanning %d intents", len(rows))
-
         now = datetime.utcnow()
+        for intent_id in self.index.pop_expired(now):
+            try:
+                await self._expire_intent(intent_id)
+            except Exception as e:
+                logger.error("Error expiring intent %s: %s", intent_id, e)
+
+        await self._ensure_subscriptions()
+
+        triggered = await self._match_intents()
+        logger.info(
+            "Scanned %d intents: %d triggered", len(self.index), len(triggered),
+        )
+        await self._fire(triggered, now)
+
+    async def _fire(
+        self,
+        triggered: List[Tuple[IndexedIntent, Dict[str, Any]]],
+        now: datetime,
+    ):
+        """Confirm and execute triggered intents (each at most once at a time)."""
+        triggered = [(i, m) for i, m in triggered if i.id not in self._executing]
+        if not triggered:
+            return
+        ids = [intent.id for intent, _ in triggered]
+        self._executing.update(ids)
+        try:
+            # Drop intents cancelled elsewhere since the last sync
+            rows = await self.db.fetchall(
+                """SELECT id FROM position_intents
+                   WHERE id = ANY($1::text[]) AND status IN ('pending', 'active')""",
+                (ids,),
+            )
+            still_open = {row["id"] for row in rows}
 
-        for row in rows:
+            for intent, market in triggered:
+                if intent.id not in still_open:
+                    self.index.remove(intent.id)
+                    continue
+                try:
+                    await self._process_intent(intent.row, now, **market)
+                except Exception as e:
+                    logger.error("Error processing intent %s: %s", intent.id, e)
+        finally:
+            self._executing.difference_update(ids)
+
+    async def _sync_index(self):
+        """Load new intents; fully reload every RESYNC_INTERVAL seconds."""
+        full = (
+            self._last_resync is None
+            or time.monotonic() - self._last_resync >= self.RESYNC_INTERVAL
+        )
+        if full:
+            rows = await self.db.fetchall(
+                f"""SELECT {self.INTENT_COLUMNS} FROM position_intents
+                    WHERE status IN ('pending', 'active')
+                    ORDER BY created_at ASC"""
+            )
+            self.index.replace(rows)
+            self._last_resync = time.monotonic()
+        else:
+            rows = await self.db.fetchall(
+                f"""SELECT {self.INTENT_COLUMNS} FROM position_intents
+                    WHERE status = 'pending'
+                    ORDER BY created_at ASC"""
+            )
+            for row in rows:
+                self.index.add(row)
+
+        # Activate new intents in one statement
+        pending = [row["id"] for row in rows if row["status"] == "pending"]
+        if pending:
+            await self.db.execute(
+                """UPDATE position_intents
+                   SET status = 'active', activated_at = NOW()
+                   WHERE id = ANY($1::text[]) AND status = 'pending'""",
+                (pending,),
+            )
+            for intent_id in pending:
+                intent = self.index.get(intent_id)
+                if intent is not None:
+                    intent.row["status"] = "active"
+            logger.info("Activated %d intents", len(pending))
+
+    async def _match_intents(self) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        Match one market snapshot against the index.
+
+        Volatility is only computed for assets whose funding rate can
+        trigger at least one intent.
+
+        Returns:
+            (intent, market) pairs, where market holds the snapshot and
+            volatility to confirm criteria with.
+        """
+        snapshot = await self._market_snapshot()
+        triggered = []
+        for asset in self.index.assets():
+            rate_info = snapshot.funding_rates.get(asset)
+            rate = None
+            if rate_info is not None:
+                rate = (
+                    rate_info.funding_rate
+                    if hasattr(rate_info, "funding_rate")
+                    else float(rate_info)
+                )
+            price = snapshot.mids.get(asset)
+            price = float(price) if price is not None else None
+            intents, volatility = await self._evaluate_asset(asset, rate, price)
+            market = {"snapshot": snapshot, "volatility": volatility}
+            triggered.extend((intent, market) for intent in intents)
+        return triggered
+
+    async def _evaluate_asset(
+        self,
+        asset: str,
+        rate: Optional[float],
+        price: Optional[float],
+    ) -> Tuple[List[IndexedIntent], Optional[float]]:
+        """Intents on ``asset`` triggered by this rate/price, plus the volatility used."""
+        if not self.index.has_funding_candidates(asset, rate):
+            return [], None
+        volatility = await self._asset_volatility(asset)
+        if volatility is None:
+            return [], None
+        return self.index.match(asset, rate, price, volatility), volatility
+
+    async def _asset_volatility(self, asset: str) -> Optional[float]:
+        """1-week funding volatility, reused for VOLATILITY_TTL seconds."""
+        cached = self._volatility.get(asset)
+        if cached is not None and time.monotonic() - cached[1] < self.VOLATILITY_TTL:
+            return cached[0]
+        try:
+            volatility = await self._get_oracle().calculate_funding_volatility(asset)
+        except Exception as e:
+            logger.warning("Funding volatility unavailable for %s: %s", asset, e)
+            return None
+        self._volatility[asset] = (volatility, time.monotonic())
+        return volatility
+
+    async def _market_snapshot(self):
+        """Funding rates and mids for this tick (fetched once, not per intent)."""
+        if self._market_snapshots is not None:
+            return await self._market_snapshots.get()
+
+        from bot.core.market_snapshot import MarketSnapshot
+
+        rates, mids = await asyncio.gather(
+            self._get_oracle().get_current_funding_rates(),
+            self._get_client().get_all_mids(),
+        )
+        return MarketSnapshot(
+            version=0,
+            fetched_at=time.time(),
+            funding_rates=rates,
+            mids={coin: float(px) for coin, px in mids.items()},
+        )
+
+    def _get_client(self):
+        if self._hl_client is None:
+            from bot.venues.client_registry import get_client_registry
+            self._hl_client = get_client_registry().hyperliquid_client()
+        return self._hl_client
+
+    def _get_oracle(self):
+        from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
+        return HyperliquidFundingOracle(self._get_client())
+
+    # ------------------------------------------------------------------
+    # Trigger mode (live stream)
+    # ------------------------------------------------------------------
+
+    async def _ensure_subscriptions(self):
+        """Subscribe to mids and the asset context of every indexed asset."""
+        if self._stream is None:
+            return
+        await self._stream.subscribe({"type": "allMids"})
+        for asset in self.index.assets():
+            await self._stream.subscribe({"type": "activeAssetCtx", "coin": asset})
+
+    def _on_stream_message(self, channel: str, data: Any):
+        """Record live values and flag assets whose inputs changed."""
+        if channel == "allMids":
+            mids = (data or {}).get("mids", {})
+            for asset in self.index.assets():
+                px = mids.get(asset)
+                if px is None:
+                    continue
+                px = float(px)
+                if self._live_mids.get(asset) != px:
+                    self._live_mids[asset] = px
+                    self._mark_dirty(asset)
+        elif channel == "activeAssetCtx":
+            coin = (data or {}).get("coin")
+            ctx = (data or {}).get("ctx") or {}
+            if coin is None or ctx.get("funding") is None:
+                return
+            rate = float(ctx["funding"])
+            if self._live_funding.get(coin) != rate:
+                self._live_funding[coin] = rate
+                if coin in self.index.assets():
+                    self._mark_dirty(coin)
+
+    def _mark_dirty(self, asset: str):
+        self._dirty_assets.setdefault(asset, time.monotonic())
+        self._wake.set()
+
+    async def _trigger_loop(self):
+        """Re-match assets as soon as their live inputs change."""
+        while self._running:
+            await self._wake.wait()
+            self._wake.clear()
+            dirty, self._dirty_assets = self._dirty_assets, {}
             try:
-                await self._process_intent(row, now)
+                await self._ensure_subscriptions()
+                for asset, changed_at in dirty.items():
+                    rate = self._live_funding.get(asset)
+                    price = self._live_mids.get(asset)
+                    intents, volatility = await self._evaluate_asset(asset, rate, price)
+                    intents = [i for i in intents if i.id not in self._executing]
+                    if not intents:
+                        continue
+                    self.stream_triggers += len(intents)
+                    logger.info(
+                        "Stream triggered %d intents on %s (%.1fms after update)",
+                        len(intents), asset, (time.monotonic() - changed_at) * 1000,
+                    )
+                    market = {"snapshot": self._live_snapshot(), "volatility": volatility}
+                    self._spawn(self._fire(
+                        [(intent, market) for intent in intents], datetime.utcnow(),
+                    ))
             except Exception as e:
-                logger.error("Error processing intent %s: %s", row["id"], e)
+                logger.error("Stream trigger error: %s", e, exc_info=True)
+
+    def _live_snapshot(self):
+        """MarketSnapshot built from the latest streamed values."""
+        from bot.core.market_snapshot import MarketSnapshot
+        from bot.venues.hyperliquid.funding_oracle import FundingRate
+
+        now = time.time()
+        return MarketSnapshot(
+            version=0,
+            fetched_at=now,
+            funding_rates={
+                coin: FundingRate(
+                    coin=coin,
+                    funding_rate=rate,
+                    timestamp_ms=int(now * 1000),
+                    annualized_rate=rate * 24 * 365,
+                )
+                for coin, rate in self._live_funding.items()
+            },
+            mids=dict(self._live_mids),
+        )
 
-    async def _process_intent(self, row: Dict[str, Any], now: datetime):
-        """Process a single intent."""
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._executions.add(task)
+        task.add_done_callback(self._executions.discard)
+
+    def on_intent_created(self, row: Dict[str, Any]):
+        """Index an intent created in this process (picked up next cycle)."""
+        intent = self.index.add(row)
+        if self._stream is not None and self._running:
+            # Subscribe to its asset and match it against live data now
+            self._mark_dirty(intent.asset)
+
+    def on_intent_cancelled(self, intent_id: str):
+        """Drop a cancelled intent from the index."""
+        self.index.remove(intent_id)
+
+    async def _process_intent(
+        self,
+        row: Dict[str, Any],
+        now: datetime,
+        snapshot=None,
+        volatility: Optional[float] = None,
+    ):
+        """Confirm criteria for a triggered intent and execute it."""
         intent_id = row["id"]
         user_id = row["user_id"]
         intent_status = row["status"]
@@ -159,7 +486,9 @@ class IntentScanner:
             logger.info("Intent %s activated", intent_id)
 
         # Check entry criteria
-        criteria_result = await self._check_criteria(row)
+        criteria_result = await self._check_criteria(
+            row, snapshot=snapshot, volatility=volatility,
+        )
 
         # Persist the criteria snapshot regardless of outcome
         await self.db.execute(
@@ -176,10 +505,18 @@ class IntentScanner:
             )
             await self._execute_intent(row, criteria_result)
 
-    async def _check_criteria(self, row: Dict[str, Any]) -> Dict[str, Any]:
+    async def _check_criteria(
+        self,
+        row: Dict[str, Any],
+        snapshot=None,
+        volatility: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Check all entry criteria for an intent.
 
+        ``snapshot`` and ``volatility`` may be passed from the scan cycle so
+        the market is read once per tick rather than once per intent.
+
         Returns a dict with:
         - all_passed: bool
         - checks: dict of individual check results
@@ -188,22 +525,30 @@ class IntentScanner:
         checks = {}
 
         try:
-            from bot.venues.hyperliquid.client import HyperliquidClient
-            from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
+            client = self._get_client()
+            oracle = self._get_oracle()
 
-            client = HyperliquidClient()
-            oracle = HyperliquidFundingOracle(client)
+            if snapshot is None and self._market_snapshots is not None:
+                snapshot = await self._market_snapshots.get()
 
             # Check 1: Funding rate
-            funding_check = await self._check_funding(oracle, asset, row)
+            funding_check = await self._check_funding(
+                oracle, asset, row,
+                rates=snapshot.funding_rates if snapshot else None,
+            )
             checks["funding_rate"] = funding_check
 
             # Check 2: Funding volatility
-            volatility_check = await self._check_volatility(oracle, asset, row)
+            volatility_check = await self._check_volatility(
+                oracle, asset, row, volatility=volatility,
+            )
             checks["funding_volatility"] = volatility_check
 
             # Check 3: Entry price
-            price_check = await self._check_price(client, asset, row)
+            price_check = await self._check_price(
+                client, asset, row,
+                mids=snapshot.mids if snapshot else None,
+            )
             checks["entry_price"] = price_check
 
         except Exception as e:
@@ -224,11 +569,16 @@ class IntentScanner:
         }
 
     async def _check_funding(
-        self, oracle, asset: str, row: Dict[str, Any]
+        self, oracle, asset: str, row: Dict[str, Any], rates=None,
     ) -> Dict[str, Any]:
-        """Check if funding rate meets the intent's criteria."""
+        """Check if funding rate meets the intent's criteria.
+
+        ``rates`` may be passed from a shared market snapshot; otherwise
+        they are fetched from the oracle.
+        """
         try:
-            rates = await oracle.get_current_funding_rates()
+            if rates is None:
+                rates = await oracle.get_current_funding_rates()
             rate_info = rates.get(asset)
 
             if not rate_info:
@@ -262,11 +612,15 @@ class IntentScanner:
             return {"passed": False, "reason": f"Funding check error: {e}"}
 
     async def _check_volatility(
-        self, oracle, asset: str, row: Dict[str, Any]
+        self, oracle, asset: str, row: Dict[str, Any], volatility=None,
     ) -> Dict[str, Any]:
-        """Check if funding volatility is within acceptable range."""
+        """Check if funding volatility is within acceptable range.
+
+        ``volatility`` may be passed when already computed for this tick.
+        """
         try:
-            volatility = await oracle.calculate_funding_volatility(asset)
+            if volatility is None:
+                volatility = await oracle.calculate_funding_volatility(asset)
             max_vol = row.get("max_funding_volatility") or 0.50
 
             if volatility > max_vol:
@@ -285,15 +639,20 @@ class IntentScanner:
             return {"passed": False, "reason": f"Volatility check error: {e}"}
 
     async def _check_price(
-        self, client, asset: str, row: Dict[str, Any]
+        self, client, asset: str, row: Dict[str, Any], mids=None,
     ) -> Dict[str, Any]:
-        """Check if current price is below the max entry price."""
+        """Check if current price is below the max entry price.
+
+        ``mids`` may be passed from a shared market snapshot; otherwise
+        they are fetched from the client.
+        """
         max_price = row.get("max_entry_price")
         if max_price is None:
             return {"passed": True, "reason": "No price limit set"}
 
         try:
-            mids = await client.get_all_mids()
+            if mids is None:
+                mids = await client.get_all_mids()
             current_price = mids.get(asset)
 
             if current_price is None:
@@ -413,6 +772,7 @@ class IntentScanner:
                         (position_id, json.dumps(criteria), intent_id),
                     )
 
+                self.index.remove(intent_id)
                 logger.info(
                     "Intent %s executed: position %s opened for user %s",
                     intent_id, position_id, user_id,
@@ -433,6 +793,7 @@ class IntentScanner:
                WHERE id = $1""",
             (intent_id,),
         )
+        self.index.remove(intent_id)
         logger.info("Intent %s expired", intent_id)
 
     async def _fail_intent(self, intent_id: str, error: str):
@@ -443,16 +804,6 @@ class IntentScanner:
                WHERE id = $2""",
             (error, intent_id),
         )
+        self.index.remove(intent_id)
         logger.warning("Intent %s failed: %s", intent_id, error)
 
-
-def _parse_datetime(val) -> Optional[datetime]:
-    """Parse a datetime string from the database."""
-    if val is None:
-        return None
-    if isinstance(val, datetime):
-        return val
-    try:
-        return datetime.fromisoformat(str(val))
-    except (ValueError, TypeError):
-        return None
@@ -3,13 +3,16 @@ Internal HTTP API for dashboard communication.
 Runs on localhost:8000, NOT exposed externally.
 """
 
+import asyncio
+import json
 from datetime import datetime
 from typing import Dict, Any
 
-from fastapi import FastAPI, Depends, HTTPException, status, WebSocket
+from fastapi import FastAPI, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from shared.common.schemas import BotStats, PositionSummary, PositionDetail, PauseState, PauseScope
+from bot.core.internal_events import RESYNC, get_event_hub
 from bot.core.pause_controller import PauseScope as CorePauseScope
 from shared.config.settings import get_settings
 
@@ -142,6 +145,7 @@ async def health_wallets(
             "policy_violations_24h": metrics.policy_violations_24h,
             "breakdown_1h": metrics.get_summary(3600),
             "breakdown_24h": metrics.get_summary(86400),
+            "executor_1h": metrics.get_latency_summary(3600),
         },
         "circuit_breaker": {
             "is_open": _get_circuit_breaker_status(),
@@ -225,15 +229,7 @@ async def get_pause_state(
     verify_internal_token(credentials)
     bot = get_bot()
     
-    state = bot._pause_controller.get_pause_state()
-    return PauseState(
-        paused=state.paused,
-        scope=PauseScope(state.scope.value),
-        reason=state.reason,
-        paused_at=state.paused_at,
-        paused_by=state.paused_by,
-        active_breakers=[b.value for b in state.active_breakers]
-    )
+    return _pause_state_to_schema(bot._pause_controller.get_pause_state())
 
 
 @internal_app.post("/internal/control/pause")
@@ -437,7 +433,7 @@ async def open_position_internal(
         else:
             # Check if partial failure (Asgard opened but Hyperliquid failed)
             partial = {
-                "asgard_opened": result.stage != "asgard_open" if hasattr(result, 'stage') else False,
+                "asgard_opened": result.stage not in ("asgard_open", "hedge_unwind_failed") if hasattr(result, 'stage') else False,
                 "stage": result.stage if hasattr(result, 'stage') else "unknown",
                 "unwind_attempted": True  # PositionManager tries to unwind on failure
             }
@@ -519,13 +515,144 @@ async def close_position_internal(
         }
 
 
+FEED_PING_INTERVAL = 20.0  # seconds of silence before a keepalive ping
+_FEED_PING = json.dumps({"type": "ping"})
+
+
 @internal_app.websocket("/internal/events")
 async def events_websocket(websocket: WebSocket):
-    """WebSocket for real-time events."""
-    # TODO: Implement in Task 1.7
+    """
+    Push position and pause-state changes to the dashboard bridge.
+
+    Authenticates with the same bearer token as the HTTP endpoints (internal
+    JWT or legacy secret). Sends a ``snapshot`` first, then streams
+    ``position_opened`` / ``position_updated`` / ``position_closed`` /
+    ``pause_state`` / ``circuit_breaker`` events. A JWT scopes the feed to
+    that user's positions.
+    """
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    try:
+        if scheme.lower() != "bearer" or not token:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Missing internal token")
+        auth_user_id = verify_internal_token(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    if _bot_instance is None:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
     await websocket.accept()
-    await websocket.send_json({"type": "connected", "message": "WebSocket events not yet implemented"})
-    await websocket.close()
+    hub = get_event_hub()
+    # Subscribe before the snapshot so nothing between the two is lost;
+    # events are idempotent against the snapshot.
+    queue = hub.subscribe(auth_user_id)
+    try:
+        await websocket.send_text(_feed_snapshot(auth_user_id))
+        while True:
+            try:
+                message = await asyncio.wait_for(queue.get(), timeout=FEED_PING_INTERVAL)
+            except asyncio.TimeoutError:
+                message = _FEED_PING
+            if message is RESYNC:
+                message = _feed_snapshot(auth_user_id)
+            await websocket.send_text(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        hub.unsubscribe(queue)
+
+
+def _feed_snapshot(auth_user_id: str) -> str:
+    """Full state message for a (re)synced feed connection."""
+    bot = get_bot()
+    positions = bot.get_positions()
+    if auth_user_id:
+        positions = {
+            pos_id: pos for pos_id, pos in positions.items()
+            if getattr(pos, "user_id", None) == auth_user_id
+        }
+    pause_state = None
+    if bot._pause_controller is not None:
+        pause_state = _pause_state_to_schema(
+            bot._pause_controller.get_pause_state()
+        ).model_dump(mode="json")
+    return json.dumps(
+        {
+            "type": "snapshot",
+            "data": {
+                "positions": [_position_event_data(pos) for pos in positions.values()],
+                "pause_state": pause_state,
+            },
+            "timestamp": datetime.utcnow().isoformat(),
+        },
+        default=str,
+    )
+
+
+def _position_event_data(position) -> Dict[str, Any]:
+    """Feed payload for one position: owner plus its summary."""
+    return {
+        "user_id": getattr(position, "user_id", None),
+        "position": _position_to_summary(position).model_dump(mode="json"),
+    }
+
+
+def attach_event_feed(bot) -> None:
+    """Publish the bot's position and pause-state changes to the event hub."""
+    hub = get_event_hub()
+    # Last position_updated payload per position (minus the ever-growing
+    # hold duration) so unchanged monitor cycles are not pushed.
+    last_sent: Dict[str, Dict[str, Any]] = {}
+
+    def _publish_position(event_type: str, position) -> None:
+        data = _position_event_data(position)
+        fingerprint = {k: v for k, v in data["position"].items() if k != "hold_duration_hours"}
+        if event_type == "position_updated" and last_sent.get(position.position_id) == fingerprint:
+            return
+        last_sent[position.position_id] = fingerprint
+        hub.publish(event_type, data, user_id=data["user_id"] or "")
+
+    def on_opened(position) -> None:
+        _publish_position("position_opened", position)
+
+    def on_updated(position) -> None:
+        _publish_position("position_updated", position)
+
+    def on_closed(position, reason: str) -> None:
+        last_sent.pop(position.position_id, None)
+        hub.publish(
+            "position_closed",
+            {
+                "user_id": getattr(position, "user_id", None),
+                "position_id": position.position_id,
+                "reason": reason,
+            },
+            user_id=getattr(position, "user_id", None) or "",
+        )
+
+    def on_pause_state(state) -> None:
+        event_type = "circuit_breaker" if state.paused_by == "circuit_breaker" else "pause_state"
+        hub.publish(event_type, _pause_state_to_schema(state).model_dump(mode="json"))
+
+    bot.add_position_opened_callback(on_opened)
+    bot.add_position_updated_callback(on_updated)
+    bot.add_position_closed_callback(on_closed)
+    bot.add_pause_state_callback(on_pause_state)
+
+
+def _pause_state_to_schema(state) -> PauseState:
+    """Convert the pause controller's PauseState to the API schema."""
+    return PauseState(
+        paused=state.paused,
+        scope=PauseScope(state.scope.value),
+        reason=state.reason,
+        paused_at=state.paused_at,
+        paused_by=state.paused_by,
+        active_breakers=[b.value for b in state.active_breakers]
+    )
 
 
 def _position_to_summary(position) -> PositionSummary:
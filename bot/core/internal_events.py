@@ -0,0 +1,123 @@
+"""
+In-process fan-out for the internal WebSocket event feed.
+
+The bot publishes position and pause-state changes here; each connection to
+``/internal/events`` holds a bounded queue of pre-serialized messages.
+
+Scoping mirrors the HTTP internal API:
+- A listener authenticated with the legacy secret (``user_id == ""``)
+  receives every event.
+- A listener authenticated with an internal JWT receives broadcast events
+  (``user_id=None``, e.g. pause state) and events for its own user only.
+
+A listener that falls ``queue_size`` messages behind is not fed partial
+history: its queue is cleared and replaced by a single ``RESYNC`` marker, on
+which the connection sends a fresh snapshot instead.
+
+Usage:
+    hub = get_event_hub()
+    queue = hub.subscribe(user_id)
+    hub.publish("position_closed", {...}, user_id="user_1")
+    message = await queue.get()   # JSON text, or RESYNC
+    hub.unsubscribe(queue)
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Queued in place of a listener's backlog once it overflows
+RESYNC = object()
+
+
+class InternalEventHub:
+    """
+    Fan-out of bot events to internal WebSocket listeners.
+
+    Args:
+        queue_size: Messages buffered per listener before it is resynced.
+    """
+
+    QUEUE_SIZE = 1000
+
+    def __init__(self, queue_size: int = QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._listeners: Dict[asyncio.Queue, str] = {}
+
+        # Counters
+        self.published = 0
+        self.resyncs = 0
+
+    @property
+    def listener_count(self) -> int:
+        return len(self._listeners)
+
+    def subscribe(self, user_id: str = "") -> asyncio.Queue:
+        """Register a listener ("" for unscoped) and return its queue."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._listeners[queue] = user_id
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._listeners.pop(queue, None)
+
+    def publish(
+        self, event_type: str, data: Dict[str, Any], user_id: Optional[str] = None
+    ) -> int:
+        """
+        Queue an event for every listener allowed to see it.
+
+        Args:
+            event_type: Event name (e.g. ``position_opened``).
+            data: JSON-serializable payload.
+            user_id: Owning user; None broadcasts to all listeners.
+
+        Returns:
+            Number of listeners the event was queued for.
+        """
+        if not self._listeners:
+            return 0
+
+        message = json.dumps(
+            {
+                "type": event_type,
+                "data": data,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            default=str,
+        )
+        self.published += 1
+
+        delivered = 0
+        for queue, scope in list(self._listeners.items()):
+            if scope and user_id is not None and scope != user_id:
+                continue
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._resync(queue)
+            delivered += 1
+        return delivered
+
+    def _resync(self, queue: asyncio.Queue) -> None:
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(RESYNC)
+        self.resyncs += 1
+        logger.warning(f"Internal event listener fell behind, resyncing ({self.resyncs} total)")
+
+
+_event_hub: Optional[InternalEventHub] = None
+
+
+def get_event_hub() -> InternalEventHub:
+    """Get the process-wide event hub."""
+    global _event_hub
+    if _event_hub is None:
+        _event_hub = InternalEventHub()
+    return _event_hub
@@ -0,0 +1,353 @@
+"""
+Shared Market-Data Snapshot Service.
+
+Polls the venue-wide market endpoints once per tick and publishes an
+immutable, versioned ``MarketSnapshot`` that every consumer reads instead
+of hitting the venues themselves:
+
+- Hyperliquid ``metaAndAssetCtxs`` (funding rates, mark/oracle prices)
+- Hyperliquid ``allMids`` (mid prices)
+- Asgard ``/markets`` (lending/borrowing rates per protocol)
+
+Consumers (PositionMonitorService, AutonomousScanner, IntentScanner and the
+dashboard ``/rates`` endpoint) call ``await service.get()``. A fresh
+in-process snapshot is returned immediately; otherwise the latest snapshot
+published to Redis by another process is used; only as a last resort is
+the venue polled on demand (single-flight, so concurrent callers share one
+fetch).
+
+Usage:
+    snapshots = MarketSnapshotService()
+    await snapshots.start()  # Polls every TICK_INTERVAL seconds
+    snapshot = await snapshots.get()
+    sol = snapshot.funding_rates["SOL"]
+    ...
+    await snapshots.stop()
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from bot.venues.asgard.client import AsgardClient
+from bot.venues.client_registry import get_client_registry
+from bot.venues.hyperliquid.client import HyperliquidClient
+from bot.venues.hyperliquid.funding_oracle import FundingRate, HyperliquidFundingOracle
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "market:snapshot"
+SNAPSHOT_FETCHED_AT_KEY = "market:snapshot:fetched_at"
+SNAPSHOT_CHANNEL = "market:snapshot"
+
+# Replace the published snapshot only with a newer one (by fetched_at), so
+# a slow poll in one process never overwrites a fresher one from another.
+# KEYS: snapshot, fetched_at; ARGV: snapshot json, fetched_at, ttl, channel
+SNAPSHOT_PUBLISH_SCRIPT = """
+local stored = tonumber(redis.call('GET', KEYS[2]))
+if stored and stored >= tonumber(ARGV[2]) then
+  return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+redis.call('PUBLISH', ARGV[4], ARGV[2])
+return 1
+"""
+
+
+def _frozen(mapping: Optional[Dict]) -> Mapping:
+    """Wrap a dict in a read-only view."""
+    return MappingProxyType(dict(mapping or {}))
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable view of venue-wide market data at a point in time."""
+    version: int
+    fetched_at: float  # epoch seconds
+    funding_rates: Mapping[str, FundingRate] = field(default_factory=lambda: _frozen({}))
+    asset_ctxs: Mapping[str, Mapping[str, Any]] = field(default_factory=lambda: _frozen({}))
+    asset_index: Mapping[str, int] = field(default_factory=lambda: _frozen({}))
+    mids: Mapping[str, float] = field(default_factory=lambda: _frozen({}))
+    asgard_markets: Mapping[str, Any] = field(default_factory=lambda: _frozen({}))
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+    def to_json(self) -> str:
+        """Serialize for Redis."""
+        return json.dumps({
+            "version": self.version,
+            "fetched_at": self.fetched_at,
+            "funding_rates": {
+                coin: {
+                    "funding_rate": r.funding_rate,
+                    "timestamp_ms": r.timestamp_ms,
+                    "annualized_rate": r.annualized_rate,
+                }
+                for coin, r in self.funding_rates.items()
+            },
+            "asset_ctxs": {coin: dict(ctx) for coin, ctx in self.asset_ctxs.items()},
+            "asset_index": dict(self.asset_index),
+            "mids": dict(self.mids),
+            "asgard_markets": dict(self.asgard_markets),
+        })
+
+    @classmethod
+    def from_json(cls, raw: str) -> "MarketSnapshot":
+        """Deserialize from Redis."""
+        d = json.loads(raw)
+        return cls(
+            version=int(d["version"]),
+            fetched_at=float(d["fetched_at"]),
+            funding_rates=_frozen({
+                coin: FundingRate(coin=coin, **r)
+                for coin, r in d.get("funding_rates", {}).items()
+            }),
+            asset_ctxs=_frozen({
+                coin: _frozen(ctx) for coin, ctx in d.get("asset_ctxs", {}).items()
+            }),
+            asset_index=_frozen(d.get("asset_index")),
+            mids=_frozen(d.get("mids")),
+            asgard_markets=_frozen(d.get("asgard_markets")),
+        )
+
+
+class MarketSnapshotService:
+    """
+    Polls market data once per tick and serves it to all consumers.
+
+    Snapshots are published in-process (``current``/``get``) and to Redis
+    (``SNAPSHOT_KEY`` plus a ``fetched_at`` notification on
+    ``SNAPSHOT_CHANNEL``) so other processes can read the same data without
+    polling the venues. Versions are per process; snapshots from different
+    processes are ordered by ``fetched_at``.
+    """
+
+    TICK_INTERVAL = 10  # seconds between polls
+    MAX_AGE = 30  # seconds before a snapshot is considered stale
+    MAX_ERRORS_BEFORE_BACKOFF = 5
+    BACKOFF_INTERVAL = 60
+
+    def __init__(
+        self,
+        hl_client: Optional[HyperliquidClient] = None,
+        asgard_client: Optional[AsgardClient] = None,
+        publish_to_redis: bool = True,
+    ):
+        self.hl_client = hl_client or get_client_registry().hyperliquid_client()
+        self._asgard_client = asgard_client
+        self.publish_to_redis = publish_to_redis
+
+        self._snapshot: Optional[MarketSnapshot] = None
+        self._version = 0
+        self._refresh_lock = asyncio.Lock()
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._consecutive_errors = 0
+
+    @property
+    def asgard_client(self) -> AsgardClient:
+        # Created lazily: AsgardClient reads settings on construction
+        if self._asgard_client is None:
+            self._asgard_client = get_client_registry().asgard_client()
+        return self._asgard_client
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        """Start the polling loop as a background task."""
+        if self._running:
+            logger.warning("MarketSnapshotService already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info("MarketSnapshotService started (interval=%ds)", self.TICK_INTERVAL)
+
+    async def stop(self):
+        """Stop the polling loop and close venue sessions."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for client in (self.hl_client, self._asgard_client):
+            if client is not None:
+                try:
+                    await client.close()
+                except Exception:
+                    pass
+        logger.info("MarketSnapshotService stopped")
+
+    async def _run_loop(self):
+        """Main polling loop."""
+        while self._running:
+            try:
+                await self.refresh()
+                self._consecutive_errors = 0
+            except Exception as e:
+                self._consecutive_errors += 1
+                logger.error(
+                    "Market snapshot error (%d consecutive): %s",
+                    self._consecutive_errors, e,
+                )
+
+                if self._consecutive_errors >= self.MAX_ERRORS_BEFORE_BACKOFF:
+                    logger.warning(
+                        "Too many consecutive errors, backing off for %ds",
+                        self.BACKOFF_INTERVAL,
+                    )
+                    await asyncio.sleep(self.BACKOFF_INTERVAL)
+                    self._consecutive_errors = 0
+                    continue
+
+            await asyncio.sleep(self.TICK_INTERVAL)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def current(self) -> Optional[MarketSnapshot]:
+        """Return the latest in-process snapshot without any I/O."""
+        return self._snapshot
+
+    async def get(self, max_age: Optional[float] = None) -> MarketSnapshot:
+        """
+        Return a snapshot no older than ``max_age`` seconds.
+
+        Order of preference: in-process snapshot, Redis snapshot published
+        by another process, then an on-demand poll shared by all callers.
+        """
+        max_age = self.MAX_AGE if max_age is None else max_age
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age <= max_age:
+            return snapshot
+
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.age <= max_age:
+                return snapshot
+
+            remote = await self._load_from_redis()
+            if remote is not None and remote.age <= max_age:
+                self._adopt(remote)
+                return remote
+
+            return await self._poll()
+
+    async def refresh(self) -> MarketSnapshot:
+        """Poll the venues now and publish a new snapshot."""
+        async with self._refresh_lock:
+            return await self._poll()
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _poll(self) -> MarketSnapshot:
+        """Fetch all venue endpoints concurrently and publish. Caller holds lock."""
+        meta_res, mids_res, asgard_res = await asyncio.gather(
+            self.hl_client.get_meta_and_asset_contexts(),
+            self.hl_client.get_all_mids(),
+            self.asgard_client.get_markets(),
+            return_exceptions=True,
+        )
+
+        # Funding data is essential; mids and Asgard fall back to last known
+        if isinstance(meta_res, BaseException):
+            raise meta_res
+
+        previous = self._snapshot
+        if isinstance(mids_res, BaseException):
+            logger.warning("allMids fetch failed, reusing previous mids: %s", mids_res)
+            mids = dict(previous.mids) if previous else {}
+        else:
+            mids = {coin: float(px) for coin, px in (mids_res or {}).items()}
+
+        if isinstance(asgard_res, BaseException):
+            logger.warning("Asgard /markets fetch failed, reusing previous: %s", asgard_res)
+            asgard_markets = dict(previous.asgard_markets) if previous else {}
+        else:
+            asgard_markets = asgard_res or {}
+
+        meta, ctxs = meta_res if isinstance(meta_res, list) else (
+            meta_res.get("meta", {}), meta_res.get("assetCtxs", [])
+        )
+        asset_index: Dict[str, int] = {}
+        asset_ctxs: Dict[str, Mapping[str, Any]] = {}
+        for i, info in enumerate(meta.get("universe", [])):
+            name = info.get("name")
+            if not name:
+                continue
+            asset_index[name] = i
+            if i < len(ctxs):
+                asset_ctxs[name] = _frozen(ctxs[i])
+
+        self._version += 1
+        snapshot = MarketSnapshot(
+            version=self._version,
+            fetched_at=time.time(),
+            funding_rates=_frozen(HyperliquidFundingOracle.funding_rates_from_meta(meta_res)),
+            asset_ctxs=_frozen(asset_ctxs),
+            asset_index=_frozen(asset_index),
+            mids=_frozen(mids),
+            asgard_markets=_frozen(asgard_markets),
+        )
+        self._snapshot = snapshot
+        await self._publish(snapshot)
+
+        logger.debug(
+            "Market snapshot v%d: %d coins, %d mids",
+            snapshot.version, len(snapshot.funding_rates), len(snapshot.mids),
+        )
+        return snapshot
+
+    def _adopt(self, snapshot: MarketSnapshot):
+        """Use a snapshot published elsewhere if it is newer than ours."""
+        if self._snapshot is None or snapshot.fetched_at > self._snapshot.fetched_at:
+            self._snapshot = snapshot
+
+    # ------------------------------------------------------------------
+    # Redis
+    # ------------------------------------------------------------------
+
+    async def _publish(self, snapshot: MarketSnapshot):
+        """Publish a snapshot to Redis (best-effort)."""
+        if not self.publish_to_redis:
+            return
+        try:
+            from shared.redis_client import get_redis
+            redis = await get_redis()
+            await redis.eval(
+                SNAPSHOT_PUBLISH_SCRIPT, 2, SNAPSHOT_KEY, SNAPSHOT_FETCHED_AT_KEY,
+                snapshot.to_json(), repr(snapshot.fetched_at), self.MAX_AGE * 2,
+                SNAPSHOT_CHANNEL,
+            )
+        except Exception as e:
+            logger.debug("Market snapshot Redis publish failed: %s", e)
+
+    async def _load_from_redis(self) -> Optional[MarketSnapshot]:
+        """Load the latest published snapshot from Redis (best-effort)."""
+        if not self.publish_to_redis:
+            return None
+        try:
+            from shared.redis_client import get_redis
+            redis = await get_redis()
+            raw = await redis.get(SNAPSHOT_KEY)
+            return MarketSnapshot.from_json(raw) if raw else None
+        except Exception as e:
+            logger.debug("Market snapshot Redis read failed: %s", e)
+            return None
+
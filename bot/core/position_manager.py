@@ -5,7 +5,8 @@ Orchestrates the opening and closing of combined delta-neutral positions
 across Asgard (Solana long) and Hyperliquid (Arbitrum short).
 
 Key Responsibilities:
-- Pre-flight checks before position entry (6 checks per spec 5.0)
+- Pre-flight checks before position entry (6 checks per spec 5.0, plus
+  the expected Hyperliquid entry impact from the L2 book)
 - Execute Asgard long FIRST, then Hyperliquid short (spec 5.1)
 - Close Hyperliquid short FIRST, then Asgard long (spec 5.2)
 - Track delta drift and trigger rebalances when cost-effective
@@ -17,22 +18,32 @@ Execution Order (Entry):
 3. Open Hyperliquid short (with retry logic)
 4. Post-execution validation
 
+The hedge is pre-staged (asset index, leverage, book/fill subscriptions)
+while consensus and the Asgard leg run, and fired the moment the Asgard
+transaction confirms (HEDGE_AFTER_CONFIRM) or alongside it
+(HEDGE_CONCURRENT). Each entry's single-leg exposure window is recorded
+in an EntryTiming.
+
 Execution Order (Exit):
 1. Close Hyperliquid short first (reduces liquidation risk)
 2. Close Asgard long
 3. Max single-leg exposure: 120 seconds
 """
+import asyncio
+import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
 
 from shared.chain.solana import SolanaClient
 from shared.chain.arbitrum import ArbitrumClient
 from shared.config.assets import Asset, get_asset_metadata, AssetMetadata
 from shared.config.settings import get_risk_limits
 from bot.core.fill_validator import FillValidator, FillInfo
+from bot.core.preflight_cache import PreflightCache
 from bot.core.price_consensus import PriceConsensus, ConsensusResult
 from shared.models.common import Protocol, TransactionState, ExitReason
 from shared.models.opportunity import ArbitrageOpportunity
@@ -57,6 +68,7 @@ class PreflightResult:
     passed: bool
     checks: Dict[str, bool]
     errors: List[str]
+    reused_checks: List[str] = field(default_factory=list)  # From PreflightCache
     
     @property
     def all_checks_passed(self) -> bool:
@@ -64,6 +76,27 @@ class PreflightResult:
         return all(self.checks.values())
 
 
+# Hedge timing policies for open_position
+HEDGE_AFTER_CONFIRM = "after_confirm"  # Asgard first, hedge on confirmation (spec 5.1)
+HEDGE_CONCURRENT = "concurrent"  # Both legs at once; the other is unwound on failure
+
+
+@dataclass
+class EntryTiming:
+    """Latency breakdown for one position entry (seconds from start)."""
+
+    position_id: str
+    policy: str
+    prestage_s: Optional[float] = None  # Hedge pre-staging done
+    asgard_s: Optional[float] = None  # Asgard leg confirmed
+    hedge_s: Optional[float] = None  # Hedge filled
+    single_leg_exposure_s: Optional[float] = None  # One leg open without the other
+    total_s: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 @dataclass
 class DeltaInfo:
     """Delta (net exposure) information."""
@@ -142,6 +175,7 @@ class PositionManagerResult:
     position: Optional[CombinedPosition] = None
     error: Optional[str] = None
     stage: Optional[str] = None  # Which stage failed
+    entry_timing: Optional[EntryTiming] = None
 
 
 class PositionManager:
@@ -174,12 +208,19 @@ class PositionManager:
         fill_validator: FillValidator instance (or created if None)
         solana_client: SolanaClient instance (or created if None)
         arbitrum_client: ArbitrumClient instance (or created if None)
+        hedge_policy: HEDGE_AFTER_CONFIRM (default) or HEDGE_CONCURRENT
+        user_id: Owner of the wallets (keys the preflight cache)
+        preflight_cache: Optional PreflightCache reused across preflight runs
     """
     
     # Timing constraints (spec 5.1, 5.2)
     MAX_SINGLE_LEG_EXPOSURE_SECONDS = 120
     HYPERLIQUID_RETRY_ATTEMPTS = 15
     HYPERLIQUID_RETRY_INTERVAL = 2.0
+
+    # When to fire the Hyperliquid hedge relative to the Asgard leg
+    HEDGE_POLICY = HEDGE_AFTER_CONFIRM
+    ENTRY_TIMING_HISTORY = 100
     
     # Delta thresholds
     DELTA_WARNING_THRESHOLD = Decimal("0.005")  # 0.5%
@@ -193,6 +234,9 @@ class PositionManager:
         fill_validator: Optional[FillValidator] = None,
         solana_client: Optional[SolanaClient] = None,
         arbitrum_client: Optional[ArbitrumClient] = None,
+        hedge_policy: Optional[str] = None,
+        user_id: Optional[str] = None,
+        preflight_cache: Optional[PreflightCache] = None,
     ):
         self.asgard_manager = asgard_manager
         self.hyperliquid_trader = hyperliquid_trader
@@ -208,6 +252,16 @@ class PositionManager:
         # Risk limits
         self._risk_limits = get_risk_limits()
 
+        # Entry orchestration
+        self.hedge_policy = hedge_policy or self.HEDGE_POLICY
+        if self.hedge_policy not in (HEDGE_AFTER_CONFIRM, HEDGE_CONCURRENT):
+            raise ValueError(f"Unknown hedge policy: {self.hedge_policy}")
+        self._entry_timings: Deque[EntryTiming] = deque(maxlen=self.ENTRY_TIMING_HISTORY)
+
+        # Passed preflight checks reused across runs for this user
+        self.user_id = user_id
+        self.preflight_cache = preflight_cache
+
         logger.info("PositionManager initialized")
 
     @classmethod
@@ -225,6 +279,7 @@ class PositionManager:
         Returns:
             PositionManager configured for this user
         """
+        kwargs.setdefault("user_id", ctx.user_id)
         return cls(
             asgard_manager=ctx.get_asgard_manager(),
             hyperliquid_trader=ctx.get_hl_trader(),
@@ -283,7 +338,7 @@ class PositionManager:
         opportunity: ArbitrageOpportunity
     ) -> PreflightResult:
         """
-        Run all 6 pre-flight checks before position entry.
+        Run all pre-flight checks before position entry.
         
         Checks:
         1. Wallet Balance Check - Both chains have sufficient funds
@@ -292,6 +347,12 @@ class PositionManager:
         4. Protocol Capacity - Asgard protocol has sufficient borrow capacity
         5. Fee Market Check - Solana compute unit price below threshold (deferred)
         6. Opportunity Simulation - Both legs can be built successfully
+        7. Hedge Impact - Expected Hyperliquid entry impact (after slicing)
+           within max_slippage_entry_bps
+
+        With a preflight cache, network-bound checks that passed recently
+        for the same user, asset, leverage and size bucket are reused
+        instead of re-run (see PreflightCache).
         
         Args:
             opportunity: The opportunity to validate
@@ -301,12 +362,15 @@ class PositionManager:
         """
         checks = {}
         errors = []
+        reused: List[str] = []
         
         logger.info(f"Running pre-flight checks for opportunity {opportunity.id}")
         
         # Check 1: Wallet Balance
         try:
-            checks["wallet_balance"] = await self._check_wallet_balance(opportunity)
+            checks["wallet_balance"] = await self._cached_check(
+                "wallet_balance", opportunity, self._check_wallet_balance, reused
+            )
             if not checks["wallet_balance"]:
                 errors.append("Insufficient wallet balance on one or both chains")
         except Exception as e:
@@ -315,11 +379,11 @@ class PositionManager:
         
         # Check 2: Price Consensus
         try:
-            consensus = await self.price_consensus.check_consensus(opportunity.asset)
-            checks["price_consensus"] = consensus.is_within_threshold
-            opportunity.price_deviation = consensus.price_deviation
+            checks["price_consensus"] = await self._cached_check(
+                "price_consensus", opportunity, self._check_price_consensus, reused
+            )
             if not checks["price_consensus"]:
-                errors.append(f"Price deviation {consensus.price_deviation:.4%} exceeds 0.5%")
+                errors.append(f"Price deviation {opportunity.price_deviation:.4%} exceeds 0.5%")
         except Exception as e:
             checks["price_consensus"] = False
             errors.append(f"Price consensus check failed: {e}")
@@ -335,7 +399,9 @@ class PositionManager:
         
         # Check 4: Protocol Capacity
         try:
-            checks["protocol_capacity"] = await self._check_protocol_capacity(opportunity)
+            checks["protocol_capacity"] = await self._cached_check(
+                "protocol_capacity", opportunity, self._check_protocol_capacity, reused
+            )
             if not checks["protocol_capacity"]:
                 errors.append("Selected protocol lacks sufficient borrow capacity")
         except Exception as e:
@@ -348,19 +414,38 @@ class PositionManager:
         
         # Check 6: Opportunity Simulation
         try:
-            checks["opportunity_simulation"] = await self._simulate_opportunity(opportunity)
+            checks["opportunity_simulation"] = await self._cached_check(
+                "opportunity_simulation", opportunity, self._simulate_opportunity, reused
+            )
             if not checks["opportunity_simulation"]:
                 errors.append("Opportunity simulation failed")
         except Exception as e:
             checks["opportunity_simulation"] = False
             errors.append(f"Opportunity simulation failed: {e}")
+
+        # Check 7: Hedge Execution Impact
+        try:
+            checks["hedge_impact"] = await self._cached_check(
+                "hedge_impact", opportunity, self._check_hedge_impact, reused
+            )
+            if not checks["hedge_impact"]:
+                errors.append(
+                    f"Expected Hyperliquid entry impact {opportunity.expected_hedge_impact:.4%} "
+                    f"exceeds {self._max_entry_impact():.2%}"
+                )
+        except Exception as e:
+            checks["hedge_impact"] = False
+            errors.append(f"Hedge impact check failed: {e}")
         
         # Determine result
         passed = all(checks.values())
         
         if passed:
             opportunity.preflight_checks_passed = True
-            logger.info(f"All pre-flight checks passed for opportunity {opportunity.id}")
+            logger.info(
+                f"All pre-flight checks passed for opportunity {opportunity.id}"
+                + (f" (reused: {', '.join(reused)})" if reused else "")
+            )
         else:
             logger.warning(
                 f"Pre-flight checks failed for opportunity {opportunity.id}: {errors}"
@@ -369,8 +454,41 @@ class PositionManager:
         return PreflightResult(
             passed=passed,
             checks=checks,
-            errors=errors
+            errors=errors,
+            reused_checks=reused,
         )
+
+    async def _cached_check(
+        self,
+        name: str,
+        opportunity: ArbitrageOpportunity,
+        check: Callable[[ArbitrageOpportunity], Awaitable[bool]],
+        reused: List[str],
+    ) -> bool:
+        """Run ``check``, or reuse its recent pass from the preflight cache."""
+        cache = self.preflight_cache
+        if cache is not None:
+            cached = cache.get(self.user_id, opportunity, name)
+            if cached is not None:
+                cached.apply(opportunity)
+                reused.append(name)
+                return True
+
+        passed = await check(opportunity)
+        if passed and cache is not None:
+            cache.put(self.user_id, opportunity, name)
+        return passed
+
+    def _invalidate_preflight(self) -> None:
+        """Forget cached checks once this user's balances have moved."""
+        if self.preflight_cache is not None:
+            self.preflight_cache.invalidate_user(self.user_id)
+
+    async def _check_price_consensus(self, opportunity: ArbitrageOpportunity) -> bool:
+        """Check the venue prices agree (records the deviation on the opportunity)."""
+        consensus = await self.price_consensus.check_consensus(opportunity.asset)
+        opportunity.price_deviation = consensus.price_deviation
+        return consensus.is_within_threshold
     
     async def _check_wallet_balance(self, opportunity: ArbitrageOpportunity) -> bool:
         """Check wallet balances on Solana and Hyperliquid.
@@ -419,6 +537,40 @@ class PositionManager:
 
         return True
     
+    def _max_entry_impact(self) -> Decimal:
+        """Maximum acceptable entry impact as a fraction."""
+        return Decimal(str(self._risk_limits.get("max_slippage_entry_bps", 50))) / Decimal("10000")
+
+    async def _check_hedge_impact(self, opportunity: ArbitrageOpportunity) -> bool:
+        """Estimate the Hyperliquid short's price impact from the L2 book.
+
+        The short is planned as depth-bounded child orders; the expected
+        impact is the worst child's, and it must stay within
+        max_slippage_entry_bps. Fails open when no book is available
+        (open_short still caps every order at the fixed slippage).
+        """
+        try:
+            plan = await self.hyperliquid_trader.plan_order(
+                coin=opportunity.hyperliquid_coin,
+                is_buy=False,
+                notional_usd=float(self._hedge_notional_usd(opportunity)),
+                max_impact=float(self._max_entry_impact()),
+            )
+            if plan is None:
+                return True
+            expected = Decimal(str(plan.expected_impact))
+        except Exception as e:
+            logger.warning(f"Failed to estimate hedge impact: {e}")
+            return True
+
+        opportunity.expected_hedge_impact = expected
+        logger.info(
+            f"Hedge impact for {opportunity.hyperliquid_coin} "
+            f"${self._hedge_notional_usd(opportunity)}: {expected:.4%} across "
+            f"{len(plan.slices)} child order(s) (single order {plan.single_impact:.4%})"
+        )
+        return expected <= self._max_entry_impact()
+
     def _check_funding_validation(self, opportunity: ArbitrageOpportunity) -> bool:
         """Validate funding rates are negative (shorts paid)."""
         # Current funding must be negative
@@ -520,6 +672,54 @@ class PositionManager:
                 stage="preflight"
             )
         
+        started = time.monotonic()
+        timing = EntryTiming(position_id=position_id, policy=self.hedge_policy)
+        coin = opportunity.hyperliquid_coin
+
+        # Pre-stage the hedge while consensus and the Asgard leg run
+        prestage = asyncio.create_task(
+            self._prestage_hedge(coin, int(opportunity.leverage), started, timing)
+        )
+        try:
+            return await self._open_legs(
+                opportunity, position_id, coin, prestage, started, timing,
+            )
+        finally:
+            if not prestage.done():
+                prestage.cancel()
+                # Let it unwind so release_order sees every ref it took
+                # (wait() doesn't raise the task's CancelledError)
+                await asyncio.wait([prestage])
+            await self.hyperliquid_trader.release_order(coin)
+            # Either leg may have moved funds
+            self._invalidate_preflight()
+
+    async def _prestage_hedge(
+        self,
+        coin: str,
+        leverage: int,
+        started: float,
+        timing: EntryTiming,
+    ) -> bool:
+        """Resolve the asset, set leverage and warm the hedge's data streams."""
+        try:
+            ok = await self.hyperliquid_trader.prepare_order(coin, leverage=leverage)
+        except Exception as e:
+            logger.warning(f"Failed to pre-stage Hyperliquid hedge: {e}")
+            ok = False
+        timing.prestage_s = round(time.monotonic() - started, 3)
+        return ok is not False
+
+    async def _open_legs(
+        self,
+        opportunity: ArbitrageOpportunity,
+        position_id: str,
+        coin: str,
+        prestage: asyncio.Task,
+        started: float,
+        timing: EntryTiming,
+    ) -> PositionManagerResult:
+        """Open both legs per the hedge policy, then validate the entry."""
         # Get current price consensus for reference
         try:
             consensus = await self.price_consensus.check_consensus(opportunity.asset)
@@ -530,7 +730,7 @@ class PositionManager:
         
         # Calculate sizes
         collateral_usd = opportunity.deployed_capital_usd / 2  # Split 50/50
-        position_size_usd = opportunity.position_size_usd / 2
+        position_size_usd = self._hedge_notional_usd(opportunity)
         
         # Get token price for size calculation
         if consensus and consensus.consensus_price:
@@ -547,41 +747,86 @@ class PositionManager:
             )
         
         token_amount = position_size_usd / token_price
-        
-        # Step 1: Open Asgard Long FIRST
-        logger.info(f"Step 1: Opening Asgard long position")
-        asgard_result = await self._open_asgard_position(
-            position_id=position_id,
-            asset=opportunity.asset,
-            protocol=opportunity.selected_protocol,
-            collateral_usd=collateral_usd,
-            leverage=opportunity.leverage,
-        )
-        
+
+        # Calculate SOL size for short (should match long exposure)
+        sol_size = token_amount  # Size in SOL tokens
+
+        async def open_asgard():
+            try:
+                result = await self._open_asgard_position(
+                    position_id=position_id,
+                    asset=opportunity.asset,
+                    protocol=opportunity.selected_protocol,
+                    collateral_usd=collateral_usd,
+                    leverage=opportunity.leverage,
+                )
+            except Exception as e:
+                logger.exception("Failed to open Asgard long")
+                result = OpenPositionResult(success=False, error=str(e))
+            timing.asgard_s = round(time.monotonic() - started, 3)
+            return result
+
+        async def open_hedge():
+            leverage_set = await prestage
+            result = await self._open_hyperliquid_position(
+                position_id=position_id,
+                coin=coin,
+                size_sol=sol_size,
+                leverage=int(opportunity.leverage),
+                update_leverage=not leverage_set,
+            )
+            timing.hedge_s = round(time.monotonic() - started, 3)
+            return result
+
+        if self.hedge_policy == HEDGE_CONCURRENT:
+            logger.info("Opening Asgard long and Hyperliquid short concurrently")
+            asgard_result, hyperliquid_result = await asyncio.gather(
+                open_asgard(), open_hedge(),
+            )
+            if not asgard_result.success and hyperliquid_result.success:
+                logger.error(
+                    f"Asgard leg failed with the hedge open; closing Hyperliquid short: "
+                    f"{asgard_result.error}"
+                )
+                unwound = await self._unwind_hyperliquid_position(coin, sol_size)
+                self._record_entry(timing, started, exposure_end=time.monotonic())
+                if not unwound:
+                    logger.error(
+                        f"CRITICAL: Failed to close Hyperliquid short after Asgard failure! "
+                        f"Manual intervention required. Position: {coin} {sol_size}"
+                    )
+                    return PositionManagerResult(
+                        success=False,
+                        error=(
+                            f"Failed to open Asgard position: {asgard_result.error}; "
+                            f"Hyperliquid short left open"
+                        ),
+                        stage="hedge_unwind_failed",
+                        entry_timing=timing,
+                    )
+        else:
+            # Step 1: Open Asgard Long FIRST
+            logger.info(f"Step 1: Opening Asgard long position")
+            asgard_result = await open_asgard()
+            hyperliquid_result = None
+
         if not asgard_result.success:
             return PositionManagerResult(
                 success=False,
                 error=f"Failed to open Asgard position: {asgard_result.error}",
-                stage="asgard_open"
+                stage="asgard_open",
+                entry_timing=timing,
             )
         
         logger.info(
             f"Asgard position opened: {asgard_result.position.position_pda} "
             f"with intent {asgard_result.intent_id}"
         )
-        
-        # Step 2: Open Hyperliquid Short
-        logger.info(f"Step 2: Opening Hyperliquid short position")
-        
-        # Calculate SOL size for short (should match long exposure)
-        sol_size = token_amount  # Size in SOL tokens
-        
-        hyperliquid_result = await self._open_hyperliquid_position(
-            position_id=position_id,
-            coin="SOL",
-            size_sol=sol_size,
-            leverage=int(opportunity.leverage),
-        )
+
+        if hyperliquid_result is None:
+            # Step 2: Open Hyperliquid Short (pre-staged; fires on confirmation)
+            logger.info(f"Step 2: Opening Hyperliquid short position")
+            hyperliquid_result = await open_hedge()
         
         if not hyperliquid_result.success:
             # FAILED - Need to unwind Asgard position
@@ -593,6 +838,7 @@ class PositionManager:
             unwind_result = await self._unwind_asgard_position(
                 asgard_result.position.position_pda
             )
+            self._record_entry(timing, started, exposure_end=time.monotonic())
             
             if not unwind_result:
                 logger.error(
@@ -603,14 +849,16 @@ class PositionManager:
             return PositionManagerResult(
                 success=False,
                 error=f"Failed to open Hyperliquid position: {hyperliquid_result.error}",
-                stage="hyperliquid_open"
+                stage="hyperliquid_open",
+                entry_timing=timing,
             )
         
         logger.info(
             f"Hyperliquid short opened: {hyperliquid_result.order_id} "
             f"avg price {hyperliquid_result.avg_px}"
         )
-        
+        self._record_entry(timing, started)
+
         # Step 3: Post-execution validation
         logger.info(f"Step 3: Post-execution validation")
         
@@ -627,7 +875,7 @@ class PositionManager:
             
             await self._emergency_close_position(
                 asgard_pda=asgard_result.position.position_pda,
-                hyperliquid_coin="SOL",
+                hyperliquid_coin=coin,
                 hyperliquid_size=sol_size
             )
             
@@ -679,8 +927,62 @@ class PositionManager:
         
         return PositionManagerResult(
             success=True,
-            position=combined_position
+            position=combined_position,
+            entry_timing=timing,
+        )
+
+    @staticmethod
+    def _hedge_notional_usd(opportunity: ArbitrageOpportunity) -> Decimal:
+        """USD notional of the Hyperliquid short for an opportunity."""
+        return opportunity.position_size_usd / 2
+
+    def _record_entry(
+        self,
+        timing: EntryTiming,
+        started: float,
+        exposure_end: Optional[float] = None,
+    ) -> None:
+        """Finish an entry's timing: exposure window and history."""
+        now = time.monotonic()
+        timing.total_s = round(now - started, 3)
+        first_leg = min(
+            (t for t in (timing.asgard_s, timing.hedge_s) if t is not None),
+            default=None,
+        )
+        if exposure_end is not None:
+            last_leg = exposure_end - started  # Lone leg closed again
+        else:
+            last_leg = max(timing.asgard_s or 0.0, timing.hedge_s or 0.0)
+        if first_leg is not None:
+            timing.single_leg_exposure_s = round(max(last_leg - first_leg, 0.0), 3)
+        self._entry_timings.append(timing)
+
+        exposure = timing.single_leg_exposure_s
+        if exposure is not None and exposure > self.MAX_SINGLE_LEG_EXPOSURE_SECONDS:
+            logger.warning(
+                f"Entry {timing.position_id}: single-leg exposure {exposure:.1f}s "
+                f"exceeded {self.MAX_SINGLE_LEG_EXPOSURE_SECONDS}s"
+            )
+        else:
+            logger.info(f"Entry {timing.position_id} timing: {timing.to_dict()}")
+
+    def get_entry_stats(self) -> Dict[str, Any]:
+        """Single-leg exposure summary over recent entries."""
+        exposures = sorted(
+            t.single_leg_exposure_s for t in self._entry_timings
+            if t.single_leg_exposure_s is not None
         )
+        if not exposures:
+            return {"entries": len(self._entry_timings)}
+        return {
+            "entries": len(self._entry_timings),
+            "p50_exposure_s": exposures[len(exposures) // 2],
+            "max_exposure_s": exposures[-1],
+            "over_limit": sum(
+                1 for e in exposures if e > self.MAX_SINGLE_LEG_EXPOSURE_SECONDS
+            ),
+            "last": self._entry_timings[-1].to_dict(),
+        }
     
     async def _open_asgard_position(
         self,
@@ -704,8 +1006,9 @@ class PositionManager:
         coin: str,
         size_sol: Decimal,
         leverage: int,
+        update_leverage: bool = True,
     ) -> 'HyperliquidOpenResult':
-        """Open Hyperliquid short position."""
+        """Open Hyperliquid short position (leverage may be pre-staged)."""
 
         @dataclass
         class HyperliquidOpenResult:
@@ -715,16 +1018,17 @@ class PositionManager:
             position_info: Optional[HyperliquidPosition] = None
             error: Optional[str] = None
 
-        # First update leverage
-        try:
-            await self.hyperliquid_trader.update_leverage(
-                coin=coin,
-                leverage=leverage,
-                is_cross=True
-            )
-        except Exception as e:
-            logger.warning(f"Failed to update leverage: {e}")
-            # Continue anyway, leverage might already be set
+        # First update leverage (unless pre-staged)
+        if update_leverage:
+            try:
+                await self.hyperliquid_trader.update_leverage(
+                    coin=coin,
+                    leverage=leverage,
+                    is_cross=True
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update leverage: {e}")
+                # Continue anyway, leverage might already be set
         
         # Open short position with retry
         size_str = f"{float(size_sol):.6f}"
@@ -917,6 +1221,7 @@ class PositionManager:
         logger.info(f"Step 2: Closing Asgard long position")
         
         asgard_close_result = await self._close_asgard_position(position)
+        self._invalidate_preflight()
         
         if not asgard_close_result.success:
             logger.error(f"Failed to close Asgard position: {asgard_close_result.error}")
@@ -1010,6 +1315,19 @@ class PositionManager:
             logger.exception(f"Failed to unwind Asgard position {position_pda}")
             return False
     
+    async def _unwind_hyperliquid_position(self, coin: str, size: Decimal) -> bool:
+        """Unwind (close) a Hyperliquid short in case of failure."""
+        try:
+            result = await self.hyperliquid_trader.close_short(
+                coin=coin, size=f"{float(size):.6f}",
+            )
+            if not result.success:
+                logger.error(f"Failed to unwind Hyperliquid short {coin}: {result.error}")
+            return result.success
+        except Exception as e:
+            logger.exception(f"Failed to unwind Hyperliquid short {coin}")
+            return False
+
     async def _emergency_close_position(
         self,
         asgard_pda: str,
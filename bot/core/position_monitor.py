@@ -11,10 +11,32 @@ Runs every POLL_INTERVAL seconds:
 3. For each user, create a UserTradingContext with their wallets
 4. Run risk engine checks against live market data
 5. Trigger exits if any condition fires (health factor, funding flip, etc.)
-6. Update position data in DB with latest PnL, health factor
+6. Flush changed PnL / health factor snapshots to the DB in one statement
+
+In concurrent mode, users are monitored in parallel (bounded by a global
+concurrency cap) and each user's positions are checked in parallel. Venue
+calls are bounded by per-venue semaphores and every position's live-data
+fetch has a deadline, so one slow venue call cannot stall the whole cycle.
+
+Hyperliquid account state (positions, margin, balances) is read through a
+per-cycle ClearinghouseBatcher, so each wallet costs one clearinghouseState
+request per cycle no matter how many positions or balance reads it has.
+
+Per-user trading contexts are cached across cycles (UserContextCache): a
+steady-state cycle does one batched ``users`` query to detect wallet
+changes and no per-user context setup.
+
+When a MarketDataFeed is attached, the assets of open positions are
+subscribed on the Hyperliquid websocket and their streamed funding rates
+replace the polled ones while fresh.
+
+Live snapshot fields (PnL, margin, health factor, funding) are staged in a
+PositionSnapshotBuffer: unchanged values are skipped and the rest are
+written in one batched UPDATE at the end of the cycle. If ``on_position_update``
+is set, it receives a position's live fields only when one of them changed.
 
 Usage:
-    monitor = PositionMonitorService(db=db)
+    monitor = PositionMonitorService(db=db, concurrent=True)
     await monitor.start()  # Runs in background
     ...
     await monitor.stop()
@@ -22,18 +44,55 @@ Usage:
 import asyncio
 import json
 import logging
+import math
+import time
 from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from bot.core.position_snapshots import PositionSnapshotBuffer
 from bot.core.risk_engine import RiskEngine, ExitDecision, ExitReason
 from bot.core.user_risk_manager import UserRiskManager
+from bot.venues.context_cache import UserContextCache
+from bot.venues.hyperliquid.clearinghouse import ClearinghouseBatcher
 from bot.venues.user_context import UserTradingContext
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CycleStats:
+    """Timing summary for a single monitoring cycle."""
+    started_at: str
+    duration_s: float
+    users: int
+    positions: int
+    timed_out: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    over_budget: bool
+    clearinghouse_requests: int = 0
+    contexts_built: int = 0
+    snapshot_writes: int = 0
+    snapshot_skipped: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
 class PositionMonitorService:
     """
     Multi-tenant position monitoring service.
@@ -46,14 +105,71 @@ class PositionMonitorService:
     MAX_ERRORS_BEFORE_BACKOFF = 5
     BACKOFF_INTERVAL = 120  # seconds to wait after too many errors
 
-    def __init__(self, db, risk_engine: Optional[RiskEngine] = None):
+    # Concurrent mode limits
+    MAX_CONCURRENT_USERS = 16  # global cap on users monitored at once
+    VENUE_CONCURRENCY = {"hyperliquid": 8, "asgard": 4}  # in-flight calls per venue
+    POSITION_DEADLINE = 10.0  # seconds to fetch live data for one position
+
+    def __init__(
+        self,
+        db,
+        risk_engine: Optional[RiskEngine] = None,
+        concurrent: bool = False,
+        max_concurrency: Optional[int] = None,
+        venue_concurrency: Optional[Dict[str, int]] = None,
+        position_deadline: Optional[float] = None,
+        market_snapshots=None,
+        market_data=None,
+        on_position_update: Optional[
+            Callable[[str, str, Dict[str, Any]], Awaitable[None]]
+        ] = None,
+    ):
         self.db = db
+        # Optional (user_id, position_id, live fields) callback, on change only
+        self.on_position_update = on_position_update
+        self._published: Dict[str, Dict[str, Any]] = {}
+        # Optional MarketSnapshotService: one funding fetch per tick, not per user
+        self.market_snapshots = market_snapshots
+        # Optional MarketDataFeed: streamed funding overrides polled rates
+        self.market_data = market_data
         self.risk_engine = risk_engine or RiskEngine()
         self.user_risk_manager = UserRiskManager(db)
         self._running = False
         self._task: Optional[asyncio.Task] = None
         self._consecutive_errors = 0
 
+        # Concurrency controls (semaphores also bound the serial path)
+        self.concurrent = concurrent
+        self.max_concurrency = max_concurrency or self.MAX_CONCURRENT_USERS
+        self.position_deadline = position_deadline or self.POSITION_DEADLINE
+        limits = {**self.VENUE_CONCURRENCY, **(venue_concurrency or {})}
+        self.venue_concurrency = limits
+        self._user_slots = asyncio.Semaphore(self.max_concurrency)
+        self._venue_slots: Dict[str, asyncio.Semaphore] = {
+            venue: asyncio.Semaphore(limit) for venue, limit in limits.items()
+        }
+        # Exits for the same user never overlap (shared wallet nonces);
+        # a user's lock lives only while an exit holds or waits for it
+        self._exit_locks: Dict[str, asyncio.Lock] = {}
+        self._exit_lock_users: Dict[str, int] = defaultdict(int)
+
+        # Per-cycle latency tracking
+        self._position_latencies: List[float] = []
+        self._timed_out = 0
+        self.last_cycle_stats: Optional[CycleStats] = None
+
+        # One clearinghouseState response per wallet per cycle (created lazily)
+        self._clearinghouse: Optional[ClearinghouseBatcher] = None
+
+        # Trading contexts reused across cycles
+        self.contexts = UserContextCache(db, factory=self._build_context)
+
+        # Live position fields, diffed and written once per cycle
+        self.snapshots = PositionSnapshotBuffer(db)
+        self._snapshot_writes = 0
+        self._snapshot_skipped = 0
+        self._contexts_built_at_start = 0
+
     async def start(self):
         """Start the monitoring loop as a background task."""
         if self._running:
@@ -62,7 +178,10 @@ class PositionMonitorService:
 
         self._running = True
         self._task = asyncio.create_task(self._run_loop())
-        logger.info("PositionMonitorService started (interval=%ds)", self.POLL_INTERVAL)
+        logger.info(
+            "PositionMonitorService started (interval=%ds, mode=%s)",
+            self.POLL_INTERVAL, "concurrent" if self.concurrent else "serial",
+        )
 
     async def stop(self):
         """Stop the monitoring loop."""
@@ -73,6 +192,14 @@ class PositionMonitorService:
                 await self._task
             except asyncio.CancelledError:
                 pass
+        await self.snapshots.flush()
+        await self.contexts.close()
+        if self._clearinghouse is not None:
+            try:
+                await self._clearinghouse.client.close()
+            except Exception:
+                pass
+            self._clearinghouse = None
         logger.info("PositionMonitorService stopped")
 
     async def _run_loop(self):
@@ -114,8 +241,16 @@ class PositionMonitorService:
 
         if not rows:
             logger.debug("No active positions to monitor")
+            self.snapshots.retain(())
+            self._published.clear()
             return
 
+        open_ids = {row["id"] for row in rows}
+        self.snapshots.retain(open_ids)
+        for position_id in [p for p in self._published if p not in open_ids]:
+            del self._published[position_id]
+        skipped_at_start = self.snapshots.skipped
+
         # Group by user
         by_user: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for row in rows:
@@ -133,12 +268,93 @@ class PositionMonitorService:
             len(rows), len(by_user),
         )
 
-        for user_id, positions in by_user.items():
+        if self.market_data is not None:
+            assets = {
+                pos["data"].get("asset", "SOL")
+                for positions in by_user.values() for pos in positions
+            }
+            for asset in assets:
+                await self.market_data.track_asset(asset)
+
+        started = time.monotonic()
+        self._position_latencies = []
+        self._timed_out = 0
+
+        # Fresh account state every cycle; in-cycle reads share one response
+        if self._clearinghouse is None:
+            self._clearinghouse = ClearinghouseBatcher(
+                max_concurrency=self.venue_concurrency["hyperliquid"],
+            )
+        self._clearinghouse.reset()
+
+        # Drop contexts whose wallets changed (one query for all users)
+        self._contexts_built_at_start = self.contexts.misses
+        await self.contexts.validate(by_user.keys())
+
+        if self.concurrent:
+            await asyncio.gather(*(
+                self._monitor_user_bounded(user_id, positions)
+                for user_id, positions in by_user.items()
+            ))
+        else:
+            for user_id, positions in by_user.items():
+                try:
+                    await self._monitor_user_positions(user_id, positions)
+                except Exception as e:
+                    logger.error("Error monitoring user %s: %s", user_id, e)
+
+        self._snapshot_writes = await self.snapshots.flush()
+        self._snapshot_skipped = self.snapshots.skipped - skipped_at_start
+        self._record_cycle_stats(started, len(by_user), len(rows))
+
+    async def _monitor_user_bounded(
+        self,
+        user_id: str,
+        positions: List[Dict[str, Any]],
+    ):
+        """Monitor one user while holding a global concurrency slot."""
+        async with self._user_slots:
             try:
                 await self._monitor_user_positions(user_id, positions)
             except Exception as e:
                 logger.error("Error monitoring user %s: %s", user_id, e)
 
+    def _record_cycle_stats(self, started: float, users: int, positions: int):
+        """Summarise per-position latencies for the cycle that just ran."""
+        duration = time.monotonic() - started
+        latencies = sorted(self._position_latencies)
+        stats = CycleStats(
+            started_at=datetime.utcnow().isoformat(),
+            duration_s=round(duration, 3),
+            users=users,
+            positions=positions,
+            timed_out=self._timed_out,
+            p50_ms=round(_percentile(latencies, 50) * 1000, 1),
+            p95_ms=round(_percentile(latencies, 95) * 1000, 1),
+            p99_ms=round(_percentile(latencies, 99) * 1000, 1),
+            max_ms=round((latencies[-1] if latencies else 0.0) * 1000, 1),
+            over_budget=duration > self.POLL_INTERVAL,
+            clearinghouse_requests=(
+                self._clearinghouse.requests if self._clearinghouse else 0
+            ),
+            contexts_built=self.contexts.misses - self._contexts_built_at_start,
+            snapshot_writes=self._snapshot_writes,
+            snapshot_skipped=self._snapshot_skipped,
+        )
+        self.last_cycle_stats = stats
+
+        log = logger.warning if stats.over_budget else logger.info
+        log(
+            "Monitor cycle took %.2fs (budget %ds): users=%d positions=%d "
+            "timed_out=%d p50=%.0fms p95=%.0fms p99=%.0fms max=%.0fms",
+            stats.duration_s, self.POLL_INTERVAL, users, positions,
+            stats.timed_out, stats.p50_ms, stats.p95_ms, stats.p99_ms, stats.max_ms,
+        )
+
+    def get_cycle_stats(self) -> Optional[Dict[str, Any]]:
+        """Return timing stats for the most recent cycle (None before first)."""
+        return self.last_cycle_stats.to_dict() if self.last_cycle_stats else None
+
     async def _monitor_user_positions(
         self,
         user_id: str,
@@ -147,7 +363,7 @@ class PositionMonitorService:
         """
         Monitor all positions for a single user.
 
-        Creates a UserTradingContext for the user, fetches live market data,
+        Uses the user's cached UserTradingContext, fetches live market data,
         and checks each position against the risk engine.  Loads per-user
         strategy config for exit thresholds (7.2.4).
         """
@@ -158,30 +374,121 @@ class PositionMonitorService:
             (user_id,),
         )
 
-        ctx = await UserTradingContext.from_user_id(user_id, self.db)
+        ctx = await self.contexts.get(user_id)
+        hl_trader = ctx.get_hl_trader()
+
+        try:
+            funding_rates = await self._get_funding_rates(hl_trader)
+        except Exception as e:
+            logger.warning("Failed to fetch funding rates for user %s: %s", user_id, e)
+            funding_rates = {}
+
+        if self.concurrent:
+            await asyncio.gather(*(
+                self._check_position_timed(ctx, pos_info, funding_rates, strategy_config)
+                for pos_info in positions
+            ))
+        else:
+            for pos_info in positions:
+                await self._check_position_timed(
+                    ctx, pos_info, funding_rates, strategy_config,
+                )
+
+    async def _build_context(self, user_id: str) -> UserTradingContext:
+        """Build a user's trading context (cache miss)."""
+        if self._clearinghouse is None:
+            self._clearinghouse = ClearinghouseBatcher(
+                max_concurrency=self.venue_concurrency["hyperliquid"],
+            )
+        return await UserTradingContext.from_user_id(
+            user_id, self.db, clearinghouse=self._clearinghouse,
+        )
 
-        async with ctx:
-            hl_trader = ctx.get_hl_trader()
+    async def _get_funding_rates(self, hl_trader) -> Dict:
+        """
+        Current funding rates, from the shared snapshot when available.
 
+        Fresh streamed rates for tracked assets override the polled values.
+        """
+        if self.market_snapshots is not None:
+            snapshot = await self.market_snapshots.get()
+            rates = dict(snapshot.funding_rates)
+        else:
+            async with self._venue_slots["hyperliquid"]:
+                rates = await hl_trader.oracle.get_current_funding_rates()
+        if self.market_data is not None:
+            rates = {**rates, **self.market_data.store.get_funding_rates()}
+        return rates
+
+    async def _check_position_timed(
+        self,
+        ctx: UserTradingContext,
+        pos_info: Dict[str, Any],
+        funding_rates: Dict,
+        strategy_config: Optional[Dict[str, Any]],
+    ):
+        """Check one position, recording its latency and swallowing errors."""
+        started = time.monotonic()
+        try:
+            await self._check_position(
+                ctx=ctx,
+                pos_info=pos_info,
+                funding_rates=funding_rates,
+                strategy_config=strategy_config,
+            )
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            logger.error(
+                "Position %s for user %s exceeded %.1fs live-data deadline",
+                pos_info["position_id"], ctx.user_id, self.position_deadline,
+            )
+        except Exception as e:
+            logger.error(
+                "Error checking position %s for user %s: %s",
+                pos_info["position_id"], ctx.user_id, e,
+            )
+        finally:
+            self._position_latencies.append(time.monotonic() - started)
+
+    async def _fetch_live_state(
+        self,
+        ctx: UserTradingContext,
+        position_id: str,
+        asset: str,
+        asgard_pda: Optional[str],
+    ):
+        """Fetch HL position and Asgard health under venue limits and deadline.
+
+        Both venue reads run in parallel.  Only the read side is bounded by
+        the deadline — exits are never cancelled half-way.
+
+        Returns:
+            Tuple of (hl_position, asgard_health).
+
+        Raises:
+            asyncio.TimeoutError: If the reads exceed ``position_deadline``.
+        """
+        async def fetch_hl():
+            async with self._venue_slots["hyperliquid"]:
+                return await ctx.get_hl_trader().get_position(asset)
+
+        async def fetch_asgard():
+            if not asgard_pda:
+                return None
+            asgard_mgr = ctx.get_asgard_manager()
             try:
-                funding_rates = await hl_trader.oracle.get_current_funding_rates()
+                async with self._venue_slots["asgard"]:
+                    health_status = await asgard_mgr.monitor_health(asgard_pda)
+                if health_status:
+                    return health_status.health_factor
             except Exception as e:
-                logger.warning("Failed to fetch funding rates for user %s: %s", user_id, e)
-                funding_rates = {}
+                logger.warning("Failed to check Asgard health for %s: %s", position_id, e)
+            return None
 
-            for pos_info in positions:
-                try:
-                    await self._check_position(
-                        ctx=ctx,
-                        pos_info=pos_info,
-                        funding_rates=funding_rates,
-                        strategy_config=strategy_config,
-                    )
-                except Exception as e:
-                    logger.error(
-                        "Error checking position %s for user %s: %s",
-                        pos_info["position_id"], user_id, e,
-                    )
+        return await asyncio.wait_for(
+            asyncio.gather(fetch_hl(), fetch_asgard()),
+            timeout=self.position_deadline,
+        )
 
     async def _check_position(
         self,
@@ -201,29 +508,19 @@ class PositionMonitorService:
         data = pos_info["data"]
         asset = data.get("asset", "SOL")
 
-        hl_trader = ctx.get_hl_trader()
-
-        # Get live Hyperliquid position data
-        hl_position = await hl_trader.get_position(asset)
-
-        # Get Asgard health (if we have a PDA)
-        asgard_health = None
-        asgard_pda = data.get("asgard_pda")
-        if asgard_pda:
-            asgard_mgr = ctx.get_asgard_manager()
-            try:
-                health_status = await asgard_mgr.monitor_health(asgard_pda)
-                if health_status:
-                    asgard_health = health_status.health_factor
-            except Exception as e:
-                logger.warning("Failed to check Asgard health for %s: %s", position_id, e)
+        # Get live Hyperliquid position data and Asgard health (if we have a PDA)
+        hl_position, asgard_health = await self._fetch_live_state(
+            ctx, position_id, asset, data.get("asgard_pda"),
+        )
 
         # Build position state for risk engine
         current_funding = None
         if asset in funding_rates:
             current_funding = funding_rates[asset]
 
-        # Update position data in DB with latest live data
+        funding_val = self._funding_value(current_funding)
+
+        # Stage latest live data; changed fields are written at end of cycle
         updates = {}
         if hl_position:
             updates["hl_unrealized_pnl"] = hl_position.unrealized_pnl
@@ -231,16 +528,12 @@ class PositionMonitorService:
             updates["hl_liquidation_px"] = hl_position.liquidation_px
         if asgard_health is not None:
             updates["asgard_health_factor"] = asgard_health
-        if current_funding is not None:
-            funding_val = current_funding.get("funding", 0) if isinstance(current_funding, dict) else current_funding
-            updates["current_funding_rate"] = float(funding_val) if funding_val else 0
+        if funding_val is not None:
+            updates["current_funding_rate"] = funding_val
 
         if updates:
-            merged = {**data, **updates}
-            await self.db.execute(
-                "UPDATE positions SET data = $1, updated_at = NOW() WHERE id = $2",
-                (json.dumps(merged), position_id),
-            )
+            self.snapshots.stage(position_id, data, updates)
+            await self._notify_update(ctx.user_id, position_id, updates)
 
         # Run system-level risk engine checks first
         exit_decision = self._evaluate_exit(data, hl_position, asgard_health, current_funding)
@@ -256,7 +549,52 @@ class PositionMonitorService:
                 "Exit trigger fired for position %s (user %s): %s",
                 position_id, ctx.user_id, exit_decision.reason.value,
             )
-            await self._execute_exit(ctx, position_id, data, exit_decision)
+            async with self._exit_lock(ctx.user_id):
+                await self._execute_exit(ctx, position_id, data, exit_decision)
+
+    @asynccontextmanager
+    async def _exit_lock(self, user_id: str):
+        """Hold the user's exit lock, dropping it once nobody holds or awaits it."""
+        lock = self._exit_locks.setdefault(user_id, asyncio.Lock())
+        self._exit_lock_users[user_id] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._exit_lock_users[user_id] -= 1
+            if not self._exit_lock_users[user_id]:
+                del self._exit_lock_users[user_id]
+                del self._exit_locks[user_id]
+
+    async def _notify_update(self, user_id: str, position_id: str, updates: Dict[str, Any]):
+        if self.on_position_update is None or self._published.get(position_id) == updates:
+            return
+        self._published[position_id] = dict(updates)
+        try:
+            await self.on_position_update(user_id, position_id, updates)
+        except Exception as e:
+            logger.warning("Position update callback failed for %s: %s", position_id, e)
+
+    @staticmethod
+    def _funding_value(current_funding) -> Optional[float]:
+        """
+        Hourly funding rate from whatever the funding source returned.
+
+        Accepts a FundingRate (oracle / market snapshot), a raw HL asset ctx
+        dict ({"funding": ...}) or a plain number.
+        """
+        if current_funding is None:
+            return None
+        if isinstance(current_funding, dict):
+            value = current_funding.get("funding", 0)
+        elif hasattr(current_funding, "funding_rate"):
+            value = current_funding.funding_rate
+        else:
+            value = current_funding
+        try:
+            return float(value) if value else 0.0
+        except (TypeError, ValueError):
+            return None
 
     def _evaluate_exit(
         self,
@@ -287,8 +625,8 @@ class PositionMonitorService:
                 details={"message": f"Margin fraction critical: {hl_position.margin_fraction:.2%}", "margin_fraction": hl_position.margin_fraction},
             )
 
-        if current_funding is not None:
-            funding_val = current_funding.get("funding", 0) if isinstance(current_funding, dict) else current_funding
+        funding_val = self._funding_value(current_funding)
+        if funding_val is not None:
             if funding_val and float(funding_val) > 0:
                 return ExitDecision(
                     should_exit=True,
@@ -347,26 +685,22 @@ class PositionMonitorService:
 
         # Min exit carry APY check
         min_exit_carry = strategy_config.get("min_exit_carry_apy")
-        if min_exit_carry is not None and current_funding is not None:
-            funding_val = (
-                current_funding.get("funding", 0)
-                if isinstance(current_funding, dict)
-                else current_funding
-            )
+        funding_val = self._funding_value(current_funding)
+        if min_exit_carry is not None and funding_val is not None:
             if funding_val:
-                # Estimate current carry: abs(funding_8hr) * 3 * 365 * leverage * 100
-                rate_8hr = float(funding_val)
+                # Estimate current carry: abs(hourly funding) * 24 * 365 * leverage * 100
+                rate_hourly = float(funding_val)
                 leverage = data.get("leverage", 3.0)
-                current_carry_apy = abs(rate_8hr) * 3 * 365 * float(leverage) * 100
+                current_carry_apy = abs(rate_hourly) * 24 * 365 * float(leverage) * 100
 
-                if rate_8hr >= 0 or current_carry_apy < float(min_exit_carry):
+                if rate_hourly >= 0 or current_carry_apy < float(min_exit_carry):
                     return ExitDecision(
                         should_exit=True,
                         reason=ExitReason.NEGATIVE_APY,
                         details={
                             "current_carry_apy": round(current_carry_apy, 2),
                             "min_exit_carry_apy": float(min_exit_carry),
-                            "funding_rate_8hr": rate_8hr,
+                            "funding_rate_hourly": rate_hourly,
                         },
                     )
 
@@ -439,6 +773,9 @@ class PositionMonitorService:
                     ),
                 )
 
+            # The row was rewritten in full; don't merge stale live fields into it
+            self.snapshots.discard(position_id)
+
             # Update cooldown tracking (N6): record close time + current cooldown value
             try:
                 await self.db.execute(
@@ -0,0 +1,163 @@
+"""
+Write-behind buffer for live position snapshot fields.
+
+The position monitor refreshes a handful of live fields (PnL, margin
+fraction, health factor, funding) for every open position every cycle.
+Writing the whole ``data`` document back for each position rewrites rows
+that usually did not change and costs one pooled connection per position.
+
+``PositionSnapshotBuffer`` instead:
+
+- Diffs each position's live fields against the values last persisted
+  (seeded from the row the monitor just read) and drops no-op updates.
+- Holds the remaining changes until ``flush()``, which applies all of them
+  in one ``UPDATE ... FROM unnest(...)`` statement, merging only the changed
+  keys into the JSONB document (``data || patch``) so concurrent writers of
+  other keys are never clobbered.
+- Keeps unflushed changes after a failed flush and retries them next time.
+
+Usage:
+    buffer = PositionSnapshotBuffer(db)
+    buffer.stage(position_id, row_data, {"hl_unrealized_pnl": 12.5})
+    ...
+    await buffer.flush()  # Once per cycle
+"""
+import json
+import logging
+from typing import Any, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class PositionSnapshotBuffer:
+    """
+    Diffing, batched writer for live position fields.
+
+    Args:
+        db: Database with ``execute``.
+    """
+
+    TRACKED_FIELDS = (
+        "hl_unrealized_pnl",
+        "hl_margin_fraction",
+        "hl_liquidation_px",
+        "asgard_health_factor",
+        "current_funding_rate",
+    )
+
+    def __init__(self, db):
+        self.db = db
+        # Last values known to be in the DB, per position
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        # Changes waiting for the next flush, per position
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+        # Counters (cumulative)
+        self.staged = 0
+        self.skipped = 0
+        self.flushed = 0
+        self.flushes = 0
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def stage(
+        self,
+        position_id: str,
+        persisted_data: Dict[str, Any],
+        updates: Dict[str, Any],
+    ) -> bool:
+        """
+        Queue the fields of ``updates`` that differ from what is persisted.
+
+        Args:
+            position_id: Position row id.
+            persisted_data: The ``data`` document as read from the DB; used
+                to seed the baseline the first time a position is seen.
+            updates: Live field values from this cycle.
+
+        Returns:
+            True if anything was queued.
+        """
+        baseline = self._persisted.get(position_id)
+        if baseline is None:
+            baseline = {
+                field: persisted_data[field]
+                for field in self.TRACKED_FIELDS
+                if field in persisted_data
+            }
+            self._persisted[position_id] = baseline
+
+        pending = self._pending.get(position_id, {})
+        changed = {
+            field: value for field, value in updates.items()
+            if field not in baseline or baseline[field] != value
+        }
+        # A pending value superseded by the persisted one is no longer a change
+        for field in list(pending):
+            if field in updates and field not in changed:
+                del pending[field]
+
+        if changed:
+            pending.update(changed)
+        if pending:
+            self._pending[position_id] = pending
+        else:
+            self._pending.pop(position_id, None)
+
+        if changed:
+            self.staged += 1
+            return True
+        self.skipped += 1
+        return False
+
+    def discard(self, position_id: str) -> None:
+        """Forget a position (e.g. after it was closed and rewritten)."""
+        self._pending.pop(position_id, None)
+        self._persisted.pop(position_id, None)
+
+    def retain(self, position_ids: Iterable[str]) -> None:
+        """Drop state for positions that are no longer open."""
+        keep = set(position_ids)
+        for position_id in [p for p in self._persisted if p not in keep]:
+            self.discard(position_id)
+        for position_id in [p for p in self._pending if p not in keep]:
+            self._pending.pop(position_id, None)
+
+    async def flush(self) -> int:
+        """
+        Write every pending change in a single statement.
+
+        Returns:
+            Number of positions written (0 if nothing was pending or the
+            write failed; failed changes stay pending).
+        """
+        if not self._pending:
+            return 0
+
+        batch = self._pending
+        self._pending = {}
+        ids = list(batch)
+        patches = [json.dumps(batch[position_id], default=str) for position_id in ids]
+
+        try:
+            await self.db.execute(
+                """UPDATE positions AS p
+                   SET data = p.data || u.patch::jsonb, updated_at = NOW()
+                   FROM unnest($1::text[], $2::text[]) AS u(id, patch)
+                   WHERE p.id = u.id AND p.is_closed = 0""",
+                (ids, patches),
+            )
+        except Exception as e:
+            logger.warning("Position snapshot flush failed (%d positions): %s", len(ids), e)
+            # Newer staged values win over the failed batch
+            for position_id, changes in batch.items():
+                self._pending[position_id] = {**changes, **self._pending.get(position_id, {})}
+            return 0
+
+        for position_id, changes in batch.items():
+            self._persisted.setdefault(position_id, {}).update(changes)
+        self.flushed += len(ids)
+        self.flushes += 1
+        return len(ids)
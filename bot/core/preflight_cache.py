@@ -0,0 +1,186 @@
+"""
+Per-user cache of passed preflight checks.
+
+``PositionManager.run_preflight_checks`` hits Solana, Hyperliquid and
+Asgard for every check. The dashboard runs it once for ``/preflight`` and
+again when the user opens the position moments later. ``PreflightCache``
+keeps each *passed* check per (user, asset, leverage, size bucket) for a
+check-specific TTL so the open path reuses it:
+
+- ``wallet_balance``: short-lived; also dropped on deposit, withdraw,
+  transfer and position open/close (``invalidate_user``).
+- ``protocol_capacity``: as long as a market snapshot stays fresh.
+- ``price_consensus`` / ``hedge_impact``: a few seconds (prices and the
+  book move; open_position re-checks consensus itself anyway).
+- ``opportunity_simulation``: as long as protocol capacity.
+
+A check passed for a size is reused only for the same or a smaller size
+within the bucket. Failed checks are never cached, so a user who fixes a
+problem (e.g. tops up) sees it on the next run. Opportunity fields a check
+writes (price deviation, selected protocol, expected hedge impact) are
+stored with it and restored on reuse.
+
+Usage:
+    cache = get_preflight_cache()
+    pm = PositionManager.from_user_context(ctx, preflight_cache=cache)
+    await pm.run_preflight_checks(opportunity)  # Reuses fresh passed checks
+    ...
+    cache.invalidate_user(user_id)  # After a deposit or withdrawal
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from bot.core.market_snapshot import MarketSnapshotService
+from shared.models.opportunity import ArbitrageOpportunity
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str, int]
+
+
+@dataclass
+class CachedCheck:
+    """One passed check and the opportunity fields it produced."""
+    size_usd: Decimal
+    checked_at: float
+    outputs: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.checked_at
+
+    def apply(self, opportunity: ArbitrageOpportunity) -> None:
+        for name, value in self.outputs.items():
+            setattr(opportunity, name, value)
+
+
+class PreflightCache:
+    """
+    LRU cache of passed preflight checks with per-check TTLs.
+
+    Args:
+        ttls: Optional per-check TTL overrides (seconds). Checks without
+            a TTL are never cached.
+        max_entries: Maximum (user, asset, leverage, bucket) keys kept.
+    """
+
+    CHECK_TTLS: Dict[str, float] = {
+        "wallet_balance": 15.0,
+        "price_consensus": 5.0,
+        "protocol_capacity": float(MarketSnapshotService.MAX_AGE),
+        "opportunity_simulation": float(MarketSnapshotService.MAX_AGE),
+        "hedge_impact": 5.0,
+    }
+
+    # Opportunity fields written by a check, restored when it is reused
+    CHECK_OUTPUTS: Dict[str, Tuple[str, ...]] = {
+        "price_consensus": ("price_deviation",),
+        "protocol_capacity": ("selected_protocol",),
+        "hedge_impact": ("expected_hedge_impact",),
+    }
+
+    # Sizes within 25% of each other share a bucket
+    SIZE_BUCKET_RATIO = 1.25
+    DEFAULT_MAX_ENTRIES = 2048
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttls = {**self.CHECK_TTLS, **(ttls or {})}
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self._entries: "OrderedDict[CacheKey, Dict[str, CachedCheck]]" = OrderedDict()
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def size_bucket(cls, size_usd: Decimal) -> int:
+        """Geometric bucket index for a position size."""
+        size = float(size_usd)
+        if size <= 1:
+            return 0
+        return int(math.log(size) / math.log(cls.SIZE_BUCKET_RATIO))
+
+    def _key(self, user_id: Optional[str], opportunity: ArbitrageOpportunity) -> CacheKey:
+        return (
+            user_id or "",
+            opportunity.asset.value,
+            str(opportunity.leverage),
+            self.size_bucket(opportunity.position_size_usd),
+        )
+
+    def get(
+        self,
+        user_id: Optional[str],
+        opportunity: ArbitrageOpportunity,
+        check: str,
+    ) -> Optional[CachedCheck]:
+        """Fresh passed result for ``check``, or None if it must be re-run."""
+        ttl = self.ttls.get(check)
+        if ttl is None:
+            return None
+        key = self._key(user_id, opportunity)
+        cached = self._entries.get(key, {}).get(check)
+        if (
+            cached is None
+            or cached.age >= ttl
+            or cached.size_usd < opportunity.position_size_usd
+        ):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return cached
+
+    def put(
+        self,
+        user_id: Optional[str],
+        opportunity: ArbitrageOpportunity,
+        check: str,
+    ) -> None:
+        """Record that ``check`` passed for ``opportunity``."""
+        if check not in self.ttls:
+            return
+        key = self._key(user_id, opportunity)
+        checks = self._entries.setdefault(key, {})
+        checks[check] = CachedCheck(
+            size_usd=opportunity.position_size_usd,
+            checked_at=time.monotonic(),
+            outputs={
+                name: getattr(opportunity, name)
+                for name in self.CHECK_OUTPUTS.get(check, ())
+            },
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: Optional[str]) -> None:
+        """Drop every cached check for a user (balances changed)."""
+        user = user_id or ""
+        for key in [k for k in self._entries if k[0] == user]:
+            del self._entries[key]
+        logger.debug("Preflight cache invalidated for user %s", user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Module-level singleton shared by the dashboard preflight and open paths
+_cache: Optional[PreflightCache] = None
+
+
+def get_preflight_cache() -> PreflightCache:
+    """Return the process-wide preflight cache."""
+    global _cache
+    if _cache is None:
+        _cache = PreflightCache()
+    return _cache
@@ -18,6 +18,7 @@ from shared.config.assets import Asset, get_mint
 
 from shared.utils.logger import get_logger
 from bot.venues.asgard.market_data import AsgardMarketData
+from bot.venues.client_registry import get_client_registry
 from bot.venues.hyperliquid.client import HyperliquidClient
 
 logger = get_logger(__name__)
@@ -131,10 +132,11 @@ class PriceConsensus:
     
     async def __aenter__(self) -> "PriceConsensus":
         """Async context manager entry."""
+        clients = get_client_registry()
         if self._own_asgard and self.asgard is None:
-            self.asgard = AsgardMarketData()
+            self.asgard = AsgardMarketData(clients.asgard_client())
         if self._own_hyperliquid and self.hyperliquid is None:
-            self.hyperliquid = HyperliquidClient()
+            self.hyperliquid = HyperliquidClient(pool=clients.pools["hyperliquid"])
         
         # Initialize sessions
         if self.asgard and self.asgard.client._session is None:
@@ -5,6 +5,11 @@ Server wallets need ETH on Arbitrum for gas (approve + bridge ≈ $0.10–0.50).
 This service periodically checks each active user's server EVM wallet and
 sends a small ETH top-up from an admin "gas funder" wallet if balance is low.
 
+Each cycle reads the funder's and every tenant's ETH balance in one
+Multicall3 sweep (a few ``eth_call`` round trips for thousands of wallets);
+the funder balance is then tracked locally across top-ups instead of being
+re-read before each one.
+
 Config (env vars / secrets):
     GAS_FUNDER_PRIVATE_KEY  — hex private key of the funder wallet
     GAS_TOP_UP_AMOUNT       — ETH to send per top-up (default 0.005)
@@ -14,11 +19,12 @@ Config (env vars / secrets):
 import asyncio
 from decimal import Decimal
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from eth_account import Account
 from web3 import AsyncWeb3
 
+from shared.chain.multicall import Multicall3Reader
 from shared.config.settings import get_settings, SECRETS_DIR
 from shared.db.database import Database
 from shared.utils.logger import get_logger
@@ -71,6 +77,7 @@ class GasFunder:
 
         self._account = Account.from_key(self._key)
         self._w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self._rpc_url))
+        self._multicall: Optional[Multicall3Reader] = None
         self._chain_id = 42161  # Arbitrum One
 
         logger.info(
@@ -94,6 +101,13 @@ class GasFunder:
         raw = await self._w3.eth.get_balance(self._w3.to_checksum_address(address))
         return Decimal(raw) / Decimal(10**18)
 
+    async def get_balances(self, addresses: List[str]) -> Dict[str, Optional[Decimal]]:
+        """ETH balances for many addresses in one Multicall3 sweep (None if unread)."""
+        if self._multicall is None:
+            self._multicall = Multicall3Reader(self._w3)
+        balances = await self._multicall.get_balances(addresses)
+        return {address: balance.eth for address, balance in balances.items()}
+
     async def send_eth(self, to_address: str, amount_eth: Decimal) -> str:
         """Send ETH from funder to a target address.
 
@@ -137,7 +151,17 @@ class GasFunder:
                WHERE server_evm_address IS NOT NULL"""
         )
 
-        funder_balance = await self.get_funder_balance()
+        # One sweep for the funder and every tenant wallet
+        addresses = [self._account.address] + [row["server_evm_address"] for row in rows]
+        try:
+            balances = await self.get_balances(addresses)
+        except Exception as e:
+            # Fall back to per-address reads so one failure can't stop the cycle
+            logger.warning("gas_funder_sweep_failed", error=str(e))
+            balances = {}
+        funder_balance = balances.get(self._account.address)
+        if funder_balance is None:
+            funder_balance = await self.get_funder_balance()
         logger.info(
             "gas_funder_check_start",
             user_count=len(rows),
@@ -162,19 +186,21 @@ class GasFunder:
             checked += 1
 
             try:
-                balance = await self.get_balance(address)
+                balance = balances.get(address)
+                if balance is None:
+                    balance = await self.get_balance(address)  # Not read by the sweep
 
                 if balance < self._min_balance:
-                    # Check funder still has enough
-                    current_funder = await self.get_funder_balance()
-                    if current_funder < self._top_up + Decimal("0.001"):
+                    # Check funder still has enough (tracked locally; 0.001 covers gas)
+                    if funder_balance < self._top_up + Decimal("0.001"):
                         logger.warning(
                             "gas_funder_insufficient",
-                            remaining_eth=str(current_funder),
+                            remaining_eth=str(funder_balance),
                         )
                         break
 
                     tx_hash = await self.send_eth(address, self._top_up)
+                    funder_balance -= self._top_up
                     logger.info(
                         "gas_top_up_complete",
                         user_id=user_id,
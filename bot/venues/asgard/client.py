@@ -22,6 +22,7 @@ from tenacity import (
 )
 
 from shared.config.settings import get_settings
+from shared.utils.http_pool import HttpConnectionPool
 from shared.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -80,6 +81,7 @@ class AsgardClient:
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         rate_limit_rps: Optional[float] = None,
+        pool: Optional[HttpConnectionPool] = None,
     ):
         """
         Initialize Asgard client.
@@ -88,12 +90,15 @@ class AsgardClient:
             api_key: Asgard API key. If not provided, loads from settings.
             base_url: Override base URL for API.
             rate_limit_rps: Requests per second limit. Default 1.0 for public.
+            pool: Shared connection pool; the session borrows its
+                connector instead of opening its own connections.
         """
         settings = get_settings()
         
         self.api_key = api_key or settings.asgard_api_key
         self.base_url = base_url or self.BASE_URL
         self.rate_limit_rps = rate_limit_rps or self.DEFAULT_RATE_LIMIT
+        self.pool = pool
         
         self._session: Optional[aiohttp.ClientSession] = None
         self._last_request_time: Optional[float] = None
@@ -124,6 +129,8 @@ class AsgardClient:
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=30),
+                connector=self.pool.connector() if self.pool else None,
+                connector_owner=self.pool is None,
             )
             logger.debug("Asgard client session initialized")
     
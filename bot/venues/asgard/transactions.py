@@ -214,7 +214,7 @@ class AsgardTransactionBuilder:
             import base64 as b64
             unsigned_tx_b64 = b64.b64encode(unsigned_tx).decode("utf-8")
 
-            signed_response_b64 = self.privy_signer.sign_solana_transaction(
+            signed_response_b64 = await self.privy_signer.sign_solana_transaction_async(
                 unsigned_tx_b64
             )
 
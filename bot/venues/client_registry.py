@@ -0,0 +1,214 @@
+"""
+Process-wide venue client registry.
+
+Owns one keep-alive connection pool per venue/RPC endpoint and hands out
+lightweight client facades that borrow it:
+
+- ``hyperliquid_client()`` / ``asgard_client()``: a new client object whose
+  aiohttp session runs on the venue's shared ``HttpConnectionPool`` (tuned
+  connection limits, DNS cache, keep-alive). Closing the facade only drops
+  its session; pooled connections survive for the next caller.
+- ``solana_client()`` / ``arbitrum_client()``: a new ``SolanaClient`` /
+  ``ArbitrumClient`` over one shared RPC transport (solana-py ``AsyncClient``
+  / ``AsyncWeb3``). Closing the facade leaves the transport open. Solana
+  clients also share one ``SignatureConfirmer`` (one websocket for every
+  transaction confirmation).
+
+Connection setup therefore happens once per process (and event loop)
+rather than once per user context, scan cycle or request.
+
+Usage:
+    clients = get_client_registry()
+    async with clients.hyperliquid_client() as hl:
+        mids = await hl.get_all_mids()
+    ...
+    await close_client_registry()  # Shutdown
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set
+
+from solana.rpc.async_api import AsyncClient
+from solana.rpc.commitment import Confirmed
+from web3 import AsyncWeb3
+
+from bot.venues.asgard.client import AsgardClient
+from bot.venues.hyperliquid.client import HyperliquidClient
+from shared.chain.arbitrum import DEFAULT_ARBITRUM_RPC, ArbitrumClient
+from shared.chain.solana import SolanaClient
+from shared.chain.solana_confirmations import SignatureConfirmer, ws_url_for
+from shared.config.settings import get_settings
+from shared.utils.http_pool import HttpConnectionPool
+from shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool sizing for one venue."""
+    limit: int = HttpConnectionPool.DEFAULT_LIMIT
+    limit_per_host: int = HttpConnectionPool.DEFAULT_LIMIT_PER_HOST
+    dns_ttl: int = HttpConnectionPool.DEFAULT_DNS_TTL
+    keepalive_timeout: float = HttpConnectionPool.DEFAULT_KEEPALIVE_TIMEOUT
+
+
+class VenueClientRegistry:
+    """
+    Shared connection pools and client facades for every venue.
+
+    Args:
+        pools: Per-venue overrides of ``DEFAULT_POOLS``
+            (keys: "hyperliquid", "asgard").
+    """
+
+    # Hyperliquid carries the monitor, scanners and order flow; Asgard is
+    # rate-limited to a few rps, so a small pool is plenty.
+    DEFAULT_POOLS: Dict[str, PoolConfig] = {
+        "hyperliquid": PoolConfig(limit=64, limit_per_host=32),
+        "asgard": PoolConfig(limit=16, limit_per_host=8),
+    }
+
+    def __init__(self, pools: Optional[Dict[str, PoolConfig]] = None):
+        configs = {**self.DEFAULT_POOLS, **(pools or {})}
+        self.pools: Dict[str, HttpConnectionPool] = {
+            venue: HttpConnectionPool(
+                venue,
+                limit=cfg.limit,
+                limit_per_host=cfg.limit_per_host,
+                dns_ttl=cfg.dns_ttl,
+                keepalive_timeout=cfg.keepalive_timeout,
+            )
+            for venue, cfg in configs.items()
+        }
+
+        # Shared RPC transports (created lazily, per event loop)
+        self._transports: Dict[str, Any] = {}
+        self._transport_loops: Dict[str, Optional[asyncio.AbstractEventLoop]] = {}
+        self._confirmer: Optional[SignatureConfirmer] = None
+        # Closes of confirmers replaced along with their transport
+        self._retiring: Set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Facades
+    # ------------------------------------------------------------------
+
+    def hyperliquid_client(self) -> HyperliquidClient:
+        """New HyperliquidClient on the shared Hyperliquid pool."""
+        return HyperliquidClient(pool=self.pools["hyperliquid"])
+
+    def asgard_client(self) -> AsgardClient:
+        """New AsgardClient on the shared Asgard pool."""
+        return AsgardClient(pool=self.pools["asgard"])
+
+    def solana_client(self) -> SolanaClient:
+        """New SolanaClient over the shared Solana RPC transport."""
+        rpc_url = get_settings().solana_rpc_url
+        transport = self._transport(
+            "solana", lambda: AsyncClient(rpc_url, commitment=Confirmed)
+        )
+        return SolanaClient(
+            rpc_url=rpc_url, client=transport, confirmer=self._solana_confirmer(transport, rpc_url)
+        )
+
+    def _solana_confirmer(self, transport: AsyncClient, rpc_url: str) -> SignatureConfirmer:
+        """One SignatureConfirmer per Solana transport (one websocket per process)."""
+        # Recreated with the transport (e.g. on a new event loop)
+        if self._confirmer is None or self._confirmer.client is not transport:
+            if self._confirmer is not None:
+                self._retire_confirmer(self._confirmer)
+            self._confirmer = SignatureConfirmer(transport, ws_url=ws_url_for(rpc_url))
+        return self._confirmer
+
+    def _retire_confirmer(self, confirmer: SignatureConfirmer) -> None:
+        """Schedule closing a replaced confirmer (its poller, websocket and session)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Transports are only replaced from a running loop
+        task = loop.create_task(self._close_confirmer(confirmer))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _close_confirmer(self, confirmer: SignatureConfirmer) -> None:
+        try:
+            await confirmer.close()
+        except Exception as e:
+            logger.warning(f"Error closing Solana signature confirmer: {e}")
+
+    def arbitrum_client(self) -> ArbitrumClient:
+        """New ArbitrumClient over the shared Arbitrum RPC transport."""
+        rpc_url = get_settings().arbitrum_rpc_url or DEFAULT_ARBITRUM_RPC
+        transport = self._transport(
+            "arbitrum", lambda: AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        )
+        return ArbitrumClient(rpc_url=rpc_url, w3=transport)
+
+    def _transport(self, name: str, factory) -> Any:
+        """Return the shared transport, recreating it if the event loop changed."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        transport = self._transports.get(name)
+        created_on = self._transport_loops.get(name)
+        if transport is None or (loop is not None and created_on not in (None, loop)):
+            transport = factory()
+            self._transports[name] = transport
+            self._transport_loops[name] = loop
+            logger.debug(f"{name} RPC transport created")
+        elif created_on is None and loop is not None:
+            self._transport_loops[name] = loop
+        return transport
+
+    # ------------------------------------------------------------------
+    # Shutdown
+    # ------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Close every pool and transport (call once, at shutdown)."""
+        for pool in self.pools.values():
+            await pool.close()
+
+        if self._retiring:
+            await asyncio.gather(*self._retiring)
+        if self._confirmer is not None:
+            await self._close_confirmer(self._confirmer)
+            self._confirmer = None
+
+        solana = self._transports.pop("solana", None)
+        if solana is not None:
+            try:
+                await solana.close()
+            except Exception as e:
+                logger.warning(f"Error closing Solana RPC transport: {e}")
+
+        arbitrum = self._transports.pop("arbitrum", None)
+        if arbitrum is not None:
+            try:
+                await arbitrum.provider.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing Arbitrum RPC transport: {e}")
+
+        self._transport_loops.clear()
+
+
+# Module-level singleton shared by the bot and dashboard
+_client_registry: Optional[VenueClientRegistry] = None
+
+
+def get_client_registry() -> VenueClientRegistry:
+    """Return the process-wide venue client registry."""
+    global _client_registry
+    if _client_registry is None:
+        _client_registry = VenueClientRegistry()
+    return _client_registry
+
+
+async def close_client_registry() -> None:
+    """Close pooled connections and drop the process-wide registry."""
+    global _client_registry
+    if _client_registry is not None:
+        await _client_registry.close()
+        _client_registry = None
@@ -0,0 +1,185 @@
+"""
+Cache of per-user trading contexts.
+
+Building a ``UserTradingContext`` costs a ``users`` query plus fresh trader,
+signer and manager objects; doing that for every user on every monitor
+cycle is pure overhead when wallets rarely change. ``UserContextCache``
+keeps contexts keyed by user_id:
+
+- LRU eviction beyond ``max_size`` and a ``ttl`` after which a context is
+  rebuilt from scratch.
+- ``validate(user_ids)`` runs one batched ``users`` query per cycle and
+  evicts any context whose wallet columns changed (or whose user is gone),
+  so provisioning a server wallet is picked up on the next cycle.
+- Evicted contexts may still be in use by an in-flight check, so they are
+  retired and only closed at the next ``validate`` or ``close``.
+
+Usage:
+    cache = UserContextCache(
+        db, factory=lambda uid: UserTradingContext.from_user_id(uid, db),
+    )
+    await cache.validate(user_ids)  # Start of each cycle
+    ctx = await cache.get(user_id)  # No DB or setup work on a hit
+    ...
+    await cache.close()
+"""
+import asyncio
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from bot.venues.user_context import UserTradingContext
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CachedContext:
+    ctx: UserTradingContext
+    created_at: float
+
+
+class UserContextCache:
+    """
+    LRU/TTL cache of UserTradingContext instances.
+
+    Args:
+        db: Database used for the batched wallet validation query.
+        factory: Coroutine function building a context for a user_id
+            (raises ValueError for unknown users, like ``from_user_id``).
+        max_size: Maximum cached contexts.
+        ttl: Seconds before a context is rebuilt.
+    """
+
+    DEFAULT_MAX_SIZE = 512
+    DEFAULT_TTL = 900  # 15 minutes
+
+    def __init__(
+        self,
+        db,
+        factory: Callable[[str], Awaitable[UserTradingContext]],
+        max_size: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ):
+        self.db = db
+        self.factory = factory
+        self.max_size = max_size or self.DEFAULT_MAX_SIZE
+        self.ttl = ttl or self.DEFAULT_TTL
+
+        self._entries: "OrderedDict[str, _CachedContext]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._retired: List[UserTradingContext] = []
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._entries
+
+    async def get(self, user_id: str) -> UserTradingContext:
+        """Return the cached context for ``user_id``, building it on a miss."""
+        entry = self._fresh_entry(user_id)
+        if entry is not None:
+            self.hits += 1
+            return entry.ctx
+
+        async with self._locks[user_id]:
+            # Another waiter may have built it while we queued
+            entry = self._fresh_entry(user_id)
+            if entry is not None:
+                self.hits += 1
+                return entry.ctx
+
+            self.misses += 1
+            ctx = await self.factory(user_id)
+            self._entries[user_id] = _CachedContext(ctx=ctx, created_at=time.monotonic())
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_size:
+                oldest, _ = next(iter(self._entries.items()))
+                self.invalidate(oldest)
+            return ctx
+
+    def _fresh_entry(self, user_id: str) -> Optional[_CachedContext]:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at >= self.ttl:
+            self.invalidate(user_id)
+            return None
+        self._entries.move_to_end(user_id)
+        return entry
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's context; it is closed at the next validate/close."""
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self.evictions += 1
+            self._retired.append(entry.ctx)
+
+    async def validate(self, user_ids: Iterable[str]) -> int:
+        """
+        Evict contexts whose ``users`` wallet columns changed.
+
+        Runs a single query for every cached user in ``user_ids`` and closes
+        previously retired contexts. Call at the start of a cycle, when no
+        context is in use.
+
+        Returns:
+            Number of contexts evicted.
+        """
+        await self._close_retired()
+
+        cached = [uid for uid in dict.fromkeys(user_ids) if uid in self._entries]
+        if not cached:
+            return 0
+
+        try:
+            rows = await self.db.fetchall(
+                f"""SELECT id, {UserTradingContext.WALLET_COLUMNS}
+                    FROM users WHERE id = ANY($1::text[])""",
+                (cached,),
+            )
+        except Exception as e:
+            # Keep serving cached contexts; TTL still bounds staleness
+            logger.warning("User context validation failed: %s", e)
+            return 0
+
+        current = {
+            row.get("id"): UserTradingContext.wallets_from_row(row) for row in rows
+        }
+        evicted = 0
+        for user_id in cached:
+            wallets = current.get(user_id)
+            ctx = self._entries[user_id].ctx
+            if wallets is None or ctx.wallet_key != (
+                wallets["solana_address"],
+                wallets["evm_address"],
+                wallets["evm_wallet_id"],
+                wallets["solana_wallet_id"],
+            ):
+                logger.info("User %s wallets changed; rebuilding trading context", user_id)
+                self.invalidate(user_id)
+                evicted += 1
+        return evicted
+
+    async def _close_retired(self) -> None:
+        retired, self._retired = self._retired, []
+        for ctx in retired:
+            try:
+                await ctx.close()
+            except Exception as e:
+                logger.debug("Error closing retired context for %s: %s", ctx.user_id, e)
+
+    async def close(self) -> None:
+        """Close every cached and retired context."""
+        for user_id in list(self._entries):
+            self.invalidate(user_id)
+        await self._close_retired()
+        self._locks.clear()
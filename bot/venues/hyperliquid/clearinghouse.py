@@ -0,0 +1,174 @@
+"""
+Hyperliquid Clearinghouse-State Batcher.
+
+``clearinghouseState`` is the single source for a wallet's positions,
+margin summary and withdrawable balance. Without coordination the monitor
+issues one request per position *and* per balance read, all for the same
+wallet. ``ClearinghouseBatcher`` holds one response per wallet for the
+lifetime of a monitoring cycle:
+
+- Concurrent requests for the same wallet share one in-flight fetch.
+- Later reads in the same cycle are served from the cached response.
+- Requests for different wallets run concurrently, bounded by
+  ``max_concurrency`` and spaced to stay within ``rate_limit_rps``.
+
+Usage:
+    batcher = ClearinghouseBatcher(client)
+    await batcher.prefetch([wallet_a, wallet_b])
+    state = await batcher.get(wallet_a)
+    ...
+    batcher.reset()  # Start of the next cycle
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, Optional
+
+from shared.utils.logger import get_logger
+
+from .client import HyperliquidClient
+
+logger = get_logger(__name__)
+
+
+class ClearinghouseBatcher:
+    """
+    Per-cycle cache and request coalescer for ``clearinghouseState``.
+
+    Args:
+        client: HyperliquidClient used for the info requests; defaults to
+            the pooled client from the process-wide registry.
+        max_concurrency: Maximum wallets fetched at once.
+        rate_limit_rps: Request budget; requests are spaced at least
+            ``1 / rate_limit_rps`` seconds apart.
+    """
+
+    # clearinghouseState has weight 2 against HL's 1200/min per-IP budget;
+    # 10 rps leaves headroom for order flow and the market snapshot.
+    DEFAULT_MAX_CONCURRENCY = 8
+    DEFAULT_RATE_LIMIT = 10.0
+
+    def __init__(
+        self,
+        client: Optional[HyperliquidClient] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit_rps: Optional[float] = None,
+    ):
+        if client is None:
+            # Imported here: the registry imports this package's client module
+            from bot.venues.client_registry import get_client_registry
+            client = get_client_registry().hyperliquid_client()
+        self.client = client
+        self.rate_limit_rps = rate_limit_rps or self.DEFAULT_RATE_LIMIT
+
+        self._states: Dict[str, dict] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bumped by invalidate()/reset() so fetches started before them are not stored
+        self._generations: Dict[str, int] = {}
+        self._slots = asyncio.Semaphore(max_concurrency or self.DEFAULT_MAX_CONCURRENCY)
+        self._rate_lock = asyncio.Lock()
+        self._last_request_time: Optional[float] = None
+
+        # Counters for the current cycle
+        self.requests = 0
+        self.cache_hits = 0
+
+    @staticmethod
+    def _key(wallet: str) -> str:
+        # EVM addresses are case-insensitive (checksum casing varies by source)
+        return wallet.lower()
+
+    async def get(self, wallet: str) -> dict:
+        """
+        Return the clearinghouse state for ``wallet``.
+
+        Raises whatever the underlying request raised; failures are not
+        cached, so a later call in the same cycle retries.
+        """
+        key = self._key(wallet)
+
+        state = self._states.get(key)
+        if state is not None:
+            self.cache_hits += 1
+            return state
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch(key, wallet))
+            self._inflight[key] = future
+        else:
+            self.cache_hits += 1
+
+        # Shield so one cancelled waiter doesn't cancel the shared fetch
+        return await asyncio.shield(future)
+
+    async def prefetch(self, wallets: Iterable[str]) -> Dict[str, dict]:
+        """
+        Fetch many wallets concurrently under the rate budget.
+
+        Returns the states that were fetched successfully, keyed by the
+        wallet as given. Failures are logged and omitted.
+        """
+        wallets = [w for w in dict.fromkeys(wallets) if w]
+        results = await asyncio.gather(
+            *(self.get(w) for w in wallets), return_exceptions=True
+        )
+
+        states: Dict[str, dict] = {}
+        for wallet, result in zip(wallets, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Clearinghouse prefetch failed for {wallet}: {result}")
+            else:
+                states[wallet] = result
+        return states
+
+    def invalidate(self, wallet: str) -> None:
+        """
+        Drop the cached state for one wallet (e.g. after an order fills).
+
+        A fetch already in flight may have read the pre-order state, so it
+        is detached: its waiters still get its result, but it is not cached
+        and the next ``get`` starts a fresh request.
+        """
+        key = self._key(wallet)
+        self._states.pop(key, None)
+        self._inflight.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Forget all cached states and counters; call at the start of each cycle.
+
+        Fetches still in flight from the previous cycle are detached the
+        same way ``invalidate`` detaches them.
+        """
+        for key in set(self._states) | set(self._inflight):
+            self._generations[key] = self._generations.get(key, 0) + 1
+        self._states.clear()
+        self._inflight.clear()
+        self.requests = 0
+        self.cache_hits = 0
+
+    async def _fetch(self, key: str, wallet: str) -> dict:
+        generation = self._generations.get(key, 0)
+        task = asyncio.current_task()
+        try:
+            async with self._slots:
+                await self._enforce_rate_limit()
+                self.requests += 1
+                state = await self.client.get_clearinghouse_state(wallet)
+            if self._generations.get(key, 0) == generation:
+                self._states[key] = state
+            return state
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+    async def _enforce_rate_limit(self) -> None:
+        """Space requests at least (1/rate_limit_rps) seconds apart."""
+        async with self._rate_lock:
+            if self._last_request_time is not None:
+                elapsed = time.monotonic() - self._last_request_time
+                min_interval = 1.0 / self.rate_limit_rps
+                if elapsed < min_interval:
+                    await asyncio.sleep(min_interval - elapsed)
+            self._last_request_time = time.monotonic()
@@ -21,6 +21,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from shared.utils.http_pool import HttpConnectionPool
 from shared.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -80,14 +81,21 @@ class HyperliquidClient:
     API_BASE = "https://api.hyperliquid.xyz"
     MAX_RETRIES = 3
     
-    def __init__(self, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        pool: Optional[HttpConnectionPool] = None,
+    ):
         """
         Initialize Hyperliquid client.
         
         Args:
             base_url: Override base URL for API.
+            pool: Shared connection pool; the session borrows its
+                connector instead of opening its own connections.
         """
         self.base_url = base_url or self.API_BASE
+        self.pool = pool
         self._session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self) -> "HyperliquidClient":
@@ -110,6 +118,8 @@ class HyperliquidClient:
             self._session = aiohttp.ClientSession(
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=30),
+                connector=self.pool.connector() if self.pool else None,
+                connector_owner=self.pool is None,
             )
             logger.debug("Hyperliquid client session initialized")
     
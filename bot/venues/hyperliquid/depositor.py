@@ -528,7 +528,7 @@ class HyperliquidDepositor:
     async def _sign_tx(self, tx: dict) -> bytes:
         """Sign a raw EVM transaction via Privy."""
         signer = self._get_privy_signer()
-        signed_hex = signer.sign_eth_transaction(tx)
+        signed_hex = await signer.sign_eth_transaction_async(tx)
         return bytes.fromhex(signed_hex.removeprefix("0x"))
 
     async def _poll_hl_credit(self, expected_amount: Decimal) -> bool:
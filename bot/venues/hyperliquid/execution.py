@@ -0,0 +1,252 @@
+"""
+Order execution helpers for HyperliquidTrader.
+
+- ``FillLedger`` accumulates the fills of one logical order across its IOC
+  attempts and reports the true volume-weighted average price. Exchange
+  responses are authoritative per order id; streamed ``userFills`` fill in
+  orders whose response was lost (timeouts, dropped connections) so a
+  retry never over-fills.
+- ``book_limit_price`` prices an IOC from the live L2 book: the level that
+  covers the remaining size plus a small buffer, capped at the maximum
+  slippage from the reference price.
+- ``estimate_impact`` walks the book for a target size and ``plan_slices``
+  splits a large order into child orders, each no larger than the depth
+  within the allowed impact (with a TWAP-style floor on the child size).
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Hyperliquid fill sides: "B" = buy (bid), "A" = sell (ask)
+BUY_SIDE = "B"
+SELL_SIDE = "A"
+
+# Extra room past the covering level so a small move does not miss the fill
+BOOK_PRICE_BUFFER = 0.001  # 0.1%
+
+
+class FillLedger:
+    """Fills for one logical order, keyed by exchange order id."""
+
+    def __init__(self):
+        # oid -> (size, notional) from exchange responses
+        self._reported: Dict[Any, Tuple[float, float]] = {}
+        # oid -> tid -> (size, price) from the user fills stream
+        self._streamed: Dict[Any, Dict[Any, Tuple[float, float]]] = {}
+        self.last_oid: Optional[Any] = None
+
+    def add_response_fill(self, oid: Any, total_sz: float, avg_px: float) -> None:
+        """Record a ``filled`` status from an exchange response."""
+        self._reported[oid] = (total_sz, total_sz * avg_px)
+        self.last_oid = oid
+
+    def add_stream_fills(self, fills: Iterable[Dict[str, Any]]) -> None:
+        """Record streamed fills (deduplicated by trade id)."""
+        for fill in fills:
+            oid = fill.get("oid")
+            tid = fill.get("tid", (fill.get("time"), fill.get("px"), fill.get("sz")))
+            self._streamed.setdefault(oid, {})[tid] = (float(fill["sz"]), float(fill["px"]))
+
+    def _totals(self) -> Tuple[float, float]:
+        size = notional = 0.0
+        for sz, ntl in self._reported.values():
+            size += sz
+            notional += ntl
+        for oid, fills in self._streamed.items():
+            if oid in self._reported:
+                continue  # Response already covers this order
+            for sz, px in fills.values():
+                size += sz
+                notional += sz * px
+        return size, notional
+
+    @property
+    def filled_sz(self) -> float:
+        return self._totals()[0]
+
+    @property
+    def avg_px(self) -> Optional[float]:
+        """Volume-weighted average fill price (None before any fill)."""
+        size, notional = self._totals()
+        return notional / size if size > 0 else None
+
+
+def book_limit_price(
+    book: Dict[str, Any],
+    is_buy: bool,
+    size: float,
+    ref_px: float,
+    max_slippage: float,
+) -> Optional[float]:
+    """
+    IOC limit price that should fill ``size`` against ``book``.
+
+    Args:
+        book: L2 book (``{"levels": [bids, asks]}`` of ``{"px", "sz"}``).
+        is_buy: True to take asks, False to take bids.
+        size: Size still to fill.
+        ref_px: Reference (mid) price the slippage cap is measured from.
+        max_slippage: Maximum fractional distance from ``ref_px``.
+
+    Returns:
+        Limit price, or None if the book side is empty.
+    """
+    levels = book.get("levels") or [[], []]
+    side = levels[1] if is_buy else levels[0]
+    if not side:
+        return None
+
+    cap = ref_px * (1 + max_slippage) if is_buy else ref_px * (1 - max_slippage)
+    covered = 0.0
+    price = None
+    for level in side:
+        price = float(level["px"])
+        covered += float(level["sz"])
+        if covered >= size:
+            break
+    else:
+        return cap  # Visible depth is short; go as far as allowed
+
+    if is_buy:
+        return min(price * (1 + BOOK_PRICE_BUFFER), cap)
+    return max(price * (1 - BOOK_PRICE_BUFFER), cap)
+
+
+def format_limit_px(px: float, is_buy: bool) -> str:
+    """Round a limit price to one decimal away from the book (never tighter)."""
+    ticks = round(px * 10, 6)  # Absorb float error before rounding
+    if is_buy:
+        return f"{math.ceil(ticks) / 10:.1f}"
+    return f"{math.floor(ticks) / 10:.1f}"
+
+
+def _book_side(book: Dict[str, Any], is_buy: bool) -> List[Dict[str, Any]]:
+    levels = book.get("levels") or [[], []]
+    return levels[1] if is_buy else levels[0]
+
+
+def book_mid(book: Dict[str, Any]) -> Optional[float]:
+    """Mid of the best bid and ask (None if either side is empty)."""
+    bids, asks = _book_side(book, False), _book_side(book, True)
+    if not bids or not asks:
+        return None
+    return (float(bids[0]["px"]) + float(asks[0]["px"])) / 2
+
+
+@dataclass
+class ImpactEstimate:
+    """Expected cost of sweeping ``size`` through the visible book."""
+    size: float
+    mid_px: float
+    filled_size: float  # Visible depth consumed (< size if the book is thin)
+    avg_px: Optional[float]
+    worst_px: Optional[float]
+
+    @property
+    def covered(self) -> bool:
+        return self.filled_size >= size_floor(self.size)
+
+    @property
+    def impact(self) -> float:
+        """Fractional distance of the average fill from mid (inf if uncovered)."""
+        if not self.covered or self.avg_px is None or self.mid_px <= 0:
+            return math.inf
+        return abs(self.avg_px - self.mid_px) / self.mid_px
+
+
+def size_floor(size: float) -> float:
+    """Size treated as filled (tolerates float dust)."""
+    return size * 0.999
+
+
+def estimate_impact(
+    book: Dict[str, Any],
+    is_buy: bool,
+    size: float,
+    mid_px: Optional[float] = None,
+) -> ImpactEstimate:
+    """Walk ``book`` for ``size`` and return the expected average/worst price."""
+    mid = mid_px if mid_px is not None else (book_mid(book) or 0.0)
+    filled = notional = 0.0
+    worst = None
+    for level in _book_side(book, is_buy):
+        if filled >= size:
+            break
+        take = min(float(level["sz"]), size - filled)
+        worst = float(level["px"])
+        filled += take
+        notional += take * worst
+    return ImpactEstimate(
+        size=size,
+        mid_px=mid,
+        filled_size=filled,
+        avg_px=notional / filled if filled > 0 else None,
+        worst_px=worst,
+    )
+
+
+@dataclass
+class SlicePlan:
+    """Child order sizes for one parent order."""
+    slices: List[float]
+    expected_impact: float  # Worst child's impact against the current book
+    single_impact: float  # Impact of sending the whole size at once
+
+    @property
+    def child_size(self) -> float:
+        return self.slices[0]
+
+
+def depth_within(
+    book: Dict[str, Any],
+    is_buy: bool,
+    max_impact: float,
+    mid_px: Optional[float] = None,
+) -> float:
+    """Visible size priced within ``max_impact`` of mid."""
+    mid = mid_px if mid_px is not None else book_mid(book)
+    if not mid:
+        return 0.0
+    bound = mid * (1 + max_impact) if is_buy else mid * (1 - max_impact)
+    depth = 0.0
+    for level in _book_side(book, is_buy):
+        px = float(level["px"])
+        if (is_buy and px > bound) or (not is_buy and px < bound):
+            break
+        depth += float(level["sz"])
+    return depth
+
+
+def plan_slices(
+    book: Dict[str, Any],
+    is_buy: bool,
+    size: float,
+    max_impact: float,
+    min_slice: float = 0.0,
+    mid_px: Optional[float] = None,
+) -> SlicePlan:
+    """
+    Split ``size`` into child orders that each stay within ``max_impact``.
+
+    Orders the book can absorb within ``max_impact`` go out whole. Larger
+    orders are cut to the depth within ``max_impact`` of mid, but never
+    below ``min_slice`` (bounds the number of children, TWAP-style, when
+    the book is thin). Children are expected to be sent as the book
+    refills, so each is costed against the current book on its own.
+    """
+    single = estimate_impact(book, is_buy, size, mid_px)
+    if single.impact <= max_impact:
+        return SlicePlan([size], single.impact, single.impact)
+
+    child = max(depth_within(book, is_buy, max_impact, mid_px), min_slice)
+    child = min(child, size)
+    if child <= 0:
+        return SlicePlan([size], single.impact, single.impact)
+
+    count = int(size // child)
+    slices = [child] * count
+    remainder = size - child * count
+    if remainder > size * 0.001:
+        slices.append(remainder)
+    expected = estimate_impact(book, is_buy, child, mid_px).impact
+    return SlicePlan(slices, expected, single.impact)
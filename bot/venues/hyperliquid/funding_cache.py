@@ -0,0 +1,242 @@
+"""
+Hyperliquid Funding-History Cache.
+
+Append-only, process-wide cache of hourly ``fundingHistory`` entries shared
+by every ``HyperliquidFundingOracle`` (and the funding-history store). Each
+coin's history is held as a sorted list and, when a database is attached,
+persisted to the ``funding_history`` table so a restart reloads it instead
+of refetching a week of data.
+
+Freshness: Hyperliquid settles funding once per hour. A coin is fresh when
+its newest entry belongs to the current hour, or when its tail was fetched
+less than ``MIN_REFRESH_INTERVAL`` seconds ago (the venue may not have
+posted the new hour yet). A stale coin fetches only entries newer than its
+last stored timestamp; a full-window fetch only happens when the requested
+window starts before anything we hold.
+
+Usage:
+    cache = get_funding_history_cache()
+    cache.attach_db(db)  # Optional persistence (dashboard lifespan)
+    history = await cache.get(client, "SOL", hours=168)
+"""
+import asyncio
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from shared.utils.logger import get_logger
+
+from .funding_oracle import ANNUALIZE_FACTOR, FundingRate
+
+logger = get_logger(__name__)
+
+HOUR_MS = 60 * 60 * 1000
+
+
+class FundingHistoryCache:
+    """
+    Shared funding-history cache with tail-only refresh.
+
+    Args:
+        db: Optional Database for persistence (``funding_history`` table).
+    """
+
+    MIN_REFRESH_INTERVAL = 60  # seconds between tail fetches for one coin
+    RETENTION_HOURS = 168 * 2  # entries older than this are dropped
+
+    def __init__(self, db=None):
+        self.db = db
+        self._entries: Dict[str, List[FundingRate]] = {}
+        # Earliest timestamp from which each coin's history is complete
+        self._coverage_ms: Dict[str, int] = {}
+        self._last_refresh_ms: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Counters
+        self.fetches = 0
+        self.fetched_entries = 0
+
+    def attach_db(self, db) -> None:
+        """Enable Postgres persistence; coins are (re)loaded on next access."""
+        self.db = db
+        self.clear()
+
+    def clear(self, coin: Optional[str] = None) -> None:
+        """Forget cached history (all coins, or one)."""
+        coins = [coin] if coin else list(self._entries)
+        for c in coins:
+            self._entries.pop(c, None)
+            self._coverage_ms.pop(c, None)
+            self._last_refresh_ms.pop(c, None)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def get(
+        self,
+        client,
+        coin: str,
+        hours: int = 168,
+        now_ms: Optional[int] = None,
+    ) -> List[FundingRate]:
+        """
+        Return hourly funding entries for ``coin`` over the last ``hours``.
+
+        Args:
+            client: HyperliquidClient used for any tail fetch.
+            coin: Coin symbol (e.g., "SOL")
+            hours: Lookback window in hours
+            now_ms: Override "now" (epoch ms), mainly for tests
+
+        Returns:
+            FundingRate entries sorted by timestamp.
+        """
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        start_ms = now_ms - hours * HOUR_MS
+
+        async with self._locks[coin]:
+            if coin not in self._entries:
+                await self._load(coin, now_ms)
+            await self._refresh(client, coin, start_ms, now_ms)
+            entries = self._entries[coin]
+
+        return [r for r in entries if start_ms <= r.timestamp_ms <= now_ms]
+
+    def _is_fresh(self, coin: str, now_ms: int) -> bool:
+        entries = self._entries.get(coin)
+        if entries and entries[-1].timestamp_ms >= (now_ms // HOUR_MS) * HOUR_MS:
+            return True
+        last = self._last_refresh_ms.get(coin)
+        return last is not None and now_ms - last < self.MIN_REFRESH_INTERVAL * 1000
+
+    async def _refresh(self, client, coin: str, start_ms: int, now_ms: int) -> None:
+        """Fetch whatever part of [start_ms, now_ms] we don't hold yet."""
+        entries = self._entries[coin]
+        coverage = self._coverage_ms.get(coin)
+
+        if coverage is None or coverage > start_ms:
+            fetch_from = start_ms
+        elif self._is_fresh(coin, now_ms):
+            return
+        else:
+            fetch_from = entries[-1].timestamp_ms + 1 if entries else start_ms
+
+        raw = await client.get_funding_history(coin, fetch_from, now_ms)
+        self.fetches += 1
+
+        added = self._merge(coin, raw)
+        self.fetched_entries += len(raw)
+        self._coverage_ms[coin] = min(coverage, fetch_from) if coverage is not None else fetch_from
+        self._last_refresh_ms[coin] = now_ms
+        self._prune(coin, now_ms)
+
+        if added:
+            await self._persist(coin, added, now_ms)
+
+        logger.debug(
+            f"Funding history for {coin}: fetched {len(raw)} entries "
+            f"from {fetch_from}, {len(added)} new"
+        )
+
+    def _merge(self, coin: str, raw: List[dict]) -> List[FundingRate]:
+        """Append new entries, keeping the list sorted and de-duplicated."""
+        entries = self._entries.setdefault(coin, [])
+        known = {r.timestamp_ms for r in entries}
+        added: List[FundingRate] = []
+        for entry in raw:
+            ts = int(entry.get("time", 0))
+            if ts in known:
+                continue
+            rate = float(entry.get("fundingRate", 0))
+            added.append(FundingRate(
+                coin=coin,
+                funding_rate=rate,
+                timestamp_ms=ts,
+                annualized_rate=rate * ANNUALIZE_FACTOR,
+            ))
+            known.add(ts)
+
+        if added:
+            entries.extend(added)
+            entries.sort(key=lambda r: r.timestamp_ms)
+        return added
+
+    def _prune(self, coin: str, now_ms: int) -> None:
+        cutoff = now_ms - self.RETENTION_HOURS * HOUR_MS
+        entries = self._entries[coin]
+        if entries and entries[0].timestamp_ms < cutoff:
+            self._entries[coin] = [r for r in entries if r.timestamp_ms >= cutoff]
+            self._coverage_ms[coin] = max(self._coverage_ms.get(coin, cutoff), cutoff)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    async def _load(self, coin: str, now_ms: int) -> None:
+        """Load persisted history for ``coin`` (best-effort)."""
+        self._entries[coin] = []
+        if self.db is None:
+            return
+
+        cutoff = now_ms - self.RETENTION_HOURS * HOUR_MS
+        try:
+            rows = await self.db.fetchall(
+                """SELECT time_ms, funding_rate FROM funding_history
+                   WHERE coin = $1 AND time_ms >= $2
+                   ORDER BY time_ms ASC""",
+                (coin, cutoff),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load funding history for {coin}: {e}")
+            return
+
+        self._entries[coin] = [
+            FundingRate(
+                coin=coin,
+                funding_rate=float(row["funding_rate"]),
+                timestamp_ms=int(row["time_ms"]),
+                annualized_rate=float(row["funding_rate"]) * ANNUALIZE_FACTOR,
+            )
+            for row in rows
+        ]
+        if rows:
+            # History is complete from (just before) the first stored hour;
+            # any gap after the last row is covered by the tail fetch.
+            self._coverage_ms[coin] = int(rows[0]["time_ms"]) - HOUR_MS
+
+    async def _persist(self, coin: str, added: List[FundingRate], now_ms: int) -> None:
+        """Append new entries and drop expired ones (best-effort)."""
+        if self.db is None:
+            return
+        try:
+            await self.db.executemany(
+                """INSERT INTO funding_history (coin, time_ms, funding_rate)
+                   VALUES ($1, $2, $3)
+                   ON CONFLICT (coin, time_ms) DO NOTHING""",
+                [(coin, r.timestamp_ms, r.funding_rate) for r in added],
+            )
+            await self.db.execute(
+                "DELETE FROM funding_history WHERE coin = $1 AND time_ms < $2",
+                (coin, now_ms - self.RETENTION_HOURS * HOUR_MS),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to persist funding history for {coin}: {e}")
+
+
+# Module-level singleton shared by all oracle instances
+_funding_history_cache: Optional[FundingHistoryCache] = None
+
+
+def get_funding_history_cache() -> FundingHistoryCache:
+    """Return the process-wide funding-history cache."""
+    global _funding_history_cache
+    if _funding_history_cache is None:
+        _funding_history_cache = FundingHistoryCache()
+    return _funding_history_cache
+
+
+def reset_funding_history_cache() -> None:
+    """Drop the process-wide cache (tests)."""
+    global _funding_history_cache
+    _funding_history_cache = None
@@ -83,9 +83,49 @@ class HyperliquidFundingOracle:
     # Maximum acceptable volatility (50%)
     MAX_VOLATILITY = 0.50
 
-    def __init__(self, client: Optional[HyperliquidClient] = None):
+    def __init__(
+        self,
+        client: Optional[HyperliquidClient] = None,
+        history_cache=None,
+        market_data=None,
+    ):
+        # Imported here: funding_cache depends on FundingRate from this module
+        from .funding_cache import get_funding_history_cache
+
         self.client = client or HyperliquidClient()
-        self._cache: Dict[str, List[FundingRate]] = {}
+        # Shared across oracle instances; only the tail is fetched when stale
+        self.history = history_cache or get_funding_history_cache()
+        self._owns_history = history_cache is not None
+        # Streamed asset contexts; falls back to the process feed when started
+        self.market_data = market_data
+
+    def _live_ctx(self, coin: str) -> Optional[dict]:
+        """Fresh streamed asset context for ``coin``, or None (use REST)."""
+        from .market_data import active_market_data_feed
+
+        feed = self.market_data or active_market_data_feed()
+        if feed is None:
+            return None
+        return feed.store.get_asset_ctx(coin)
+
+    async def get_current_funding_rate(self, coin: str) -> Optional[FundingRate]:
+        """
+        Current funding rate for one coin.
+
+        Read from the streamed asset context when fresh, otherwise from
+        ``metaAndAssetCtxs``.
+        """
+        ctx = self._live_ctx(coin)
+        if ctx is not None and ctx.get("funding") is not None:
+            rate = float(ctx["funding"])
+            return FundingRate(
+                coin=coin,
+                funding_rate=rate,
+                timestamp_ms=int(time.time() * 1000),
+                annualized_rate=rate * ANNUALIZE_FACTOR,
+            )
+        rates = await self.get_current_funding_rates()
+        return rates.get(coin)
 
     async def __aenter__(self) -> "HyperliquidFundingOracle":
         if not self.client._session or self.client._session.closed:
@@ -108,49 +148,55 @@ class HyperliquidFundingOracle:
         """
         try:
             response = await self.client.get_meta_and_asset_contexts()
+            funding_rates = self.funding_rates_from_meta(response)
 
-            # Response is a 2-element list: [meta, assetCtxs]
-            if isinstance(response, list) and len(response) == 2:
-                meta, asset_ctxs = response
-            elif isinstance(response, dict):
-                meta = response.get("meta", {})
-                asset_ctxs = response.get("assetCtxs", [])
-            else:
-                raise ValueError(f"Unexpected response format: {type(response)}")
+            logger.debug(f"Fetched funding rates for {len(funding_rates)} coins")
+            return funding_rates
 
-            funding_rates = {}
-            universe = meta.get("universe", [])
+        except Exception as e:
+            logger.error(f"Failed to fetch funding rates: {e}")
+            raise
 
-            for i, asset_info in enumerate(universe):
-                if i >= len(asset_ctxs):
-                    break
+    @staticmethod
+    def funding_rates_from_meta(response) -> Dict[str, FundingRate]:
+        """
+        Build per-coin FundingRate objects from a metaAndAssetCtxs response.
 
-                coin = asset_info.get("name")
-                if not coin:
-                    continue
+        Shared by get_current_funding_rates() and the market snapshot
+        service so both parse the universe identically.
+        """
+        # Response is a 2-element list: [meta, assetCtxs]
+        if isinstance(response, list) and len(response) == 2:
+            meta, asset_ctxs = response
+        elif isinstance(response, dict):
+            meta = response.get("meta", {})
+            asset_ctxs = response.get("assetCtxs", [])
+        else:
+            raise ValueError(f"Unexpected response format: {type(response)}")
 
-                ctx = asset_ctxs[i]
+        funding_rates = {}
+        universe = meta.get("universe", [])
+        timestamp_ms = int(time.time() * 1000)
 
-                # funding field is the hourly rate (string)
-                funding_rate = float(ctx.get("funding", 0))
-                timestamp_ms = int(time.time() * 1000)
+        for i, asset_info in enumerate(universe):
+            if i >= len(asset_ctxs):
+                break
 
-                # Annualize from hourly
-                annualized = funding_rate * ANNUALIZE_FACTOR
+            coin = asset_info.get("name")
+            if not coin:
+                continue
 
-                funding_rates[coin] = FundingRate(
-                    coin=coin,
-                    funding_rate=funding_rate,
-                    timestamp_ms=timestamp_ms,
-                    annualized_rate=annualized,
-                )
+            # funding field is the hourly rate (string)
+            funding_rate = float(asset_ctxs[i].get("funding", 0))
 
-            logger.debug(f"Fetched funding rates for {len(funding_rates)} coins")
-            return funding_rates
+            funding_rates[coin] = FundingRate(
+                coin=coin,
+                funding_rate=funding_rate,
+                timestamp_ms=timestamp_ms,
+                annualized_rate=funding_rate * ANNUALIZE_FACTOR,
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to fetch funding rates: {e}")
-            raise
+        return funding_rates
 
     def _parse_meta_and_ctxs(self, response) -> Tuple[dict, list]:
         """Parse metaAndAssetCtxs response into (meta, asset_ctxs)."""
@@ -182,34 +228,13 @@ class HyperliquidFundingOracle:
 
         Returns:
             List of FundingRate objects (hourly entries)
-        """
-        cache_key = f"{coin}_{hours}"
-
-        if cache_key in self._cache:
-            return self._cache[cache_key]
 
+        History comes from the shared FundingHistoryCache, which only
+        fetches entries newer than the last stored one.
+        """
         try:
-            end_time = int(time.time() * 1000)
-            start_time = end_time - (hours * 60 * 60 * 1000)
-
-            history = await self.client.get_funding_history(coin, start_time, end_time)
-
-            funding_rates = []
-            for entry in history:
-                # fundingHistory returns hourly rates (entries spaced 1 hour apart)
-                rate = float(entry.get("fundingRate", 0))
-                funding_rates.append(FundingRate(
-                    coin=coin,
-                    funding_rate=rate,
-                    timestamp_ms=entry.get("time", 0),
-                    annualized_rate=rate * ANNUALIZE_FACTOR,
-                ))
-
-            funding_rates.sort(key=lambda x: x.timestamp_ms)
-
-            self._cache[cache_key] = funding_rates
-
-            logger.debug(f"Fetched {len(funding_rates)} funding history entries for {coin}")
+            funding_rates = await self.history.get(self.client, coin, hours)
+            logger.debug(f"Loaded {len(funding_rates)} funding history entries for {coin}")
             return funding_rates
 
         except Exception as e:
@@ -244,10 +269,11 @@ class HyperliquidFundingOracle:
             FundingPrediction with predicted rate and components
         """
         try:
-            response = await self.client.get_meta_and_asset_contexts()
-            meta, asset_ctxs = self._parse_meta_and_ctxs(response)
-
-            ctx = self._find_coin_ctx(meta, asset_ctxs, coin)
+            ctx = self._live_ctx(coin)
+            if ctx is None:
+                response = await self.client.get_meta_and_asset_contexts()
+                meta, asset_ctxs = self._parse_meta_and_ctxs(response)
+                ctx = self._find_coin_ctx(meta, asset_ctxs, coin)
             if not ctx:
                 raise ValueError(f"Coin {coin} not found in asset contexts")
 
@@ -338,8 +364,7 @@ class HyperliquidFundingOracle:
         3. Funding volatility < 50%
         """
         try:
-            current_rates = await self.get_current_funding_rates()
-            current = current_rates.get(coin)
+            current = await self.get_current_funding_rate(coin)
 
             if not current:
                 return False, {"error": f"No funding data for {coin}"}
@@ -380,6 +405,13 @@ class HyperliquidFundingOracle:
             return False, {"error": str(e)}
 
     def clear_cache(self) -> None:
-        """Clear cached funding history."""
-        self._cache.clear()
+        """
+        Clear this oracle's cached funding history.
+
+        Only a history cache passed to this oracle is cleared. The shared
+        process-wide cache serves every oracle and is left intact (reset it
+        with ``funding_cache.reset_funding_history_cache``).
+        """
+        if self._owns_history:
+            self.history.clear()
         logger.debug("Funding oracle cache cleared")
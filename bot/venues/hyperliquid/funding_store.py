@@ -0,0 +1,210 @@
+"""
+Hyperliquid Funding-History Store.
+
+Keeps a rolling ``coins x hours`` matrix of hourly funding rates in memory
+so funding volatility can be computed for every tracked coin in a single
+vectorized pass, instead of one ``fundingHistory`` request and a pure-Python
+mean/variance per coin per scan.
+
+Column ``j`` of the matrix holds the funding settled in hour
+``end_hour - (hours - 1 - j)`` (epoch hours); missing hours are NaN.
+When the clock crosses an hour boundary the matrix is shifted left and each
+coin is re-read from the shared FundingHistoryCache, which fetches only the
+new tail (and reloads persisted history after a restart), so a steady-state
+sync costs one request per tracked coin per hour and none within the hour.
+
+Usage:
+    store = FundingHistoryStore(client)
+    await store.sync(["SOL", "ETH"])
+    vols = store.volatilities()  # {"SOL": 0.31, "ETH": 0.12}
+"""
+import asyncio
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from shared.utils.logger import get_logger
+
+from .client import HyperliquidClient
+from .funding_cache import HOUR_MS, FundingHistoryCache, get_funding_history_cache
+from .funding_oracle import FundingRate
+
+logger = get_logger(__name__)
+
+
+class FundingHistoryStore:
+    """
+    Rolling hourly funding-rate matrix for a set of coins.
+
+    Args:
+        client: HyperliquidClient used for ``fundingHistory`` requests.
+        hours: Lookback window (default 168h, matching the volatility check).
+        max_concurrency: Maximum concurrent history requests during sync.
+        history_cache: Funding-history cache (defaults to the shared one).
+    """
+
+    DEFAULT_HOURS = 168
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        client: Optional[HyperliquidClient] = None,
+        hours: int = DEFAULT_HOURS,
+        max_concurrency: Optional[int] = None,
+        history_cache: Optional[FundingHistoryCache] = None,
+    ):
+        self.client = client or HyperliquidClient()
+        self.history = history_cache or get_funding_history_cache()
+        self.hours = hours
+        self._slots = asyncio.Semaphore(max_concurrency or self.DEFAULT_MAX_CONCURRENCY)
+
+        self._coins: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._rates = np.full((0, hours), np.nan)
+        # Latest funding timestamp seen per coin (sync cursor)
+        self._cursor_ms: Dict[str, int] = {}
+        self._end_hour: Optional[int] = None
+
+    @property
+    def coins(self) -> List[str]:
+        """Coins currently tracked, in matrix row order."""
+        return list(self._coins)
+
+    def rates(self, coin: str) -> np.ndarray:
+        """Return a copy of one coin's hourly rates (NaN where missing)."""
+        return self._rates[self._index[coin]].copy()
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    async def sync(self, coins: Iterable[str], now_ms: Optional[int] = None) -> int:
+        """
+        Bring the matrix up to date for ``coins``.
+
+        Coins not in ``coins`` are dropped. A coin is re-read from the
+        history cache only once the current hour has rolled over past its
+        cursor; the cache itself fetches just the missing tail.
+
+        Returns:
+            Number of coins re-read.
+        """
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        self._set_coins(coins)
+        self._advance_to(now_ms // HOUR_MS)
+
+        current_hour_start = self._end_hour * HOUR_MS
+        stale = [
+            coin for coin in self._coins
+            if self._cursor_ms.get(coin, -1) < current_hour_start
+        ]
+        if not stale:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._read(coin, now_ms) for coin in stale),
+            return_exceptions=True,
+        )
+        for coin, result in zip(stale, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Funding history sync failed for {coin}: {result}")
+            else:
+                self._insert(coin, result)
+
+        logger.debug(f"Funding store synced {len(stale)}/{len(self._coins)} coins")
+        return len(stale)
+
+    def _set_coins(self, coins: Iterable[str]) -> None:
+        """Reshape the matrix to exactly ``coins``, keeping existing rows."""
+        wanted = list(dict.fromkeys(coins))
+        if wanted == self._coins:
+            return
+
+        rates = np.full((len(wanted), self.hours), np.nan)
+        for row, coin in enumerate(wanted):
+            old = self._index.get(coin)
+            if old is not None:
+                rates[row] = self._rates[old]
+
+        self._coins = wanted
+        self._index = {coin: row for row, coin in enumerate(wanted)}
+        self._rates = rates
+        self._cursor_ms = {
+            coin: ts for coin, ts in self._cursor_ms.items() if coin in self._index
+        }
+
+    def _advance_to(self, end_hour: int) -> None:
+        """Shift the window so its last column is ``end_hour``."""
+        if self._end_hour is None or end_hour - self._end_hour >= self.hours:
+            if self._end_hour is not None:
+                self._rates[:] = np.nan
+            self._end_hour = end_hour
+            return
+
+        shift = end_hour - self._end_hour
+        if shift <= 0:
+            return
+        self._rates[:, :-shift] = self._rates[:, shift:]
+        self._rates[:, -shift:] = np.nan
+        self._end_hour = end_hour
+
+    async def _read(self, coin: str, now_ms: int) -> List[FundingRate]:
+        async with self._slots:
+            return await self.history.get(self.client, coin, self.hours, now_ms=now_ms)
+
+    def _insert(self, coin: str, entries: List[FundingRate]) -> None:
+        """Write funding entries into the coin's row by hour bucket."""
+        row = self._index.get(coin)
+        if row is None:
+            return
+        first_hour = self._end_hour - self.hours + 1
+        cursor = self._cursor_ms.get(coin, -1)
+        for entry in entries:
+            ts = entry.timestamp_ms
+            col = ts // HOUR_MS - first_hour
+            if 0 <= col < self.hours:
+                self._rates[row, col] = entry.funding_rate
+            cursor = max(cursor, ts)
+        # Mark the coin as current even if the venue returned nothing new
+        self._cursor_ms[coin] = max(cursor, self._end_hour * HOUR_MS)
+
+    # ------------------------------------------------------------------
+    # Volatility
+    # ------------------------------------------------------------------
+
+    def volatilities(self, coins: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """
+        Coefficient of variation (std_dev / mean_abs_value) per coin.
+
+        Matches ``HyperliquidFundingOracle.calculate_funding_volatility``:
+        population standard deviation over the available hours, 0.0 when
+        fewer than two hours are known or every rate is zero. Coins with no
+        history at all (e.g. their backfill failed) are omitted so callers
+        can apply their own default.
+        """
+        if coins is None:
+            names = self._coins
+            rates = self._rates
+        else:
+            names = [c for c in coins if c in self._index]
+            rates = self._rates[[self._index[c] for c in names]]
+
+        if not names:
+            return {}
+
+        known = ~np.isnan(rates)
+        n = known.sum(axis=1)
+        denom = np.maximum(n, 1)
+        values = np.where(known, rates, 0.0)
+
+        mean = values.sum(axis=1) / denom
+        mean_abs = np.abs(values).sum(axis=1) / denom
+        sq_dev = np.where(known, (values - mean[:, None]) ** 2, 0.0)
+        std = np.sqrt(sq_dev.sum(axis=1) / denom)
+
+        valid = (n >= 2) & (mean_abs > 0)
+        cv = np.divide(std, mean_abs, out=np.zeros_like(std), where=valid)
+        return {
+            coin: float(v) for coin, v, count in zip(names, cv, n) if count > 0
+        }
@@ -0,0 +1,378 @@
+"""
+Streaming Hyperliquid market data with a latest-value store.
+
+``MarketDataFeed`` owns one ``HyperliquidWebSocket`` for the process and
+feeds every message into a ``MarketDataStore``:
+
+- ``allMids``: mid prices for every coin
+- ``activeAssetCtx``: per-coin context (funding, mark/oracle price, premium)
+- ``l2Book``: per-coin L2 book, in the same shape as the REST ``l2Book``
+- ``orderUpdates`` / ``userFills``: per-user order status and fills
+
+Readers (trader, funding oracle, position monitor) ask the store for the
+latest value with a maximum age. A value is returned with zero request
+latency while the stream is fresh; ``None`` means "stale or never seen"
+and the caller falls back to its REST request.
+
+Subscriptions are added on demand (``track_asset``, ``track_book``,
+``track_user``) and survive reconnects. Book and user subscriptions are
+refcounted: each ``track_book``/``track_user`` must be paired with a
+``release_book``/``release_user``, and the last release unsubscribes, so
+wallets that are done trading don't count toward Hyperliquid's per-IP
+limit on user subscriptions.
+
+Usage:
+    feed = get_market_data_feed()
+    await feed.start()  # Subscribes to allMids
+    await feed.track_asset("SOL")
+    mid = feed.store.get_mid("SOL")  # None when stale -> use REST
+    ...
+    await close_market_data_feed()
+"""
+import asyncio
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from shared.utils.logger import get_logger
+
+from .funding_oracle import ANNUALIZE_FACTOR, FundingRate
+from .websocket import HyperliquidWebSocket
+
+logger = get_logger(__name__)
+
+UserListener = Callable[[str, Any], None]
+
+
+def book_key(coin: str) -> str:
+    """``wait_for_update`` key woken by every L2 book update for ``coin``."""
+    return f"l2Book:{coin}"
+
+
+def user_key(user: str) -> str:
+    """``wait_for_update`` key woken by streamed fills for ``user``."""
+    return f"user:{user.lower()}"
+
+
+# Woken by every orderUpdates message (the payload carries no user)
+ORDERS_KEY = "orderUpdates"
+
+
+class MarketDataStore:
+    """
+    Latest streamed values, each stamped with its arrival time.
+
+    All ``get_*`` readers take ``max_age`` (seconds) and return ``None`` when
+    the value is older, so callers never act on a silently stale stream.
+    """
+
+    MIDS_MAX_AGE = 5.0
+    CTX_MAX_AGE = 30.0
+    BOOK_MAX_AGE = 5.0
+    MAX_FILLS_PER_USER = 1000
+    MAX_ORDERS = 10000
+
+    def __init__(self):
+        self._mids: Dict[str, float] = {}
+        self._mids_at: Optional[float] = None
+        self._ctxs: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._books: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self._fills: Dict[str, Deque[Dict[str, Any]]] = defaultdict(
+            lambda: deque(maxlen=self.MAX_FILLS_PER_USER)
+        )
+        self._orders: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._user_listeners: List[UserListener] = []
+        self._waiters: Dict[str, List[asyncio.Future]] = defaultdict(list)
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def on_message(self, channel: str, data: Any) -> None:
+        """HyperliquidWebSocket listener."""
+        now = time.monotonic()
+        if channel == "allMids":
+            mids = (data or {}).get("mids", {})
+            for coin, px in mids.items():
+                try:
+                    self._mids[coin] = float(px)
+                except (TypeError, ValueError):
+                    continue
+            self._mids_at = now
+        elif channel in ("activeAssetCtx", "activeSpotAssetCtx"):
+            coin = (data or {}).get("coin")
+            if coin is not None:
+                self._ctxs[coin] = (data.get("ctx") or {}, now)
+        elif channel == "l2Book":
+            coin = (data or {}).get("coin")
+            if coin is not None:
+                self._books[coin] = (data, now)
+                self._wake(book_key(coin))
+        elif channel == "orderUpdates":
+            for update in data or []:
+                oid = update.get("order", {}).get("oid")
+                if oid is None:
+                    continue
+                self._orders[oid] = update
+                self._orders.move_to_end(oid)
+                while len(self._orders) > self.MAX_ORDERS:
+                    self._orders.popitem(last=False)
+            self._wake(ORDERS_KEY)
+            self._notify_user("orderUpdates", data)
+        elif channel == "userFills":
+            user = (data or {}).get("user", "").lower()
+            fills = (data or {}).get("fills", [])
+            self._fills[user].extend(fills)
+            self._wake(user_key(user))
+            if not data.get("isSnapshot"):
+                self._notify_user("userFills", data)
+
+    def add_user_listener(self, listener: UserListener) -> None:
+        """Called with ("orderUpdates", updates) / ("userFills", data)."""
+        self._user_listeners.append(listener)
+
+    def remove_user_listener(self, listener: UserListener) -> None:
+        if listener in self._user_listeners:
+            self._user_listeners.remove(listener)
+
+    async def wait_for_update(self, keys: List[str], timeout: float) -> bool:
+        """
+        Wait until any of ``keys`` is updated (see ``book_key``/``user_key``).
+
+        Returns False if ``timeout`` passed without an update.
+        """
+        future = asyncio.get_running_loop().create_future()
+        for key in keys:
+            self._waiters[key].append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for key in keys:
+                waiters = self._waiters.get(key)
+                if waiters and future in waiters:
+                    waiters.remove(future)
+                    if not waiters:
+                        del self._waiters[key]
+
+    def _wake(self, key: str) -> None:
+        for future in self._waiters.pop(key, ()):
+            if not future.done():
+                future.set_result(None)
+
+    def _notify_user(self, channel: str, data: Any) -> None:
+        for listener in list(self._user_listeners):
+            try:
+                listener(channel, data)
+            except Exception as e:
+                logger.error(f"User event listener failed on {channel}: {e}")
+
+    # ------------------------------------------------------------------
+    # Readers
+    # ------------------------------------------------------------------
+
+    def _fresh(self, at: Optional[float], max_age: float) -> bool:
+        ok = at is not None and time.monotonic() - at <= max_age
+        if ok:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return ok
+
+    def get_mid(self, coin: str, max_age: Optional[float] = None) -> Optional[float]:
+        if coin not in self._mids:
+            self.misses += 1
+            return None
+        if not self._fresh(self._mids_at, self.MIDS_MAX_AGE if max_age is None else max_age):
+            return None
+        return self._mids[coin]
+
+    def get_mids(self, max_age: Optional[float] = None) -> Optional[Dict[str, float]]:
+        """All mids (same shape as REST ``allMids``, but floats), or None if stale."""
+        if not self._fresh(self._mids_at, self.MIDS_MAX_AGE if max_age is None else max_age):
+            return None
+        return dict(self._mids)
+
+    def get_asset_ctx(self, coin: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        entry = self._ctxs.get(coin)
+        if entry is None or not self._fresh(entry[1], self.CTX_MAX_AGE if max_age is None else max_age):
+            if entry is None:
+                self.misses += 1
+            return None
+        return entry[0]
+
+    def get_funding_rate(self, coin: str, max_age: Optional[float] = None) -> Optional[FundingRate]:
+        """Hourly funding for ``coin`` from its streamed asset context."""
+        ctx = self.get_asset_ctx(coin, max_age)
+        if ctx is None or ctx.get("funding") is None:
+            return None
+        rate = float(ctx["funding"])
+        return FundingRate(
+            coin=coin,
+            funding_rate=rate,
+            timestamp_ms=int(time.time() * 1000),
+            annualized_rate=rate * ANNUALIZE_FACTOR,
+        )
+
+    def get_funding_rates(self, max_age: Optional[float] = None) -> Dict[str, FundingRate]:
+        """Fresh funding rates for every streamed coin (may be empty)."""
+        rates = {}
+        for coin in list(self._ctxs):
+            rate = self.get_funding_rate(coin, max_age)
+            if rate is not None:
+                rates[coin] = rate
+        return rates
+
+    def get_l2_book(self, coin: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        entry = self._books.get(coin)
+        if entry is None or not self._fresh(entry[1], self.BOOK_MAX_AGE if max_age is None else max_age):
+            if entry is None:
+                self.misses += 1
+            return None
+        return entry[0]
+
+    def get_fills(
+        self,
+        user: str,
+        oid: Optional[int] = None,
+        coin: Optional[str] = None,
+        since_ms: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Streamed fills for ``user``, optionally filtered by order, coin and time."""
+        fills = list(self._fills.get(user.lower(), ()))
+        if oid is not None:
+            fills = [f for f in fills if f.get("oid") == oid]
+        if coin is not None:
+            fills = [f for f in fills if f.get("coin") == coin]
+        if since_ms is not None:
+            fills = [f for f in fills if f.get("time", 0) >= since_ms]
+        return fills
+
+    def get_order(self, oid: int) -> Optional[Dict[str, Any]]:
+        """Latest orderUpdates entry for ``oid``."""
+        return self._orders.get(oid)
+
+
+class MarketDataFeed:
+    """
+    One websocket plus the store it feeds.
+
+    Args:
+        ws: Optional HyperliquidWebSocket (e.g. pointed at a replay server).
+        store: Optional MarketDataStore.
+    """
+
+    def __init__(
+        self,
+        ws: Optional[HyperliquidWebSocket] = None,
+        store: Optional[MarketDataStore] = None,
+    ):
+        self.ws = ws or HyperliquidWebSocket()
+        self.store = store or MarketDataStore()
+        self.ws.add_listener(self.store.on_message)
+        self._started = False
+        self._refs: Dict[str, int] = defaultdict(int)
+
+    @property
+    def running(self) -> bool:
+        return self._started
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        self._started = True
+        await self.ws.subscribe({"type": "allMids"})
+        await self.ws.start()
+        logger.info("Hyperliquid market data feed started")
+
+    async def stop(self) -> None:
+        self._started = False
+        await self.ws.stop()
+        logger.info("Hyperliquid market data feed stopped")
+
+    async def track_asset(self, coin: str) -> None:
+        """Stream ``activeAssetCtx`` (funding, mark/oracle price) for ``coin``."""
+        await self.ws.subscribe({"type": "activeAssetCtx", "coin": coin})
+
+    async def track_book(self, coin: str) -> None:
+        """Stream the L2 book for ``coin`` until the matching ``release_book``."""
+        await self._acquire(f"book:{coin}", [{"type": "l2Book", "coin": coin}])
+
+    async def release_book(self, coin: str) -> None:
+        await self._release(f"book:{coin}", [{"type": "l2Book", "coin": coin}])
+
+    async def track_user(self, address: str) -> None:
+        """Stream order updates and fills for a wallet until ``release_user``."""
+        await self._acquire(f"user:{address.lower()}", self._user_subscriptions(address))
+
+    async def release_user(self, address: str) -> None:
+        await self._release(f"user:{address.lower()}", self._user_subscriptions(address))
+
+    def tracked(self, key: str) -> int:
+        """Live reference count for ``book:<coin>`` / ``user:<address>``."""
+        return self._refs.get(key, 0)
+
+    @staticmethod
+    def _user_subscriptions(address: str) -> List[Dict[str, Any]]:
+        address = address.lower()
+        return [
+            {"type": "orderUpdates", "user": address},
+            {"type": "userFills", "user": address},
+        ]
+
+    async def _acquire(self, key: str, subscriptions: List[Dict[str, Any]]) -> None:
+        # Count first so a release pairs with this call even if it is cancelled
+        self._refs[key] += 1
+        if self._refs[key] == 1:
+            await self._send_all(self.ws.subscribe, subscriptions)
+
+    async def _release(self, key: str, subscriptions: List[Dict[str, Any]]) -> None:
+        count = self._refs.get(key, 0)
+        if count <= 0:
+            return
+        if count > 1:
+            self._refs[key] = count - 1
+            return
+        del self._refs[key]
+        await self._send_all(self.ws.unsubscribe, subscriptions)
+
+    @staticmethod
+    async def _send_all(method, subscriptions: List[Dict[str, Any]]) -> None:
+        # The websocket registry is updated before sending, so a failed send
+        # is corrected by the replay on reconnect
+        for subscription in subscriptions:
+            try:
+                await method(subscription)
+            except Exception as e:
+                logger.warning(f"Hyperliquid subscription update failed for {subscription}: {e}")
+
+
+# Module-level singleton shared by trader, oracle, monitor and scanners
+_feed: Optional[MarketDataFeed] = None
+
+
+def get_market_data_feed() -> MarketDataFeed:
+    """Return the process-wide market data feed (not started)."""
+    global _feed
+    if _feed is None:
+        _feed = MarketDataFeed()
+    return _feed
+
+
+def active_market_data_feed() -> Optional[MarketDataFeed]:
+    """The process-wide feed if it has been started, else None."""
+    return _feed if _feed is not None and _feed.running else None
+
+
+async def close_market_data_feed() -> None:
+    """Stop and drop the process-wide feed."""
+    global _feed
+    if _feed is not None:
+        await _feed.stop()
+        _feed = None
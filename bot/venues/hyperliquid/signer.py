@@ -197,7 +197,7 @@ class HyperliquidSigner:
         phantom_agent = self._construct_phantom_agent(hash_bytes)
 
         # 3. Sign phantom agent via Privy EIP-712
-        raw_signature = self._privy_signer.sign_typed_data_v4(
+        raw_signature = await self._privy_signer.sign_typed_data_v4_async(
             domain=self.DOMAIN,
             types=self.AGENT_TYPES,
             value=phantom_agent,
@@ -238,7 +238,7 @@ class HyperliquidSigner:
         if nonce is None:
             nonce = int(time.time() * 1000)
 
-        raw_signature = self._privy_signer.sign_typed_data_v4(
+        raw_signature = await self._privy_signer.sign_typed_data_v4_async(
             domain=self.USER_SIGNED_DOMAIN,
             types=types,
             value=value,
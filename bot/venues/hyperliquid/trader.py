@@ -12,24 +12,52 @@ Provides high-level trading functionality for Hyperliquid perpetuals:
 
 Per spec 5.1:
 - Max retries: 15 attempts
-- Interval: Every 2 seconds (30 second total window)
+- Interval: Every 2 seconds (30 second total window); with the market data
+  feed running, retries fire on the next L2 book / fill update instead and
+  are repriced from the live book
 - Stop-loss monitoring: Active during entire retry window
 - Stop-loss trigger: SOL moves >1% against position
 """
 import asyncio
+import time
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
 
 from shared.config.settings import get_settings
 from shared.utils.logger import get_logger
 
-from .client import HyperliquidClient
+from .clearinghouse import ClearinghouseBatcher
+from .client import HyperliquidClient, HyperliquidServerError
+from .execution import (
+    BUY_SIDE,
+    SELL_SIDE,
+    FillLedger,
+    SlicePlan,
+    book_limit_price,
+    book_mid,
+    format_limit_px,
+    plan_slices,
+)
 from .funding_oracle import HyperliquidFundingOracle
+from .market_data import MarketDataFeed, active_market_data_feed, book_key, user_key
 from .signer import HyperliquidSigner, SignedAction
 
 logger = get_logger(__name__)
 
+# Exchange failures after which a sent order may still have executed
+UNKNOWN_OUTCOME_ERRORS = (
+    asyncio.TimeoutError,
+    TimeoutError,
+    aiohttp.ClientError,
+    HyperliquidServerError,
+)
+
+# A held market data stream: (feed, "book" | "user", coin or wallet)
+StreamRef = Tuple[MarketDataFeed, str, str]
+
 
 @dataclass
 class OrderResult:
@@ -102,6 +130,16 @@ class HyperliquidTrader:
     MARKET_BUY_SLIPPAGE = 1.02   # 2% above mid
     MARKET_SELL_SLIPPAGE = 0.98  # 2% below mid
 
+    # Streamed retries fire on the next book/fill update, but no sooner than this
+    MIN_REPRICE_INTERVAL = 0.1  # seconds
+
+    # Order slicing: child orders stay within this impact of mid, and an
+    # order is cut into at most MAX_CHILD_ORDERS children (TWAP floor)
+    SLICE_MAX_IMPACT = 0.0025  # 25 bps
+    MAX_CHILD_ORDERS = 10
+    # Without a streamed book, orders this large fetch one over REST
+    LARGE_ORDER_NOTIONAL = 25_000.0  # USD
+
     def __init__(
         self,
         client: Optional[HyperliquidClient] = None,
@@ -110,6 +148,8 @@ class HyperliquidTrader:
         wallet_address: Optional[str] = None,
         user_id: Optional[str] = None,
         wallet_id: Optional[str] = None,
+        clearinghouse: Optional[ClearinghouseBatcher] = None,
+        market_data: Optional[MarketDataFeed] = None,
     ):
         """Initialize trader.
 
@@ -120,15 +160,23 @@ class HyperliquidTrader:
             wallet_address: EVM wallet address for this user.
             user_id: User ID for multi-tenant mode.
             wallet_id: Privy wallet ID (from server wallets DB).
+            clearinghouse: Shared per-cycle batcher; when set, account-state
+                reads share one clearinghouseState response per wallet.
+            market_data: Streamed market data; defaults to the process feed
+                when it is running. Prices fall back to REST when stale.
         """
         self.client = client or HyperliquidClient()
         self.signer = signer
         self.oracle = oracle
+        self.clearinghouse = clearinghouse
+        self.market_data = market_data
         self.user_id = user_id
         self.wallet_address = wallet_address
 
         # Cache for coin -> asset index mapping
         self._asset_index_cache: Dict[str, int] = {}
+        # Stream refs held by prepare_order until release_order, per coin
+        self._prepared: Dict[str, List[StreamRef]] = {}
 
         if self.signer is not None:
             if not self.wallet_address:
@@ -269,12 +317,174 @@ class HyperliquidTrader:
     # Order placement
     # ------------------------------------------------------------------
 
+    async def prepare_order(self, coin: str, leverage: Optional[int] = None) -> bool:
+        """
+        Pre-stage an upcoming order on ``coin``.
+
+        Resolves the asset index, then concurrently sets leverage and (with
+        the market data feed running) subscribes the coin's L2 book and the
+        wallet's fills, so the order itself starts with warm state. The
+        subscriptions are held until ``release_order``.
+
+        Returns:
+            False if the leverage update was requested and failed.
+        """
+        try:
+            await self._resolve_asset_index(coin)
+        except Exception as e:
+            logger.warning(f"Failed to resolve asset index for {coin}: {e}")
+
+        tasks = []
+        feed = self._feed()
+        if feed is not None:
+            held = self._prepared.setdefault(coin, [])
+            tasks.append(self._track(feed, coin, self.wallet_address, held))
+        if leverage is not None:
+            tasks.append(self.update_leverage(coin=coin, leverage=leverage, is_cross=True))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Order pre-staging for {coin} failed: {result}")
+        return leverage is None or results[-1] is True
+
+    async def release_order(self, coin: str) -> None:
+        """Release the streams ``prepare_order`` subscribed for ``coin``."""
+        await self._untrack(self._prepared.pop(coin, []))
+
+    def _feed(self) -> Optional[MarketDataFeed]:
+        return self.market_data or active_market_data_feed()
+
+    @staticmethod
+    async def _track(
+        feed: Optional[MarketDataFeed],
+        coin: str,
+        wallet: Optional[str],
+        held: List[StreamRef],
+    ) -> None:
+        """
+        Hold the coin's book and the wallet's fills; pair with ``_untrack``.
+
+        Each ref is appended to ``held`` once taken (the feed counts it as
+        soon as the call starts, so also when cancelled mid-subscribe).
+        """
+        if feed is None:
+            return
+        try:
+            await feed.track_book(coin)
+        finally:
+            held.append((feed, "book", coin))
+        if wallet:
+            try:
+                await feed.track_user(wallet)
+            finally:
+                held.append((feed, "user", wallet))
+
+    @staticmethod
+    async def _untrack(held: List[StreamRef]) -> None:
+        """Release the refs ``_track`` recorded in ``held``."""
+        while held:
+            feed, kind, key = held.pop()
+            try:
+                if kind == "book":
+                    await feed.release_book(key)
+                else:
+                    await feed.release_user(key)
+            except Exception as e:
+                logger.warning(f"Failed to release {kind} stream {key}: {e}")
+
+    async def _order_book(self, coin: str, size: float) -> Optional[Dict[str, Any]]:
+        """
+        L2 book to price and slice an order of ``size`` against.
+
+        The streamed book when fresh; otherwise a REST ``l2Book`` only for
+        orders of at least LARGE_ORDER_NOTIONAL (small orders skip the
+        extra request and go out whole at the fixed slippage).
+        """
+        feed = self._feed()
+        if feed is not None:
+            book = feed.store.get_l2_book(coin)
+            if book is not None:
+                return book
+
+        current_price = await self._get_current_price(coin)
+        if current_price is None or size * current_price < self.LARGE_ORDER_NOTIONAL:
+            return None
+        try:
+            return await self.client.get_l2_book(coin)
+        except Exception as e:
+            logger.warning(f"Failed to fetch L2 book for {coin}: {e}")
+            return None
+
+    async def plan_order(
+        self,
+        coin: str,
+        is_buy: bool,
+        size: Optional[float] = None,
+        notional_usd: Optional[float] = None,
+        max_impact: Optional[float] = None,
+    ) -> Optional[SlicePlan]:
+        """
+        Estimate the impact of an order and how it would be sliced.
+
+        Uses the streamed book when fresh, otherwise a REST ``l2Book``.
+        Pass ``size`` (coin units) or ``notional_usd`` (converted at the
+        book mid).
+
+        Returns:
+            SlicePlan, or None if no book is available.
+        """
+        feed = self._feed()
+        book = feed.store.get_l2_book(coin) if feed is not None else None
+        if book is None:
+            book = await self.client.get_l2_book(coin)
+        mid = book_mid(book or {})
+        if not mid:
+            return None
+        if size is None:
+            size = notional_usd / mid
+        return plan_slices(
+            book, is_buy, size, max_impact or self.SLICE_MAX_IMPACT,
+            min_slice=size / self.MAX_CHILD_ORDERS, mid_px=mid,
+        )
+
+    async def _limit_price(
+        self,
+        coin: str,
+        is_buy: bool,
+        size: float,
+        book: Optional[Dict[str, Any]] = None,
+    ) -> Optional[float]:
+        """
+        Aggressive IOC limit price for ``size``.
+
+        Priced from the L2 book when one is given or streamed fresh (the
+        level covering ``size`` plus a small buffer), otherwise mid +/- the
+        fixed market slippage. Never further than that fixed slippage from mid.
+        """
+        current_price = await self._get_current_price(coin)
+        if current_price is None:
+            return None
+
+        multiplier = self.MARKET_BUY_SLIPPAGE if is_buy else self.MARKET_SELL_SLIPPAGE
+        if book is None:
+            feed = self._feed()
+            book = feed.store.get_l2_book(coin) if feed is not None else None
+        if book is not None:
+            px = book_limit_price(
+                book, is_buy, size, current_price, max_slippage=abs(multiplier - 1),
+            )
+            if px is not None:
+                return px
+        return current_price * multiplier
+
     async def _submit_order(
         self,
         coin: str,
         is_buy: bool,
         sz: str,
         reduce_only: bool = False,
+        limit_px: Optional[float] = None,
     ) -> dict:
         """
         Build, sign, and submit a market IOC order.
@@ -284,42 +494,235 @@ class HyperliquidTrader:
             is_buy: True for buy, False for sell
             sz: Size as string
             reduce_only: Whether this is a reduce-only order
+            limit_px: IOC limit price (priced from book/mid when omitted)
 
         Returns:
             API response dict
         """
+        payload = await self._sign_order(coin, is_buy, sz, reduce_only, limit_px)
+        return await self._send_order(payload)
+
+    async def _sign_order(
+        self,
+        coin: str,
+        is_buy: bool,
+        sz: str,
+        reduce_only: bool = False,
+        limit_px: Optional[float] = None,
+    ) -> dict:
+        """Build and sign a market IOC order; nothing is sent."""
         asset_index = await self._resolve_asset_index(coin)
 
-        # Get current price for IOC limit price calculation
-        current_price = await self._get_current_price(coin)
-        if current_price is None:
+        if limit_px is None:
+            limit_px = await self._limit_price(coin, is_buy, float(sz))
+        if limit_px is None:
             raise ValueError(f"Could not get current price for {coin}")
 
-        # IOC at aggressive price acts as market order
-        if is_buy:
-            limit_px = f"{current_price * self.MARKET_BUY_SLIPPAGE:.1f}"
-        else:
-            limit_px = f"{current_price * self.MARKET_SELL_SLIPPAGE:.1f}"
-
-        # Market orders use IOC (immediate-or-cancel)
+        # Market orders use IOC (immediate-or-cancel) at an aggressive price
         order_type = {"limit": {"tif": "Ioc"}}
 
         signed = await self.signer.sign_order(
             asset_index=asset_index,
             is_buy=is_buy,
             sz=sz,
-            limit_px=limit_px,
+            limit_px=format_limit_px(limit_px, is_buy),
             order_type=order_type,
             reduce_only=reduce_only,
         )
 
-        payload = {
+        return {
             "action": signed.action,
             "nonce": signed.nonce,
             "signature": signed.signature,
         }
 
-        return await self.client.exchange(payload)
+    async def _send_order(self, payload: dict) -> dict:
+        """Submit a signed order to the exchange."""
+        try:
+            return await self.client.exchange(payload)
+        finally:
+            # Any cached account state predates this order
+            if self.clearinghouse is not None and self.wallet_address:
+                self.clearinghouse.invalidate(self.wallet_address)
+
+    async def _fill_order(
+        self,
+        coin: str,
+        is_buy: bool,
+        target_size: float,
+        reduce_only: bool,
+        max_retries: int,
+        retry_interval: float,
+        ledger: FillLedger,
+        stop_loss: Optional[Tuple[float, float]] = None,
+    ) -> Optional[StopLossTrigger]:
+        """
+        Submit IOC orders until ``target_size`` is filled or retries run out.
+
+        Orders larger than the book can absorb within SLICE_MAX_IMPACT are
+        sent as child orders sized to that depth. Only submissions that make
+        no progress count toward ``max_retries``.
+
+        Fills are recorded in ``ledger``. With the market data feed running,
+        each retry fires on the next L2 book or user fill update (at most
+        ``retry_interval`` later) and is repriced from the live book; fills
+        streamed for orders whose response was lost are counted so a retry
+        never over-fills. Without the feed, retries are ``retry_interval``
+        apart.
+
+        Args:
+            stop_loss: ``(entry_price, stop_loss_price)`` for a short entry;
+                checked before every attempt.
+
+        Returns:
+            The StopLossTrigger if the stop fired, else None.
+        """
+        feed = self._feed()
+        wallet = self.wallet_address
+        held: List[StreamRef] = []
+        try:
+            await self._track(feed, coin, wallet, held)
+            side = BUY_SIDE if is_buy else SELL_SIDE
+            started = time.monotonic()
+            started_ms = int(time.time() * 1000)
+            known_oids = set()
+            lost_since_ms: Optional[int] = None  # Submission whose response never came
+
+            def reconcile_stream():
+                if feed is None or not wallet:
+                    return
+                fills = [
+                    f for f in feed.store.get_fills(wallet, coin=coin, since_ms=started_ms)
+                    if f.get("side") == side and (
+                        f.get("oid") in known_oids
+                        or (lost_since_ms is not None and f.get("time", 0) >= lost_since_ms)
+                    )
+                ]
+                ledger.add_stream_fills(fills)
+
+            failures = 0  # Submissions without progress; these count as retries
+            attempts = max_retries + self.MAX_CHILD_ORDERS
+            for attempt in range(attempts):
+                submitted_ms = None
+                filled_before = ledger.filled_sz
+                try:
+                    if stop_loss is not None:
+                        entry_price, stop_loss_price = stop_loss
+                        stop_check = await self._check_stop_loss(
+                            coin=coin,
+                            entry_price=entry_price,
+                            stop_loss_price=stop_loss_price,
+                            is_short=not is_buy,
+                        )
+                        if stop_check.triggered:
+                            return stop_check
+
+                    reconcile_stream()
+                    remaining = target_size - ledger.filled_sz
+                    if remaining <= target_size * 0.001:
+                        break
+
+                    # Large orders go out in depth-bounded child orders
+                    child = remaining
+                    book = await self._order_book(coin, remaining)
+                    if book is not None:
+                        plan = plan_slices(
+                            book, is_buy, remaining, self.SLICE_MAX_IMPACT,
+                            min_slice=target_size / self.MAX_CHILD_ORDERS,
+                        )
+                        child = plan.child_size
+                        if len(plan.slices) > 1:
+                            logger.info(
+                                f"Slicing {coin} {remaining:.4f} into {len(plan.slices)} "
+                                f"child orders of {child:.4f} (impact "
+                                f"{plan.expected_impact:.3%} vs {plan.single_impact:.3%})"
+                            )
+
+                    limit_px = await self._limit_price(coin, is_buy, child, book=book)
+                    if limit_px is None:
+                        raise ValueError(f"Could not get current price for {coin}")
+
+                    payload = await self._sign_order(
+                        coin=coin,
+                        is_buy=is_buy,
+                        sz=f"{child:.4f}",
+                        reduce_only=reduce_only,
+                        limit_px=limit_px,
+                    )
+                    submitted_ms = int(time.time() * 1000)
+                    response = await self._send_order(payload)
+
+                    if response.get("status") == "ok":
+                        resp_data = response.get("response", {})
+                        statuses = resp_data.get("data", {}).get("statuses", [])
+
+                        for s in statuses:
+                            if "filled" in s:
+                                fill = s["filled"]
+                                filled = float(fill.get("totalSz", 0))
+                                oid = fill.get("oid", f"attempt-{attempt}")
+                                known_oids.add(oid)
+                                if filled > 0:
+                                    avg_px = float(fill.get("avgPx") or limit_px)
+                                    ledger.add_response_fill(oid, filled, avg_px)
+                                    logger.info(
+                                        f"Filled {filled} of {target_size} "
+                                        f"@ {avg_px} on attempt {attempt + 1}"
+                                    )
+                            elif "resting" in s:
+                                oid = s["resting"].get("oid")
+                                known_oids.add(oid)
+                                ledger.last_oid = oid
+                                logger.info(f"Order resting (oid={oid})")
+                            elif "error" in s:
+                                logger.warning(f"Order error on attempt {attempt + 1}: {s['error']}")
+                    else:
+                        error = response.get("response", "Unknown error")
+                        logger.warning(f"Order rejected on attempt {attempt + 1}: {error}")
+
+                except Exception as e:
+                    logger.error(f"Error on attempt {attempt + 1}: {e}")
+                    # The order may still have executed; count its streamed fills
+                    sent = submitted_ms is not None and isinstance(e, UNKNOWN_OUTCOME_ERRORS)
+                    if sent and lost_since_ms is None:
+                        lost_since_ms = submitted_ms
+
+                reconcile_stream()
+                if ledger.filled_sz >= target_size * 0.999:
+                    break
+                if ledger.filled_sz <= filled_before:
+                    failures += 1
+                    if failures >= max_retries:
+                        break
+                if ledger.filled_sz > 0:
+                    logger.info(f"Partial fill: {ledger.filled_sz}/{target_size}, retrying...")
+
+                if attempt < attempts - 1:
+                    await self._wait_for_market(feed, coin, retry_interval)
+
+            logger.info(
+                f"{'Buy' if is_buy else 'Sell'} {coin}: filled {ledger.filled_sz}/{target_size} "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+            return None
+        finally:
+            await self._untrack(held)
+
+    async def _wait_for_market(
+        self,
+        feed: Optional[MarketDataFeed],
+        coin: str,
+        timeout: float,
+    ) -> None:
+        """Wait for the next book/fill update (streamed) or ``timeout``."""
+        if feed is None:
+            await asyncio.sleep(timeout)
+            return
+        keys = [book_key(coin)]
+        if self.wallet_address:
+            keys.append(user_key(self.wallet_address))
+        await asyncio.sleep(self.MIN_REPRICE_INTERVAL)
+        await feed.store.wait_for_update(keys, max(timeout - self.MIN_REPRICE_INTERVAL, 0))
 
     async def open_short(
         self,
@@ -333,7 +736,7 @@ class HyperliquidTrader:
         Open a short position with retry logic.
 
         Per spec 5.1:
-        - Max 15 retries every 2 seconds
+        - Max 15 retries, at most 2 seconds apart
         - Stop-loss monitoring active during retry window
         - Accept partial fills
 
@@ -341,11 +744,12 @@ class HyperliquidTrader:
             coin: Coin symbol (e.g., "SOL")
             size: Position size (e.g., "10.5")
             max_retries: Maximum retry attempts
-            retry_interval: Seconds between retries
+            retry_interval: Maximum seconds between retries
             stop_loss_pct: Stop loss percentage (default 1%)
 
         Returns:
-            OrderResult with fill details
+            OrderResult with fill details; avg_px is the volume-weighted
+            average over every fill.
         """
         if not self.signer:
             return OrderResult(success=False, error="Signer not configured")
@@ -362,7 +766,6 @@ class HyperliquidTrader:
         logger.info(f"Entry price: {entry_price}, Stop-loss: {stop_loss_price}")
 
         target_size = float(size)
-        filled_size = 0.0
 
         # Check deposited balance before trading
         deposited_balance = await self.get_deposited_balance()
@@ -377,95 +780,31 @@ class HyperliquidTrader:
                 error=f"Insufficient deposited balance: ${deposited_balance:.2f} USDC",
             )
 
-        for attempt in range(max_retries):
-            try:
-                # Check stop-loss before each attempt
-                stop_check = await self._check_stop_loss(
-                    coin=coin,
-                    entry_price=entry_price,
-                    stop_loss_price=stop_loss_price,
-                    is_short=True,
-                )
-
-                if stop_check.triggered:
-                    logger.critical(
-                        f"STOP-LOSS TRIGGERED: {coin} moved {stop_check.move_pct:.2%} "
-                        f"against position. Unwinding..."
-                    )
-                    return await self._execute_stop_loss(
-                        coin=coin,
-                        target_size=target_size,
-                        filled_size=filled_size,
-                    )
-
-                # Place sell order (short)
-                remaining = target_size - filled_size
-                response = await self._submit_order(
-                    coin=coin,
-                    is_buy=False,
-                    sz=f"{remaining:.4f}",
-                    reduce_only=False,
-                )
-
-                if response.get("status") == "ok":
-                    resp_data = response.get("response", {})
-                    statuses = resp_data.get("data", {}).get("statuses", [])
-
-                    for s in statuses:
-                        if "filled" in s:
-                            fill = s["filled"]
-                            filled = float(fill.get("totalSz", 0))
-                            avg_px = fill.get("avgPx", str(entry_price))
-                            if filled > 0:
-                                filled_size += filled
-                                logger.info(
-                                    f"Filled {filled} of {target_size} "
-                                    f"@ {avg_px} on attempt {attempt + 1}"
-                                )
-                        elif "resting" in s:
-                            logger.info(f"Order resting (oid={s['resting'].get('oid')})")
-
-                    if filled_size >= target_size * 0.999:
-                        logger.info(f"Short position fully filled: {filled_size}")
-                        return OrderResult(
-                            success=True,
-                            filled_sz=str(filled_size),
-                            avg_px=str(entry_price),
-                        )
-                    elif filled_size > 0:
-                        logger.info(
-                            f"Partial fill: {filled_size}/{target_size}, retrying..."
-                        )
-                else:
-                    error = response.get("response", "Unknown error")
-                    logger.warning(f"Order rejected on attempt {attempt + 1}: {error}")
-
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_interval)
-
-            except Exception as e:
-                logger.error(f"Error on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_interval)
+        ledger = FillLedger()
+        stop_check = await self._fill_order(
+            coin=coin,
+            is_buy=False,
+            target_size=target_size,
+            reduce_only=False,
+            max_retries=max_retries,
+            retry_interval=retry_interval,
+            ledger=ledger,
+            stop_loss=(entry_price, stop_loss_price),
+        )
 
-        # Max retries exceeded
-        if filled_size > 0:
-            logger.warning(
-                f"Max retries exceeded with partial fill: "
-                f"{filled_size}/{target_size} ({filled_size / target_size:.1%})"
+        filled_size = ledger.filled_sz
+        if stop_check is not None:
+            logger.critical(
+                f"STOP-LOSS TRIGGERED: {coin} moved {stop_check.move_pct:.2%} "
+                f"against position. Unwinding..."
             )
-            return OrderResult(
-                success=True,
-                filled_sz=str(filled_size),
-                remaining_sz=str(target_size - filled_size),
-                avg_px=str(entry_price),
-                error="Max retries exceeded - partial fill",
+            return await self._execute_stop_loss(
+                coin=coin,
+                target_size=target_size,
+                filled_size=filled_size,
             )
 
-        return OrderResult(
-            success=False,
-            error=f"Failed to fill after {max_retries} attempts",
-        )
+        return self._fill_result(ledger, target_size, max_retries, "open short")
 
     async def close_short(
         self,
@@ -481,62 +820,107 @@ class HyperliquidTrader:
             coin: Coin symbol
             size: Size to close
             max_retries: Maximum retry attempts
-            retry_interval: Seconds between retries
+            retry_interval: Maximum seconds between retries
 
         Returns:
-            OrderResult with fill details
+            OrderResult with fill details; avg_px is the volume-weighted
+            average over every fill.
         """
         if not self.signer:
             return OrderResult(success=False, error="Signer not configured")
 
         logger.info(f"Closing short: {coin} {size}")
 
-        for attempt in range(max_retries):
-            try:
-                response = await self._submit_order(
-                    coin=coin,
-                    is_buy=True,
-                    sz=size,
-                    reduce_only=True,
-                )
-
-                if response.get("status") == "ok":
-                    resp_data = response.get("response", {})
-                    statuses = resp_data.get("data", {}).get("statuses", [])
-
-                    for s in statuses:
-                        if "filled" in s:
-                            fill = s["filled"]
-                            filled_sz = fill.get("totalSz", size)
-                            avg_px = fill.get("avgPx")
-                            logger.info(f"Short position closed: {filled_sz}")
-                            return OrderResult(
-                                success=True,
-                                filled_sz=str(filled_sz),
-                                avg_px=str(avg_px) if avg_px else None,
-                            )
+        ledger = FillLedger()
+        await self._fill_order(
+            coin=coin,
+            is_buy=True,
+            target_size=float(size),
+            reduce_only=True,
+            max_retries=max_retries,
+            retry_interval=retry_interval,
+            ledger=ledger,
+        )
+        return self._fill_result(ledger, float(size), max_retries, "close short")
 
-                    logger.warning(f"Close order had no fills: {statuses}")
-                else:
-                    logger.warning(f"Close order rejected: {response}")
+    @staticmethod
+    def _fill_result(
+        ledger: FillLedger,
+        target_size: float,
+        max_retries: int,
+        action: str,
+    ) -> OrderResult:
+        """OrderResult for a finished ``_fill_order`` run."""
+        filled_size = ledger.filled_sz
+        avg_px = ledger.avg_px
+        order_id = str(ledger.last_oid) if ledger.last_oid is not None else None
 
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_interval)
+        if filled_size >= target_size * 0.999:
+            logger.info(f"{action}: fully filled {filled_size} @ {avg_px}")
+            return OrderResult(
+                success=True,
+                order_id=order_id,
+                filled_sz=str(filled_size),
+                avg_px=str(avg_px),
+            )
 
-            except Exception as e:
-                logger.error(f"Error closing short on attempt {attempt + 1}: {e}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(retry_interval)
+        if filled_size > 0:
+            logger.warning(
+                f"{action}: max retries exceeded with partial fill: "
+                f"{filled_size}/{target_size} ({filled_size / target_size:.1%})"
+            )
+            return OrderResult(
+                success=True,
+                order_id=order_id,
+                filled_sz=str(filled_size),
+                remaining_sz=str(target_size - filled_size),
+                avg_px=str(avg_px),
+                error="Max retries exceeded - partial fill",
+            )
 
         return OrderResult(
             success=False,
-            error=f"Failed to close short after {max_retries} attempts",
+            error=f"Failed to {action} after {max_retries} attempts",
         )
 
     # ------------------------------------------------------------------
     # Account state
     # ------------------------------------------------------------------
 
+    async def _fetch_clearinghouse_state(self, wallet: str) -> Dict[str, Any]:
+        """Fetch account state, through the shared batcher when configured."""
+        if self.clearinghouse is not None:
+            return await self.clearinghouse.get(wallet)
+        return await self.client.get_clearinghouse_state(wallet)
+
+    @staticmethod
+    def position_from_state(state: Dict[str, Any], coin: str) -> Optional[PositionInfo]:
+        """Extract the position for ``coin`` from a clearinghouse state."""
+        for pos in state.get("assetPositions", []):
+            position = pos.get("position", {})
+            if position.get("coin") == coin:
+                return PositionInfo(
+                    coin=coin,
+                    size=float(position.get("szi", 0)),
+                    entry_px=float(position.get("entryPx", 0)),
+                    leverage=int(
+                        position.get("leverage", {}).get("value", 1)
+                    ),
+                    margin_used=float(position.get("marginUsed", 0)),
+                    margin_fraction=float(
+                        position.get("marginFraction", 0)
+                    ),
+                    unrealized_pnl=float(
+                        position.get("unrealizedPnl", 0)
+                    ),
+                    liquidation_px=(
+                        float(position.get("liquidationPx", 0))
+                        if position.get("liquidationPx")
+                        else None
+                    ),
+                )
+        return None
+
     async def get_position(self, coin: str) -> Optional[PositionInfo]:
         """
         Get current position for a coin.
@@ -553,35 +937,8 @@ class HyperliquidTrader:
                 logger.error("Hyperliquid wallet address not configured")
                 return None
 
-            response = await self.client.get_clearinghouse_state(wallet)
-
-            asset_positions = response.get("assetPositions", [])
-
-            for pos in asset_positions:
-                position = pos.get("position", {})
-                if position.get("coin") == coin:
-                    return PositionInfo(
-                        coin=coin,
-                        size=float(position.get("szi", 0)),
-                        entry_px=float(position.get("entryPx", 0)),
-                        leverage=int(
-                            position.get("leverage", {}).get("value", 1)
-                        ),
-                        margin_used=float(position.get("marginUsed", 0)),
-                        margin_fraction=float(
-                            position.get("marginFraction", 0)
-                        ),
-                        unrealized_pnl=float(
-                            position.get("unrealizedPnl", 0)
-                        ),
-                        liquidation_px=(
-                            float(position.get("liquidationPx", 0))
-                            if position.get("liquidationPx")
-                            else None
-                        ),
-                    )
-
-            return None
+            response = await self._fetch_clearinghouse_state(wallet)
+            return self.position_from_state(response, coin)
 
         except Exception as e:
             logger.error(f"Failed to get position: {e}")
@@ -599,7 +956,7 @@ class HyperliquidTrader:
             if not wallet:
                 return {}
 
-            return await self.client.get_clearinghouse_state(wallet)
+            return await self._fetch_clearinghouse_state(wallet)
         except Exception as e:
             logger.error(f"Failed to get clearinghouse state: {e}")
             return {}
@@ -617,7 +974,7 @@ class HyperliquidTrader:
                 logger.error("Wallet address not configured")
                 return 0.0
 
-            state = await self.client.get_clearinghouse_state(wallet)
+            state = await self._fetch_clearinghouse_state(wallet)
 
             # HL returns crossMarginSummary.accountValue for total equity
             cross_margin = state.get("crossMarginSummary", {})
@@ -652,7 +1009,7 @@ class HyperliquidTrader:
                 logger.error("Wallet address not configured")
                 return 0.0
 
-            state = await self.client.get_clearinghouse_state(wallet)
+            state = await self._fetch_clearinghouse_state(wallet)
 
             # HL directly tells us how much is withdrawable
             withdrawable = state.get("withdrawable")
@@ -731,7 +1088,12 @@ class HyperliquidTrader:
     # ------------------------------------------------------------------
 
     async def _get_current_price(self, coin: str) -> Optional[float]:
-        """Get current mark price for a coin."""
+        """Get current mid price for a coin (streamed when fresh, else REST)."""
+        feed = self.market_data or active_market_data_feed()
+        if feed is not None:
+            price = feed.store.get_mid(coin)
+            if price is not None:
+                return price
         try:
             mids = await self.client.get_all_mids()
             price = mids.get(coin)
@@ -0,0 +1,265 @@
+"""
+Hyperliquid WebSocket subscription client.
+
+Keeps one persistent connection to ``wss://api.hyperliquid.xyz/ws`` and
+multiplexes any number of subscriptions over it:
+
+- ``subscribe({"type": "allMids"})`` / ``subscribe({"type": "activeAssetCtx",
+  "coin": "SOL"})`` register a subscription; it is sent immediately when
+  connected and replayed after every reconnect.
+- Listeners registered with ``add_listener`` are called synchronously with
+  ``(channel, data)`` for every data message, in arrival order. They must
+  not block; hand slow work off to a task.
+- The connection is kept alive with ``{"method": "ping"}`` and re-established
+  with exponential backoff when it drops.
+
+Usage:
+    ws = HyperliquidWebSocket()
+    ws.add_listener(lambda channel, data: ...)
+    await ws.subscribe({"type": "allMids"})
+    await ws.start()
+    ...
+    await ws.stop()
+"""
+import asyncio
+import json
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+from shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Listener = Callable[[str, Any], None]
+
+# Control channels that carry no market data
+_CONTROL_CHANNELS = {"pong", "subscriptionResponse"}
+
+
+def _subscription_key(subscription: Dict[str, Any]) -> str:
+    return json.dumps(subscription, sort_keys=True)
+
+
+class HyperliquidWebSocket:
+    """
+    Persistent, auto-reconnecting Hyperliquid WebSocket client.
+
+    Args:
+        url: Override the WebSocket URL (e.g. a local replay server).
+        session: Optional aiohttp session to connect with; one is created
+            (and closed on ``stop``) otherwise.
+    """
+
+    WS_URL = "wss://api.hyperliquid.xyz/ws"
+    PING_INTERVAL = 30.0  # Server drops idle connections after 60s
+    RECONNECT_MIN = 0.5
+    RECONNECT_MAX = 30.0
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        self.url = url or self.WS_URL
+        self._session = session
+        self._owns_session = session is None
+
+        self._subscriptions: Dict[str, Dict[str, Any]] = {}
+        self._listeners: List[Listener] = []
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._connected = asyncio.Event()
+        self._last_sent = 0.0  # monotonic; pings are due PING_INTERVAL after it
+
+        # Stats
+        self.messages = 0
+        self.reconnects = 0
+        self.last_message_at: Optional[float] = None  # monotonic
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @property
+    def subscriptions(self) -> List[Dict[str, Any]]:
+        return list(self._subscriptions.values())
+
+    def age(self) -> float:
+        """Seconds since the last message (inf if none yet)."""
+        if self.last_message_at is None:
+            return math.inf
+        return time.monotonic() - self.last_message_at
+
+    async def wait_connected(self, timeout: Optional[float] = None) -> bool:
+        """Wait until connected; returns False on timeout."""
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Subscriptions and listeners
+    # ------------------------------------------------------------------
+
+    def add_listener(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    async def subscribe(self, subscription: Dict[str, Any]) -> None:
+        """Register a subscription (idempotent) and send it if connected."""
+        key = _subscription_key(subscription)
+        if key in self._subscriptions:
+            return
+        self._subscriptions[key] = subscription
+        if self.connected:
+            await self._send({"method": "subscribe", "subscription": subscription})
+
+    async def unsubscribe(self, subscription: Dict[str, Any]) -> None:
+        key = _subscription_key(subscription)
+        if self._subscriptions.pop(key, None) is not None and self.connected:
+            await self._send({"method": "unsubscribe", "subscription": subscription})
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Connect in the background (returns immediately)."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        self._running = False
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._connected.clear()
+
+    async def _run(self) -> None:
+        backoff = self.RECONNECT_MIN
+        while self._running:
+            try:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession()
+                    self._owns_session = True
+                async with self._session.ws_connect(self.url, autoping=True) as ws:
+                    self._ws = ws
+                    await self._replay_subscriptions()
+                    self._connected.set()
+                    backoff = self.RECONNECT_MIN
+                    logger.info(f"Hyperliquid websocket connected ({len(self._subscriptions)} subscriptions)")
+                    await self._read(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Hyperliquid websocket error: {e}")
+            finally:
+                self._connected.clear()
+                self._ws = None
+
+            if not self._running:
+                break
+            self.reconnects += 1
+            logger.info(f"Hyperliquid websocket reconnecting in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.RECONNECT_MAX)
+
+    async def _replay_subscriptions(self) -> None:
+        """
+        Send every registered subscription on a fresh connection.
+
+        ``subscribe``/``unsubscribe`` calls made while replaying only update
+        the registry (not connected yet), so loop until the registry and what
+        was sent agree; there is no await between the final check and the
+        caller setting ``_connected``.
+        """
+        sent: Dict[str, Dict[str, Any]] = {}
+        while True:
+            pending = [
+                (key, sub) for key, sub in self._subscriptions.items() if key not in sent
+            ]
+            dropped = [(key, sub) for key, sub in sent.items() if key not in self._subscriptions]
+            if not pending and not dropped:
+                return
+            for key, subscription in pending:
+                sent[key] = subscription
+                await self._send({"method": "subscribe", "subscription": subscription})
+            for key, subscription in dropped:
+                del sent[key]
+                await self._send({"method": "unsubscribe", "subscription": subscription})
+
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        while True:
+            # The server only counts client frames as activity
+            remaining = self.PING_INTERVAL - (time.monotonic() - self._last_sent)
+            if remaining <= 0:
+                await ws.send_json({"method": "ping"})  # Errors reconnect
+                self._last_sent = time.monotonic()
+                continue
+            try:
+                msg = await ws.receive(timeout=remaining)
+            except asyncio.TimeoutError:
+                continue
+
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                self._dispatch(msg.data)
+            elif msg.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.CLOSING,
+                aiohttp.WSMsgType.ERROR,
+            ):
+                return
+
+    def _dispatch(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            logger.debug(f"Ignoring non-JSON websocket frame: {raw[:100]}")
+            return
+
+        self.last_message_at = time.monotonic()
+        channel = message.get("channel")
+        if channel is None or channel in _CONTROL_CHANNELS:
+            return
+        if channel == "error":
+            logger.warning(f"Hyperliquid websocket error message: {message.get('data')}")
+            return
+
+        self.messages += 1
+        data = message.get("data")
+        for listener in list(self._listeners):
+            try:
+                listener(channel, data)
+            except Exception as e:
+                logger.error(f"Websocket listener failed on {channel}: {e}")
+
+    async def _send(self, payload: Dict[str, Any]) -> None:
+        ws = self._ws
+        if ws is None or ws.closed:
+            return  # Replayed on reconnect
+        try:
+            await ws.send_json(payload)
+            self._last_sent = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Hyperliquid websocket send failed: {e}")
@@ -8,9 +8,18 @@ Phase 3 refactor: accepts wallet_id directly from the database,
 removing the need for address→wallet_id resolution.  Adds structured
 logging, policy-aware error handling, retry with exponential backoff,
 and a circuit breaker (N2).
+
+The Privy SDK is synchronous. Async callers use the ``*_async`` signing
+methods, which run each ``wallets.rpc()`` call on a bounded thread pool
+so a burst of signatures never blocks the event loop. Queue depth and
+queue-wait/RPC latency are tracked in ``SigningMetrics``.
 """
+import asyncio
+import functools
+import math
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -31,6 +40,9 @@ CIRCUIT_BREAKER_COOLDOWN = 60   # seconds to pause after tripping
 # Metrics retention
 METRICS_WINDOW_SECONDS = 86400  # 24h rolling window
 
+# Signing thread pool (Privy SDK calls are blocking HTTP requests)
+SIGNING_MAX_WORKERS = 8
+
 
 @dataclass
 class SigningEvent:
@@ -41,16 +53,41 @@ class SigningEvent:
     wallet_id: str
 
 
+@dataclass
+class DispatchSample:
+    """Timing of one RPC dispatched to the signing thread pool."""
+    timestamp: float
+    queue_ms: float  # waiting for a free worker
+    rpc_ms: float    # wallets.rpc() duration on the worker
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
 class SigningMetrics:
     """Rolling-window metrics for signing activity.
 
-    Thread-safe enough for single-process async (no lock needed).
-    Events older than ``window_seconds`` are pruned on read.
+    Thread-safe enough for single-process async (no lock needed): all
+    updates happen on the event loop, including dispatch timings measured
+    on pool workers. Events older than ``window_seconds`` are pruned on read.
     """
 
-    def __init__(self, window_seconds: float = METRICS_WINDOW_SECONDS):
+    def __init__(
+        self,
+        window_seconds: float = METRICS_WINDOW_SECONDS,
+        max_workers: int = SIGNING_MAX_WORKERS,
+    ):
         self._window = window_seconds
         self._events: deque[SigningEvent] = deque()
+        self._dispatches: deque[DispatchSample] = deque()
+        self.max_workers = max_workers
+        # RPCs submitted to the pool and not yet completed
+        self.pending = 0
 
     def record(self, result: str, method: str, wallet_id: str) -> None:
         self._events.append(SigningEvent(
@@ -60,10 +97,48 @@ class SigningMetrics:
             wallet_id=wallet_id,
         ))
 
+    def record_dispatch(self, queue_ms: float, rpc_ms: float) -> None:
+        self._dispatches.append(DispatchSample(
+            timestamp=time.time(),
+            queue_ms=queue_ms,
+            rpc_ms=rpc_ms,
+        ))
+
     def _prune(self) -> None:
         cutoff = time.time() - self._window
         while self._events and self._events[0].timestamp < cutoff:
             self._events.popleft()
+        while self._dispatches and self._dispatches[0].timestamp < cutoff:
+            self._dispatches.popleft()
+
+    @property
+    def queue_depth(self) -> int:
+        """RPCs waiting for a free signing worker."""
+        return max(0, self.pending - self.max_workers)
+
+    @property
+    def in_flight(self) -> int:
+        """RPCs currently running on signing workers."""
+        return min(self.pending, self.max_workers)
+
+    def get_latency_summary(self, window_seconds: Optional[float] = None) -> Dict[str, float]:
+        """Return queue-wait and RPC latency percentiles (ms) within the window."""
+        self._prune()
+        cutoff = time.time() - (window_seconds or self._window)
+        samples = [d for d in self._dispatches if d.timestamp >= cutoff]
+        queue = sorted(d.queue_ms for d in samples)
+        rpc = sorted(d.rpc_ms for d in samples)
+        return {
+            "count": len(samples),
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "queue_p50_ms": round(_percentile(queue, 50), 1),
+            "queue_p95_ms": round(_percentile(queue, 95), 1),
+            "queue_max_ms": round(queue[-1] if queue else 0.0, 1),
+            "rpc_p50_ms": round(_percentile(rpc, 50), 1),
+            "rpc_p95_ms": round(_percentile(rpc, 95), 1),
+            "rpc_max_ms": round(rpc[-1] if rpc else 0.0, 1),
+        }
 
     def get_summary(self, window_seconds: Optional[float] = None) -> Dict[str, int]:
         """Return counts by result within the given window (default: full window)."""
@@ -95,6 +170,48 @@ def get_signing_metrics() -> SigningMetrics:
     return _signing_metrics
 
 
+# Module-level signing pool (created on first async signing call)
+_signing_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_signing_executor() -> ThreadPoolExecutor:
+    global _signing_executor
+    if _signing_executor is None:
+        _signing_executor = ThreadPoolExecutor(
+            max_workers=SIGNING_MAX_WORKERS,
+            thread_name_prefix="privy-sign",
+        )
+    return _signing_executor
+
+
+async def _run_in_signing_pool(fn) -> Any:
+    """Run a blocking Privy call on the signing pool and record its timing."""
+    loop = asyncio.get_running_loop()
+    submitted = time.monotonic()
+
+    def job():
+        started = time.monotonic()
+        try:
+            return started, fn(), None
+        except Exception as e:
+            return started, None, e
+
+    _signing_metrics.pending += 1
+    try:
+        started, result, error = await loop.run_in_executor(_get_signing_executor(), job)
+    finally:
+        _signing_metrics.pending -= 1
+
+    finished = time.monotonic()
+    _signing_metrics.record_dispatch(
+        queue_ms=(started - submitted) * 1000,
+        rpc_ms=(finished - started) * 1000,
+    )
+    if error is not None:
+        raise error
+    return result
+
+
 class PolicyDeniedError(Exception):
     """Raised when a Privy policy blocks a signing request."""
 
@@ -293,6 +410,54 @@ class PrivyWalletSigner:
         else:
             logger.info("signing_success", **log_data)
 
+    def _check_circuit(self, method: str, action: str) -> None:
+        """Reject immediately while the module-level circuit breaker is open."""
+        if _circuit_breaker.is_open:
+            self._log_signing(method, action, "circuit_open", 0.0, "circuit breaker is open")
+            raise SigningError(
+                "Signing circuit breaker is open — pausing all signing",
+                self.wallet_id, method, retriable=True,
+            )
+
+    def _on_rpc_error(
+        self,
+        error: Exception,
+        attempt: int,
+        method: str,
+        action: str,
+        duration: float,
+    ) -> float:
+        """Classify a failed attempt: return the backoff before retrying, or raise."""
+        # Policy denials are never retried
+        if _is_policy_denial(error):
+            self._log_signing(method, action, "policy_denied", duration, str(error))
+            raise PolicyDeniedError(str(error), self.wallet_id, method) from error
+
+        retriable = _is_retriable(error)
+
+        if retriable and attempt < RETRY_MAX_ATTEMPTS:
+            backoff = RETRY_BACKOFF_BASE * (2 ** (attempt - 1))
+            logger.warning(
+                "signing_retry",
+                attempt=attempt,
+                max_attempts=RETRY_MAX_ATTEMPTS,
+                backoff_s=backoff,
+                method=method,
+                error=str(error)[:100],
+            )
+            return backoff
+
+        # Final failure
+        _circuit_breaker.record_failure()
+        self._log_signing(method, action, "error", duration, str(error))
+        raise SigningError(
+            str(error), self.wallet_id, method, retriable=retriable,
+        ) from error
+
+    def _on_rpc_success(self, method: str, action: str, duration: float) -> None:
+        self._log_signing(method, action, "success", duration)
+        _circuit_breaker.record_success()
+
     def _call_rpc(self, method: str, params: dict, action: str, **kwargs) -> Any:
         """Call wallets.rpc() with retry, circuit breaker, and error classification.
 
@@ -300,20 +465,15 @@ class PrivyWalletSigner:
         for transient errors.  Policy denials are never retried.  The
         module-level circuit breaker rejects all requests when tripped.
 
+        Blocks the calling thread; async code should use ``_call_rpc_async``.
+
         Raises:
             PolicyDeniedError: If the request was blocked by a Privy policy.
             SigningError: For all other failures (after retries exhausted
                 or circuit breaker tripped).
         """
-        # Circuit breaker check
-        if _circuit_breaker.is_open:
-            self._log_signing(method, action, "circuit_open", 0.0, "circuit breaker is open")
-            raise SigningError(
-                "Signing circuit breaker is open — pausing all signing",
-                self.wallet_id, method, retriable=True,
-            )
+        self._check_circuit(method, action)
 
-        last_error: Optional[Exception] = None
         for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
             start = time.monotonic()
             try:
@@ -323,46 +483,111 @@ class PrivyWalletSigner:
                     params=params,
                     **kwargs,
                 )
+            except Exception as e:
                 duration = (time.monotonic() - start) * 1000
-                self._log_signing(method, action, "success", duration)
-                _circuit_breaker.record_success()
-                return response
+                time.sleep(self._on_rpc_error(e, attempt, method, action, duration))
+                continue
+
+            self._on_rpc_success(method, action, (time.monotonic() - start) * 1000)
+            return response
+
+    async def _call_rpc_async(self, method: str, params: dict, action: str, **kwargs) -> Any:
+        """Async ``_call_rpc``: same retry and circuit-breaker semantics.
+
+        Each attempt runs on the bounded signing pool and backoff uses
+        ``asyncio.sleep``, so the event loop is never blocked.
+        """
+        self._check_circuit(method, action)
+        client = self.client  # create lazily on the loop thread
+
+        for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
+            start = time.monotonic()
+            try:
+                response = await _run_in_signing_pool(functools.partial(
+                    client.wallets.rpc,
+                    self.wallet_id,
+                    method=method,
+                    params=params,
+                    **kwargs,
+                ))
             except Exception as e:
                 duration = (time.monotonic() - start) * 1000
+                await asyncio.sleep(self._on_rpc_error(e, attempt, method, action, duration))
+                continue
 
-                # Policy denials are never retried
-                if _is_policy_denial(e):
-                    self._log_signing(method, action, "policy_denied", duration, str(e))
-                    raise PolicyDeniedError(str(e), self.wallet_id, method) from e
-
-                last_error = e
-                retriable = _is_retriable(e)
-
-                if retriable and attempt < RETRY_MAX_ATTEMPTS:
-                    backoff = RETRY_BACKOFF_BASE * (2 ** (attempt - 1))
-                    logger.warning(
-                        "signing_retry",
-                        attempt=attempt,
-                        max_attempts=RETRY_MAX_ATTEMPTS,
-                        backoff_s=backoff,
-                        method=method,
-                        error=str(e)[:100],
-                    )
-                    time.sleep(backoff)
-                    continue
-
-                # Final failure
-                _circuit_breaker.record_failure()
-                self._log_signing(method, action, "error", duration, str(e))
-                raise SigningError(
-                    str(e), self.wallet_id, method, retriable=retriable,
-                ) from e
-
-        # Should not reach here, but just in case
-        _circuit_breaker.record_failure()
-        raise SigningError(
-            str(last_error), self.wallet_id, method, retriable=True,
-        )
+            self._on_rpc_success(method, action, (time.monotonic() - start) * 1000)
+            return response
+
+    # ------------------------------------------------------------------
+    # Request builders (shared by the sync and async signing methods)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _typed_data_request(
+        domain: Dict[str, Any],
+        types: Dict[str, Any],
+        value: Dict[str, Any],
+        primary_type: str,
+    ) -> Dict[str, Any]:
+        eip712_types: Dict[str, Any] = {}
+        for type_name, fields in types.items():
+            eip712_types[type_name] = [
+                {"name": f["name"], "type": f["type"]} for f in fields
+            ]
+
+        return {
+            "method": "eth_signTypedData_v4",
+            "params": {
+                "typed_data": {
+                    "domain": domain,
+                    "types": eip712_types,
+                    "message": value,
+                    "primary_type": primary_type,
+                }
+            },
+            "action": f"eip712:{primary_type}",
+        }
+
+    @staticmethod
+    def _eth_transaction_request(transaction: Dict[str, Any]) -> Dict[str, Any]:
+        # Privy API expects snake_case keys; web3.py uses camelCase
+        key_map = {
+            "chainId": "chain_id",
+            "gasPrice": "gas_price",
+            "gas": "gas_limit",
+            "maxFeePerGas": "max_fee_per_gas",
+            "maxPriorityFeePerGas": "max_priority_fee_per_gas",
+        }
+        tx_params: Dict[str, Any] = {}
+        for key, val in transaction.items():
+            mapped_key = key_map.get(key, key)
+            if isinstance(val, int):
+                tx_params[mapped_key] = hex(val)
+            else:
+                tx_params[mapped_key] = val
+
+        to_addr = transaction.get("to", "unknown")
+        return {
+            "method": "eth_signTransaction",
+            "params": {"transaction": tx_params},
+            "action": f"eth_tx:{to_addr[:10]}...",
+        }
+
+    @staticmethod
+    def _solana_transaction_request(unsigned_tx_base64: str) -> Dict[str, Any]:
+        return {
+            "method": "signTransaction",
+            "params": {
+                "transaction": unsigned_tx_base64,
+                "encoding": "base64",
+            },
+            "action": "solana_tx",
+            "chain_type": "solana",
+        }
+
+    # ------------------------------------------------------------------
+    # Signing
+    # ------------------------------------------------------------------
 
     def sign_typed_data_v4(
         self,
@@ -386,24 +611,21 @@ class PrivyWalletSigner:
             PolicyDeniedError: If blocked by policy.
             SigningError: On API / network failure.
         """
-        eip712_types: Dict[str, Any] = {}
-        for type_name, fields in types.items():
-            eip712_types[type_name] = [
-                {"name": f["name"], "type": f["type"]} for f in fields
-            ]
-
-        action = f"eip712:{primary_type}"
         response = self._call_rpc(
-            method="eth_signTypedData_v4",
-            params={
-                "typed_data": {
-                    "domain": domain,
-                    "types": eip712_types,
-                    "message": value,
-                    "primary_type": primary_type,
-                }
-            },
-            action=action,
+            **self._typed_data_request(domain, types, value, primary_type)
+        )
+        return response.data.signature
+
+    async def sign_typed_data_v4_async(
+        self,
+        domain: Dict[str, Any],
+        types: Dict[str, Any],
+        value: Dict[str, Any],
+        primary_type: str,
+    ) -> str:
+        """Non-blocking ``sign_typed_data_v4`` for use inside the event loop."""
+        response = await self._call_rpc_async(
+            **self._typed_data_request(domain, types, value, primary_type)
         )
         return response.data.signature
 
@@ -420,29 +642,12 @@ class PrivyWalletSigner:
             PolicyDeniedError: If blocked by policy.
             SigningError: On API / network failure.
         """
-        # Privy API expects snake_case keys; web3.py uses camelCase
-        key_map = {
-            "chainId": "chain_id",
-            "gasPrice": "gas_price",
-            "gas": "gas_limit",
-            "maxFeePerGas": "max_fee_per_gas",
-            "maxPriorityFeePerGas": "max_priority_fee_per_gas",
-        }
-        tx_params: Dict[str, Any] = {}
-        for key, val in transaction.items():
-            mapped_key = key_map.get(key, key)
-            if isinstance(val, int):
-                tx_params[mapped_key] = hex(val)
-            else:
-                tx_params[mapped_key] = val
+        response = self._call_rpc(**self._eth_transaction_request(transaction))
+        return response.data.signed_transaction
 
-        to_addr = transaction.get("to", "unknown")
-        action = f"eth_tx:{to_addr[:10]}..."
-        response = self._call_rpc(
-            method="eth_signTransaction",
-            params={"transaction": tx_params},
-            action=action,
-        )
+    async def sign_eth_transaction_async(self, transaction: Dict[str, Any]) -> str:
+        """Non-blocking ``sign_eth_transaction`` for use inside the event loop."""
+        response = await self._call_rpc_async(**self._eth_transaction_request(transaction))
         return response.data.signed_transaction
 
     def sign_solana_transaction(self, unsigned_tx_base64: str) -> str:
@@ -458,13 +663,12 @@ class PrivyWalletSigner:
             PolicyDeniedError: If blocked by policy.
             SigningError: On API / network failure.
         """
-        response = self._call_rpc(
-            method="signTransaction",
-            params={
-                "transaction": unsigned_tx_base64,
-                "encoding": "base64",
-            },
-            action="solana_tx",
-            chain_type="solana",
+        response = self._call_rpc(**self._solana_transaction_request(unsigned_tx_base64))
+        return response.data.signed_transaction
+
+    async def sign_solana_transaction_async(self, unsigned_tx_base64: str) -> str:
+        """Non-blocking ``sign_solana_transaction`` for use inside the event loop."""
+        response = await self._call_rpc_async(
+            **self._solana_transaction_request(unsigned_tx_base64)
         )
         return response.data.signed_transaction
@@ -255,7 +255,7 @@ class SolanaTransferor:
 
         # Sign via Privy
         signer = self._get_privy_signer()
-        signed_b64 = signer.sign_solana_transaction(tx_b64)
+        signed_b64 = await signer.sign_solana_transaction_async(tx_b64)
         signed_bytes = base64.b64decode(signed_b64)
 
         # Deserialize signed tx and send
@@ -22,11 +22,17 @@ Usage:
     # Get per-user trading components
     hl_trader = ctx.get_hl_trader()
     asgard_mgr = ctx.get_asgard_manager()
+
+Venue clients are lightweight facades over the process-wide
+``VenueClientRegistry`` pools, so creating and closing a context never
+opens or tears down TCP/TLS connections.
 """
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from bot.venues.asgard.manager import AsgardPositionManager
+from bot.venues.client_registry import VenueClientRegistry, get_client_registry
+from bot.venues.hyperliquid.clearinghouse import ClearinghouseBatcher
 from bot.venues.hyperliquid.client import HyperliquidClient
 from bot.venues.hyperliquid.depositor import HyperliquidDepositor
 from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
@@ -48,6 +54,13 @@ class UserTradingContext:
     without address→ID resolution.
     """
 
+    # users columns a context is built from (see wallets_from_row)
+    WALLET_COLUMNS = (
+        "solana_address, evm_address, "
+        "server_evm_wallet_id, server_evm_address, "
+        "server_solana_wallet_id, server_solana_address"
+    )
+
     def __init__(
         self,
         user_id: str,
@@ -55,12 +68,18 @@ class UserTradingContext:
         evm_address: Optional[str] = None,
         evm_wallet_id: Optional[str] = None,
         solana_wallet_id: Optional[str] = None,
+        clearinghouse: Optional[ClearinghouseBatcher] = None,
+        clients: Optional[VenueClientRegistry] = None,
     ):
         self.user_id = user_id
         self.solana_address = solana_address
         self.evm_address = evm_address
         self.evm_wallet_id = evm_wallet_id
         self.solana_wallet_id = solana_wallet_id
+        # Optional per-cycle clearinghouseState batcher shared across users
+        self.clearinghouse = clearinghouse
+        # Pooled venue connections (process-wide registry by default)
+        self.clients = clients or get_client_registry()
 
         # Lazily created instances
         self._hl_client: Optional[HyperliquidClient] = None
@@ -72,7 +91,13 @@ class UserTradingContext:
         self._sol_client: Optional[SolanaClient] = None
 
     @classmethod
-    async def from_user_id(cls, user_id: str, db) -> "UserTradingContext":
+    async def from_user_id(
+        cls,
+        user_id: str,
+        db,
+        clearinghouse: Optional[ClearinghouseBatcher] = None,
+        clients: Optional[VenueClientRegistry] = None,
+    ) -> "UserTradingContext":
         """Create a UserTradingContext by loading wallet info from the database.
 
         Prefers server wallet addresses/IDs (from Phase 2 provisioning).
@@ -82,6 +107,9 @@ class UserTradingContext:
         Args:
             user_id: Privy user ID (matches users.id in DB).
             db: Database instance with fetchone().
+            clearinghouse: Optional shared ClearinghouseBatcher for the
+                user's HyperliquidTrader.
+            clients: Venue client registry (defaults to the process-wide one).
 
         Returns:
             UserTradingContext with resolved wallet addresses.
@@ -90,36 +118,50 @@ class UserTradingContext:
             ValueError: If user not found or has no wallets.
         """
         user = await db.fetchone(
-            """SELECT solana_address, evm_address,
-                      server_evm_wallet_id, server_evm_address,
-                      server_solana_wallet_id, server_solana_address
-               FROM users WHERE id = $1""",
+            f"SELECT {cls.WALLET_COLUMNS} FROM users WHERE id = $1",
             (user_id,),
         )
         if not user:
             raise ValueError(f"User not found: {user_id}")
 
-        # Prefer server wallet addresses (Phase 2); fall back to embedded
-        evm_wallet_id = user.get("server_evm_wallet_id")
-        solana_wallet_id = user.get("server_solana_wallet_id")
-        evm_address = user.get("server_evm_address") or user.get("evm_address")
-        solana_address = user.get("server_solana_address") or user.get("solana_address")
-
-        if not solana_address and not evm_address:
+        wallets = cls.wallets_from_row(user)
+        if not wallets["solana_address"] and not wallets["evm_address"]:
             raise ValueError(f"User {user_id} has no wallet addresses configured")
 
         return cls(
             user_id=user_id,
-            solana_address=solana_address,
-            evm_address=evm_address,
-            evm_wallet_id=evm_wallet_id,
-            solana_wallet_id=solana_wallet_id,
+            clearinghouse=clearinghouse,
+            clients=clients,
+            **wallets,
+        )
+
+    @staticmethod
+    def wallets_from_row(row) -> Dict[str, Optional[str]]:
+        """Resolve wallet addresses/IDs from a ``users`` row.
+
+        Prefers server wallet addresses (Phase 2); falls back to embedded.
+        """
+        return {
+            "solana_address": row.get("server_solana_address") or row.get("solana_address"),
+            "evm_address": row.get("server_evm_address") or row.get("evm_address"),
+            "evm_wallet_id": row.get("server_evm_wallet_id"),
+            "solana_wallet_id": row.get("server_solana_wallet_id"),
+        }
+
+    @property
+    def wallet_key(self) -> Tuple[Optional[str], ...]:
+        """Identity of this context's wallets (changes when ``users`` is updated)."""
+        return (
+            self.solana_address,
+            self.evm_address,
+            self.evm_wallet_id,
+            self.solana_wallet_id,
         )
 
     def get_hl_client(self) -> HyperliquidClient:
         """Get a shared HyperliquidClient (read-only API, no auth needed)."""
         if self._hl_client is None:
-            self._hl_client = HyperliquidClient()
+            self._hl_client = self.clients.hyperliquid_client()
         return self._hl_client
 
     def get_hl_trader(self) -> HyperliquidTrader:
@@ -137,6 +179,7 @@ class UserTradingContext:
                 wallet_address=self.evm_address,
                 user_id=self.user_id,
                 wallet_id=self.evm_wallet_id,
+                clearinghouse=self.clearinghouse,
             )
         return self._hl_trader
 
@@ -148,6 +191,7 @@ class UserTradingContext:
         """
         if self._asgard_manager is None:
             self._asgard_manager = AsgardPositionManager(
+                client=self.clients.asgard_client(),
                 solana_wallet_address=self.solana_address,
                 user_id=self.user_id,
                 solana_wallet_id=self.solana_wallet_id,
@@ -157,7 +201,7 @@ class UserTradingContext:
     def get_arb_client(self) -> ArbitrumClient:
         """Get a shared ArbitrumClient for RPC reads."""
         if self._arb_client is None:
-            self._arb_client = ArbitrumClient()
+            self._arb_client = self.clients.arbitrum_client()
         return self._arb_client
 
     def get_hl_depositor(self) -> HyperliquidDepositor:
@@ -178,7 +222,7 @@ class UserTradingContext:
     def get_sol_client(self) -> SolanaClient:
         """Get a shared SolanaClient for RPC reads."""
         if self._sol_client is None:
-            self._sol_client = SolanaClient()
+            self._sol_client = self.clients.solana_client()
         return self._sol_client
 
     def get_solana_transferor(self) -> SolanaTransferor:
@@ -196,7 +240,7 @@ class UserTradingContext:
         return self._sol_transferor
 
     async def close(self):
-        """Clean up HTTP sessions."""
+        """Clean up HTTP sessions (pooled connections stay open)."""
         if self._hl_trader is not None:
             try:
                 await self._hl_trader.__aexit__(None, None, None)
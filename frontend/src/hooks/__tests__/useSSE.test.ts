@@ -3,12 +3,14 @@ import { renderHook } from '@testing-library/react';
 import { useSSE } from '../useSSE';
 
 const mockUpdatePosition = vi.fn();
+const mockSetPositions = vi.fn();
 const mockSetRates = vi.fn();
 const mockAddToast = vi.fn();
 
 vi.mock('../../stores', () => ({
   usePositionsStore: () => ({
     updatePosition: mockUpdatePosition,
+    setPositions: mockSetPositions,
   }),
   useRatesStore: () => ({
     setRates: mockSetRates,
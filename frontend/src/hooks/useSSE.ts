@@ -1,8 +1,13 @@
 import { useEffect, useRef, useCallback } from 'react';
-import { usePositionsStore, useRatesStore, useUIStore } from '../stores';
+import { usePositionsStore, useRatesStore, useUIStore, type Position } from '../stores';
+
+interface PositionDelta {
+  position_id: string;
+  ops: { op: 'add' | 'replace' | 'remove'; path: string; value?: unknown }[];
+}
 
 interface SSEMessage {
-  type: 'position_update' | 'rate_update' | 'error' | 'connected';
+  type: 'position_update' | 'position_delta' | 'rate_update' | 'snapshot' | 'error' | 'connected';
   data: unknown;
   timestamp: string;
 }
@@ -11,8 +16,11 @@ export function useSSE() {
   const eventSourceRef = useRef<EventSource | null>(null);
   const reconnectTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const reconnectAttemptsRef = useRef(0);
+  // Resume point: the server replays only events after it on reconnect
+  const lastEventIdRef = useRef<string | null>(null);
   
   const updatePosition = usePositionsStore((s) => s.updatePosition);
+  const setPositions = usePositionsStore((s) => s.setPositions);
   const setRates = useRatesStore((s) => s.setRates);
   const addToast = useUIStore((s) => s.addToast);
 
@@ -27,7 +35,9 @@ export function useSSE() {
 
     const apiUrl = import.meta.env.VITE_API_BASE_URL || '/api/v1';
     // Backend SSE endpoint is at /api/v1/events/stream
-    const sseUrl = `${apiUrl}/events/stream`;
+    const sseUrl = lastEventIdRef.current
+      ? `${apiUrl}/events/stream?last_event_id=${encodeURIComponent(lastEventIdRef.current)}`
+      : `${apiUrl}/events/stream`;
     
     try {
       const eventSource = new EventSource(sseUrl);
@@ -39,6 +49,9 @@ export function useSSE() {
       };
 
       eventSource.onmessage = (event) => {
+        if (event.lastEventId) {
+          lastEventIdRef.current = event.lastEventId;
+        }
         try {
           const message: SSEMessage = JSON.parse(event.data);
           
@@ -50,6 +63,26 @@ export function useSSE() {
               }
               break;
               
+            case 'position_delta':
+              // Changed fields since the last frame for this position
+              if (typeof message.data === 'object' && message.data) {
+                const delta = message.data as PositionDelta;
+                const updates: Record<string, unknown> = {};
+                for (const op of delta.ops) {
+                  updates[op.path.slice(1)] = op.op === 'remove' ? undefined : op.value;
+                }
+                updatePosition(delta.position_id, updates);
+              }
+              break;
+
+            case 'snapshot':
+              // Missed events could not be replayed: replace the positions
+              if (typeof message.data === 'object' && message.data) {
+                const snapshot = message.data as { positions?: Position[] };
+                setPositions(snapshot.positions ?? []);
+              }
+              break;
+
             case 'rate_update':
               if (typeof message.data === 'object' && message.data) {
                 setRates(message.data as Parameters<typeof setRates>[0]);
@@ -61,6 +94,7 @@ export function useSSE() {
               break;
               
             case 'connected':
+              // Carries the resume point as its id (recorded above)
               console.log('SSE connected:', message.data);
               break;
           }
@@ -90,7 +124,7 @@ export function useSSE() {
     } catch (error) {
       console.error('Failed to create SSE connection:', error);
     }
-  }, [updatePosition, setRates, addToast]);
+  }, [updatePosition, setPositions, setRates, addToast]);
 
   const disconnect = useCallback(() => {
     if (reconnectTimeoutRef.current) {
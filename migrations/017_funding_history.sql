@@ -0,0 +1,12 @@
+-- Migration 017: Persistent Hyperliquid funding history
+--
+-- Append-only hourly funding rates per coin, shared by every funding
+-- oracle. On restart only the tail since the newest stored row is
+-- fetched instead of a full week of history.
+
+CREATE TABLE IF NOT EXISTS funding_history (
+    coin TEXT NOT NULL,
+    time_ms BIGINT NOT NULL,
+    funding_rate DOUBLE PRECISION NOT NULL,
+    PRIMARY KEY (coin, time_ms)
+);
@@ -1,7 +1,10 @@
 """
 Arbitrum/Web3 client with retry logic.
+
+``get_balances`` reads ETH and native USDC for many addresses through
+Multicall3 (a few ``eth_call`` round trips for thousands of addresses).
 """
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from decimal import Decimal
 
 from web3 import AsyncWeb3
@@ -10,6 +13,8 @@ from shared.config.settings import get_settings
 from shared.utils.logger import get_logger
 from shared.utils.retry import retry_rpc
 
+from .multicall import EvmBalance, Multicall3Reader
+
 logger = get_logger(__name__)
 
 # Default Arbitrum RPC
@@ -37,10 +42,18 @@ class ArbitrumClient:
     Note: This client is for read-only operations. All signing is done via Privy.
     """
     
-    def __init__(self, rpc_url: Optional[str] = None):
+    def __init__(self, rpc_url: Optional[str] = None, w3: Optional[AsyncWeb3] = None):
+        """
+        Args:
+            rpc_url: Override RPC endpoint (default: settings).
+            w3: Shared ``AsyncWeb3`` instance (connection pool); not
+                disconnected by ``close()`` when provided.
+        """
         self.settings = get_settings()
         self.rpc_url = rpc_url or self.settings.arbitrum_rpc_url or DEFAULT_ARBITRUM_RPC
-        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
+        self._owns_w3 = w3 is None
+        self.w3 = w3 or AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.rpc_url))
+        self._multicall: Optional[Multicall3Reader] = None
     
     @property
     def wallet_address(self) -> str:
@@ -202,6 +215,24 @@ class ArbitrumClient:
             decimals=6,
         )
 
+    @retry_rpc
+    async def get_balances(self, addresses: Sequence[str]) -> Dict[str, EvmBalance]:
+        """
+        ETH and native USDC balances for many addresses via Multicall3.
+
+        Args:
+            addresses: Addresses to read
+
+        Returns:
+            EvmBalance per address; USDC under ``tokens[NATIVE_USDC_ARBITRUM]``
+            (``None`` for any individual read that failed)
+        """
+        if self._multicall is None:
+            self._multicall = Multicall3Reader(self.w3)
+        return await self._multicall.get_balances(
+            addresses, tokens={NATIVE_USDC_ARBITRUM: 6}
+        )
+
     async def health_check(self) -> bool:
         """
         Quick health check for the RPC connection.
@@ -217,8 +248,9 @@ class ArbitrumClient:
             return False
     
     async def close(self):
-        """Close the client connection."""
-        await self.w3.provider.disconnect()
+        """Close the client connection (unless it is shared)."""
+        if self._owns_w3:
+            await self.w3.provider.disconnect()
     
     async def __aenter__(self):
         return self
@@ -1,7 +1,19 @@
 """
 Solana RPC client with retry logic.
+
+``get_balances`` reads SOL and SPL (associated token account) balances
+for many owners with ``getMultipleAccounts``: one round trip per 100
+accounts, issued concurrently, instead of two sequential requests per
+owner and mint.
+
+Transaction confirmation goes through a shared ``SignatureConfirmer``
+(``signatureSubscribe`` plus batched status polls) when one is attached,
+e.g. by the client registry; otherwise it polls the signature status.
 """
-from typing import Optional, Dict, Any
+import asyncio
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
 
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Confirmed
@@ -14,18 +26,64 @@ from shared.config.settings import get_settings
 from shared.utils.logger import get_logger
 from shared.utils.retry import retry_rpc
 
+from .solana_confirmations import SignatureConfirmer, TransactionFailedError
+
 logger = get_logger(__name__)
 
+TOKEN_PROGRAM_ID = Pubkey.from_string("TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA")
+ASSOCIATED_TOKEN_PROGRAM_ID = Pubkey.from_string("ATokenGPvbdGVxr1b2hvZbsiqW5xWH25efTNsLJA8knL")
+
+# SPL account layouts: token account amount (u64) after mint + owner;
+# mint decimals (u8) after the mint authority option and supply
+TOKEN_AMOUNT_OFFSET = 64
+MINT_DECIMALS_OFFSET = 44
+
+MAX_MULTIPLE_ACCOUNTS = 100  # getMultipleAccounts limit
+
+
+def associated_token_address(owner: str, mint: str) -> Pubkey:
+    """Associated token account of ``owner`` for ``mint``."""
+    address, _ = Pubkey.find_program_address(
+        [bytes(Pubkey.from_string(owner)), bytes(TOKEN_PROGRAM_ID), bytes(Pubkey.from_string(mint))],
+        ASSOCIATED_TOKEN_PROGRAM_ID,
+    )
+    return address
+
+
+@dataclass(frozen=True)
+class WalletBalance:
+    """SOL and per-mint SPL balances (UI units) for one owner."""
+    sol: float
+    tokens: Dict[str, float]
+
 
 class SolanaClient:
     """
     Async Solana RPC client with retry and error handling.
     """
+
+    # Mint decimals never change; shared by every client in the process
+    _mint_decimals: Dict[str, int] = {}
     
-    def __init__(self, rpc_url: Optional[str] = None):
+    def __init__(
+        self,
+        rpc_url: Optional[str] = None,
+        client: Optional[AsyncClient] = None,
+        confirmer: Optional[SignatureConfirmer] = None,
+    ):
+        """
+        Args:
+            rpc_url: Override RPC endpoint (default: settings).
+            client: Shared ``AsyncClient`` (connection pool); not closed by
+                ``close()`` when provided.
+            confirmer: Shared ``SignatureConfirmer`` for ``confirm_transaction``
+                (not closed by ``close()``).
+        """
         self.settings = get_settings()
         self.rpc_url = rpc_url or self.settings.solana_rpc_url
-        self.client = AsyncClient(self.rpc_url, commitment=Confirmed)
+        self._owns_client = client is None
+        self.client = client or AsyncClient(self.rpc_url, commitment=Confirmed)
+        self.confirmer = confirmer
         
     @property
     def wallet_address(self) -> str:
@@ -91,6 +149,73 @@ class SolanaClient:
         
         return amount / (10 ** decimals)
     
+    @retry_rpc
+    async def get_balances(
+        self,
+        owners: Sequence[str],
+        mints: Sequence[str] = (),
+    ) -> Dict[str, WalletBalance]:
+        """
+        SOL and SPL balances for many owners in one batched read.
+
+        Reads every owner account and its associated token account per
+        mint (plus any mint whose decimals are not cached yet) with
+        ``getMultipleAccounts``. Balances held outside the associated
+        token account are not counted; a missing account reads as 0.
+
+        Args:
+            owners: Wallet addresses
+            mints: SPL token mints to read for every owner
+
+        Returns:
+            WalletBalance per owner; owners that are not valid addresses are
+            left out rather than failing the whole read
+        """
+        owner_keys: Dict[str, Pubkey] = {}
+        for owner in dict.fromkeys(owners):
+            try:
+                owner_keys[owner] = Pubkey.from_string(owner)
+            except ValueError:
+                logger.warning("invalid_owner_address", owner=owner)
+        owners = list(owner_keys)
+        mints = list(dict.fromkeys(mints))
+        unknown_mints = [m for m in mints if m not in self._mint_decimals]
+
+        keys: List[Pubkey] = list(owner_keys.values())
+        keys += [associated_token_address(o, m) for o in owners for m in mints]
+        keys += [Pubkey.from_string(m) for m in unknown_mints]
+
+        chunks = [
+            keys[i:i + MAX_MULTIPLE_ACCOUNTS]
+            for i in range(0, len(keys), MAX_MULTIPLE_ACCOUNTS)
+        ]
+        responses = await asyncio.gather(*(
+            self.client.get_multiple_accounts(chunk, encoding="base64") for chunk in chunks
+        ))
+        accounts = [account for resp in responses for account in resp.value]
+
+        mint_accounts = accounts[len(owners) * (1 + len(mints)):]
+        for mint, account in zip(unknown_mints, mint_accounts):
+            if account is None:
+                raise Exception(f"Mint account not found: {mint}")
+            self._mint_decimals[mint] = bytes(account.data)[MINT_DECIMALS_OFFSET]
+
+        balances = {}
+        for i, owner in enumerate(owners):
+            account = accounts[i]
+            tokens = {}
+            for j, mint in enumerate(mints):
+                token_account = accounts[len(owners) + i * len(mints) + j]
+                amount = 0
+                if token_account is not None:
+                    (amount,) = struct.unpack_from("<Q", bytes(token_account.data), TOKEN_AMOUNT_OFFSET)
+                tokens[mint] = amount / (10 ** self._mint_decimals[mint])
+            balances[owner] = WalletBalance(
+                sol=(account.lamports if account is not None else 0) / 1e9,
+                tokens=tokens,
+            )
+        return balances
+
     @retry_rpc
     async def get_latest_blockhash(self) -> str:
         """Get latest blockhash for transaction construction."""
@@ -153,7 +278,6 @@ class SolanaClient:
         
         return signature
     
-    @retry_rpc
     async def confirm_transaction(
         self,
         signature: str,
@@ -163,6 +287,10 @@ class SolanaClient:
         """
         Wait for transaction confirmation.
         
+        With a confirmer the signature is resolved by its subscription (or
+        the confirmer's batched poll); the timeout is the same
+        ``max_retries * retry_interval`` the polling loop would take.
+        
         Args:
             signature: Transaction signature
             max_retries: Maximum confirmation attempts
@@ -170,8 +298,14 @@ class SolanaClient:
         
         Returns:
             True if confirmed, False if timeout
+
+        Raises:
+            TransactionFailedError: The transaction landed with an error
         """
         import asyncio
+
+        if self.confirmer is not None:
+            return await self.confirmer.confirm(signature, timeout=max_retries * retry_interval)
         
         for i in range(max_retries):
             status = await self.get_signature_status(signature)
@@ -181,7 +315,7 @@ class SolanaClient:
                 continue
             
             if status.get("err") is not None:
-                raise Exception(f"Transaction failed: {status['err']}")
+                raise TransactionFailedError(signature, status["err"])
             
             if status.get("confirmed"):
                 return True
@@ -205,8 +339,9 @@ class SolanaClient:
             return False
     
     async def close(self):
-        """Close the client connection."""
-        await self.client.close()
+        """Close the client connection (unless it is shared)."""
+        if self._owns_client:
+            await self.client.close()
     
     async def __aenter__(self):
         return self
@@ -0,0 +1,324 @@
+"""
+Multiplexed Solana transaction confirmation.
+
+``SignatureConfirmer`` replaces per-transaction status polling with:
+
+- ``signatureSubscribe`` over one persistent websocket: every outstanding
+  signature gets a subscription and its waiters are resolved the moment the
+  notification arrives (subscriptions are replayed after a reconnect).
+- One batched ``getSignatureStatuses`` call per tick covering *all*
+  outstanding signatures, as a safety net for missed notifications and as
+  the only source while the websocket is down (it then ticks faster).
+
+Any number of concurrent ``confirm`` calls therefore cost one websocket
+plus at most one status request per tick. Waiters for the same signature
+share one future.
+
+Usage:
+    confirmer = SignatureConfirmer(async_client, ws_url="wss://...")
+    confirmed = await confirmer.confirm(signature, timeout=30)  # raises on tx error
+    ...
+    await confirmer.close()
+"""
+import asyncio
+import itertools
+import json
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from solana.rpc.async_api import AsyncClient
+from solders.signature import Signature
+
+from shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TransactionFailedError(Exception):
+    """A confirmed transaction that landed with an error."""
+
+    def __init__(self, signature: str, err: Any):
+        super().__init__(f"Transaction failed: {err}")
+        self.signature = signature
+        self.err = err
+
+
+def ws_url_for(rpc_url: str) -> Optional[str]:
+    """Websocket endpoint for an HTTP(S) Solana RPC URL (None if unknown)."""
+    if rpc_url.startswith("https://"):
+        return "wss://" + rpc_url[len("https://"):]
+    if rpc_url.startswith("http://"):
+        return "ws://" + rpc_url[len("http://"):]
+    return None
+
+
+class SignatureConfirmer:
+    """
+    Shared confirmation service for one Solana RPC endpoint.
+
+    Args:
+        client: solana-py ``AsyncClient`` used for the batched status polls.
+        ws_url: Websocket endpoint for ``signatureSubscribe``; polling only
+            when None.
+        session: Optional aiohttp session for the websocket.
+        commitment: Commitment the subscriptions wait for.
+    """
+
+    POLL_INTERVAL = 0.5  # Websocket down: polls are the only source
+    POLL_INTERVAL_WS = 2.0  # Websocket up: polls only backstop missed notifications
+    MAX_BATCH = 256  # getSignatureStatuses limit
+    RECONNECT_MIN = 0.5
+    RECONNECT_MAX = 30.0
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        ws_url: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        commitment: str = "confirmed",
+    ):
+        self.client = client
+        self.ws_url = ws_url
+        self.commitment = commitment
+        self._session = session
+        self._owns_session = session is None
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+        self._has_pending = asyncio.Event()
+
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._ids = itertools.count(1)
+        self._requests: Dict[int, str] = {}  # request id -> signature
+        self._subscriptions: Dict[int, str] = {}  # subscription id -> signature
+        self._subscribed: Dict[str, int] = {}  # signature -> subscription id
+
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+        # Counters
+        self.polls = 0
+        self.notifications = 0
+
+    @property
+    def connected(self) -> bool:
+        return self._ws is not None and not self._ws.closed
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def confirm(self, signature: str, timeout: float) -> bool:
+        """
+        Wait until ``signature`` is confirmed.
+
+        Returns:
+            True once confirmed, False if ``timeout`` passed first.
+
+        Raises:
+            TransactionFailedError: The transaction landed with an error.
+        """
+        self._ensure_running()
+        future = self._pending.get(signature)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[signature] = future
+            self._has_pending.set()
+            await self._subscribe(signature)
+        self._waiters[signature] = self._waiters.get(signature, 0) + 1
+
+        try:
+            # Shield: one waiter timing out must not cancel the shared future
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._waiters[signature] -= 1
+            if not self._waiters[signature]:
+                del self._waiters[signature]
+                if not future.done():
+                    await self._forget(signature)
+
+    async def close(self) -> None:
+        """Stop the websocket and poller; outstanding waiters time out."""
+        self._running = False
+        if self._ws is not None and not self._ws.closed:
+            await self._ws.close()
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    def _ensure_running(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._tasks = [asyncio.create_task(self._poll_loop())]
+        if self.ws_url:
+            self._tasks.append(asyncio.create_task(self._ws_loop()))
+
+    def _resolve(self, signature: str, err: Any = None) -> Optional[int]:
+        """Settle a signature's waiters; returns its live subscription id, if any."""
+        future = self._pending.pop(signature, None)
+        if not self._pending:
+            self._has_pending.clear()
+        subscription = self._subscribed.pop(signature, None)
+        if subscription is not None:
+            self._subscriptions.pop(subscription, None)
+        if future is not None and not future.done():
+            if err is not None:
+                future.set_exception(TransactionFailedError(signature, err))
+                # Retrieved by waiters; avoid "exception never retrieved" if none are left
+                future.exception()
+            else:
+                future.set_result(True)
+        return subscription
+
+    async def _forget(self, signature: str) -> None:
+        """Drop a signature nobody is waiting for any more."""
+        self._pending.pop(signature, None)
+        if not self._pending:
+            self._has_pending.clear()
+        subscription = self._subscribed.pop(signature, None)
+        if subscription is not None:
+            self._subscriptions.pop(subscription, None)
+            await self._send("signatureUnsubscribe", [subscription])
+
+    # ------------------------------------------------------------------
+    # Batched polling
+    # ------------------------------------------------------------------
+
+    async def _poll_loop(self) -> None:
+        while self._running:
+            await self._has_pending.wait()
+            await asyncio.sleep(self.POLL_INTERVAL_WS if self.connected else self.POLL_INTERVAL)
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("signature_status_poll_failed", error=str(e), outstanding=self.outstanding)
+
+    async def poll(self) -> None:
+        """One ``getSignatureStatuses`` call per MAX_BATCH outstanding signatures."""
+        signatures = list(self._pending)
+        for start in range(0, len(signatures), self.MAX_BATCH):
+            batch = signatures[start:start + self.MAX_BATCH]
+            resp = await self.client.get_signature_statuses(
+                [Signature.from_string(sig) for sig in batch]
+            )
+            self.polls += 1
+            for signature, status in zip(batch, resp.value or []):
+                if status is None:
+                    continue
+                if status.err is not None:
+                    subscription = self._resolve(signature, status.err)
+                elif status.confirmation_status is not None:
+                    subscription = self._resolve(signature)
+                else:
+                    continue
+                if subscription is not None:
+                    await self._send("signatureUnsubscribe", [subscription])
+
+    # ------------------------------------------------------------------
+    # signatureSubscribe
+    # ------------------------------------------------------------------
+
+    async def _ws_loop(self) -> None:
+        backoff = self.RECONNECT_MIN
+        while self._running:
+            try:
+                if self._session is None or self._session.closed:
+                    self._session = aiohttp.ClientSession()
+                    self._owns_session = True
+                async with self._session.ws_connect(self.ws_url, heartbeat=30.0) as ws:
+                    self._ws = ws
+                    backoff = self.RECONNECT_MIN
+                    for signature in list(self._pending):
+                        await self._subscribe(signature)
+                    logger.info("solana_ws_connected", outstanding=self.outstanding)
+                    async for msg in ws:
+                        if msg.type == aiohttp.WSMsgType.TEXT:
+                            self._dispatch(msg.data)
+                        elif msg.type == aiohttp.WSMsgType.ERROR:
+                            break
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("solana_ws_error", error=str(e))
+            finally:
+                self._ws = None
+                # Subscription ids do not survive the connection
+                self._requests.clear()
+                self._subscriptions.clear()
+                self._subscribed.clear()
+
+            if not self._running:
+                break
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.RECONNECT_MAX)
+
+    async def _subscribe(self, signature: str) -> None:
+        request_id = await self._send(
+            "signatureSubscribe", [signature, {"commitment": self.commitment}]
+        )
+        if request_id is not None:
+            self._requests[request_id] = signature
+
+    async def _send(self, method: str, params: List[Any]) -> Optional[int]:
+        ws = self._ws
+        if ws is None or ws.closed:
+            return None  # Subscribed on (re)connect; polled meanwhile
+        request_id = next(self._ids)
+        try:
+            await ws.send_str(json.dumps(
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            ))
+        except Exception as e:
+            logger.warning("solana_ws_send_failed", method=method, error=str(e))
+            return None
+        return request_id
+
+    def _dispatch(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return
+
+        if "id" in message:
+            signature = self._requests.pop(message["id"], None)
+            subscription = message.get("result")
+            if signature is None or not isinstance(subscription, int) or isinstance(subscription, bool):
+                return
+            if signature in self._pending:
+                self._subscriptions[subscription] = signature
+                self._subscribed[signature] = subscription
+            return
+
+        if message.get("method") != "signatureNotification":
+            return
+        params = message.get("params") or {}
+        signature = self._subscriptions.pop(params.get("subscription"), None)
+        if signature is None:
+            return
+        # The server drops a signature subscription after its notification
+        self._subscribed.pop(signature, None)
+        self.notifications += 1
+        value = (params.get("result") or {}).get("value") or {}
+        self._resolve(signature, value.get("err"))
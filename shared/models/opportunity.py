@@ -77,6 +77,9 @@ class ArbitrageOpportunity(BaseModel):
     
     # Validation results
     price_deviation: Decimal = Field(description="Price deviation between venues")
+    expected_hedge_impact: Optional[Decimal] = Field(
+        None, description="Expected Hyperliquid entry price impact vs mid (fraction)"
+    )
     preflight_checks_passed: bool = Field(default=False)
     
     # Metadata
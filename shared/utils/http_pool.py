@@ -0,0 +1,85 @@
+"""
+Shared keep-alive connection pools for aiohttp-based venue clients.
+
+A client constructed with a pool opens its ``ClientSession`` on the pool's
+connector without owning it: closing the client only drops the (cheap)
+session object, while TCP/TLS connections and cached DNS lookups stay in
+the pool for the next client. Connectors are bound to an event loop, so
+the pool creates its connector lazily inside the running loop and replaces
+it if the loop changes.
+
+Usage:
+    pool = HttpConnectionPool("hyperliquid", limit=64, limit_per_host=32)
+    client = HyperliquidClient(pool=pool)
+"""
+import asyncio
+from typing import Optional
+
+import aiohttp
+
+from shared.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HttpConnectionPool:
+    """
+    Lazily created, loop-aware ``aiohttp.TCPConnector``.
+
+    Args:
+        name: Label for logs (usually the venue).
+        limit: Total simultaneous connections.
+        limit_per_host: Simultaneous connections per endpoint.
+        dns_ttl: Seconds DNS answers are cached.
+        keepalive_timeout: Seconds idle connections are kept open.
+    """
+
+    DEFAULT_LIMIT = 100
+    DEFAULT_LIMIT_PER_HOST = 32
+    DEFAULT_DNS_TTL = 300
+    DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+
+    def __init__(
+        self,
+        name: str,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        dns_ttl: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.limit = limit or self.DEFAULT_LIMIT
+        self.limit_per_host = limit_per_host or self.DEFAULT_LIMIT_PER_HOST
+        self.dns_ttl = dns_ttl or self.DEFAULT_DNS_TTL
+        self.keepalive_timeout = keepalive_timeout or self.DEFAULT_KEEPALIVE_TIMEOUT
+
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Return the pooled connector (must be called inside the event loop)."""
+        loop = asyncio.get_running_loop()
+        if self._connector is None or self._connector.closed or self._loop is not loop:
+            self._connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._loop = loop
+            logger.debug(
+                f"{self.name} connection pool created "
+                f"(limit={self.limit}, per_host={self.limit_per_host})"
+            )
+        return self._connector
+
+    async def close(self) -> None:
+        """Close pooled connections (clients using the pool must not be in use)."""
+        if self._connector is not None and not self._connector.closed:
+            try:
+                if self._loop is asyncio.get_running_loop():
+                    await self._connector.close()
+            except Exception as e:
+                logger.warning(f"Error closing {self.name} connection pool: {e}")
+        self._connector = None
+        self._loop = None
@@ -22,3 +22,24 @@ mock_privy.PrivyClient = mock_privy_client_class
 
 # Register mock in sys.modules before any imports
 sys.modules['privy'] = mock_privy
+
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _reset_funding_history_cache():
+    """Give each test a fresh process-wide funding-history cache."""
+    from bot.venues.hyperliquid.funding_cache import reset_funding_history_cache
+    reset_funding_history_cache()
+    yield
+    reset_funding_history_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_local_caches():
+    """Keep in-process cache entries from leaking between tests."""
+    yield
+    cache = sys.modules.get("backend.dashboard.cache")
+    if cache is not None:
+        cache.clear_local_caches()
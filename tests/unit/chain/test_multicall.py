@@ -0,0 +1,129 @@
+"""Tests for batched EVM balance reads through Multicall3."""
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from eth_abi import decode, encode
+from web3 import AsyncWeb3
+
+from shared.chain.arbitrum import ArbitrumClient, NATIVE_USDC_ARBITRUM
+from shared.chain.multicall import (
+    BALANCE_OF_SELECTOR,
+    GET_ETH_BALANCE_SELECTOR,
+    MULTICALL3_ADDRESS,
+    EvmBalance,
+    Multicall3Reader,
+)
+
+OWNER_A = "0x742d35Cc6634C0532925a3b844Bc9e7595f0bEbE"
+OWNER_B = "0x1111111111111111111111111111111111111111"
+
+
+class _FakeMulticall:
+    """aggregate3 stand-in answering from {(target, owner): raw amount}."""
+
+    def __init__(self, amounts, failing=()):
+        self.amounts = amounts
+        self.failing = set(failing)
+        self.batches = []
+
+    def aggregate3(self, calls):
+        self.batches.append(calls)
+        results = []
+        for target, allow_failure, data in calls:
+            assert allow_failure is True
+            (owner,) = decode(["address"], data[4:])
+            if data[:4] == GET_ETH_BALANCE_SELECTOR:
+                key = ("eth", owner)
+            else:
+                assert data[:4] == BALANCE_OF_SELECTOR
+                key = (target, owner)
+            if key in self.failing:
+                results.append((False, b""))
+            else:
+                results.append((True, encode(["uint256"], [self.amounts.get(key, 0)])))
+        call = MagicMock()
+        call.call = AsyncMock(return_value=results)
+        return call
+
+
+def _reader(fake):
+    w3 = MagicMock()
+    w3.to_checksum_address = AsyncWeb3.to_checksum_address
+    w3.eth.contract.return_value.functions = fake
+    return Multicall3Reader(w3)
+
+
+class TestMulticall3Reader:
+
+    @pytest.mark.asyncio
+    async def test_eth_and_token_balances(self):
+        usdc = AsyncWeb3.to_checksum_address(NATIVE_USDC_ARBITRUM)
+        fake = _FakeMulticall({
+            ("eth", OWNER_A.lower()): 2 * 10**18,
+            (usdc, OWNER_A.lower()): 1_500_000,
+            ("eth", OWNER_B.lower()): 10**15,
+        })
+        reader = _reader(fake)
+
+        balances = await reader.get_balances([OWNER_A, OWNER_B], tokens={NATIVE_USDC_ARBITRUM: 6})
+
+        assert balances[OWNER_A] == EvmBalance(
+            eth=Decimal(2), tokens={NATIVE_USDC_ARBITRUM: Decimal("1.5")}
+        )
+        assert balances[OWNER_B].eth == Decimal("0.001")
+        assert balances[OWNER_B].tokens[NATIVE_USDC_ARBITRUM] == Decimal(0)
+        assert len(fake.batches) == 1 and len(fake.batches[0]) == 4
+        assert fake.batches[0][0][0] == MULTICALL3_ADDRESS
+        assert reader.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self):
+        fake = _FakeMulticall({})
+        reader = _reader(fake)
+        reader.MAX_CALLS = 2
+        owners = [f"0x{i:040x}" for i in range(1, 6)]
+
+        balances = await reader.get_balances(owners)
+
+        assert [len(batch) for batch in fake.batches] == [2, 2, 1]
+        assert reader.requests == 3
+        assert list(balances) == owners
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_call_is_none(self):
+        fake = _FakeMulticall({("eth", OWNER_B.lower()): 10**18}, failing=[("eth", OWNER_A.lower())])
+        reader = _reader(fake)
+
+        balances = await reader.get_balances([OWNER_A, OWNER_B])
+
+        assert balances[OWNER_A].eth is None
+        assert balances[OWNER_B].eth == Decimal(1)
+
+
+    @pytest.mark.asyncio
+    async def test_invalid_address_left_out(self):
+        fake = _FakeMulticall({("eth", OWNER_B.lower()): 10**18})
+        reader = _reader(fake)
+
+        balances = await reader.get_balances(["0xnot-an-address", OWNER_B])
+
+        assert list(balances) == [OWNER_B]
+        assert balances[OWNER_B].eth == Decimal(1)
+
+
+class TestArbitrumClientGetBalances:
+
+    @pytest.mark.asyncio
+    @patch('shared.chain.arbitrum.get_settings')
+    async def test_reads_eth_and_usdc(self, mock_get_settings):
+        mock_get_settings.return_value = MagicMock(arbitrum_rpc_url="https://arb1.arbitrum.io/rpc")
+        client = ArbitrumClient(w3=MagicMock())
+        client._multicall = MagicMock()
+        client._multicall.get_balances = AsyncMock(return_value={OWNER_A: MagicMock()})
+
+        await client.get_balances([OWNER_A])
+
+        client._multicall.get_balances.assert_awaited_once_with(
+            [OWNER_A], tokens={NATIVE_USDC_ARBITRUM: 6}
+        )
@@ -250,6 +250,93 @@ class TestSolanaGetTokenBalance:
             assert owner in str(call_args)
 
 
+# Batched Balance Tests
+class TestSolanaGetBalances:
+    """Tests for the batched get_balances reader."""
+
+    USDC = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    OWNER_A = "687wkSEuqffp39b8gvScpUAGNejjgVzabkUoEnUS3Xt5"
+    OWNER_B = "9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM"
+
+    @staticmethod
+    def _token_account(amount):
+        return MagicMock(lamports=2039280, data=bytes(64) + amount.to_bytes(8, "little") + bytes(93))
+
+    @staticmethod
+    def _mint_account(decimals):
+        return MagicMock(lamports=1461600, data=bytes(44) + bytes([decimals]) + bytes(37))
+
+    @pytest.mark.asyncio
+    @patch('shared.chain.solana.get_settings')
+    async def test_owners_and_tokens_in_one_request(self, mock_get_settings, mock_settings):
+        """SOL, token accounts and mint decimals come from one getMultipleAccounts."""
+        from shared.chain.solana import SolanaClient as Client, associated_token_address
+
+        mock_get_settings.return_value = mock_settings
+        Client._mint_decimals.pop(self.USDC, None)
+        accounts = [
+            MagicMock(lamports=1_500_000_000),
+            MagicMock(lamports=250_000_000),
+            self._token_account(12_345_678),
+            None,  # Owner B has no USDC account
+            self._mint_account(6),
+        ]
+        rpc = MagicMock()
+        rpc.get_multiple_accounts = AsyncMock(return_value=MagicMock(value=accounts))
+        client = SolanaClient(client=rpc)
+
+        balances = await client.get_balances([self.OWNER_A, self.OWNER_B], [self.USDC])
+
+        assert balances[self.OWNER_A].sol == 1.5
+        assert balances[self.OWNER_A].tokens[self.USDC] == pytest.approx(12.345678)
+        assert balances[self.OWNER_B].sol == 0.25
+        assert balances[self.OWNER_B].tokens[self.USDC] == 0.0
+        rpc.get_multiple_accounts.assert_awaited_once()
+        keys = rpc.get_multiple_accounts.call_args.args[0]
+        assert keys[2] == associated_token_address(self.OWNER_A, self.USDC)
+        assert keys[4] == Pubkey.from_string(self.USDC)
+
+        # Decimals are cached: the next read skips the mint account
+        rpc.get_multiple_accounts = AsyncMock(return_value=MagicMock(value=accounts[:1] + accounts[2:3]))
+        await client.get_balances([self.OWNER_A], [self.USDC])
+        assert len(rpc.get_multiple_accounts.call_args.args[0]) == 2
+
+    @pytest.mark.asyncio
+    @patch('shared.chain.solana.get_settings')
+    async def test_invalid_owner_left_out(self, mock_get_settings, mock_settings):
+        """A malformed owner does not fail the other owners' read."""
+        mock_get_settings.return_value = mock_settings
+        rpc = MagicMock()
+        rpc.get_multiple_accounts = AsyncMock(
+            return_value=MagicMock(value=[MagicMock(lamports=1_000_000_000)])
+        )
+        client = SolanaClient(client=rpc)
+
+        balances = await client.get_balances([self.OWNER_A, "not-a-pubkey"])
+
+        assert list(balances) == [self.OWNER_A]
+        assert rpc.get_multiple_accounts.call_args.args[0] == [Pubkey.from_string(self.OWNER_A)]
+
+    @pytest.mark.asyncio
+    @patch('shared.chain.solana.get_settings')
+    async def test_large_sweeps_chunked(self, mock_get_settings, mock_settings):
+        """Reads beyond 100 accounts are split into concurrent requests."""
+        mock_get_settings.return_value = mock_settings
+        owners = [str(Pubkey.new_unique()) for _ in range(150)]
+
+        async def get_multiple_accounts(keys, encoding):
+            return MagicMock(value=[MagicMock(lamports=1_000_000_000) for _ in keys])
+
+        rpc = MagicMock()
+        rpc.get_multiple_accounts = AsyncMock(side_effect=get_multiple_accounts)
+        client = SolanaClient(client=rpc)
+
+        balances = await client.get_balances(owners)
+
+        assert rpc.get_multiple_accounts.await_count == 2
+        assert all(b.sol == 1.0 for b in balances.values())
+
+
 # Blockhash Tests
 class TestSolanaGetLatestBlockhash:
     """Tests for get_latest_blockhash method."""
@@ -0,0 +1,217 @@
+"""Tests for multiplexed Solana signature confirmation."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiohttp import WSMsgType, web
+from aiohttp.test_utils import TestServer
+from solders.signature import Signature
+
+from shared.chain.solana import SolanaClient
+from shared.chain.solana_confirmations import (
+    SignatureConfirmer,
+    TransactionFailedError,
+    ws_url_for,
+)
+
+
+def _status(confirmed=True, err=None):
+    status = MagicMock()
+    status.confirmation_status = "confirmed" if confirmed else None
+    status.err = err
+    return status
+
+
+class _StatusRpc:
+    """AsyncClient stand-in answering getSignatureStatuses from a dict."""
+
+    def __init__(self, statuses=None):
+        self.statuses = statuses or {}
+        self.calls = []
+
+    async def get_signature_statuses(self, signatures):
+        batch = [str(sig) for sig in signatures]
+        self.calls.append(batch)
+        return MagicMock(value=[self.statuses.get(sig) for sig in batch])
+
+
+class FakeSolanaWsServer:
+    """Acks signatureSubscribe and sends notifications on ``notify``."""
+
+    def __init__(self):
+        self.received = []
+        self._subscriptions = {}
+        self._sockets = []
+        self._server = None
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._server = TestServer(app)
+        await self._server.start_server()
+        return str(self._server.make_url("/")).replace("http://", "ws://")
+
+    async def stop(self):
+        for ws in list(self._sockets):
+            await ws.close()
+        await self._server.close()
+
+    async def notify(self, signature, err=None):
+        subscription = self._subscriptions[signature]
+        for ws in self._sockets:
+            await ws.send_str(json.dumps({
+                "jsonrpc": "2.0",
+                "method": "signatureNotification",
+                "params": {
+                    "result": {"context": {"slot": 1}, "value": {"err": err}},
+                    "subscription": subscription,
+                },
+            }))
+
+    async def _handle(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self._sockets.append(ws)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = json.loads(msg.data)
+                self.received.append(message)
+                if message["method"] == "signatureSubscribe":
+                    subscription = len(self._subscriptions) + 100
+                    self._subscriptions[message["params"][0]] = subscription
+                    await ws.send_str(json.dumps(
+                        {"jsonrpc": "2.0", "id": message["id"], "result": subscription}
+                    ))
+        finally:
+            self._sockets.remove(ws)
+        return ws
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+class TestBatchedPolling:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_confirmations_share_one_poll(self):
+        sigs = [str(Signature.new_unique()) for _ in range(5)]
+        rpc = _StatusRpc({sig: _status() for sig in sigs})
+        confirmer = SignatureConfirmer(rpc)
+        confirmer.POLL_INTERVAL = 0.01
+        try:
+            results = await asyncio.gather(*(confirmer.confirm(s, timeout=2) for s in sigs))
+        finally:
+            await confirmer.close()
+
+        assert results == [True] * 5
+        assert len(rpc.calls) == 1
+        assert sorted(rpc.calls[0]) == sorted(sigs)
+        assert confirmer.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_raises(self):
+        sig = str(Signature.new_unique())
+        rpc = _StatusRpc({sig: _status(err={"InstructionError": [0, "Custom"]})})
+        confirmer = SignatureConfirmer(rpc)
+        confirmer.POLL_INTERVAL = 0.01
+        try:
+            with pytest.raises(TransactionFailedError, match="Transaction failed"):
+                await confirmer.confirm(sig, timeout=2)
+        finally:
+            await confirmer.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_forgets_signature(self):
+        sig = str(Signature.new_unique())
+        confirmer = SignatureConfirmer(_StatusRpc())
+        confirmer.POLL_INTERVAL = 0.01
+        try:
+            assert await confirmer.confirm(sig, timeout=0.05) is False
+        finally:
+            await confirmer.close()
+
+        assert confirmer.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_capped(self):
+        sigs = [str(Signature.new_unique()) for _ in range(5)]
+        rpc = _StatusRpc({sig: _status() for sig in sigs})
+        confirmer = SignatureConfirmer(rpc)
+        confirmer.MAX_BATCH = 2
+        confirmer._pending = {sig: asyncio.get_running_loop().create_future() for sig in sigs}
+
+        await confirmer.poll()
+
+        assert [len(batch) for batch in rpc.calls] == [2, 2, 1]
+        assert confirmer.outstanding == 0
+
+
+class TestSignatureSubscribe:
+
+    @pytest.mark.asyncio
+    async def test_notification_resolves_without_polling(self):
+        server = FakeSolanaWsServer()
+        url = await server.start()
+        rpc = _StatusRpc()
+        confirmer = SignatureConfirmer(rpc, ws_url=url)
+        confirmer.POLL_INTERVAL = confirmer.POLL_INTERVAL_WS = 30.0
+        sig = str(Signature.new_unique())
+        try:
+            waiter = asyncio.ensure_future(confirmer.confirm(sig, timeout=5))
+            await _wait_for(lambda: sig in confirmer._subscribed)
+            await server.notify(sig)
+
+            assert await waiter is True
+        finally:
+            await confirmer.close()
+            await server.stop()
+
+        assert rpc.calls == []
+        assert confirmer.notifications == 1
+        assert server.received[0]["method"] == "signatureSubscribe"
+        assert server.received[0]["params"] == [sig, {"commitment": "confirmed"}]
+
+    @pytest.mark.asyncio
+    async def test_notification_error_raises(self):
+        server = FakeSolanaWsServer()
+        url = await server.start()
+        confirmer = SignatureConfirmer(_StatusRpc(), ws_url=url)
+        confirmer.POLL_INTERVAL = confirmer.POLL_INTERVAL_WS = 30.0
+        sig = str(Signature.new_unique())
+        try:
+            waiter = asyncio.ensure_future(confirmer.confirm(sig, timeout=5))
+            await _wait_for(lambda: sig in confirmer._subscribed)
+            await server.notify(sig, err={"InstructionError": [0, "Custom"]})
+
+            with pytest.raises(TransactionFailedError):
+                await waiter
+        finally:
+            await confirmer.close()
+            await server.stop()
+
+    def test_ws_url_for(self):
+        assert ws_url_for("https://api.mainnet-beta.solana.com") == "wss://api.mainnet-beta.solana.com"
+        assert ws_url_for("http://localhost:8899") == "ws://localhost:8899"
+        assert ws_url_for("") is None
+
+
+class TestClientDelegation:
+
+    @pytest.mark.asyncio
+    @patch('shared.chain.solana.get_settings')
+    async def test_confirm_transaction_uses_confirmer(self, mock_get_settings):
+        mock_get_settings.return_value = MagicMock(solana_rpc_url="https://api.devnet.solana.com")
+        confirmer = MagicMock()
+        confirmer.confirm = AsyncMock(return_value=True)
+        client = SolanaClient(client=MagicMock(), confirmer=confirmer)
+
+        assert await client.confirm_transaction("sig", max_retries=10, retry_interval=0.5) is True
+        confirmer.confirm.assert_awaited_once_with("sig", timeout=5.0)
@@ -242,3 +242,50 @@ class TestScanCycle:
 
         assert USER_A in users_evaluated
         assert USER_B in users_evaluated
+
+    @pytest.mark.asyncio
+    async def test_market_data_limited_to_enabled_assets(self):
+        db = AsyncMock()
+        db.fetchall = AsyncMock(return_value=[
+            _config_row(user_id=USER_A, assets=["SOL"]),
+            _config_row(user_id=USER_B, assets=["ETH", "SOL"]),
+        ])
+        scanner = AutonomousScanner(db=db)
+        scanner._evaluate_user = AsyncMock()
+
+        with patch.object(
+            scanner, "_fetch_market_data", return_value={"funding_rates": {}},
+        ) as mock_fetch:
+            await scanner._scan_cycle()
+
+        mock_fetch.assert_awaited_once_with({"SOL", "ETH"})
+
+
+# ---------------------------------------------------------------------------
+# Market data
+# ---------------------------------------------------------------------------
+
+class TestFetchMarketData:
+    @pytest.mark.asyncio
+    async def test_volatility_only_for_tracked_assets(self):
+        snapshot = MagicMock()
+        snapshot.funding_rates = {
+            "SOL": _make_rate_info(-0.01),
+            "ETH": _make_rate_info(-0.01),
+            "DOGE": _make_rate_info(-0.01),
+        }
+        snapshots = MagicMock()
+        snapshots.get = AsyncMock(return_value=snapshot)
+        scanner = AutonomousScanner(db=AsyncMock(), market_snapshots=snapshots)
+
+        store = MagicMock()
+        store.sync = AsyncMock(return_value=2)
+        store.volatilities = MagicMock(return_value={"SOL": 0.2})
+        scanner._hl_client = MagicMock()
+        scanner._funding_store = store
+
+        market = await scanner._fetch_market_data({"SOL", "ETH"})
+
+        store.sync.assert_awaited_once_with(["ETH", "SOL"])
+        # ETH has no history yet -> defaults to high volatility
+        assert market["volatilities"] == {"ETH": 1.0, "SOL": 0.2}
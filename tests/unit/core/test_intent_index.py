@@ -0,0 +1,125 @@
+"""Tests for the threshold-indexed intent matcher."""
+from datetime import datetime, timedelta
+
+from bot.core.intent_index import IntentIndex
+
+
+def _row(intent_id, asset="SOL", min_funding_rate=None, max_funding_volatility=0.50,
+         max_entry_price=None, expires_at=None):
+    return {
+        "id": intent_id,
+        "user_id": "u1",
+        "asset": asset,
+        "min_funding_rate": min_funding_rate,
+        "max_funding_volatility": max_funding_volatility,
+        "max_entry_price": max_entry_price,
+        "status": "active",
+        "expires_at": expires_at,
+    }
+
+
+def _ids(intents):
+    return sorted(i.id for i in intents)
+
+
+class TestMatch:
+
+    def test_funding_threshold(self):
+        index = IntentIndex()
+        index.add(_row("any"))
+        index.add(_row("strict", min_funding_rate=-0.001))
+        index.add(_row("stricter", min_funding_rate=-0.005))
+
+        assert _ids(index.match("SOL", -0.002, 100.0, 0.1)) == ["any", "strict"]
+        assert _ids(index.match("SOL", -0.0001, 100.0, 0.1)) == ["any"]
+        assert index.match("SOL", 0.0, 100.0, 0.1) == []
+
+    def test_positive_min_rate_still_requires_negative_funding(self):
+        index = IntentIndex()
+        index.add(_row("i1", min_funding_rate=0.01))
+
+        assert index.match("SOL", 0.001, 100.0, 0.1) == []
+        assert _ids(index.match("SOL", -0.001, 100.0, 0.1)) == ["i1"]
+
+    def test_volatility_and_price_thresholds(self):
+        index = IntentIndex()
+        index.add(_row("calm", max_funding_volatility=0.2))
+        index.add(_row("loose", max_funding_volatility=0.8))
+        index.add(_row("cheap", max_entry_price=90.0))
+
+        assert _ids(index.match("SOL", -0.002, 100.0, 0.5)) == ["loose"]
+        assert _ids(index.match("SOL", -0.002, 85.0, 0.1)) == ["calm", "cheap", "loose"]
+        # Without a price only unlimited intents can pass
+        assert _ids(index.match("SOL", -0.002, None, 0.1)) == ["calm", "loose"]
+
+    def test_default_volatility_limit(self):
+        index = IntentIndex()
+        index.add(_row("i1", max_funding_volatility=None))
+
+        assert index.match("SOL", -0.002, 100.0, 0.6) == []
+        assert _ids(index.match("SOL", -0.002, 100.0, 0.4)) == ["i1"]
+
+    def test_assets_are_independent(self):
+        index = IntentIndex()
+        index.add(_row("sol", asset="SOL"))
+        index.add(_row("jito", asset="jitoSOL"))
+
+        assert _ids(index.match("SOL", -0.002, 100.0, 0.1)) == ["sol"]
+        assert index.assets() == ["SOL", "jitoSOL"]
+
+    def test_only_shortest_suffix_walked(self):
+        index = IntentIndex()
+        for i in range(100):
+            index.add(_row(f"i{i}", max_entry_price=float(i)))
+
+        matched = index.match("SOL", -0.002, 98.0, 0.1)
+
+        assert _ids(matched) == ["i98", "i99"]
+        assert index.evaluated == 2
+
+
+class TestMaintenance:
+
+    def test_remove(self):
+        index = IntentIndex()
+        index.add(_row("i1"))
+        index.remove("i1")
+
+        assert "i1" not in index
+        assert index.match("SOL", -0.002, 100.0, 0.1) == []
+        assert index.assets() == []
+
+    def test_add_replaces_previous_version(self):
+        index = IntentIndex()
+        index.add(_row("i1", min_funding_rate=-0.005))
+        index.add(_row("i1", min_funding_rate=-0.001))
+
+        assert len(index) == 1
+        assert _ids(index.match("SOL", -0.002, 100.0, 0.1)) == ["i1"]
+
+    def test_replace_rebuilds(self):
+        index = IntentIndex()
+        index.add(_row("old"))
+        index.replace([_row("new")])
+
+        assert "old" not in index
+        assert "new" in index
+
+    def test_pop_expired(self):
+        now = datetime.utcnow()
+        index = IntentIndex()
+        index.add(_row("past", expires_at=(now - timedelta(hours=1)).isoformat()))
+        index.add(_row("future", expires_at=(now + timedelta(hours=1)).isoformat()))
+        index.add(_row("never"))
+
+        assert index.pop_expired(now) == ["past"]
+        assert "past" not in index
+        assert index.pop_expired(now) == []
+
+    def test_pop_expired_ignores_removed_intents(self):
+        now = datetime.utcnow()
+        index = IntentIndex()
+        index.add(_row("i1", expires_at=now - timedelta(hours=1)))
+        index.remove("i1")
+
+        assert index.pop_expired(now) == []
@@ -10,6 +10,7 @@ These tests verify:
 - Execution flow
 - Error handling
 """
+import asyncio
 import json
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
@@ -131,6 +132,23 @@ class TestScannerLifecycle:
 class TestScanCycle:
     """Tests for the main scan cycle."""
 
+    @staticmethod
+    def _snapshot(rate=-0.002, mids=None):
+        snapshot = MagicMock()
+        snapshot.funding_rates = {"SOL": MagicMock(funding_rate=rate)}
+        snapshot.mids = mids if mids is not None else {"SOL": 100.0}
+        snapshots = MagicMock()
+        snapshots.get = AsyncMock(return_value=snapshot)
+        return snapshots
+
+    @staticmethod
+    def _scanner(db, snapshots, volatility=0.30):
+        scanner = IntentScanner(db=db, market_snapshots=snapshots)
+        oracle = MagicMock()
+        oracle.calculate_funding_volatility = AsyncMock(return_value=volatility)
+        scanner._get_oracle = MagicMock(return_value=oracle)
+        return scanner, oracle
+
     @pytest.mark.asyncio
     async def test_no_intents_is_noop(self):
         db = _make_mock_db(rows=[])
@@ -139,17 +157,46 @@ class TestScanCycle:
         db.fetchall.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_processes_all_intents(self):
+    async def test_processes_triggered_intents(self):
         rows = [
             _make_intent_row("i1", "u1"),
             _make_intent_row("i2", "u2"),
         ]
         db = _make_mock_db(rows=rows)
-        scanner = _make_scanner(db=db)
+        scanner, _ = self._scanner(db, self._snapshot())
 
         with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
             await scanner._scan_cycle()
             assert mock_proc.call_count == 2
+            assert mock_proc.call_args.kwargs["volatility"] == 0.30
+
+    @pytest.mark.asyncio
+    async def test_only_crossed_thresholds_are_touched(self):
+        rows = [
+            _make_intent_row("i1", "u1", min_funding_rate=-0.001),
+            _make_intent_row("i2", "u2", min_funding_rate=-0.005),  # Not reached
+            _make_intent_row("i3", "u3", max_entry_price=90.0),  # Price too high
+        ]
+        db = _make_mock_db(rows=rows)
+        scanner, _ = self._scanner(db, self._snapshot(rate=-0.002))
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner._scan_cycle()
+
+        assert [c.args[0]["id"] for c in mock_proc.call_args_list] == ["i1"]
+        # No criteria snapshot writes for intents that did not trigger
+        assert not any("criteria_snapshot" in str(c) for c in db.execute.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_positive_funding_skips_volatility(self):
+        db = _make_mock_db(rows=[_make_intent_row("i1", "u1")])
+        scanner, oracle = self._scanner(db, self._snapshot(rate=0.001))
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner._scan_cycle()
+
+        mock_proc.assert_not_called()
+        oracle.calculate_funding_volatility.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_intent_error_does_not_cascade(self):
@@ -158,11 +205,11 @@ class TestScanCycle:
             _make_intent_row("i2", "u2"),
         ]
         db = _make_mock_db(rows=rows)
-        scanner = _make_scanner(db=db)
+        scanner, _ = self._scanner(db, self._snapshot())
 
         call_count = 0
 
-        async def side_effect(row, now):
+        async def side_effect(row, now, **kwargs):
             nonlocal call_count
             call_count += 1
             if row["id"] == "i1":
@@ -173,6 +220,170 @@ class TestScanCycle:
 
         assert call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_pending_intents_activated_in_one_statement(self):
+        rows = [
+            _make_intent_row("i1", "u1", status="pending"),
+            _make_intent_row("i2", "u2", status="pending"),
+        ]
+        db = _make_mock_db(rows=rows)
+        scanner, _ = self._scanner(db, self._snapshot(rate=0.001))
+
+        await scanner._scan_cycle()
+
+        activations = [
+            c for c in db.execute.call_args_list if "status = 'active'" in c.args[0]
+        ]
+        assert len(activations) == 1
+        assert activations[0].args[1] == (["i1", "i2"],)
+        assert scanner.index.get("i1").row["status"] == "active"
+
+    @pytest.mark.asyncio
+    async def test_index_loaded_once_then_incremental(self):
+        db = _make_mock_db(rows=[_make_intent_row("i1", "u1")])
+        scanner, _ = self._scanner(db, self._snapshot(rate=0.001))
+
+        await scanner._scan_cycle()
+        db.fetchall = AsyncMock(return_value=[])
+        await scanner._scan_cycle()
+
+        # Second cycle only looks for new pending intents
+        assert "status = 'pending'" in db.fetchall.call_args.args[0]
+        assert "i1" in scanner.index
+
+    @pytest.mark.asyncio
+    async def test_expired_intents_removed(self):
+        past = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+        db = _make_mock_db(rows=[_make_intent_row("i1", "u1", expires_at=past)])
+        scanner, _ = self._scanner(db, self._snapshot())
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner._scan_cycle()
+
+        mock_proc.assert_not_called()
+        assert "i1" not in scanner.index
+        assert any("status = 'expired'" in c.args[0] for c in db.execute.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_elsewhere_not_executed(self):
+        rows = [_make_intent_row("i1", "u1")]
+        db = _make_mock_db()
+        # Full load, then the confirm query finds the intent no longer open
+        db.fetchall = AsyncMock(side_effect=[rows, []])
+        scanner, _ = self._scanner(db, self._snapshot())
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner._scan_cycle()
+
+        mock_proc.assert_not_called()
+        assert "i1" not in scanner.index
+
+    @pytest.mark.asyncio
+    async def test_api_hooks_update_index(self):
+        scanner = _make_scanner()
+
+        scanner.on_intent_created(_make_intent_row("i1", "u1", status="pending"))
+        assert "i1" in scanner.index
+
+        scanner.on_intent_cancelled("i1")
+        assert "i1" not in scanner.index
+
+
+class TestStreamTrigger:
+    """Tests for event-driven triggering off the Hyperliquid websocket."""
+
+    @staticmethod
+    async def _start(frames, rows):
+        from bot.venues.hyperliquid.websocket import HyperliquidWebSocket
+        from tests.unit.venues.hl_ws_server import FakeHyperliquidWsServer
+
+        server = FakeHyperliquidWsServer(frames=frames)
+        url = await server.start()
+        stream = HyperliquidWebSocket(url=url)
+
+        db = _make_mock_db(rows=rows)
+        scanner = IntentScanner(db=db, market_stream=stream)
+        oracle = MagicMock()
+        oracle.calculate_funding_volatility = AsyncMock(return_value=0.2)
+        scanner._get_oracle = MagicMock(return_value=oracle)
+        scanner._run_loop = AsyncMock()  # Polling fallback not under test
+        for row in rows:
+            scanner.index.add(row)
+        return server, stream, scanner
+
+    @staticmethod
+    async def _wait_for(predicate, timeout=2.0):
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not predicate():
+            if asyncio.get_running_loop().time() > deadline:
+                raise AssertionError("condition not met in time")
+            await asyncio.sleep(0.002)
+
+    @pytest.mark.asyncio
+    async def test_price_crossing_fires_intent(self):
+        frames = [
+            {"channel": "activeAssetCtx", "data": {"coin": "SOL", "ctx": {"funding": "-0.0002"}}},
+            {"channel": "allMids", "data": {"mids": {"SOL": "105.0"}}},
+        ]
+        rows = [_make_intent_row("i1", "u1", max_entry_price=100.0)]
+        server, stream, scanner = await self._start(frames, rows)
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner.start()
+            try:
+                await self._wait_for(lambda: scanner._live_mids.get("SOL") == 105.0)
+                mock_proc.assert_not_called()
+
+                await server.push({"channel": "allMids", "data": {"mids": {"SOL": "99.5"}}})
+                await self._wait_for(lambda: mock_proc.call_count == 1, timeout=0.5)
+            finally:
+                await scanner.stop()
+                await stream.stop()
+                await server.stop()
+
+        row, _ = mock_proc.call_args.args
+        assert row["id"] == "i1"
+        snapshot = mock_proc.call_args.kwargs["snapshot"]
+        assert snapshot.mids["SOL"] == 99.5
+        assert snapshot.funding_rates["SOL"].funding_rate == -0.0002
+        assert {"type": "activeAssetCtx", "coin": "SOL"} in server.subscriptions_received()
+
+    @pytest.mark.asyncio
+    async def test_recorded_funding_flip_fires_intent(self):
+        """Replay of recorded data: SOL funding turns negative mid-stream."""
+        rows = [_make_intent_row("i1", "u1")]
+        server, stream, scanner = await self._start(None, rows)
+
+        async def execute(row, now, **kwargs):
+            scanner.index.remove(row["id"])  # As a successful execution does
+
+        with patch.object(scanner, "_process_intent", side_effect=execute) as mock_proc:
+            await scanner.start()
+            try:
+                await self._wait_for(lambda: mock_proc.call_count == 1)
+                await asyncio.sleep(0.05)
+            finally:
+                await scanner.stop()
+                await stream.stop()
+                await server.stop()
+
+        # Fired once, on the negative funding frame
+        assert mock_proc.call_count == 1
+        snapshot = mock_proc.call_args.kwargs["snapshot"]
+        assert snapshot.funding_rates["SOL"].funding_rate == -0.0000375
+        assert scanner.stream_triggers == 1
+
+    @pytest.mark.asyncio
+    async def test_executing_intent_not_fired_twice(self):
+        scanner = _make_scanner()
+        scanner._executing.add("i1")
+        intent = scanner.index.add(_make_intent_row("i1", "u1"))
+
+        with patch.object(scanner, "_process_intent", new_callable=AsyncMock) as mock_proc:
+            await scanner._fire([(intent, {})], datetime.utcnow())
+
+        mock_proc.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Intent Processing Tests
@@ -16,7 +16,7 @@ from bot.core.internal_api import (
     internal_app, set_bot_instance, get_bot, verify_internal_token,
     health_check, _get_bot_state, get_stats, get_positions, get_position_detail,
     get_pause_state, pause_bot, resume_bot, open_position_internal,
-    _position_to_summary, _position_to_detail
+    _position_to_summary, _position_to_detail, attach_event_feed
 )
 from shared.common.schemas import BotStats, PositionSummary, PositionDetail, PauseState
 
@@ -547,3 +547,130 @@ class TestPositionToDetail:
         assert "hyperliquid" in result.model_dump()
         assert "pnl" in result.model_dump()
         assert "risk" in result.model_dump()
+
+
+def _summary_position(position_id="pos1", user_id="user_1", total_pnl="50"):
+    position = MagicMock()
+    position.position_id = position_id
+    position.user_id = user_id
+    position.status = "open"
+    position.asgard.asset.value = "SOL"
+    position.asgard.leverage = Decimal("3.0")
+    position.asgard.collateral_usd = Decimal("10000")
+    position.asgard.current_value_usd = Decimal("30000")
+    position.asgard.current_health_factor = Decimal("1.2")
+    position.hyperliquid.size_usd = Decimal("30000")
+    position.hyperliquid.margin_fraction = Decimal("0.15")
+    position.delta = Decimal("100")
+    position.delta_ratio = Decimal("0.01")
+    position.total_pnl = Decimal(total_pnl)
+    position.net_funding_pnl = Decimal("30")
+    position.created_at = datetime.utcnow()
+    return position
+
+
+class _FeedBot:
+    """Bot stand-in exposing the callback hooks the event feed attaches to."""
+
+    def __init__(self, positions):
+        from bot.core.pause_controller import PauseController
+        self._running = True
+        self._positions = positions
+        self._pause_controller = PauseController(admin_api_key="key")
+        self.opened, self.updated, self.closed, self.pause = [], [], [], []
+
+    def get_positions(self):
+        return dict(self._positions)
+
+    def add_position_opened_callback(self, cb):
+        self.opened.append(cb)
+
+    def add_position_updated_callback(self, cb):
+        self.updated.append(cb)
+
+    def add_position_closed_callback(self, cb):
+        self.closed.append(cb)
+
+    def add_pause_state_callback(self, cb):
+        self.pause.append(cb)
+
+
+class TestEventFeed:
+    """Tests for the internal WebSocket event feed."""
+
+    @pytest.fixture
+    def hub(self):
+        from bot.core import internal_events
+        original = internal_events._event_hub
+        internal_events._event_hub = internal_events.InternalEventHub()
+        yield internal_events._event_hub
+        internal_events._event_hub = original
+        set_bot_instance(None)
+
+    @pytest.fixture
+    def secret_dir(self, tmp_path):
+        (tmp_path / "server_secret.txt").write_text("valid_token\n")
+        with patch('shared.config.settings.SECRETS_DIR', tmp_path):
+            yield tmp_path
+
+    def test_rejects_missing_or_invalid_token(self, hub, secret_dir):
+        from fastapi.testclient import TestClient
+        from starlette.websockets import WebSocketDisconnect
+        set_bot_instance(_FeedBot({}))
+        client = TestClient(internal_app)
+
+        for headers in ({}, {"Authorization": "Bearer wrong"}):
+            with pytest.raises(WebSocketDisconnect) as exc_info:
+                with client.websocket_connect("/internal/events", headers=headers):
+                    pass
+            assert exc_info.value.code == 1008
+
+    def test_snapshot_scoped_by_jwt(self, hub, secret_dir):
+        from fastapi.testclient import TestClient
+        from shared.auth.internal_jwt import generate_internal_jwt
+        set_bot_instance(_FeedBot({
+            "pos1": _summary_position("pos1", "user_1"),
+            "pos2": _summary_position("pos2", "user_2"),
+        }))
+        client = TestClient(internal_app)
+
+        with client.websocket_connect(
+            "/internal/events", headers={"Authorization": "Bearer valid_token"}
+        ) as ws:
+            snapshot = ws.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert {p["position"]["position_id"] for p in snapshot["data"]["positions"]} == {"pos1", "pos2"}
+        assert snapshot["data"]["pause_state"]["paused"] is False
+
+        token = generate_internal_jwt("user_2", "valid_token")
+        with client.websocket_connect(
+            "/internal/events", headers={"Authorization": f"Bearer {token}"}
+        ) as ws:
+            snapshot = ws.receive_json()
+        assert [p["user_id"] for p in snapshot["data"]["positions"]] == ["user_2"]
+        assert hub.listener_count == 0
+
+    @pytest.mark.asyncio
+    async def test_bot_callbacks_publish_events(self, hub):
+        import json
+        from bot.core.pause_controller import PauseScope as CoreScope
+        bot = _FeedBot({})
+        attach_event_feed(bot)
+        queue = hub.subscribe("")
+
+        position = _summary_position()
+        bot.opened[0](position)
+        bot.updated[0](position)  # Unchanged since opened: not pushed
+        position.total_pnl = Decimal("75")
+        bot.updated[0](position)
+        bot.closed[0](position, "manual")
+        bot._pause_controller.pause("key", "maintenance", CoreScope.ENTRY)
+        bot.pause[0](bot._pause_controller.get_pause_state())
+
+        events = [json.loads(queue.get_nowait()) for _ in range(queue.qsize())]
+        assert [e["type"] for e in events] == [
+            "position_opened", "position_updated", "position_closed", "pause_state",
+        ]
+        assert events[1]["data"]["position"]["total_pnl_usd"] == "75"
+        assert events[2]["data"] == {"user_id": "user_1", "position_id": "pos1", "reason": "manual"}
+        assert events[3]["data"]["scope"] == "entry"
@@ -0,0 +1,53 @@
+"""
+Tests for the internal event hub behind the bot WebSocket feed.
+"""
+import json
+
+import pytest
+
+from bot.core.internal_events import RESYNC, InternalEventHub
+
+
+class TestInternalEventHub:
+
+    @pytest.mark.asyncio
+    async def test_scoping(self):
+        hub = InternalEventHub()
+        unscoped = hub.subscribe("")
+        alice = hub.subscribe("alice")
+        bob = hub.subscribe("bob")
+
+        assert hub.publish("position_opened", {"position_id": "p1"}, user_id="alice") == 2
+        assert hub.publish("pause_state", {"paused": True}) == 3
+
+        assert unscoped.qsize() == 2
+        assert [json.loads(alice.get_nowait())["type"] for _ in range(2)] == [
+            "position_opened", "pause_state",
+        ]
+        assert json.loads(bob.get_nowait())["type"] == "pause_state"
+        assert bob.empty()
+
+    @pytest.mark.asyncio
+    async def test_overflow_resyncs_listener(self):
+        hub = InternalEventHub(queue_size=2)
+        queue = hub.subscribe()
+
+        for i in range(3):
+            hub.publish("position_updated", {"position_id": str(i)})
+
+        assert queue.get_nowait() is RESYNC
+        assert queue.empty()
+        assert hub.resyncs == 1
+
+        hub.publish("position_updated", {"position_id": "3"})
+        assert json.loads(queue.get_nowait())["data"] == {"position_id": "3"}
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe(self):
+        hub = InternalEventHub()
+        queue = hub.subscribe()
+        hub.unsubscribe(queue)
+
+        assert hub.publish("pause_state", {}) == 0
+        assert queue.empty()
+        assert hub.listener_count == 0
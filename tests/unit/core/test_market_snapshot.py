@@ -0,0 +1,239 @@
+"""
+Tests for MarketSnapshotService.
+
+These tests verify:
+- Snapshot contents and immutability
+- Monotonic versioning across refreshes
+- Single-flight on-demand refresh for concurrent readers
+- Fallback to previous mids/Asgard data on partial failure
+- JSON round-trip for Redis publishing
+"""
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.core.market_snapshot import MarketSnapshot, MarketSnapshotService
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _meta_response(sol_funding="-0.0001", eth_funding="0.00002"):
+    """Create a fake metaAndAssetCtxs response."""
+    return [
+        {"universe": [{"name": "SOL"}, {"name": "ETH"}]},
+        [
+            {"funding": sol_funding, "markPx": "150.0", "oraclePx": "150.1"},
+            {"funding": eth_funding, "markPx": "3000.0", "oraclePx": "3000.5"},
+        ],
+    ]
+
+
+def _make_service(meta=None, mids=None, markets=None):
+    """Create a MarketSnapshotService with mocked venue clients."""
+    hl_client = MagicMock()
+    hl_client.get_meta_and_asset_contexts = AsyncMock(return_value=meta or _meta_response())
+    hl_client.get_all_mids = AsyncMock(return_value=mids or {"SOL": "150.05", "ETH": "3000.2"})
+    hl_client.close = AsyncMock()
+
+    asgard_client = MagicMock()
+    asgard_client.get_markets = AsyncMock(
+        return_value=markets or {"strategies": {"SOL/USDC": {"liquiditySources": []}}}
+    )
+    asgard_client.close = AsyncMock()
+
+    return MarketSnapshotService(
+        hl_client=hl_client, asgard_client=asgard_client, publish_to_redis=False,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Snapshot Tests
+# ---------------------------------------------------------------------------
+
+
+class TestSnapshotContents:
+    """Tests for the data carried by a snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_builds_snapshot(self):
+        """Test that one refresh populates funding, ctxs, mids and markets."""
+        service = _make_service()
+
+        snapshot = await service.refresh()
+
+        assert snapshot.version == 1
+        assert snapshot.funding_rates["SOL"].funding_rate == -0.0001
+        assert snapshot.asset_index == {"SOL": 0, "ETH": 1}
+        assert snapshot.asset_ctxs["ETH"]["markPx"] == "3000.0"
+        assert snapshot.mids["SOL"] == 150.05
+        assert "SOL/USDC" in snapshot.asgard_markets["strategies"]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_immutable(self):
+        """Test that consumers cannot mutate a published snapshot."""
+        service = _make_service()
+        snapshot = await service.refresh()
+
+        with pytest.raises(TypeError):
+            snapshot.mids["SOL"] = 1.0
+        with pytest.raises(AttributeError):
+            snapshot.version = 99
+
+    @pytest.mark.asyncio
+    async def test_versions_increase(self):
+        """Test that each refresh publishes a new version."""
+        service = _make_service()
+
+        first = await service.refresh()
+        second = await service.refresh()
+
+        assert second.version == first.version + 1
+        assert service.current() is second
+
+    def test_json_round_trip(self):
+        """Test that snapshots survive serialization for Redis."""
+        from bot.venues.hyperliquid.funding_oracle import FundingRate
+
+        snapshot = MarketSnapshot(
+            version=7,
+            fetched_at=time.time(),
+            funding_rates={"SOL": FundingRate("SOL", -0.0001, 1000, -0.876)},
+            mids={"SOL": 150.0},
+        )
+
+        restored = MarketSnapshot.from_json(snapshot.to_json())
+
+        assert restored.version == 7
+        assert restored.funding_rates["SOL"].annualized_rate == -0.876
+        assert restored.mids["SOL"] == 150.0
+
+
+# ---------------------------------------------------------------------------
+# Read Path Tests
+# ---------------------------------------------------------------------------
+
+
+class TestGet:
+    """Tests for the consumer read path."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_served_without_io(self):
+        """Test that a fresh snapshot is returned without polling again."""
+        service = _make_service()
+        await service.refresh()
+
+        await service.get()
+        await service.get()
+
+        assert service.hl_client.get_meta_and_asset_contexts.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_fetch(self):
+        """Test that concurrent cold readers trigger a single venue poll."""
+        service = _make_service()
+
+        async def slow_meta():
+            await asyncio.sleep(0.02)
+            return _meta_response()
+
+        service.hl_client.get_meta_and_asset_contexts = AsyncMock(side_effect=slow_meta)
+
+        results = await asyncio.gather(*(service.get() for _ in range(5)))
+
+        assert service.hl_client.get_meta_and_asset_contexts.await_count == 1
+        assert len({s.version for s in results}) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_triggers_refresh(self):
+        """Test that a snapshot older than max_age is replaced."""
+        service = _make_service()
+        first = await service.refresh()
+
+        second = await service.get(max_age=-1)
+
+        assert second.version == first.version + 1
+
+
+    @pytest.mark.asyncio
+    async def test_remote_snapshot_ordered_by_fetch_time(self):
+        """Test that a restarted publisher's low version is still adopted."""
+        service = _make_service()
+        for _ in range(3):
+            await service.refresh()
+        local = service.current()
+
+        remote = MarketSnapshot(version=1, fetched_at=local.fetched_at + 1)
+        service._adopt(remote)
+        assert service.current() is remote
+
+        service._adopt(MarketSnapshot(version=50, fetched_at=remote.fetched_at - 5))
+        assert service.current() is remote
+
+    @pytest.mark.asyncio
+    async def test_publish_is_conditional_on_fetch_time(self):
+        """Test that Redis only takes a snapshot newer than the stored one."""
+        from unittest.mock import patch
+
+        from bot.core.market_snapshot import SNAPSHOT_FETCHED_AT_KEY, SNAPSHOT_KEY
+
+        service = _make_service()
+        service.publish_to_redis = True
+        redis = MagicMock()
+        redis.eval = AsyncMock(return_value=1)
+
+        with patch("shared.redis_client.get_redis", AsyncMock(return_value=redis)):
+            snapshot = await service.refresh()
+
+        args = redis.eval.await_args.args
+        assert args[1:4] == (2, SNAPSHOT_KEY, SNAPSHOT_FETCHED_AT_KEY)
+        assert float(args[5]) == snapshot.fetched_at
+
+
+# ---------------------------------------------------------------------------
+# Failure Tests
+# ---------------------------------------------------------------------------
+
+
+class TestPartialFailure:
+    """Tests for degraded venue responses."""
+
+    @pytest.mark.asyncio
+    async def test_mids_and_markets_fall_back_to_previous(self):
+        """Test that optional feeds keep their last value on error."""
+        service = _make_service()
+        first = await service.refresh()
+
+        service.hl_client.get_all_mids = AsyncMock(side_effect=RuntimeError("boom"))
+        service.asgard_client.get_markets = AsyncMock(side_effect=RuntimeError("boom"))
+        second = await service.refresh()
+
+        assert second.version == first.version + 1
+        assert dict(second.mids) == dict(first.mids)
+        assert dict(second.asgard_markets) == dict(first.asgard_markets)
+
+    @pytest.mark.asyncio
+    async def test_meta_failure_raises(self):
+        """Test that losing funding data fails the refresh."""
+        service = _make_service()
+        service.hl_client.get_meta_and_asset_contexts = AsyncMock(
+            side_effect=RuntimeError("HL down")
+        )
+
+        with pytest.raises(RuntimeError):
+            await service.refresh()
+        assert service.current() is None
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_clients(self):
+        """Test that stopping the service closes venue sessions."""
+        service = _make_service()
+        await service.start()
+        await service.stop()
+
+        service.hl_client.close.assert_awaited()
+        service.asgard_client.close.assert_awaited()
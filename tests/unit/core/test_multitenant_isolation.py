@@ -331,19 +331,29 @@ class TestErrorBoundaries:
         from bot.core.intent_scanner import IntentScanner
 
         db = AsyncMock()
-        # Two intents: first will raise, second should still be processed
+        # Two triggered intents: first will raise, second should still be processed
         db.fetchall = AsyncMock(return_value=[
-            {"id": "i1", "user_id": USER_A, "status": "active",
-             "expires_at": None, "data": "{}"},
-            {"id": "i2", "user_id": USER_B, "status": "active",
-             "expires_at": None, "data": "{}"},
+            {"id": "i1", "user_id": USER_A, "asset": "SOL", "status": "active",
+             "min_funding_rate": None, "max_funding_volatility": 0.5,
+             "max_entry_price": None, "expires_at": None},
+            {"id": "i2", "user_id": USER_B, "asset": "SOL", "status": "active",
+             "min_funding_rate": None, "max_funding_volatility": 0.5,
+             "max_entry_price": None, "expires_at": None},
         ])
+        snapshot = MagicMock()
+        snapshot.funding_rates = {"SOL": MagicMock(funding_rate=-0.001)}
+        snapshot.mids = {"SOL": 100.0}
+        snapshots = MagicMock()
+        snapshots.get = AsyncMock(return_value=snapshot)
 
-        scanner = IntentScanner(db=db)
+        scanner = IntentScanner(db=db, market_snapshots=snapshots)
+        oracle = MagicMock()
+        oracle.calculate_funding_volatility = AsyncMock(return_value=0.1)
+        scanner._get_oracle = MagicMock(return_value=oracle)
 
         call_count = 0
 
-        async def mock_process(row, now):
+        async def mock_process(row, now, **kwargs):
             nonlocal call_count
             call_count += 1
             if row["id"] == "i1":
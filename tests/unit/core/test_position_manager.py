@@ -9,6 +9,7 @@ These tests verify:
 - Rebalance logic (cost-benefit analysis)
 - Error handling and recovery
 """
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -395,6 +396,166 @@ class TestPositionOpening:
                 # Verify unwind was attempted
                 mock_asgard_instance.close_position.assert_called_once_with("testpda123")
     
+    @staticmethod
+    def _entry_manager(asgard_position, asgard_success=True, hl_success=True,
+                       prestaged=True, hedge_policy=None):
+        """PositionManager with injected venue mocks for entry tests."""
+        from bot.venues.hyperliquid.trader import PositionInfo
+
+        asgard = AsyncMock()
+        asgard.open_long_position = AsyncMock(return_value=MagicMock(
+            success=asgard_success,
+            position=asgard_position if asgard_success else None,
+            intent_id="intent123",
+            error=None if asgard_success else "build failed",
+        ))
+        asgard.close_position = AsyncMock(return_value=MagicMock(success=True))
+
+        hl = AsyncMock()
+        hl.prepare_order = AsyncMock(return_value=prestaged)
+        hl.update_leverage = AsyncMock()
+        hl.open_short = AsyncMock(return_value=MagicMock(
+            success=hl_success, order_id="order123", avg_px="100.0",
+            error=None if hl_success else "Insufficient margin",
+        ))
+        hl.get_position = AsyncMock(return_value=PositionInfo(
+            coin="SOL", size=-150.0, entry_px=100.0, leverage=3,
+            margin_used=5000.0, margin_fraction=0.25, unrealized_pnl=0.0,
+        ))
+        hl.close_short = AsyncMock(return_value=MagicMock(success=True))
+
+        consensus = AsyncMock()
+        consensus.check_consensus = AsyncMock(return_value=MagicMock(
+            asgard_price=Decimal("100"), hyperliquid_price=Decimal("100"),
+            consensus_price=Decimal("100"), price_deviation=Decimal("0"),
+            is_within_threshold=True,
+        ))
+        validator = AsyncMock()
+        validator.validate_fills = AsyncMock(return_value=MagicMock(action="proceed"))
+
+        return PositionManager(
+            asgard_manager=asgard,
+            hyperliquid_trader=hl,
+            price_consensus=consensus,
+            fill_validator=validator,
+            solana_client=AsyncMock(),
+            arbitrum_client=AsyncMock(),
+            hedge_policy=hedge_policy,
+        )
+
+    @pytest.mark.asyncio
+    async def test_hedge_prestaged_and_exposure_recorded(self, mock_opportunity, mock_asgard_position):
+        """Test that leverage is pre-staged and the exposure window is measured."""
+        manager = self._entry_manager(mock_asgard_position)
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.success is True
+        manager.hyperliquid_trader.prepare_order.assert_awaited_once_with("SOL", leverage=3)
+        manager.hyperliquid_trader.update_leverage.assert_not_called()
+        manager.hyperliquid_trader.release_order.assert_awaited_once_with("SOL")
+        timing = result.entry_timing
+        assert timing.policy == "after_confirm"
+        assert timing.asgard_s <= timing.hedge_s
+        assert timing.single_leg_exposure_s == pytest.approx(
+            timing.hedge_s - timing.asgard_s, abs=1e-3,
+        )
+        stats = manager.get_entry_stats()
+        assert stats["entries"] == 1
+        assert stats["over_limit"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_prestage_sets_leverage_before_hedge(self, mock_opportunity, mock_asgard_position):
+        """Test that a failed pre-stage falls back to the inline leverage update."""
+        manager = self._entry_manager(mock_asgard_position, prestaged=False)
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.success is True
+        manager.hyperliquid_trader.update_leverage.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_policy_unwinds_hedge_when_asgard_fails(self, mock_opportunity, mock_asgard_position):
+        """Test that the concurrent policy closes the hedge if the long fails."""
+        manager = self._entry_manager(
+            mock_asgard_position, asgard_success=False, hedge_policy="concurrent",
+        )
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.success is False
+        assert result.stage == "asgard_open"
+        manager.hyperliquid_trader.open_short.assert_awaited_once()
+        manager.hyperliquid_trader.close_short.assert_awaited_once_with(
+            coin="SOL", size="150.000000",
+        )
+        assert result.entry_timing.single_leg_exposure_s is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("close_short", [
+        AsyncMock(return_value=MagicMock(success=False, error="rejected")),
+        AsyncMock(side_effect=Exception("exchange down")),
+    ])
+    async def test_concurrent_policy_reports_failed_hedge_unwind(
+        self, mock_opportunity, mock_asgard_position, close_short,
+    ):
+        """Test that a hedge left open after the long fails is reported, not raised."""
+        manager = self._entry_manager(
+            mock_asgard_position, asgard_success=False, hedge_policy="concurrent",
+        )
+        manager.hyperliquid_trader.close_short = close_short
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.success is False
+        assert result.stage == "hedge_unwind_failed"
+        assert "short left open" in result.error
+        assert result.entry_timing.single_leg_exposure_s is not None
+
+    @pytest.mark.asyncio
+    async def test_streams_released_after_prestage_unwinds(self, mock_opportunity, mock_asgard_position):
+        """Test that release_order waits for a cancelled pre-stage to finish."""
+        manager = self._entry_manager(mock_asgard_position, asgard_success=False)
+        order = []
+
+        async def slow_prepare(coin, leverage=None):
+            try:
+                await asyncio.sleep(10)
+            finally:
+                order.append("prestage_done")
+
+        manager.hyperliquid_trader.prepare_order = AsyncMock(side_effect=slow_prepare)
+        failed_open = manager.asgard_manager.open_long_position.return_value
+
+        async def slow_open(**kwargs):
+            await asyncio.sleep(0.01)
+            return failed_open
+
+        manager.asgard_manager.open_long_position = AsyncMock(side_effect=slow_open)
+        manager.hyperliquid_trader.release_order = AsyncMock(
+            side_effect=lambda coin: order.append("released"),
+        )
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.stage == "asgard_open"
+        assert order == ["prestage_done", "released"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_policy_opens_both_legs(self, mock_opportunity, mock_asgard_position):
+        """Test a successful concurrent entry."""
+        manager = self._entry_manager(mock_asgard_position, hedge_policy="concurrent")
+
+        result = await manager.open_position(mock_opportunity)
+
+        assert result.success is True
+        manager.hyperliquid_trader.close_short.assert_not_called()
+        assert result.entry_timing.single_leg_exposure_s >= 0
+
+    def test_unknown_hedge_policy_rejected(self):
+        with pytest.raises(ValueError, match="hedge policy"):
+            PositionManager(hedge_policy="yolo")
+
     @pytest.mark.asyncio
     async def test_open_position_preflight_not_passed(self, mock_opportunity):
         """Test that position opening fails if preflight checks not passed."""
@@ -1099,3 +1260,84 @@ class TestHyperliquidBalancePreflight:
 
         # Fails open — HL check error doesn't block (open_short will catch it)
         assert result.checks["wallet_balance"] is True
+
+
+class TestHedgeImpactPreflight:
+    """Tests for the L2-book hedge impact preflight check."""
+
+    def _manager(self, plan=None, plan_error=None):
+        mock_hl_trader = AsyncMock()
+        mock_hl_trader.get_deposited_balance = AsyncMock(return_value=10000.0)
+        mock_hl_trader.plan_order = AsyncMock(return_value=plan, side_effect=plan_error)
+        return PositionManager(
+            asgard_manager=AsyncMock(),
+            hyperliquid_trader=mock_hl_trader,
+            price_consensus=AsyncMock(),
+            fill_validator=MagicMock(),
+            solana_client=AsyncMock(),
+            arbitrum_client=AsyncMock(),
+        )
+
+    @pytest.fixture
+    def mock_opportunity(self):
+        """Create a mock opportunity with a $30k short."""
+        return ArbitrageOpportunity(
+            id="test-opp-impact",
+            asset=Asset.SOL,
+            selected_protocol=Protocol.MARGINFI,
+            asgard_rates=AsgardRates(
+                protocol_id=0,
+                token_a_mint="So11111111111111111111111111111111111111112",
+                token_b_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+                token_a_lending_apy=Decimal("0.05"),
+                token_b_borrowing_apy=Decimal("0.08"),
+                token_b_max_borrow_capacity=Decimal("1000000"),
+            ),
+            current_funding=FundingRate(
+                timestamp=datetime.utcnow(),
+                coin="SOL",
+                rate_8hr=Decimal("-0.0001"),
+            ),
+            predicted_funding=FundingRate(
+                timestamp=datetime.utcnow(),
+                coin="SOL",
+                rate_8hr=Decimal("-0.0001"),
+            ),
+            funding_volatility=Decimal("0.1"),
+            leverage=Decimal("3"),
+            deployed_capital_usd=Decimal("10000"),
+            position_size_usd=Decimal("30000"),
+            score=OpportunityScore(
+                funding_apy=Decimal("0.10"),
+                net_carry_apy=Decimal("-0.01"),
+            ),
+            price_deviation=Decimal("0.001"),
+            preflight_checks_passed=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sliced_impact_within_limit(self, mock_opportunity):
+        from bot.venues.hyperliquid.execution import SlicePlan
+
+        manager = self._manager(SlicePlan([50.0] * 6, expected_impact=0.002, single_impact=0.012))
+
+        assert await manager._check_hedge_impact(mock_opportunity) is True
+        assert mock_opportunity.expected_hedge_impact == Decimal("0.002")
+        kwargs = manager.hyperliquid_trader.plan_order.await_args.kwargs
+        assert kwargs["notional_usd"] == 15000.0  # Hedge is half the position size
+        assert kwargs["is_buy"] is False
+
+    @pytest.mark.asyncio
+    async def test_impact_over_limit_fails(self, mock_opportunity):
+        from bot.venues.hyperliquid.execution import SlicePlan
+
+        manager = self._manager(SlicePlan([300.0], expected_impact=0.009, single_impact=0.009))
+
+        assert await manager._check_hedge_impact(mock_opportunity) is False
+
+    @pytest.mark.asyncio
+    async def test_no_book_fails_open(self, mock_opportunity):
+        manager = self._manager(plan_error=Exception("l2Book unavailable"))
+
+        assert await manager._check_hedge_impact(mock_opportunity) is True
+        assert mock_opportunity.expected_hedge_impact is None
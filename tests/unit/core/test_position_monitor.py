@@ -17,7 +17,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from bot.core.position_monitor import PositionMonitorService
+from bot.core.position_monitor import PositionMonitorService, _percentile
 from bot.core.risk_engine import ExitDecision, ExitReason
 
 
@@ -346,6 +346,23 @@ class TestEvaluateExit:
         assert result is not None
         assert result.reason == ExitReason.FUNDING_FLIP
 
+    def test_exit_funding_flip_from_funding_rate(self):
+        """FundingRate objects from the oracle/snapshot trigger the funding-flip exit."""
+        from bot.venues.hyperliquid.funding_oracle import FundingRate
+
+        hl_pos = _make_hl_position(margin_fraction=0.25)
+        result = self.monitor._evaluate_exit(
+            data={"asset": "SOL"},
+            hl_position=hl_pos,
+            asgard_health=0.30,
+            current_funding=FundingRate(
+                coin="SOL", funding_rate=0.0001, timestamp_ms=0, annualized_rate=0.876,
+            ),
+        )
+        assert result is not None
+        assert result.reason == ExitReason.FUNDING_FLIP
+        assert result.details["funding_rate"] == 0.0001
+
     def test_priority_asgard_over_margin(self):
         """Test that Asgard health check has priority over HL margin."""
         hl_pos = _make_hl_position(margin_fraction=0.05)  # Also critical
@@ -572,13 +589,96 @@ class TestCheckPosition:
 
         await monitor._check_position(ctx, pos_info, funding_rates={"SOL": {"funding": -0.001}})
 
-        # DB should be updated with live data
-        db.execute.assert_called()
-        update_args = db.execute.call_args_list[0]
-        assert "UPDATE positions SET data" in update_args.args[0]
-        merged = json.loads(update_args.args[1][0])
-        assert merged["hl_unrealized_pnl"] == 50.0
-        assert merged["asgard_health_factor"] == 0.30
+        # Staged, then written in one batched statement on flush
+        db.execute.assert_not_called()
+        assert await monitor.snapshots.flush() == 1
+
+        db.execute.assert_called_once()
+        sql, (ids, patches) = db.execute.call_args.args
+        assert "UPDATE positions" in sql
+        assert ids == ["pos_1"]
+        patch = json.loads(patches[0])
+        assert patch["hl_unrealized_pnl"] == 50.0
+        assert patch["asgard_health_factor"] == 0.30
+        assert patch["current_funding_rate"] == -0.001
+
+    @pytest.mark.asyncio
+    async def test_unchanged_live_data_not_written(self):
+        """Values matching the persisted row produce no write."""
+        db = _make_mock_db()
+        monitor = _make_monitor(db=db)
+
+        hl_pos = _make_hl_position(
+            margin_fraction=0.25,
+            unrealized_pnl=50.0,
+            liquidation_px=150.0,
+        )
+        ctx = _make_mock_ctx(hl_position=hl_pos, health_factor=0.30)
+        pos_info = {
+            "position_id": "pos_1",
+            "data": {
+                "asset": "SOL",
+                "asgard_pda": "pda_123",
+                "hl_unrealized_pnl": 50.0,
+                "hl_margin_fraction": 0.25,
+                "hl_liquidation_px": 150.0,
+                "asgard_health_factor": 0.30,
+                "current_funding_rate": -0.001,
+            },
+            "updated_at": "2026-01-01T00:00:00",
+        }
+
+        await monitor._check_position(ctx, pos_info, funding_rates={"SOL": {"funding": -0.001}})
+
+        assert await monitor.snapshots.flush() == 0
+        db.execute.assert_not_called()
+        assert monitor.snapshots.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_update_callback_only_on_change(self):
+        """on_position_update gets the live fields when something changed."""
+        monitor = _make_monitor()
+        monitor.on_position_update = AsyncMock()
+        ctx = _make_mock_ctx(hl_position=_make_hl_position(), health_factor=0.30)
+        pos_info = {
+            "position_id": "pos_1",
+            "data": {"asset": "SOL", "asgard_pda": "pda_123"},
+            "updated_at": "2026-01-01T00:00:00",
+        }
+
+        await monitor._check_position(ctx, pos_info, funding_rates={})
+        await monitor._check_position(ctx, pos_info, funding_rates={})
+
+        monitor.on_position_update.assert_awaited_once()
+        user_id, position_id, fields = monitor.on_position_update.call_args.args
+        assert (user_id, position_id) == ("user_1", "pos_1")
+        assert fields["hl_unrealized_pnl"] == 50.0
+        assert fields["asgard_health_factor"] == 0.30
+
+    @pytest.mark.asyncio
+    async def test_funding_rate_object_persisted(self):
+        """FundingRate objects from the oracle/snapshot are read as hourly rates."""
+        from bot.venues.hyperliquid.funding_oracle import FundingRate
+
+        db = _make_mock_db()
+        monitor = _make_monitor(db=db)
+        ctx = _make_mock_ctx(hl_position=None)
+        pos_info = {
+            "position_id": "pos_1",
+            "data": {"asset": "SOL"},
+            "updated_at": "2026-01-01T00:00:00",
+        }
+        rate = FundingRate(
+            coin="SOL", funding_rate=-0.0001, timestamp_ms=0, annualized_rate=-0.876,
+        )
+
+        with patch.object(monitor, "_execute_exit", new_callable=AsyncMock) as mock_exit:
+            await monitor._check_position(ctx, pos_info, funding_rates={"SOL": rate})
+            mock_exit.assert_not_called()
+
+        await monitor.snapshots.flush()
+        _, (_, patches) = db.execute.call_args.args
+        assert json.loads(patches[0])["current_funding_rate"] == -0.0001
 
     @pytest.mark.asyncio
     async def test_no_exit_when_healthy(self):
@@ -676,3 +776,356 @@ class TestErrorHandling:
 
             # Should not raise despite inner error
             await monitor._monitor_user_positions("user_1", positions)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent Mode Tests
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentMode:
+    """Tests for concurrent fan-out, deadlines and cycle stats."""
+
+    @pytest.mark.asyncio
+    async def test_exit_locks_serialize_and_are_dropped(self):
+        """Test that same-user exits don't overlap and leave no lock behind."""
+        monitor = PositionMonitorService(db=MagicMock(), risk_engine=MagicMock(), concurrent=True)
+        active = 0
+        peak = 0
+
+        async def exit_once():
+            nonlocal active, peak
+            async with monitor._exit_lock("user_1"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(exit_once(), exit_once(), exit_once())
+
+        assert peak == 1
+        assert monitor._exit_locks == {}
+        assert monitor._exit_lock_users == {}
+
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 11)]
+        assert _percentile(values, 50) == 5.0
+        assert _percentile(values, 95) == 10.0
+        assert _percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+        assert _percentile([], 50) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_users_monitored_in_parallel(self):
+        """Test that slow users overlap instead of running back-to-back."""
+        rows = [_make_position_row(f"pos_{i}", f"user_{i}") for i in range(4)]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_user(user_id, positions):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+        with patch.object(monitor, "_monitor_user_positions", side_effect=slow_user):
+            await monitor._monitor_cycle()
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_cap(self):
+        """Test that no more than max_concurrency users run at once."""
+        rows = [_make_position_row(f"pos_{i}", f"user_{i}") for i in range(6)]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True, max_concurrency=2,
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_user(user_id, positions):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        with patch.object(monitor, "_monitor_user_positions", side_effect=slow_user):
+            await monitor._monitor_cycle()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_user_error_does_not_cascade_concurrent(self):
+        """Test that one failing user doesn't stop the others in concurrent mode."""
+        rows = [
+            _make_position_row("pos_1", "user_1"),
+            _make_position_row("pos_2", "user_2"),
+        ]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+        )
+        seen = []
+
+        async def side_effect(user_id, positions):
+            seen.append(user_id)
+            if user_id == "user_1":
+                raise RuntimeError("User 1 error")
+
+        with patch.object(monitor, "_monitor_user_positions", side_effect=side_effect):
+            await monitor._monitor_cycle()
+
+        assert sorted(seen) == ["user_1", "user_2"]
+
+    @pytest.mark.asyncio
+    async def test_position_deadline_exceeded(self):
+        """Test that a hung venue call is cut off and counted as timed out."""
+        db = _make_mock_db()
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True, position_deadline=0.05,
+        )
+        ctx = _make_mock_ctx()
+
+        async def hang(asset):
+            await asyncio.sleep(5)
+
+        ctx.get_hl_trader().get_position = AsyncMock(side_effect=hang)
+        pos_info = {
+            "position_id": "pos_1",
+            "data": {"asset": "SOL", "asgard_pda": "pda_123"},
+            "updated_at": "2026-01-01",
+        }
+
+        await monitor._check_position_timed(ctx, pos_info, {}, None)
+
+        assert monitor._timed_out == 1
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_venue_semaphore_bounds_hl_calls(self):
+        """Test that per-venue semaphores cap in-flight HL calls."""
+        db = _make_mock_db()
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+            venue_concurrency={"hyperliquid": 1},
+        )
+        ctx = _make_mock_ctx()
+        in_flight = 0
+        peak = 0
+
+        async def get_position(asset):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_hl_position()
+
+        ctx.get_hl_trader().get_position = AsyncMock(side_effect=get_position)
+        positions = [
+            {"position_id": f"pos_{i}", "data": {"asset": "SOL"}, "updated_at": "2026-01-01"}
+            for i in range(3)
+        ]
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_user_positions("user_1", positions)
+
+        assert ctx.get_hl_trader().get_position.call_count == 3
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_cycle_stats_recorded(self):
+        """Test that each cycle records latency percentiles."""
+        rows = [
+            _make_position_row("pos_1", "user_1"),
+            _make_position_row("pos_2", "user_2"),
+        ]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+        )
+        ctx = _make_mock_ctx()
+
+        assert monitor.get_cycle_stats() is None
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+
+        stats = monitor.get_cycle_stats()
+        assert stats["users"] == 2
+        assert stats["positions"] == 2
+        assert stats["timed_out"] == 0
+        assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+        assert stats["over_budget"] is False
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_market_snapshot(self):
+        """Test that funding rates come from the snapshot, not per-user calls."""
+        rows = [
+            _make_position_row("pos_1", "user_1"),
+            _make_position_row("pos_2", "user_2"),
+        ]
+        db = _make_mock_db(rows=rows)
+        snapshot = MagicMock()
+        snapshot.funding_rates = {"SOL": MagicMock(funding_rate=-0.0001)}
+        snapshots = MagicMock()
+        snapshots.get = AsyncMock(return_value=snapshot)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+            market_snapshots=snapshots,
+        )
+        ctx = _make_mock_ctx()
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+
+        assert snapshots.get.await_count == 2
+        ctx.get_hl_trader().oracle.get_current_funding_rates.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_streamed_funding_overrides_snapshot(self):
+        """Test that open-position assets are tracked and fresh streamed funding wins."""
+        from bot.venues.hyperliquid.market_data import MarketDataStore
+
+        rows = [_make_position_row("pos_1", "user_1")]
+        db = _make_mock_db(rows=rows)
+        snapshot = MagicMock()
+        snapshot.funding_rates = {
+            "SOL": MagicMock(funding_rate=-0.0001),
+            "BTC": MagicMock(funding_rate=0.0002),
+        }
+        snapshots = MagicMock()
+        snapshots.get = AsyncMock(return_value=snapshot)
+        store = MarketDataStore()
+        store.on_message("activeAssetCtx", {"coin": "SOL", "ctx": {"funding": "0.00005"}})
+        market_data = MagicMock()
+        market_data.store = store
+        market_data.track_asset = AsyncMock()
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), market_snapshots=snapshots,
+            market_data=market_data,
+        )
+        monitor._check_position = AsyncMock()
+        ctx = _make_mock_ctx()
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+
+        market_data.track_asset.assert_awaited_once_with("SOL")
+        rates = monitor._check_position.await_args.kwargs["funding_rates"]
+        assert rates["SOL"].funding_rate == 0.00005
+        assert rates["BTC"].funding_rate == 0.0002
+
+    @pytest.mark.asyncio
+    async def test_clearinghouse_batcher_shared_per_cycle(self):
+        """Test that every user context gets the same per-cycle batcher."""
+        rows = [
+            _make_position_row("pos_1", "user_1"),
+            _make_position_row("pos_2", "user_2"),
+        ]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(
+            db=db, risk_engine=MagicMock(), concurrent=True,
+        )
+        ctx = _make_mock_ctx()
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+
+        batchers = {
+            call.kwargs["clearinghouse"]
+            for call in mock_ctx_cls.from_user_id.await_args_list
+        }
+        assert len(batchers) == 1
+        assert monitor.get_cycle_stats()["clearinghouse_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_contexts_reused_across_cycles(self):
+        """Test that steady-state cycles build no new user contexts."""
+        rows = [_make_position_row("pos_1", "user_1")]
+        user_row = {
+            "id": "user_1",
+            "server_solana_address": "SoL", "server_evm_address": "0xabc",
+            "server_evm_wallet_id": "evm_wid", "server_solana_wallet_id": "sol_wid",
+        }
+        db = _make_mock_db()
+        db.fetchall = AsyncMock(side_effect=[rows, rows, [user_row]])
+        monitor = PositionMonitorService(db=db, risk_engine=MagicMock(), concurrent=True)
+        ctx = _make_mock_ctx()
+        ctx.wallet_key = ("SoL", "0xabc", "evm_wid", "sol_wid")
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+            assert monitor.get_cycle_stats()["contexts_built"] == 1
+            await monitor._monitor_cycle()
+
+        assert mock_ctx_cls.from_user_id.await_count == 1
+        assert monitor.get_cycle_stats()["contexts_built"] == 0
+        ctx.__aexit__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wallet_change_rebuilds_context(self):
+        """Test that a changed users row invalidates the cached context."""
+        rows = [_make_position_row("pos_1", "user_1")]
+        user_row = {
+            "id": "user_1",
+            "server_solana_address": "SoL", "server_evm_address": "0xNEW",
+            "server_evm_wallet_id": "evm_wid", "server_solana_wallet_id": "sol_wid",
+        }
+        db = _make_mock_db()
+        db.fetchall = AsyncMock(side_effect=[rows, rows, [user_row]])
+        monitor = PositionMonitorService(db=db, risk_engine=MagicMock(), concurrent=True)
+        ctx = _make_mock_ctx()
+        ctx.wallet_key = ("SoL", "0xabc", "evm_wid", "sol_wid")
+        ctx.close = AsyncMock()
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+            await monitor._monitor_cycle()
+
+        assert mock_ctx_cls.from_user_id.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_snapshot_writes_batched_and_deduplicated(self):
+        """Test one UPDATE per cycle, and none when live data is unchanged."""
+        rows = [
+            _make_position_row("pos_1", "user_1"),
+            _make_position_row("pos_2", "user_2"),
+        ]
+        db = _make_mock_db(rows=rows)
+        monitor = PositionMonitorService(db=db, risk_engine=MagicMock(), concurrent=True)
+        ctx = _make_mock_ctx()
+
+        with patch("bot.core.position_monitor.UserTradingContext") as mock_ctx_cls:
+            mock_ctx_cls.from_user_id = AsyncMock(return_value=ctx)
+            await monitor._monitor_cycle()
+
+            position_updates = [
+                c for c in db.execute.call_args_list if "UPDATE positions" in c.args[0]
+            ]
+            assert len(position_updates) == 1
+            assert sorted(position_updates[0].args[1][0]) == ["pos_1", "pos_2"]
+            assert monitor.get_cycle_stats()["snapshot_writes"] == 2
+
+            db.execute.reset_mock()
+            await monitor._monitor_cycle()
+
+        assert not any("UPDATE positions" in c.args[0] for c in db.execute.call_args_list)
+        stats = monitor.get_cycle_stats()
+        assert stats["snapshot_writes"] == 0
+        assert stats["snapshot_skipped"] == 2
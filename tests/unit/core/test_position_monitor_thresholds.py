@@ -103,18 +103,18 @@ class TestTakeProfit:
 class TestMinExitCarryAPY:
     def test_carry_dropped_below_threshold(self):
         monitor = _make_monitor()
-        # funding rate -0.0001 → carry = 0.0001 * 3 * 365 * 3.0 * 100 = 32.85%
+        # hourly funding -0.00001 → carry = 0.00001 * 24 * 365 * 3.0 * 100 = 26.28%
         data = {"leverage": 3.0}
         config = {"stop_loss_pct": None, "take_profit_pct": None, "min_exit_carry_apy": 50.0}
 
-        result = monitor._check_user_exit_thresholds(data, config, -0.0001)
+        result = monitor._check_user_exit_thresholds(data, config, -0.00001)
         assert result is not None
         assert result.reason == ExitReason.NEGATIVE_APY
         assert result.details["current_carry_apy"] < 50.0
 
     def test_carry_above_threshold(self):
         monitor = _make_monitor()
-        # funding rate -0.01 → carry = 0.01 * 3 * 365 * 3.0 * 100 = 3285%
+        # hourly funding -0.01 → carry = 0.01 * 24 * 365 * 3.0 * 100 = 26280%
         data = {"leverage": 3.0}
         config = {"stop_loss_pct": None, "take_profit_pct": None, "min_exit_carry_apy": 50.0}
 
@@ -130,6 +130,25 @@ class TestMinExitCarryAPY:
         assert result is not None
         assert result.reason == ExitReason.NEGATIVE_APY
 
+    def test_carry_from_funding_rate(self):
+        """FundingRate objects are hourly and annualized over 24 * 365 hours."""
+        from bot.venues.hyperliquid.funding_oracle import FundingRate
+
+        monitor = _make_monitor()
+        data = {"leverage": 3.0}
+        config = {"stop_loss_pct": None, "take_profit_pct": None, "min_exit_carry_apy": 50.0}
+        # -0.0001/h at 3x → 262.8% APY, above the 50% minimum
+        rate = FundingRate(coin="SOL", funding_rate=-0.0001, timestamp_ms=0, annualized_rate=-0.876)
+        assert monitor._check_user_exit_thresholds(data, config, rate) is None
+
+        # -0.00001/h at 3x → 26.28% APY, below it
+        rate = FundingRate(coin="SOL", funding_rate=-0.00001, timestamp_ms=0, annualized_rate=-0.0876)
+        result = monitor._check_user_exit_thresholds(data, config, rate)
+        assert result is not None
+        assert result.reason == ExitReason.NEGATIVE_APY
+        assert result.details["current_carry_apy"] == 26.28
+        assert result.details["funding_rate_hourly"] == -0.00001
+
     def test_no_funding_data_skips(self):
         monitor = _make_monitor()
         data = {"leverage": 3.0}
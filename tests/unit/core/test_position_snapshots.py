@@ -0,0 +1,105 @@
+"""Tests for the batched position snapshot buffer."""
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.core.position_snapshots import PositionSnapshotBuffer
+
+
+def _make_buffer():
+    db = MagicMock()
+    db.execute = AsyncMock()
+    return PositionSnapshotBuffer(db), db
+
+
+class TestStage:
+
+    def test_changed_fields_only(self):
+        buffer, _ = _make_buffer()
+
+        staged = buffer.stage(
+            "pos_1",
+            {"asset": "SOL", "hl_unrealized_pnl": 10.0, "asgard_health_factor": 0.3},
+            {"hl_unrealized_pnl": 12.0, "asgard_health_factor": 0.3},
+        )
+
+        assert staged is True
+        assert buffer._pending == {"pos_1": {"hl_unrealized_pnl": 12.0}}
+
+    def test_no_op_skipped(self):
+        buffer, _ = _make_buffer()
+
+        staged = buffer.stage("pos_1", {"hl_unrealized_pnl": 10.0}, {"hl_unrealized_pnl": 10.0})
+
+        assert staged is False
+        assert buffer.pending_count == 0
+        assert buffer.skipped == 1
+
+    def test_revert_to_persisted_value_clears_pending(self):
+        buffer, _ = _make_buffer()
+        data = {"hl_unrealized_pnl": 10.0}
+
+        buffer.stage("pos_1", data, {"hl_unrealized_pnl": 11.0})
+        buffer.stage("pos_1", data, {"hl_unrealized_pnl": 10.0})
+
+        assert buffer.pending_count == 0
+
+    def test_retain_drops_closed_positions(self):
+        buffer, _ = _make_buffer()
+        buffer.stage("pos_1", {}, {"hl_unrealized_pnl": 1.0})
+        buffer.stage("pos_2", {}, {"hl_unrealized_pnl": 2.0})
+
+        buffer.retain(["pos_2"])
+
+        assert list(buffer._pending) == ["pos_2"]
+        assert "pos_1" not in buffer._persisted
+
+
+class TestFlush:
+
+    @pytest.mark.asyncio
+    async def test_single_statement_for_all_positions(self):
+        buffer, db = _make_buffer()
+        buffer.stage("pos_1", {}, {"hl_unrealized_pnl": 1.0})
+        buffer.stage("pos_2", {}, {"asgard_health_factor": 0.4})
+
+        assert await buffer.flush() == 2
+
+        db.execute.assert_awaited_once()
+        sql, (ids, patches) = db.execute.call_args.args
+        assert "p.data || u.patch::jsonb" in sql
+        assert "unnest" in sql
+        assert ids == ["pos_1", "pos_2"]
+        assert json.loads(patches[1]) == {"asgard_health_factor": 0.4}
+        assert buffer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_flushed_values_become_baseline(self):
+        buffer, db = _make_buffer()
+        buffer.stage("pos_1", {}, {"hl_unrealized_pnl": 1.0})
+        await buffer.flush()
+
+        # Row data read before the flush is stale; the buffer remembers the write
+        assert buffer.stage("pos_1", {}, {"hl_unrealized_pnl": 1.0}) is False
+        assert await buffer.flush() == 0
+        db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_retried(self):
+        buffer, db = _make_buffer()
+        db.execute = AsyncMock(side_effect=[Exception("db down"), None])
+        buffer.stage("pos_1", {}, {"hl_unrealized_pnl": 1.0})
+
+        assert await buffer.flush() == 0
+        assert buffer.pending_count == 1
+
+        assert await buffer.flush() == 1
+        assert buffer.flushed == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_flush_skips_db(self):
+        buffer, db = _make_buffer()
+
+        assert await buffer.flush() == 0
+        db.execute.assert_not_called()
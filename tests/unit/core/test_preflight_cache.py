@@ -0,0 +1,179 @@
+"""Tests for the per-user preflight check cache."""
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.core.position_manager import PositionManager
+from bot.core.preflight_cache import PreflightCache
+from shared.config.assets import Asset
+from shared.models.common import Protocol
+from shared.models.funding import AsgardRates, FundingRate
+from shared.models.opportunity import ArbitrageOpportunity, OpportunityScore
+
+
+def _opportunity(size_usd="30000", leverage="3"):
+    return ArbitrageOpportunity(
+        id="test-opp-1",
+        asset=Asset.SOL,
+        selected_protocol=Protocol.MARGINFI,
+        asgard_rates=AsgardRates(
+            protocol_id=0,
+            token_a_mint="So11111111111111111111111111111111111111112",
+            token_b_mint="EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",
+            token_a_lending_apy=Decimal("0.05"),
+            token_b_borrowing_apy=Decimal("0.08"),
+            token_b_max_borrow_capacity=Decimal("1000000"),
+        ),
+        current_funding=FundingRate(
+            timestamp=datetime.utcnow(),
+            coin="SOL",
+            rate_8hr=Decimal("-0.0001"),
+        ),
+        funding_volatility=Decimal("0.1"),
+        leverage=Decimal(leverage),
+        deployed_capital_usd=Decimal(size_usd) / Decimal(leverage),
+        position_size_usd=Decimal(size_usd),
+        score=OpportunityScore(
+            funding_apy=Decimal("0.10"),
+            net_carry_apy=Decimal("-0.01"),
+        ),
+        price_deviation=Decimal("0"),
+    )
+
+
+def _age(cache, seconds):
+    for checks in cache._entries.values():
+        for cached in checks.values():
+            cached.checked_at -= seconds
+
+
+class TestPreflightCache:
+
+    def test_hit_within_ttl(self):
+        cache = PreflightCache()
+        cache.put("user-1", _opportunity(), "wallet_balance")
+
+        assert cache.get("user-1", _opportunity(), "wallet_balance") is not None
+        assert cache.get("user-2", _opportunity(), "wallet_balance") is None
+        assert cache.hits == 1
+
+        _age(cache, cache.ttls["wallet_balance"])
+        assert cache.get("user-1", _opportunity(), "wallet_balance") is None
+
+    def test_per_check_ttls(self):
+        cache = PreflightCache()
+        cache.put("user-1", _opportunity(), "wallet_balance")
+        cache.put("user-1", _opportunity(), "protocol_capacity")
+
+        _age(cache, cache.ttls["wallet_balance"] + 1)
+
+        assert cache.get("user-1", _opportunity(), "wallet_balance") is None
+        assert cache.get("user-1", _opportunity(), "protocol_capacity") is not None
+
+    def test_reused_only_for_same_or_smaller_size_in_bucket(self):
+        cache = PreflightCache()
+        cache.put("user-1", _opportunity("30000"), "wallet_balance")
+
+        assert cache.get("user-1", _opportunity("29000"), "wallet_balance") is not None
+        assert cache.get("user-1", _opportunity("31000"), "wallet_balance") is None
+        # A much smaller order is a different bucket
+        assert cache.get("user-1", _opportunity("1000"), "wallet_balance") is None
+
+    def test_uncached_check_and_outputs(self):
+        cache = PreflightCache()
+        opportunity = _opportunity()
+        opportunity.selected_protocol = Protocol.KAMINO
+        cache.put("user-1", opportunity, "protocol_capacity")
+        cache.put("user-1", opportunity, "funding_validation")
+
+        fresh = _opportunity()
+        cache.get("user-1", fresh, "protocol_capacity").apply(fresh)
+
+        assert fresh.selected_protocol == Protocol.KAMINO
+        assert cache.get("user-1", fresh, "funding_validation") is None
+
+    def test_invalidate_user(self):
+        cache = PreflightCache()
+        cache.put("user-1", _opportunity(), "wallet_balance")
+        cache.put("user-2", _opportunity(), "wallet_balance")
+
+        cache.invalidate_user("user-1")
+
+        assert cache.get("user-1", _opportunity(), "wallet_balance") is None
+        assert cache.get("user-2", _opportunity(), "wallet_balance") is not None
+
+    def test_bounded(self):
+        cache = PreflightCache(max_entries=2)
+        for user in ("a", "b", "c"):
+            cache.put(user, _opportunity(), "wallet_balance")
+
+        assert cache.get("a", _opportunity(), "wallet_balance") is None
+        assert cache.get("c", _opportunity(), "wallet_balance") is not None
+
+
+class TestPositionManagerReuse:
+
+    @staticmethod
+    def _manager(cache, wallet_ok=True):
+        consensus = AsyncMock()
+        consensus.check_consensus = AsyncMock(return_value=MagicMock(
+            is_within_threshold=True, price_deviation=Decimal("0.002"),
+        ))
+        manager = PositionManager(
+            asgard_manager=AsyncMock(),
+            hyperliquid_trader=AsyncMock(),
+            price_consensus=consensus,
+            fill_validator=AsyncMock(),
+            solana_client=AsyncMock(),
+            arbitrum_client=AsyncMock(),
+            user_id="user-1",
+            preflight_cache=cache,
+        )
+        manager._check_wallet_balance = AsyncMock(return_value=wallet_ok)
+        manager._check_protocol_capacity = AsyncMock(return_value=True)
+        manager._check_hedge_impact = AsyncMock(return_value=True)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_second_run_reuses_passed_checks(self):
+        manager = self._manager(PreflightCache())
+
+        first = await manager.run_preflight_checks(_opportunity())
+        second_opp = _opportunity()
+        second = await manager.run_preflight_checks(second_opp)
+
+        assert first.passed and second.passed
+        assert first.reused_checks == []
+        assert set(second.reused_checks) == {
+            "wallet_balance", "price_consensus", "protocol_capacity",
+            "opportunity_simulation", "hedge_impact",
+        }
+        manager._check_wallet_balance.assert_awaited_once()
+        manager.price_consensus.check_consensus.assert_awaited_once()
+        assert second_opp.price_deviation == Decimal("0.002")
+        assert second_opp.preflight_checks_passed is True
+
+    @pytest.mark.asyncio
+    async def test_failed_check_rerun(self):
+        manager = self._manager(PreflightCache(), wallet_ok=False)
+
+        await manager.run_preflight_checks(_opportunity())
+        result = await manager.run_preflight_checks(_opportunity())
+
+        assert result.passed is False
+        assert manager._check_wallet_balance.await_count == 2
+        assert "wallet_balance" not in result.reused_checks
+
+    @pytest.mark.asyncio
+    async def test_invalidated_after_open_attempt(self):
+        cache = PreflightCache()
+        manager = self._manager(cache)
+        opportunity = _opportunity()
+        await manager.run_preflight_checks(opportunity)
+        manager._open_legs = AsyncMock(return_value=MagicMock(success=False))
+
+        await manager.open_position(opportunity)
+
+        assert cache.get("user-1", _opportunity(), "wallet_balance") is None
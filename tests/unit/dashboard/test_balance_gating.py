@@ -183,10 +183,18 @@ class TestBalancesResponseModel:
 class TestHlClearinghouseBalance:
     """Tests for HL clearinghouse balance API helper."""
 
+    @pytest.fixture(autouse=True)
+    async def _fresh_balance_service(self):
+        from backend.dashboard.balance_service import close_balance_service
+        await close_balance_service()
+        yield
+        await close_balance_service()
+
     @pytest.mark.asyncio
     async def test_get_hl_clearinghouse_balance_success(self):
         """Test fetching HL clearinghouse balance."""
-        with patch("backend.dashboard.api.balances.HyperliquidTrader") as mock_trader_cls:
+        with patch("backend.dashboard.balance_service.HyperliquidTrader") as mock_trader_cls, \
+                patch("backend.dashboard.balance_service.get_client_registry") as mock_registry:
             mock_trader = MagicMock()
             mock_trader.get_deposited_balance = AsyncMock(return_value=1234.56)
             mock_trader_cls.return_value = mock_trader
@@ -194,12 +202,16 @@ class TestHlClearinghouseBalance:
             balance = await _get_hl_clearinghouse_balance("0xWallet")
 
             assert balance == 1234.56
-            mock_trader_cls.assert_called_once_with(wallet_address="0xWallet")
+            mock_trader_cls.assert_called_once_with(
+                wallet_address="0xWallet",
+                client=mock_registry.return_value.hyperliquid_client.return_value,
+            )
 
     @pytest.mark.asyncio
     async def test_get_hl_clearinghouse_balance_zero(self):
         """Test zero HL balance returns 0."""
-        with patch("backend.dashboard.api.balances.HyperliquidTrader") as mock_trader_cls:
+        with patch("backend.dashboard.balance_service.HyperliquidTrader") as mock_trader_cls, \
+                patch("backend.dashboard.balance_service.get_client_registry") as mock_registry:
             mock_trader = MagicMock()
             mock_trader.get_deposited_balance = AsyncMock(return_value=0)
             mock_trader_cls.return_value = mock_trader
@@ -211,7 +223,8 @@ class TestHlClearinghouseBalance:
     @pytest.mark.asyncio
     async def test_get_hl_clearinghouse_balance_error(self):
         """Test error returns None."""
-        with patch("backend.dashboard.api.balances.HyperliquidTrader") as mock_trader_cls:
+        with patch("backend.dashboard.balance_service.HyperliquidTrader") as mock_trader_cls, \
+                patch("backend.dashboard.balance_service.get_client_registry") as mock_registry:
             mock_trader_cls.side_effect = Exception("API error")
 
             balance = await _get_hl_clearinghouse_balance("0xWallet")
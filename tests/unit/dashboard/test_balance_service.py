@@ -0,0 +1,295 @@
+"""
+Tests for the dashboard BalanceService.
+
+These tests verify:
+- Venues are read concurrently over pooled clients
+- Fresh balances are served from cache
+- Stale balances are served while a background refresh runs
+- Concurrent misses share one fetch; failures are not cached
+"""
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.dashboard.balance_service import (
+    USDC_MINT_SOLANA,
+    ArbitrumBalance,
+    BalanceService,
+    SolanaBalance,
+    WalletBalances,
+)
+from shared.chain.arbitrum import NATIVE_USDC_ARBITRUM
+from shared.chain.multicall import EvmBalance
+from shared.chain.solana import WalletBalance
+
+
+def _balances(sol=1.5, usdc=100.0):
+    """get_balances side effect returning the same balance for every owner."""
+    async def get_balances(owners, mints):
+        return {owner: WalletBalance(sol=sol, tokens={USDC_MINT_SOLANA: usdc}) for owner in owners}
+    return get_balances
+
+
+def _solana_client(sol=1.5, usdc=100.0, delay=0.0):
+    client = MagicMock()
+    read = _balances(sol, usdc)
+
+    async def get_balances(owners, mints):
+        await asyncio.sleep(delay)
+        return await read(owners, mints)
+
+    client.get_balances = AsyncMock(side_effect=get_balances)
+    client.close = AsyncMock()
+    return client
+
+
+def _arbitrum_client(eth="0.01", usdc="50", delay=0.0):
+    client = MagicMock()
+
+    async def get_balances(addresses):
+        await asyncio.sleep(delay)
+        return {
+            address: EvmBalance(eth=Decimal(eth), tokens={NATIVE_USDC_ARBITRUM: Decimal(usdc)})
+            for address in addresses
+        }
+
+    client.get_balances = AsyncMock(side_effect=get_balances)
+    client.close = AsyncMock()
+    return client
+
+
+def _hl_client(account_value="250.0", delay=0.0):
+    client = MagicMock()
+
+    async def get_state(address):
+        await asyncio.sleep(delay)
+        return {"crossMarginSummary": {"accountValue": account_value}}
+
+    client.get_clearinghouse_state = AsyncMock(side_effect=get_state)
+    client.close = AsyncMock()
+    return client
+
+
+class TestGetAll:
+
+    @pytest.mark.asyncio
+    async def test_reads_all_venues(self):
+        service = BalanceService(
+            solana_client=_solana_client(),
+            arbitrum_client=_arbitrum_client(),
+            hl_client=_hl_client(),
+        )
+
+        result = await service.get_all("SoLAddr", "0xEvm")
+
+        assert result == WalletBalances(
+            solana=SolanaBalance(sol=1.5, usdc=100.0),
+            arbitrum=ArbitrumBalance(eth=0.01, usdc=50.0),
+            hl_clearinghouse=250.0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_venues_fetched_concurrently(self):
+        """Total latency is one round trip, not the sum of three."""
+        service = BalanceService(
+            solana_client=_solana_client(delay=0.1),
+            arbitrum_client=_arbitrum_client(delay=0.1),
+            hl_client=_hl_client(delay=0.1),
+        )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await service.get_all("SoLAddr", "0xEvm")
+        elapsed = loop.time() - start
+
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_missing_addresses_skip_venues(self):
+        solana = _solana_client()
+        arbitrum = _arbitrum_client()
+        service = BalanceService(solana_client=solana, arbitrum_client=arbitrum)
+
+        result = await service.get_all(None, None)
+
+        assert result == WalletBalances()
+        solana.get_balances.assert_not_called()
+        arbitrum.get_balances.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_one_venue_failing_does_not_fail_others(self):
+        solana = _solana_client()
+        solana.get_balances = AsyncMock(side_effect=Exception("rpc down"))
+        service = BalanceService(
+            solana_client=solana,
+            arbitrum_client=_arbitrum_client(),
+            hl_client=_hl_client(),
+        )
+
+        result = await service.get_all("SoLAddr", "0xEvm")
+
+        assert result.solana is None
+        assert result.arbitrum == ArbitrumBalance(eth=0.01, usdc=50.0)
+        assert result.hl_clearinghouse == 250.0
+
+
+class TestCaching:
+
+    @pytest.mark.asyncio
+    async def test_fresh_value_served_from_cache(self):
+        solana = _solana_client()
+        service = BalanceService(solana_client=solana, ttl=60)
+
+        await service.get_solana("SoLAddr")
+        await service.get_solana("SoLAddr")
+
+        assert solana.get_balances.call_count == 1
+        assert service.hits == 1
+        assert service.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self):
+        solana = _solana_client(sol=1.0)
+        service = BalanceService(solana_client=solana, ttl=0, stale_ttl=60)
+
+        first = await service.get_solana("SoLAddr")
+        solana.get_balances = AsyncMock(side_effect=_balances(sol=2.0))
+
+        second = await service.get_solana("SoLAddr")
+        assert second == first  # stale value returned immediately
+        assert service.stale_hits == 1
+
+        await service._inflight[("solana", "SoLAddr")]  # background refresh
+        service.ttl = 60
+        third = await service.get_solana("SoLAddr")
+        assert third.sol == 2.0
+
+    @pytest.mark.asyncio
+    async def test_expired_value_refetched_inline(self):
+        solana = _solana_client()
+        service = BalanceService(solana_client=solana, ttl=0, stale_ttl=0)
+
+        await service.get_solana("SoLAddr")
+        await service.get_solana("SoLAddr")
+
+        assert solana.get_balances.call_count == 2
+        assert service.misses == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        solana = _solana_client(delay=0.05)
+        service = BalanceService(solana_client=solana)
+
+        results = await asyncio.gather(*(service.get_solana("SoLAddr") for _ in range(5)))
+
+        assert all(r == results[0] for r in results)
+        assert solana.get_balances.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        solana = _solana_client()
+        solana.get_balances = AsyncMock(side_effect=[
+            Exception("timeout"),
+            {"SoLAddr": WalletBalance(sol=3.0, tokens={USDC_MINT_SOLANA: 0.0})},
+        ])
+        service = BalanceService(solana_client=solana)
+
+        assert await service.get_solana("SoLAddr") is None
+        assert (await service.get_solana("SoLAddr")).sol == 3.0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_address(self):
+        solana = _solana_client()
+        service = BalanceService(solana_client=solana, ttl=60)
+
+        await service.get_solana("SoLAddr")
+        service.invalidate("SoLAddr")
+        await service.get_solana("SoLAddr")
+
+        assert solana.get_balances.call_count == 2
+
+
+class TestPooledClients:
+
+    @pytest.mark.asyncio
+    async def test_registry_facade_created_once_and_closed(self):
+        with patch("backend.dashboard.balance_service.get_client_registry") as mock_registry:
+            factory = mock_registry.return_value.solana_client
+            factory.return_value = _solana_client()
+            service = BalanceService(ttl=0, stale_ttl=0)
+
+            await service.get_solana("A")
+            await service.get_solana("B")
+
+            assert factory.call_count == 1
+            await service.close()
+            factory.return_value.close.assert_awaited_once()
+
+
+class TestBatchedSolana:
+
+    @pytest.mark.asyncio
+    async def test_many_addresses_one_read(self):
+        solana = _solana_client()
+        service = BalanceService(solana_client=solana)
+
+        result = await service.get_solana_many(["A", "B", "C", "A"])
+
+        assert result == {addr: SolanaBalance(sol=1.5, usdc=100.0) for addr in "ABC"}
+        solana.get_balances.assert_awaited_once_with(["A", "B", "C"], [USDC_MINT_SOLANA])
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_address(self):
+        solana = _solana_client()
+        solana.get_balances = AsyncMock(side_effect=Exception("rpc down"))
+        service = BalanceService(solana_client=solana)
+
+        assert await service.get_solana_many(["A", "B"]) == {"A": None, "B": None}
+        assert solana.get_balances.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_address_missing_from_read_fails_only_that_address(self):
+        solana = _solana_client()
+        read = _balances()
+
+        async def skip_invalid(owners, mints):
+            return await read([o for o in owners if o != "bad"], mints)
+
+        solana.get_balances = AsyncMock(side_effect=skip_invalid)
+        service = BalanceService(solana_client=solana)
+
+        result = await asyncio.wait_for(service.get_solana_many(["A", "bad"]), 1)
+
+        assert result == {"A": SolanaBalance(sol=1.5, usdc=100.0), "bad": None}
+        assert service._inflight == {}
+
+
+class TestBatchedArbitrum:
+
+    @pytest.mark.asyncio
+    async def test_many_addresses_one_multicall(self):
+        arbitrum = _arbitrum_client()
+        service = BalanceService(arbitrum_client=arbitrum)
+
+        result = await service.get_arbitrum_many(["0xA", "0xB", "0xA"])
+
+        assert result == {
+            "0xA": ArbitrumBalance(eth=0.01, usdc=50.0),
+            "0xB": ArbitrumBalance(eth=0.01, usdc=50.0),
+        }
+        arbitrum.get_balances.assert_awaited_once_with(["0xA", "0xB"])
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_call_fails_only_that_address(self):
+        arbitrum = MagicMock()
+        arbitrum.get_balances = AsyncMock(return_value={
+            "0xA": EvmBalance(eth=Decimal("1"), tokens={NATIVE_USDC_ARBITRUM: Decimal("2")}),
+            "0xB": EvmBalance(eth=None, tokens={NATIVE_USDC_ARBITRUM: Decimal("2")}),
+        })
+        service = BalanceService(arbitrum_client=arbitrum)
+
+        result = await service.get_arbitrum_many(["0xA", "0xB"])
+
+        assert result == {"0xA": ArbitrumBalance(eth=1.0, usdc=2.0), "0xB": None}
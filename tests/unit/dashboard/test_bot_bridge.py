@@ -3,6 +3,7 @@ Tests for dashboard bot bridge module.
 """
 import pytest
 import asyncio
+import json
 import time
 from unittest.mock import MagicMock, patch, AsyncMock
 from decimal import Decimal
@@ -641,6 +642,135 @@ class TestHealthCheck:
             assert result is False
 
 
+def _feed_position(position_id, user_id):
+    return {
+        "user_id": user_id,
+        "position": {
+            "position_id": position_id,
+            "asset": "SOL",
+            "status": "open",
+            "leverage": "3.0",
+            "deployed_usd": "10000",
+            "long_value_usd": "10000",
+            "short_value_usd": "30000",
+            "delta": "100",
+            "delta_ratio": "0.01",
+            "asgard_hf": "1.2",
+            "hyperliquid_mf": "0.15",
+            "total_pnl_usd": "50",
+            "funding_pnl_usd": "30",
+            "opened_at": datetime.utcnow().isoformat(),
+            "hold_duration_hours": 1.0,
+        },
+    }
+
+
+_PAUSE = {
+    "paused": False, "scope": "all", "reason": None,
+    "paused_at": None, "paused_by": None, "active_breakers": [],
+}
+
+
+class _FakeFeed:
+    """Stands in for ``websockets.connect``: yields messages, then closes."""
+
+    def __init__(self, messages):
+        self.messages = [json.dumps(m) for m in messages]
+        self.headers = None
+
+    def __call__(self, url, extra_headers=None, **kwargs):
+        self.url = url
+        self.headers = extra_headers
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.messages:
+            raise StopAsyncIteration
+        return self.messages.pop(0)
+
+
+class TestEventFeed:
+    """Tests for the pushed event feed."""
+
+    @pytest.mark.asyncio
+    async def test_pushed_state_served_without_http(self):
+        bridge = BotBridge()
+        bridge._apply_feed_message({"type": "snapshot", "data": {
+            "positions": [_feed_position("pos1", "alice"), _feed_position("pos2", "bob")],
+            "pause_state": _PAUSE,
+        }})
+        bridge._apply_feed_message({"type": "position_closed", "data": {"position_id": "pos2"}})
+        bridge._apply_feed_message({"type": "position_opened", "data": _feed_position("pos3", "bob")})
+        bridge._apply_feed_message({"type": "circuit_breaker", "data": {
+            **_PAUSE, "paused": True, "paused_by": "circuit_breaker",
+        }})
+
+        with patch.object(bridge, '_request', new_callable=AsyncMock) as mock_request:
+            assert set(await bridge.get_positions()) == {"pos1", "pos3"}
+            assert set(await bridge.get_positions(user_id="alice")) == {"pos1"}
+            assert (await bridge.get_pause_state()).paused is True
+            mock_request.assert_not_called()
+        assert bridge.feed_events == 4
+
+    @pytest.mark.asyncio
+    async def test_run_feed_hands_state_to_cache_on_disconnect(self):
+        bridge = BotBridge(internal_token="secret")
+        feed = _FakeFeed([
+            {"type": "snapshot", "data": {"positions": [_feed_position("pos1", "alice")], "pause_state": _PAUSE}},
+            {"type": "ping"},
+        ])
+
+        with patch("backend.dashboard.bot_bridge.websockets.connect", feed):
+            assert await bridge._run_feed() is True
+
+        assert feed.url == "ws://bot:8000/internal/events"
+        assert feed.headers == {"Authorization": "Bearer secret"}
+        assert bridge.feed_connected is False
+        assert set(bridge._get_cached("positions_all")) == {"pos1"}
+        assert bridge._get_cached("pause_state").paused is False
+
+    @pytest.mark.asyncio
+    async def test_run_feed_unavailable(self):
+        bridge = BotBridge()
+        connect = MagicMock(side_effect=OSError("refused"))
+
+        with patch("backend.dashboard.bot_bridge.websockets.connect", connect):
+            assert await bridge._run_feed() is False
+
+    @pytest.mark.asyncio
+    async def test_polls_only_until_reconnect(self):
+        bridge = BotBridge()
+        bridge.POLL_INTERVAL = 0.02
+
+        with patch.object(bridge, '_poll', new_callable=AsyncMock) as mock_poll:
+            await bridge._poll_until(time.monotonic() - 1)
+            assert mock_poll.await_count == 1
+
+            await bridge._poll_until(time.monotonic() + 0.05)
+            assert 3 <= mock_poll.await_count <= 5
+
+    @pytest.mark.asyncio
+    async def test_invalidate_pause_state_reads_through(self):
+        bridge = BotBridge()
+        bridge._apply_feed_message({"type": "snapshot", "data": {"positions": [], "pause_state": _PAUSE}})
+        bridge.invalidate_cache("pause_state")
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {**_PAUSE, "paused": True}
+        with patch.object(bridge, '_request', new_callable=AsyncMock, return_value=mock_response):
+            assert (await bridge.get_pause_state()).paused is True
+        assert bridge._feed_pause_state.paused is True
+
+
 class TestBotUnavailableError:
     """Tests for BotUnavailableError exception."""
     
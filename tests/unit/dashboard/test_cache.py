@@ -0,0 +1,278 @@
+"""
+Tests for the two-tier dashboard cache.
+
+These tests verify:
+- Hot keys are served from the in-process tier without touching Redis
+- Values set by another worker are read from Redis and promoted to memory
+- Concurrent misses for one key share a single upstream call
+- Early refresh recomputes in the background while serving the current value
+- Tag invalidation drops tagged keys from both tiers in batched round-trips
+- Redis outages degrade to memory-only caching
+"""
+import asyncio
+import fnmatch
+import json
+
+import pytest
+
+from backend.dashboard import cache as cache_module
+from backend.dashboard.cache import CACHE_PREFIX, TimedCache, cached
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._ops = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._ops.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        self._redis.round_trips += 1
+        return [getattr(self._redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self._ops]
+
+
+class _FakeRedis:
+    """Just enough of redis.asyncio for the cache (no real expiry)."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def _get(self, key):
+        return self.data.get(key)
+
+    def _pttl(self, key):
+        return 5000 if key in self.data else -2
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def _sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+        return len(members)
+
+    def _expire(self, key, seconds):
+        return key in self.data
+
+    def _smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return self._delete(*keys)
+
+    async def scan_iter(self, match="*", count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+
+class _DownRedis:
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis down")
+
+
+def _cache(redis, **kwargs):
+    cache = TimedCache(ttl_seconds=10, **kwargs)
+
+    async def get_redis():
+        return redis
+    cache._get_redis = get_redis
+    return cache
+
+
+class TestTwoTierCache:
+
+    @pytest.mark.asyncio
+    async def test_hot_key_served_from_memory(self):
+        redis = _FakeRedis()
+        cache = _cache(redis)
+        await cache.set("rates", {"apy": 1.5})
+        trips = redis.round_trips
+
+        for _ in range(5):
+            assert await cache.get("rates") == {"apy": 1.5}
+
+        assert redis.round_trips == trips
+        assert cache.l1_hits == 5
+
+    @pytest.mark.asyncio
+    async def test_value_from_other_worker_promoted(self):
+        redis = _FakeRedis()
+        await _cache(redis).set("rates", {"apy": 2}, tags=("rates",))
+        cache = _cache(redis)
+
+        assert await cache.get("rates") == {"apy": 2}
+        assert await cache.get("rates") == {"apy": 2}
+        assert (cache.l2_hits, cache.l1_hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        cache = _cache(_FakeRedis(), max_entries=2)
+        for key in ("a", "b", "c"):
+            await cache.set(key, key)
+
+        assert list(cache._l1) == ["b", "c"]
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self):
+        cache = _cache(_FakeRedis())
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"n": calls}
+
+        results = await asyncio.gather(*(cache.get_or_set("k", factory) for _ in range(10)))
+
+        assert calls == 1
+        assert results == [{"n": 1}] * 10
+        assert cache.coalesced >= 1
+        assert cache._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_single_flight_shares_errors(self):
+        cache = _cache(_FakeRedis())
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("venue down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_set("k", factory) for _ in range(3)), return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.load_errors == 1
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_early_refresh_serves_current_value(self):
+        cache = _cache(_FakeRedis())
+        await cache.set("k", "old", delta=100.0)  # Expensive value: always due early
+        cache._random = lambda: 0.5
+
+        async def factory():
+            return "new"
+
+        assert await cache.get_or_set("k", factory) == "old"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert cache.early_refreshes == 1
+        assert await cache.get("k") == "new"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self):
+        redis = _FakeRedis()
+        cache = _cache(redis)
+        await cache.set("a", 1, tags=("rates",))
+        await cache.set("b", 2, tags=("rates", "user:1"))
+        await cache.set("c", 3, tags=("user:2",))
+        trips = redis.round_trips
+
+        deleted = await cache.invalidate_tags("rates")
+
+        assert deleted == 3  # a, b and the tag set
+        assert redis.round_trips - trips == 2
+        assert set(cache._l1) == {"c"}
+        assert f"{CACHE_PREFIX}c" in redis.data
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_discards_inflight_load(self):
+        cache = _cache(_FakeRedis())
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def factory():
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.ensure_future(cache.get_or_set("k", factory))
+        await started.wait()
+        await cache.invalidate("k")
+        release.set()
+
+        assert await task == "stale"
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_batches_deletes(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "DELETE_BATCH", 2)
+        redis = _FakeRedis()
+        cache = _cache(redis)
+        for key in "abcde":
+            await cache.set(key, key)
+        trips = redis.round_trips
+
+        await cache.invalidate()
+
+        assert redis.data == {}
+        assert cache._l1 == {}
+        assert redis.round_trips - trips == 3
+
+    @pytest.mark.asyncio
+    async def test_redis_down_degrades_to_memory(self):
+        cache = _cache(_DownRedis())
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            return "value"
+
+        assert await cache.get_or_set("k", factory) == "value"
+        assert await cache.get_or_set("k", factory) == "value"
+
+        assert calls == 1
+        assert cache.l2_errors >= 2
+        stats = cache.get_stats()
+        assert stats["l1_hits"] == 1 and stats["misses"] == 1 and stats["loads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_values_decoded_like_l2(self):
+        from decimal import Decimal
+        redis = _FakeRedis()
+        cache = _cache(redis)
+
+        await cache.set("k", {"amount": Decimal("1.5")})
+
+        assert await cache.get("k") == {"amount": "1.5"}
+        assert json.loads(redis.data[f"{CACHE_PREFIX}k"])["v"] == {"amount": "1.5"}
+
+
+class TestCachedDecorator:
+
+    @pytest.mark.asyncio
+    async def test_cached_by_arguments(self):
+        calls = []
+
+        @cached(ttl_seconds=10, tags=("rates",))
+        async def get_rates(leverage=3.0):
+            calls.append(leverage)
+            return {"leverage": leverage}
+
+        async def get_redis():
+            return _FakeRedis()
+        get_rates.cache._get_redis = get_redis
+
+        assert await get_rates(leverage=3.0) == {"leverage": 3.0}
+        assert await get_rates(leverage=3.0) == {"leverage": 3.0}
+        assert await get_rates(leverage=2.0) == {"leverage": 2.0}
+
+        assert calls == [3.0, 2.0]
+        assert get_rates.cache.tags == ("rates",)
@@ -0,0 +1,403 @@
+"""
+Tests for the dashboard EventManager.
+
+These tests verify:
+- Events are routed to the publishing user's (or position's) subscribers only
+- Each event is serialized once for all subscribers
+- Fan-out never blocks on a slow subscriber (coalesce, then drop oldest)
+- Redis user channels follow local subscriptions
+- User events are logged with a seq and replayed after reconnects
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.dashboard import events_manager as em
+from backend.dashboard.api import events as events_api
+from backend.dashboard.events_manager import (
+    EVENTS_BROADCAST_CHANNEL,
+    EVENTS_USER_CHANNEL_PREFIX,
+    Event,
+    EventManager,
+    EventType,
+    Subscription,
+)
+
+
+@pytest.fixture
+def manager():
+    """Fresh manager publishing locally (Redis unavailable)."""
+    original = EventManager._instance
+    EventManager._instance = None
+    manager = EventManager()
+    with patch("shared.redis_client.get_redis", AsyncMock(side_effect=Exception("no redis"))), \
+            patch.object(em, "event_manager", manager):
+        yield manager
+    EventManager._instance = original
+
+
+def _event(event_type=EventType.POSITION_OPENED, **data):
+    return Event(type=event_type, data=data, timestamp="2026-01-01T00:00:00")
+
+
+async def _drain(subscription):
+    events = []
+    while not subscription.empty():
+        events.append(await subscription.get())
+    return events
+
+
+class TestRouting:
+
+    @pytest.mark.asyncio
+    async def test_user_events_only_reach_that_user(self, manager):
+        alice = await manager.subscribe(user_id="alice")
+        bob = await manager.subscribe(user_id="bob")
+        await _drain(alice), await _drain(bob)
+
+        await manager.publish(EventType.POSITION_OPENED, {"position_id": "p1"}, user_id="alice")
+        await manager.publish(EventType.RATE_UPDATE, {"sol": 0.1})
+
+        assert [e.type for e in await _drain(alice)] == [EventType.POSITION_OPENED, EventType.RATE_UPDATE]
+        assert [e.type for e in await _drain(bob)] == [EventType.RATE_UPDATE]
+
+    @pytest.mark.asyncio
+    async def test_position_subscription(self, manager):
+        sub = await manager.subscribe(user_id="alice", position_ids=["p1"])
+        await _drain(sub)
+
+        await manager.publish(EventType.POSITION_UPDATE, {"position_id": "p1"}, user_id="alice")
+        await manager.publish(EventType.POSITION_UPDATE, {"position_id": "p2"}, user_id="alice")
+        # Same position id under another user never leaks across
+        await manager.publish(EventType.POSITION_UPDATE, {"position_id": "p1"}, user_id="mallory")
+
+        events = await _drain(sub)
+        assert len(events) == 1 and events[0].data["position_id"] == "p1"
+
+    @pytest.mark.asyncio
+    async def test_position_subscription_requires_user(self, manager):
+        with pytest.raises(ValueError):
+            await manager.subscribe(position_ids=["p1"])
+
+    @pytest.mark.asyncio
+    async def test_helpers_route_by_user_id(self, manager):
+        alice = await manager.subscribe(user_id="alice")
+        bob = await manager.subscribe(user_id="bob")
+        await _drain(alice), await _drain(bob)
+
+        await em.publish_position_closed("p1", {"total_pnl": 5, "user_id": "alice"})
+
+        assert [e.type for e in await _drain(alice)] == [EventType.POSITION_CLOSED]
+        assert await _drain(bob) == []
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_cleans_up(self, manager):
+        sub = await manager.subscribe(user_id="alice", position_ids=["p1"])
+        await manager.unsubscribe(sub)
+        await manager.unsubscribe(sub)
+
+        assert manager.get_stats() == {
+            "subscribers": 0, "topics": 0, "user_channels": 0,
+            "pending": 0, "coalesced": 0, "dropped": 0,
+        }
+
+
+class TestFanout:
+
+    @pytest.mark.asyncio
+    async def test_serialized_once(self, manager):
+        subs = [await manager.subscribe(user_id="alice") for _ in range(3)]
+        for sub in subs:
+            await _drain(sub)
+
+        with patch.object(em.json, "dumps", wraps=em.json.dumps) as dumps:
+            await manager.publish(EventType.POSITION_OPENED, {"position_id": "p1"}, user_id="alice")
+            payloads = [(await sub.get()).to_sse() for sub in subs]
+
+        assert dumps.call_count == 1
+        assert payloads[0] is payloads[1] is payloads[2]
+
+    def test_redis_payload_reused_for_sse(self):
+        raw = _event(position_id="p1").to_json()
+
+        with patch.object(em.json, "dumps") as dumps:
+            sse = Event.from_json(raw).to_sse()
+
+        dumps.assert_not_called()
+        assert sse == f"data: {raw}\n\n"
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_others(self, manager):
+        slow = await manager.subscribe(user_id="alice")
+        fast = await manager.subscribe(user_id="alice")
+        slow.maxsize = 2
+        await _drain(fast)
+
+        for i in range(5):
+            await manager.publish(EventType.POSITION_OPENED, {"position_id": f"p{i}"}, user_id="alice")
+
+        assert [e.data["position_id"] for e in await _drain(fast)] == [f"p{i}" for i in range(5)]
+        # Oldest pending events were dropped
+        assert [e.data["position_id"] for e in await _drain(slow)] == ["p3", "p4"]
+        assert slow.dropped == 4  # Includes the initial "connected" event
+
+
+class TestSubscription:
+
+    @pytest.mark.asyncio
+    async def test_state_updates_coalesce(self):
+        sub = Subscription("s", "alice", set())
+        sub.offer(_event(EventType.POSITION_UPDATE, position_id="p1", pnl=1))
+        sub.offer(_event(EventType.POSITION_OPENED, position_id="p2"))
+        sub.offer(_event(EventType.POSITION_UPDATE, position_id="p1", pnl=2))
+        sub.offer(_event(EventType.POSITION_UPDATE, position_id="p3", pnl=9))
+
+        events = await _drain(sub)
+
+        assert [(e.type, e.data.get("pnl")) for e in events] == [
+            (EventType.POSITION_OPENED, None),
+            (EventType.POSITION_UPDATE, 2),
+            (EventType.POSITION_UPDATE, 9),
+        ]
+        assert sub.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_coalescible_first(self):
+        sub = Subscription("s", "alice", set(), maxsize=2)
+        sub.offer(_event(EventType.POSITION_OPENED, position_id="p1"))
+        sub.offer(_event(EventType.RATE_UPDATE))
+        sub.offer(_event(EventType.POSITION_CLOSED, position_id="p1"))
+
+        events = await _drain(sub)
+
+        assert [e.type for e in events] == [EventType.POSITION_OPENED, EventType.POSITION_CLOSED]
+        assert sub.dropped == 1
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_offer(self):
+        sub = Subscription("s", None, set())
+        waiter = asyncio.ensure_future(sub.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        sub.offer(_event())
+
+        assert (await waiter).type == EventType.POSITION_OPENED
+
+
+class TestRedisChannels:
+
+    @pytest.mark.asyncio
+    async def test_user_channels_follow_subscriptions(self, manager):
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.unsubscribe = AsyncMock()
+        manager._pubsub = pubsub
+
+        first = await manager.subscribe(user_id="alice")
+        second = await manager.subscribe(user_id="alice")
+        await manager.unsubscribe(first)
+        pubsub.unsubscribe.assert_not_called()
+        await manager.unsubscribe(second)
+
+        channel = EVENTS_USER_CHANNEL_PREFIX + "alice"
+        pubsub.subscribe.assert_awaited_once_with(channel)
+        pubsub.unsubscribe.assert_awaited_once_with(channel)
+
+    @pytest.mark.asyncio
+    async def test_listener_routes_by_channel(self, manager):
+        alice = await manager.subscribe(user_id="alice")
+        await _drain(alice)
+        raw = _event(position_id="p1").to_json()
+
+        async def listen():
+            yield {"type": "subscribe", "channel": EVENTS_BROADCAST_CHANNEL, "data": 1}
+            yield {"type": "message", "channel": EVENTS_USER_CHANNEL_PREFIX + "alice", "data": raw}
+            yield {"type": "message", "channel": EVENTS_USER_CHANNEL_PREFIX + "bob", "data": raw}
+            raise asyncio.CancelledError
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.listen = listen
+        redis = MagicMock()
+        redis.pubsub.return_value = pubsub
+
+        with patch("shared.redis_client.get_redis", AsyncMock(return_value=redis)):
+            await manager._redis_listener()
+
+        pubsub.subscribe.assert_awaited_once_with(
+            EVENTS_BROADCAST_CHANNEL, EVENTS_USER_CHANNEL_PREFIX + "alice"
+        )
+        events = await _drain(alice)
+        assert len(events) == 1 and events[0].to_sse() == f"data: {raw}\n\n"
+
+    @pytest.mark.asyncio
+    async def test_channel_acquired_while_subscribing_is_sent(self, manager):
+        pubsub = MagicMock()
+        pubsub.unsubscribe = AsyncMock()
+        first_call = True
+
+        async def subscribe(*channels):
+            nonlocal first_call
+            if first_call:
+                first_call = False
+                # A user connects while the initial subscribe is in flight
+                await manager._acquire_channel(EVENTS_USER_CHANNEL_PREFIX + "bob")
+
+        pubsub.subscribe = AsyncMock(side_effect=subscribe)
+
+        await manager._subscribe_channels(pubsub)
+
+        assert pubsub.subscribe.await_args_list[1].args == (EVENTS_USER_CHANNEL_PREFIX + "bob",)
+        pubsub.unsubscribe.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_listener_closes_pubsub_on_reconnect(self, manager):
+        manager.RECONNECT_MIN = 0
+
+        async def broken():
+            raise ConnectionError("redis gone")
+            yield  # pragma: no cover
+
+        async def cancelled():
+            raise asyncio.CancelledError
+            yield  # pragma: no cover
+
+        pubsubs = []
+        for listen in (broken, cancelled):
+            pubsub = MagicMock()
+            pubsub.subscribe = AsyncMock()
+            pubsub.unsubscribe = AsyncMock()
+            pubsub.aclose = AsyncMock()
+            pubsub.listen = listen
+            pubsubs.append(pubsub)
+        redis = MagicMock()
+        redis.pubsub.side_effect = pubsubs
+
+        with patch("shared.redis_client.get_redis", AsyncMock(return_value=redis)):
+            await manager._redis_listener()
+
+        for pubsub in pubsubs:
+            pubsub.unsubscribe.assert_awaited_once_with()
+            pubsub.aclose.assert_awaited_once()
+        assert manager._pubsub is None
+
+
+class _FakeLogRedis:
+    """Redis stand-in running EVENT_LOG_SCRIPT's steps in Python."""
+
+    def __init__(self):
+        self.seqs = {}
+        self.streams = {}
+        self.published = []
+
+    async def eval(self, script, numkeys, log_key, seq_key, raw, maxlen, ttl, channel):
+        assert script == em.EVENT_LOG_SCRIPT and numkeys == 2
+        seq = self.seqs[seq_key] = self.seqs.get(seq_key, 0) + 1
+        stream = self.streams.setdefault(log_key, [])
+        if seq == 1 and stream:
+            seq = self.seqs[seq_key] = int(stream[-1][0].split("-")[0]) + 1
+        payload = '{"seq": %d, ' % seq + raw[1:]
+        stream.append((f"{seq}-0", {"event": payload}))
+        del stream[:-maxlen]
+        self.published.append((channel, payload))
+        return seq
+
+    async def publish(self, channel, payload):
+        self.published.append((channel, payload))
+
+    async def get(self, key):
+        return str(self.seqs[key]) if key in self.seqs else None
+
+    async def xrange(self, key, min, max, count):
+        low = int(min.split("-")[0])
+        entries = [e for e in self.streams.get(key, []) if int(e[0].split("-")[0]) >= low]
+        return entries[:count]
+
+
+class TestEventLog:
+
+    @pytest.fixture
+    def redis(self, manager):
+        redis = _FakeLogRedis()
+        with patch("shared.redis_client.get_redis", AsyncMock(return_value=redis)):
+            yield redis
+
+    async def _publish(self, manager, count, user_id="alice", **data):
+        for i in range(count):
+            await manager.publish(EventType.POSITION_OPENED, {"n": i, **data}, user_id=user_id)
+
+    @pytest.mark.asyncio
+    async def test_user_events_logged_with_seq(self, manager, redis):
+        await self._publish(manager, 2)
+        await manager.publish(EventType.RATE_UPDATE, {"sol": 0.1})
+
+        channel, payload = redis.published[1]
+        event = Event.from_json(payload)
+        assert channel == EVENTS_USER_CHANNEL_PREFIX + "alice"
+        assert event.seq == 2 and event.data == {"n": 1}
+        assert event.to_sse() == f"id: 2\ndata: {payload}\n\n"
+        # Broadcasts are not logged and carry no id
+        assert redis.published[2][0] == EVENTS_BROADCAST_CHANNEL
+        assert Event.from_json(redis.published[2][1]).seq is None
+        assert await manager.current_seq("alice") == 2
+
+    @pytest.mark.asyncio
+    async def test_seq_resumes_after_log_when_seq_key_lost(self, manager, redis):
+        await self._publish(manager, 3)
+        redis.seqs.clear()  # e.g. evicted while the stream survived
+
+        await self._publish(manager, 1)
+
+        assert Event.from_json(redis.published[-1][1]).seq == 4
+        assert [e.seq for e in await manager.replay("alice", 2)] == [3, 4]
+
+    @pytest.mark.asyncio
+    async def test_replay_returns_only_missed_events(self, manager, redis):
+        await self._publish(manager, 5)
+
+        missed = await manager.replay("alice", 3)
+
+        assert [e.seq for e in missed] == [4, 5]
+        assert await manager.replay("alice", 5) == []
+
+    @pytest.mark.asyncio
+    async def test_replay_filters_positions(self, manager, redis):
+        await self._publish(manager, 1, position_id="p1")
+        await self._publish(manager, 1, position_id="p2")
+
+        missed = await manager.replay("alice", 0, position_ids=["p2"])
+
+        assert [e.seq for e in missed] == [2]
+
+    @pytest.mark.asyncio
+    async def test_replay_needs_snapshot_when_gap_unrecoverable(self, manager, redis):
+        with patch.object(em, "EVENT_LOG_MAXLEN", 3):
+            await self._publish(manager, 6)
+
+        assert await manager.replay("alice", 1) is None  # Trimmed
+        assert await manager.replay("alice", 4) is not None
+        assert await manager.replay("alice", 99) is None  # Log reset since
+        with patch.object(em, "REPLAY_MAX", 1):
+            assert await manager.replay("alice", 4) is None  # Too far behind
+
+    @pytest.mark.asyncio
+    async def test_catch_up_falls_back_to_snapshot(self, manager, redis):
+        await self._publish(manager, 3)
+        position = MagicMock(position_id="p1")
+        position.model_dump.return_value = {"position_id": "p1"}
+
+        with patch(
+            "backend.dashboard.api.positions._list_positions_from_db",
+            AsyncMock(return_value=[position]),
+        ):
+            replayed = await events_api._catch_up("alice", 1, MagicMock(), [])
+            snapshot = await events_api._catch_up("alice", 99, MagicMock(), [])
+
+        assert [e.seq for e in replayed] == [2, 3]
+        assert len(snapshot) == 1
+        assert snapshot[0].type == EventType.SNAPSHOT
+        assert snapshot[0].seq == 3
+        assert snapshot[0].data == {"positions": [{"position_id": "p1"}]}
+        assert snapshot[0].to_sse().startswith("id: 3\n")
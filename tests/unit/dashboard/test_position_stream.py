@@ -0,0 +1,193 @@
+"""
+Tests for the coalescing, delta-compressed position stream.
+
+These tests verify:
+- Updates for one position within the window merge into one frame
+- Clients get a keyframe first, then only changed fields as deltas
+- Keyframes repeat on the configured interval; unchanged state sends nothing
+- The SSE loop waits on events and window deadlines, not a fixed poll
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.dashboard.api.events import _stream
+from backend.dashboard.events_manager import Event, EventType, Subscription
+from backend.dashboard.position_stream import PositionStreamCoalescer, diff_ops
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _update(position_id="p1", seq=None, **fields):
+    return Event(
+        type=EventType.POSITION_UPDATE,
+        data={"position_id": position_id, **fields},
+        timestamp="2026-01-01T00:00:00",
+        seq=seq,
+    )
+
+
+class TestCoalescer:
+
+    def test_updates_merge_within_window(self):
+        clock = _Clock()
+        coalescer = PositionStreamCoalescer(window=1.0, clock=clock)
+
+        assert coalescer.add(_update(pnl=1, hf=1.5, seq=1))
+        assert coalescer.add(_update(pnl=2, seq=2))
+        assert coalescer.flush() == []
+        assert coalescer.next_flush_in() == 1.0
+
+        clock.now += 1.0
+        frames = coalescer.flush()
+
+        assert len(frames) == 1
+        assert frames[0].type == EventType.POSITION_UPDATE
+        assert frames[0].data == {"position_id": "p1", "pnl": 2, "hf": 1.5}
+        assert frames[0].seq == 2
+        assert coalescer.merged == 1
+
+    def test_deltas_after_keyframe(self):
+        clock = _Clock()
+        coalescer = PositionStreamCoalescer(window=0, keyframe_interval=60, clock=clock)
+        coalescer.add(_update(pnl=1, hf=1.5))
+        coalescer.flush()
+
+        coalescer.add(_update(pnl=3, hf=1.5))
+        (frame,) = coalescer.flush()
+
+        assert frame.type == EventType.POSITION_DELTA
+        assert frame.data == {
+            "position_id": "p1",
+            "ops": [{"op": "replace", "path": "/pnl", "value": 3}],
+        }
+
+    def test_unchanged_state_sends_nothing(self):
+        coalescer = PositionStreamCoalescer(window=0, clock=_Clock())
+        coalescer.add(_update(pnl=1))
+        coalescer.flush()
+
+        coalescer.add(_update(pnl=1))
+
+        assert coalescer.flush() == []
+        assert coalescer.unchanged == 1
+
+    def test_periodic_keyframe(self):
+        clock = _Clock()
+        coalescer = PositionStreamCoalescer(window=0, keyframe_interval=60, clock=clock)
+        coalescer.add(_update(pnl=1, hf=1.5))
+        coalescer.flush()
+
+        clock.now += 60
+        coalescer.add(_update(pnl=2))
+        (frame,) = coalescer.flush()
+
+        assert frame.type == EventType.POSITION_UPDATE
+        assert frame.data == {"position_id": "p1", "pnl": 2, "hf": 1.5}
+        assert coalescer.keyframes == 2
+
+    def test_other_events_pass_through(self):
+        coalescer = PositionStreamCoalescer()
+
+        assert coalescer.add(Event(EventType.POSITION_CLOSED, {"position_id": "p1"}, "t")) is False
+        assert coalescer.add(Event(EventType.POSITION_UPDATE, {"pnl": 1}, "t")) is False
+
+    def test_diff_ops(self):
+        assert diff_ops({"a": 1, "b": 2}, {"a": 1, "b": 3, "c": 4}) == [
+            {"op": "replace", "path": "/b", "value": 3},
+            {"op": "add", "path": "/c", "value": 4},
+        ]
+        assert diff_ops({"a": 1}, {}) == [{"op": "remove", "path": "/a"}]
+
+
+def _payloads(chunks):
+    return [json.loads(c.split("data: ", 1)[1]) for c in chunks if "data: " in c]
+
+
+class TestStreamLoop:
+
+    @staticmethod
+    async def _collect(subscription, coalescer, count, backlog=(), last_seq=0, connected=False):
+        request = MagicMock()
+        request.is_disconnected = AsyncMock(return_value=False)
+        stream = _stream(
+            request, subscription, coalescer, "alice", MagicMock(), [], last_seq, list(backlog),
+        )
+        chunks = []
+        try:
+            async for chunk in stream:
+                if not connected and '"type": "connected"' in chunk:
+                    continue
+                chunks.append(chunk)
+                if len(chunks) == count:
+                    break
+        finally:
+            await stream.aclose()
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_updates_coalesced_then_delta(self):
+        subscription = Subscription("s", "alice", set())
+        coalescer = PositionStreamCoalescer(window=0.05, keyframe_interval=60)
+        for seq, pnl in enumerate([1, 2, 3], start=1):
+            subscription.offer(_update(seq=seq, pnl=pnl, hf=1.5))
+
+        async def later():
+            await asyncio.sleep(0.1)
+            subscription.offer(_update(seq=4, pnl=4, hf=1.5))
+
+        task = asyncio.ensure_future(later())
+        chunks = await asyncio.wait_for(self._collect(subscription, coalescer, 2), 2)
+        await task
+
+        keyframe, delta = _payloads(chunks)
+        assert keyframe["type"] == "position_update" and keyframe["data"]["pnl"] == 3
+        assert delta["type"] == "position_delta"
+        assert delta["data"]["ops"] == [{"op": "replace", "path": "/pnl", "value": 4}]
+        assert chunks[0].startswith("id: 3\n") and chunks[1].startswith("id: 4\n")
+
+    @pytest.mark.asyncio
+    async def test_held_update_flushed_before_next_user_event(self):
+        subscription = Subscription("s", "alice", set())
+        coalescer = PositionStreamCoalescer(window=60)
+        subscription.offer(_update(seq=1, pnl=1))
+        subscription.offer(Event(EventType.POSITION_CLOSED, {"position_id": "p1"}, "t", seq=2))
+
+        chunks = await asyncio.wait_for(self._collect(subscription, coalescer, 2), 2)
+
+        assert [p["seq"] for p in _payloads(chunks)] == [1, 2]
+        assert coalescer._frames == {}
+
+    @pytest.mark.asyncio
+    async def test_replayed_events_deduplicated(self):
+        subscription = Subscription("s", "alice", set())
+        coalescer = PositionStreamCoalescer()
+        opened = Event(EventType.POSITION_OPENED, {"position_id": "p1"}, "t", seq=5)
+        subscription.offer(opened)
+        subscription.offer(Event(EventType.POSITION_OPENED, {"position_id": "p2"}, "t", seq=6))
+
+        chunks = await asyncio.wait_for(
+            self._collect(subscription, coalescer, 2, backlog=[opened], last_seq=4), 2,
+        )
+
+        assert [p["seq"] for p in _payloads(chunks)] == [5, 6]
+
+    @pytest.mark.asyncio
+    async def test_stream_opens_with_resume_point(self):
+        subscription = Subscription("s", "alice", set())
+        coalescer = PositionStreamCoalescer()
+
+        chunks = await asyncio.wait_for(
+            self._collect(subscription, coalescer, 1, last_seq=7, connected=True), 2,
+        )
+
+        assert chunks[0].startswith("id: 7\n")
+        assert _payloads(chunks)[0]["type"] == "connected"
@@ -50,20 +50,29 @@ class TestCheckAndFund:
             f._w3.to_checksum_address = lambda addr: addr
             return f
 
-    @pytest.mark.asyncio
-    async def test_funds_low_balance_user(self, funder):
-        """Should send ETH to user with low balance."""
+    @staticmethod
+    def _db(*addresses):
         db = MagicMock()
-        db.fetch = AsyncMock(return_value=[
-            {"id": "user1", "server_evm_address": "0xUser1"},
+        db.fetchall = AsyncMock(return_value=[
+            {"id": f"user{i}", "server_evm_address": address}
+            for i, address in enumerate(addresses, 1)
         ])
+        return db
 
-        # Mock get_balance and get_funder_balance
-        funder.get_funder_balance = AsyncMock(side_effect=[
-            Decimal("1.0"),    # initial check
-            Decimal("0.995"),  # recheck before send
-        ])
-        funder.get_balance = AsyncMock(return_value=Decimal("0.001"))  # user below threshold
+    @staticmethod
+    def _balances(funder, funder_eth, **users):
+        """One Multicall3 sweep answering the funder and every user."""
+        balances = {funder.funder_address: Decimal(funder_eth)}
+        balances.update({address: Decimal(eth) for address, eth in users.items()})
+        return AsyncMock(return_value=balances)
+
+    @pytest.mark.asyncio
+    async def test_funds_low_balance_user(self, funder):
+        """Should send ETH to user with low balance."""
+        db = self._db("0xUser1")
+        funder.get_balances = self._balances(funder, "1.0", **{"0xUser1": "0.001"})
+        funder.get_balance = AsyncMock()
+        funder.get_funder_balance = AsyncMock()
         funder.send_eth = AsyncMock(return_value="0xtxhash")
 
         result = await funder.check_and_fund_users(db)
@@ -72,17 +81,15 @@ class TestCheckAndFund:
         assert result["funded"] == 1
         assert result["errors"] == 0
         funder.send_eth.assert_called_once_with("0xUser1", Decimal("0.005"))
+        funder.get_balances.assert_awaited_once_with([funder.funder_address, "0xUser1"])
+        funder.get_balance.assert_not_called()
+        funder.get_funder_balance.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_skips_sufficient_balance_user(self, funder):
         """Should not send ETH to user with sufficient balance."""
-        db = MagicMock()
-        db.fetch = AsyncMock(return_value=[
-            {"id": "user1", "server_evm_address": "0xUser1"},
-        ])
-
-        funder.get_funder_balance = AsyncMock(return_value=Decimal("1.0"))
-        funder.get_balance = AsyncMock(return_value=Decimal("0.01"))  # above threshold
+        db = self._db("0xUser1")
+        funder.get_balances = self._balances(funder, "1.0", **{"0xUser1": "0.01"})
         funder.send_eth = AsyncMock()
 
         result = await funder.check_and_fund_users(db)
@@ -94,33 +101,70 @@ class TestCheckAndFund:
     @pytest.mark.asyncio
     async def test_stops_when_funder_low(self, funder):
         """Should stop funding when funder balance is too low."""
-        db = MagicMock()
-        db.fetch = AsyncMock(return_value=[
-            {"id": "user1", "server_evm_address": "0xUser1"},
-        ])
-
-        funder.get_funder_balance = AsyncMock(return_value=Decimal("0.001"))
+        db = self._db("0xUser1")
+        funder.get_balances = self._balances(funder, "0.001", **{"0xUser1": "0.001"})
 
         result = await funder.check_and_fund_users(db)
 
         assert result["error"] == "funder low balance"
         assert result["funded"] == 0
 
+    @pytest.mark.asyncio
+    async def test_funder_balance_tracked_across_top_ups(self, funder):
+        """Top-ups spend the locally tracked funder balance; no re-reads."""
+        db = self._db("0xUser1", "0xUser2", "0xUser3")
+        funder.get_balances = self._balances(
+            funder, "0.012", **{"0xUser1": "0", "0xUser2": "0", "0xUser3": "0"}
+        )
+        funder.send_eth = AsyncMock(return_value="0xtxhash")
+
+        result = await funder.check_and_fund_users(db)
+
+        # 0.012 -> 0.007 -> 0.002: the third top-up would breach the gas margin
+        assert result["funded"] == 2
+        assert [c.args[0] for c in funder.send_eth.call_args_list] == ["0xUser1", "0xUser2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_sub_call_falls_back_to_single_read(self, funder):
+        db = self._db("0xUser1")
+        funder.get_balances = AsyncMock(return_value={
+            funder.funder_address: Decimal("1.0"), "0xUser1": None,
+        })
+        funder.get_balance = AsyncMock(return_value=Decimal("0.01"))
+        funder.send_eth = AsyncMock()
+
+        result = await funder.check_and_fund_users(db)
+
+        assert result["funded"] == 0
+        funder.get_balance.assert_awaited_once_with("0xUser1")
+
+    @pytest.mark.asyncio
+    async def test_sweep_failure_falls_back_to_single_reads(self, funder):
+        """A failed sweep (or bad address) only fails that user's top-up."""
+        db = self._db("0xUser1", "bad")
+        funder.get_balances = AsyncMock(side_effect=Exception("multicall reverted"))
+        funder.get_funder_balance = AsyncMock(return_value=Decimal("1.0"))
+
+        async def get_balance(address):
+            if address == "bad":
+                raise ValueError("invalid address")
+            return Decimal("0.001")
+
+        funder.get_balance = AsyncMock(side_effect=get_balance)
+        funder.send_eth = AsyncMock(return_value="0xtxhash")
+
+        result = await funder.check_and_fund_users(db)
+
+        assert result == {"checked": 2, "funded": 1, "errors": 1}
+        funder.send_eth.assert_called_once_with("0xUser1", Decimal("0.005"))
+
     @pytest.mark.asyncio
     async def test_handles_send_error(self, funder):
         """Should continue after individual send failures."""
-        db = MagicMock()
-        db.fetch = AsyncMock(return_value=[
-            {"id": "user1", "server_evm_address": "0xUser1"},
-            {"id": "user2", "server_evm_address": "0xUser2"},
-        ])
-
-        funder.get_funder_balance = AsyncMock(side_effect=[
-            Decimal("1.0"),    # initial
-            Decimal("0.995"),  # recheck before user1
-            Decimal("0.990"),  # recheck before user2
-        ])
-        funder.get_balance = AsyncMock(return_value=Decimal("0.001"))
+        db = self._db("0xUser1", "0xUser2")
+        funder.get_balances = self._balances(
+            funder, "1.0", **{"0xUser1": "0.001", "0xUser2": "0.001"}
+        )
         funder.send_eth = AsyncMock(side_effect=Exception("tx failed"))
 
         result = await funder.check_and_fund_users(db)
@@ -130,10 +174,8 @@ class TestCheckAndFund:
     @pytest.mark.asyncio
     async def test_no_users(self, funder):
         """Should handle empty user list."""
-        db = MagicMock()
-        db.fetch = AsyncMock(return_value=[])
-
-        funder.get_funder_balance = AsyncMock(return_value=Decimal("1.0"))
+        db = self._db()
+        funder.get_balances = self._balances(funder, "1.0")
 
         result = await funder.check_and_fund_users(db)
 
@@ -152,11 +152,11 @@ class TestSignTransaction:
             builder = AsgardTransactionBuilder()
             builder.state_machine = MagicMock()
 
-            # Mock privy signer — sign_solana_transaction returns base64-encoded signed tx
+            # Mock privy signer — sign_solana_transaction_async returns base64-encoded signed tx
             import base64
             signed_tx_b64 = base64.b64encode(b"signed_tx_bytes").decode()
             mock_signer = MagicMock()
-            mock_signer.sign_solana_transaction = MagicMock(
+            mock_signer.sign_solana_transaction_async = AsyncMock(
                 return_value=signed_tx_b64
             )
             builder._privy_signer = mock_signer
@@ -188,7 +188,7 @@ class TestSignTransaction:
         )
 
         # Verify the signer was called with base64-encoded transaction
-        mock_builder._privy_signer.sign_solana_transaction.assert_called_once_with(
+        mock_builder._privy_signer.sign_solana_transaction_async.assert_awaited_once_with(
             base64.b64encode(b"test_tx").decode()
         )
 
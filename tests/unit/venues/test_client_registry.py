@@ -0,0 +1,152 @@
+"""Tests for the process-wide venue client registry and shared HTTP pools."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.venues.client_registry import PoolConfig, VenueClientRegistry
+from bot.venues.user_context import UserTradingContext
+from shared.utils.http_pool import HttpConnectionPool
+
+
+class TestHttpConnectionPool:
+
+    @pytest.mark.asyncio
+    async def test_connector_created_lazily_with_limits(self):
+        pool = HttpConnectionPool("test", limit=10, limit_per_host=4, dns_ttl=60)
+        connector = pool.connector()
+        try:
+            assert connector.limit == 10
+            assert connector.limit_per_host == 4
+            assert pool.connector() is connector
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connector_recreated_after_close(self):
+        pool = HttpConnectionPool("test")
+        first = pool.connector()
+        await pool.close()
+        assert first.closed
+
+        second = pool.connector()
+        try:
+            assert second is not first
+            assert not second.closed
+        finally:
+            await pool.close()
+
+
+class TestHyperliquidFacades:
+
+    @pytest.mark.asyncio
+    async def test_facades_share_one_connector(self):
+        registry = VenueClientRegistry()
+        a = registry.hyperliquid_client()
+        b = registry.hyperliquid_client()
+        try:
+            await a._init_session()
+            await b._init_session()
+            assert a is not b
+            assert a._session.connector is b._session.connector
+        finally:
+            await a.close()
+            await b.close()
+            await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_closing_facade_keeps_pool_open(self):
+        registry = VenueClientRegistry()
+        client = registry.hyperliquid_client()
+        await client._init_session()
+        connector = client._session.connector
+
+        await client.close()
+
+        assert client._session.closed
+        assert not connector.closed
+        await registry.close()
+        assert connector.closed
+
+    @pytest.mark.asyncio
+    async def test_pool_overrides(self):
+        registry = VenueClientRegistry(pools={"hyperliquid": PoolConfig(limit=5, limit_per_host=5)})
+        try:
+            assert registry.pools["hyperliquid"].limit == 5
+            assert registry.pools["asgard"].limit == VenueClientRegistry.DEFAULT_POOLS["asgard"].limit
+        finally:
+            await registry.close()
+
+    @pytest.mark.asyncio
+    async def test_asgard_facade_uses_asgard_pool(self):
+        registry = VenueClientRegistry()
+        client = registry.asgard_client()
+        try:
+            await client._init_session()
+            assert client._session.connector is registry.pools["asgard"].connector()
+        finally:
+            await client.close()
+            await registry.close()
+
+
+class TestRpcTransports:
+
+    @pytest.mark.asyncio
+    async def test_solana_facades_share_transport(self):
+        registry = VenueClientRegistry()
+        a = registry.solana_client()
+        b = registry.solana_client()
+
+        assert a is not b
+        assert a.client is b.client
+
+        a.client.close = AsyncMock()
+        await a.close()
+        a.client.close.assert_not_called()
+
+        await registry.close()
+        a.client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_replaced_confirmer_is_closed(self):
+        registry = VenueClientRegistry()
+        old = registry.solana_client().confirmer
+        old.close = AsyncMock()
+
+        # Transport recreated (e.g. on a new event loop)
+        registry._transports.pop("solana")
+        new = registry.solana_client().confirmer
+
+        assert new is not old
+        await registry.close()
+        old.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_arbitrum_facades_share_transport(self):
+        registry = VenueClientRegistry()
+        a = registry.arbitrum_client()
+        b = registry.arbitrum_client()
+
+        assert a.w3 is b.w3
+
+        a.w3.provider.disconnect = AsyncMock()
+        await a.close()
+        a.w3.provider.disconnect.assert_not_called()
+
+        await registry.close()
+        a.w3.provider.disconnect.assert_awaited_once()
+
+
+class TestUserTradingContextUsesRegistry:
+
+    def test_clients_come_from_registry(self):
+        registry = MagicMock()
+        ctx = UserTradingContext(
+            user_id="u1", solana_address="SoL", evm_address="0xabc", clients=registry,
+        )
+
+        assert ctx.get_hl_client() is registry.hyperliquid_client.return_value
+        assert ctx.get_arb_client() is registry.arbitrum_client.return_value
+        assert ctx.get_sol_client() is registry.solana_client.return_value
+        # Cached per context
+        ctx.get_hl_client()
+        assert registry.hyperliquid_client.call_count == 1
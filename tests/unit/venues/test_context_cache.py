@@ -0,0 +1,167 @@
+"""Tests for the per-user trading context cache."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.venues.context_cache import UserContextCache
+from bot.venues.user_context import UserTradingContext
+
+
+def _user_row(user_id, evm="0xabc", sol="SoLAddr", evm_wid="evm_wid", sol_wid="sol_wid"):
+    return {
+        "id": user_id,
+        "solana_address": None,
+        "evm_address": None,
+        "server_evm_wallet_id": evm_wid,
+        "server_evm_address": evm,
+        "server_solana_wallet_id": sol_wid,
+        "server_solana_address": sol,
+    }
+
+
+def _make_cache(rows=None, **kwargs):
+    db = MagicMock()
+    db.fetchall = AsyncMock(return_value=rows or [])
+    built = []
+
+    async def factory(user_id):
+        ctx = UserTradingContext(
+            user_id=user_id,
+            solana_address="SoLAddr",
+            evm_address="0xabc",
+            evm_wallet_id="evm_wid",
+            solana_wallet_id="sol_wid",
+            clients=MagicMock(),
+        )
+        ctx.close = AsyncMock()
+        built.append(ctx)
+        return ctx
+
+    return UserContextCache(db, factory=factory, **kwargs), db, built
+
+
+class TestGet:
+
+    @pytest.mark.asyncio
+    async def test_hit_reuses_context(self):
+        cache, _, built = _make_cache()
+
+        first = await cache.get("u1")
+        second = await cache.get("u1")
+
+        assert first is second
+        assert len(built) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_build_once(self):
+        cache, _, built = _make_cache()
+
+        results = await asyncio.gather(*(cache.get("u1") for _ in range(5)))
+
+        assert all(r is results[0] for r in results)
+        assert len(built) == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        cache, _, built = _make_cache(max_size=2)
+
+        await cache.get("u1")
+        await cache.get("u2")
+        await cache.get("u1")  # u2 is now least recently used
+        await cache.get("u3")
+
+        assert "u1" in cache
+        assert "u2" not in cache
+        assert "u3" in cache
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_rebuilds(self):
+        cache, _, built = _make_cache(ttl=0.01)
+
+        first = await cache.get("u1")
+        await asyncio.sleep(0.02)
+        second = await cache.get("u1")
+
+        assert first is not second
+        assert len(built) == 2
+
+    @pytest.mark.asyncio
+    async def test_factory_error_not_cached(self):
+        db = MagicMock()
+        factory = AsyncMock(side_effect=ValueError("User not found: u1"))
+        cache = UserContextCache(db, factory=factory)
+
+        with pytest.raises(ValueError):
+            await cache.get("u1")
+        assert "u1" not in cache
+
+
+class TestValidate:
+
+    @pytest.mark.asyncio
+    async def test_unchanged_wallets_keep_context(self):
+        cache, db, built = _make_cache(rows=[_user_row("u1")])
+        ctx = await cache.get("u1")
+
+        evicted = await cache.validate(["u1"])
+
+        assert evicted == 0
+        assert await cache.get("u1") is ctx
+        db.fetchall.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_changed_wallet_evicts_and_closes(self):
+        cache, db, built = _make_cache(rows=[_user_row("u1", evm_wid="new_wid")])
+        old = await cache.get("u1")
+
+        assert await cache.validate(["u1"]) == 1
+        new = await cache.get("u1")
+        assert new is not old
+
+        # Retired context is closed at the next validate, not while in use
+        old.close.assert_not_called()
+        await cache.validate([])
+        old.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_deleted_user_evicted(self):
+        cache, _, _ = _make_cache(rows=[])
+        await cache.get("u1")
+
+        assert await cache.validate(["u1"]) == 1
+        assert "u1" not in cache
+
+    @pytest.mark.asyncio
+    async def test_skips_query_when_nothing_cached(self):
+        cache, db, _ = _make_cache()
+
+        assert await cache.validate(["u1", "u2"]) == 0
+        db.fetchall.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_query_failure_keeps_contexts(self):
+        cache, db, _ = _make_cache()
+        ctx = await cache.get("u1")
+        db.fetchall = AsyncMock(side_effect=Exception("db down"))
+
+        assert await cache.validate(["u1"]) == 0
+        assert await cache.get("u1") is ctx
+
+
+class TestClose:
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_contexts(self):
+        cache, _, built = _make_cache()
+        await cache.get("u1")
+        await cache.get("u2")
+
+        await cache.close()
+
+        assert len(cache) == 0
+        for ctx in built:
+            ctx.close.assert_awaited_once()
@@ -0,0 +1,257 @@
+"""
+Tests for the Hyperliquid clearinghouse-state batcher.
+
+These tests verify:
+- One request per wallet per cycle (dedupe of concurrent and repeat reads)
+- Concurrent multi-wallet prefetch under a concurrency cap
+- Failures are not cached
+- Trader account-state reads share one response
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.venues.hyperliquid.clearinghouse import ClearinghouseBatcher
+from bot.venues.hyperliquid.trader import HyperliquidTrader
+
+WALLET_A = "0x" + "a" * 40
+WALLET_B = "0x" + "b" * 40
+
+
+def _state(coin="SOL", szi="-10.0", withdrawable="500.0", account_value="1000.0"):
+    """Create a fake clearinghouseState response."""
+    return {
+        "assetPositions": [{
+            "position": {
+                "coin": coin,
+                "szi": szi,
+                "entryPx": "150.0",
+                "leverage": {"value": 3},
+                "marginUsed": "500.0",
+                "marginFraction": "0.2",
+                "unrealizedPnl": "12.5",
+                "liquidationPx": "190.0",
+            },
+        }],
+        "crossMarginSummary": {"accountValue": account_value, "totalMarginUsed": "500.0"},
+        "withdrawable": withdrawable,
+    }
+
+
+def _make_client(delay=0.0):
+    """Create a mock HyperliquidClient whose state fetch can be slow."""
+    client = MagicMock()
+
+    async def fetch(wallet):
+        await asyncio.sleep(delay)
+        return _state()
+
+    client.get_clearinghouse_state = AsyncMock(side_effect=fetch)
+    return client
+
+
+class TestClearinghouseBatcher:
+    """Tests for per-cycle caching and coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_request(self):
+        """Test that concurrent reads for one wallet issue a single request."""
+        client = _make_client(delay=0.02)
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        results = await asyncio.gather(*(batcher.get(WALLET_A) for _ in range(5)))
+
+        assert client.get_clearinghouse_state.await_count == 1
+        assert all(r is results[0] for r in results)
+        assert batcher.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_wallet_key_is_case_insensitive(self):
+        """Test that checksummed and lowercase addresses share a cache entry."""
+        client = _make_client()
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        await batcher.get(WALLET_A)
+        await batcher.get(WALLET_A.upper().replace("0X", "0x"))
+
+        assert client.get_clearinghouse_state.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_starts_new_cycle(self):
+        """Test that reset forces a fresh fetch."""
+        client = _make_client()
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        await batcher.get(WALLET_A)
+        batcher.reset()
+        await batcher.get(WALLET_A)
+
+        assert client.get_clearinghouse_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        """Test that a failed fetch is retried on the next read."""
+        client = MagicMock()
+        client.get_clearinghouse_state = AsyncMock(
+            side_effect=[RuntimeError("429"), _state()]
+        )
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        with pytest.raises(RuntimeError):
+            await batcher.get(WALLET_A)
+        state = await batcher.get(WALLET_A)
+
+        assert state["withdrawable"] == "500.0"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_inflight_fetch(self):
+        """A fetch started before invalidate() must not restore pre-order state."""
+        client = MagicMock()
+        release = asyncio.Event()
+        states = [_state(szi="-10.0"), _state(szi="-20.0")]
+
+        async def fetch(wallet):
+            state = states.pop(0)
+            if state["assetPositions"][0]["position"]["szi"] == "-10.0":
+                await release.wait()
+            return state
+
+        client.get_clearinghouse_state = AsyncMock(side_effect=fetch)
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        stale = asyncio.ensure_future(batcher.get(WALLET_A))
+        await asyncio.sleep(0.01)
+        batcher.invalidate(WALLET_A)
+        release.set()
+
+        assert (await stale)["assetPositions"][0]["position"]["szi"] == "-10.0"
+        fresh = await batcher.get(WALLET_A)
+        assert fresh["assetPositions"][0]["position"]["szi"] == "-20.0"
+        assert (await batcher.get(WALLET_A)) is fresh
+        assert client.get_clearinghouse_state.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reset_discards_previous_cycle_fetch(self):
+        """A fetch from the previous cycle is not served in the next one."""
+        client = MagicMock()
+        release = asyncio.Event()
+        states = [_state(szi="-10.0"), _state(szi="-20.0")]
+
+        async def fetch(wallet):
+            state = states.pop(0)
+            if state["assetPositions"][0]["position"]["szi"] == "-10.0":
+                await release.wait()
+            return state
+
+        client.get_clearinghouse_state = AsyncMock(side_effect=fetch)
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        stale = asyncio.ensure_future(batcher.get(WALLET_A))
+        await asyncio.sleep(0.01)
+        batcher.reset()
+        fresh = asyncio.ensure_future(batcher.get(WALLET_A))
+        release.set()
+
+        assert (await stale)["assetPositions"][0]["position"]["szi"] == "-10.0"
+        assert (await fresh)["assetPositions"][0]["position"]["szi"] == "-20.0"
+        assert (await batcher.get(WALLET_A)) is await fresh
+
+    def test_default_client_from_registry(self):
+        """Test that the batcher uses the pooled registry client."""
+        from unittest.mock import patch
+
+        registry = MagicMock()
+        with patch(
+            "bot.venues.client_registry.get_client_registry", return_value=registry,
+        ):
+            batcher = ClearinghouseBatcher()
+
+        assert batcher.client is registry.hyperliquid_client.return_value
+
+    @pytest.mark.asyncio
+    async def test_prefetch_bounded_concurrency(self):
+        """Test that prefetch fans out across wallets under the cap."""
+        in_flight = 0
+        peak = 0
+
+        async def fetch(wallet):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _state()
+
+        client = MagicMock()
+        client.get_clearinghouse_state = AsyncMock(side_effect=fetch)
+        batcher = ClearinghouseBatcher(client, max_concurrency=2, rate_limit_rps=1000)
+        wallets = [f"0x{i:040x}" for i in range(6)]
+
+        states = await batcher.prefetch(wallets + wallets[:2])
+
+        assert len(states) == 6
+        assert client.get_clearinghouse_state.await_count == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_prefetch_omits_failures(self):
+        """Test that one failing wallet does not fail the prefetch."""
+        async def fetch(wallet):
+            if wallet == WALLET_B:
+                raise RuntimeError("boom")
+            return _state()
+
+        client = MagicMock()
+        client.get_clearinghouse_state = AsyncMock(side_effect=fetch)
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+
+        states = await batcher.prefetch([WALLET_A, WALLET_B])
+
+        assert list(states) == [WALLET_A]
+
+
+class TestTraderWithBatcher:
+    """Tests for HyperliquidTrader reads through a shared batcher."""
+
+    @pytest.mark.asyncio
+    async def test_position_and_balances_share_one_response(self):
+        """Test that position, deposited and withdrawable reads cost one request."""
+        client = _make_client()
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+        trader = HyperliquidTrader(
+            client=client, wallet_address=WALLET_A, clearinghouse=batcher,
+        )
+
+        position = await trader.get_position("SOL")
+        deposited = await trader.get_deposited_balance()
+        withdrawable = await trader.get_withdrawable_balance()
+
+        assert position.size == -10.0
+        assert position.margin_fraction == 0.2
+        assert deposited == 1000.0
+        assert withdrawable == 500.0
+        assert client.get_clearinghouse_state.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_order_invalidates_cached_state(self):
+        """Test that submitting an order drops the wallet's cached state."""
+        client = _make_client()
+        client.exchange = AsyncMock(return_value={"status": "ok"})
+        batcher = ClearinghouseBatcher(client, rate_limit_rps=1000)
+        signer = MagicMock()
+        signer.sign_order = AsyncMock(return_value=MagicMock(
+            action={}, nonce=1, signature={},
+        ))
+        trader = HyperliquidTrader(
+            client=client, signer=signer, wallet_address=WALLET_A,
+            clearinghouse=batcher,
+        )
+        trader._resolve_asset_index = AsyncMock(return_value=5)
+        trader._get_current_price = AsyncMock(return_value=150.0)
+
+        await trader.get_position("SOL")
+        await trader._submit_order("SOL", is_buy=True, sz="10.0", reduce_only=True)
+        await trader.get_position("SOL")
+
+        assert client.get_clearinghouse_state.await_count == 2
@@ -91,7 +91,7 @@ def depositor(mock_arb_client, mock_hl_trader, mock_settings):
 
         # Mock the Privy wallet signer
         mock_privy = MagicMock()
-        mock_privy.sign_eth_transaction = MagicMock(return_value="0x0102")
+        mock_privy.sign_eth_transaction_async = AsyncMock(return_value="0x0102")
         dep._privy = mock_privy
 
         return dep
@@ -199,7 +199,7 @@ class TestHlCreditPolling:
             )
 
             mock_privy = MagicMock()
-            mock_privy.sign_eth_transaction = MagicMock(return_value="0x0102")
+            mock_privy.sign_eth_transaction_async = AsyncMock(return_value="0x0102")
             dep._privy = mock_privy
 
             usdc_contract = _mock_usdc_contract()
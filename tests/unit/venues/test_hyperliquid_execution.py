@@ -0,0 +1,119 @@
+"""Tests for Hyperliquid order execution helpers."""
+import pytest
+
+from bot.venues.hyperliquid.execution import (
+    FillLedger,
+    book_limit_price,
+    estimate_impact,
+    format_limit_px,
+    plan_slices,
+)
+
+BOOK = {"coin": "SOL", "levels": [
+    [{"px": "142.30", "sz": "5.0", "n": 2}, {"px": "142.20", "sz": "20.0", "n": 5}],
+    [{"px": "142.40", "sz": "5.0", "n": 2}, {"px": "142.50", "sz": "20.0", "n": 5}],
+]}
+
+
+class TestFillLedger:
+
+    def test_vwap_across_attempts(self):
+        ledger = FillLedger()
+        ledger.add_response_fill(1, 4.0, 100.0)
+        ledger.add_response_fill(2, 6.0, 101.0)
+
+        assert ledger.filled_sz == 10.0
+        assert ledger.avg_px == pytest.approx(100.6)
+        assert ledger.last_oid == 2
+
+    def test_empty_ledger(self):
+        ledger = FillLedger()
+
+        assert ledger.filled_sz == 0.0
+        assert ledger.avg_px is None
+
+    def test_stream_fills_deduplicated_and_response_wins(self):
+        ledger = FillLedger()
+        fill = {"oid": 7, "tid": 1, "px": "100.0", "sz": "2.0"}
+        ledger.add_stream_fills([fill, fill, {"oid": 7, "tid": 2, "px": "102.0", "sz": "2.0"}])
+
+        assert ledger.filled_sz == 4.0
+        assert ledger.avg_px == pytest.approx(101.0)
+
+        # The exchange response for the same order replaces its streamed fills
+        ledger.add_response_fill(7, 4.0, 101.5)
+        assert ledger.filled_sz == 4.0
+        assert ledger.avg_px == pytest.approx(101.5)
+
+
+class TestBookLimitPrice:
+
+    def test_sell_priced_at_covering_bid(self):
+        px = book_limit_price(BOOK, is_buy=False, size=10.0, ref_px=142.35, max_slippage=0.02)
+
+        assert px == pytest.approx(142.20 * 0.999)
+
+    def test_buy_within_top_level(self):
+        px = book_limit_price(BOOK, is_buy=True, size=3.0, ref_px=142.35, max_slippage=0.02)
+
+        assert px == pytest.approx(142.40 * 1.001)
+
+    def test_capped_at_max_slippage(self):
+        px = book_limit_price(BOOK, is_buy=True, size=3.0, ref_px=142.35, max_slippage=0.0001)
+
+        assert px == pytest.approx(142.35 * 1.0001)
+
+    def test_thin_book_uses_cap(self):
+        px = book_limit_price(BOOK, is_buy=False, size=100.0, ref_px=142.35, max_slippage=0.02)
+
+        assert px == pytest.approx(142.35 * 0.98)
+
+    def test_empty_side(self):
+        book = {"levels": [[], []]}
+
+        assert book_limit_price(book, True, 1.0, 100.0, 0.02) is None
+
+
+class TestFormatLimitPx:
+
+    def test_rounds_away_from_book(self):
+        assert format_limit_px(142.31, is_buy=True) == "142.4"
+        assert format_limit_px(142.39, is_buy=False) == "142.3"
+
+    def test_exact_tick_unchanged(self):
+        assert format_limit_px(142.3, is_buy=True) == "142.3"
+        assert format_limit_px(142.3, is_buy=False) == "142.3"
+
+
+class TestImpactAndSlicing:
+
+    def test_estimate_impact(self):
+        estimate = estimate_impact(BOOK, is_buy=False, size=10.0)
+
+        assert estimate.mid_px == pytest.approx(142.35)
+        assert estimate.avg_px == pytest.approx(142.25)
+        assert estimate.worst_px == 142.20
+        assert estimate.impact == pytest.approx(0.10 / 142.35)
+
+    def test_uncovered_size_has_infinite_impact(self):
+        estimate = estimate_impact(BOOK, is_buy=True, size=100.0)
+
+        assert estimate.covered is False
+        assert estimate.impact == float("inf")
+
+    def test_small_order_not_sliced(self):
+        plan = plan_slices(BOOK, is_buy=False, size=4.0, max_impact=0.001)
+
+        assert plan.slices == [4.0]
+
+    def test_large_order_sliced_to_depth_within_impact(self):
+        # Only the 142.30 bid (5.0) is within 5 bps of the 142.35 mid
+        plan = plan_slices(BOOK, is_buy=False, size=12.0, max_impact=0.0005)
+
+        assert plan.slices == pytest.approx([5.0, 5.0, 2.0])
+        assert plan.expected_impact < plan.single_impact
+
+    def test_min_slice_bounds_child_count(self):
+        plan = plan_slices(BOOK, is_buy=False, size=12.0, max_impact=0.0005, min_slice=6.0)
+
+        assert plan.slices == pytest.approx([6.0, 6.0])
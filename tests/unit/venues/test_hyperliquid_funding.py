@@ -10,6 +10,8 @@ These tests verify:
 """
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import time
+
 import pytest
 
 from bot.venues.hyperliquid.client import HyperliquidClient
@@ -20,6 +22,11 @@ from bot.venues.hyperliquid.funding_oracle import (
 )
 
 
+def _hours_ago(hours: float) -> int:
+    """Epoch ms timestamp ``hours`` before now (history is windowed to now)."""
+    return int(time.time() * 1000 - hours * 60 * 60 * 1000)
+
+
 class TestFundingOracleInit:
     """Tests for funding oracle initialization."""
     
@@ -97,8 +104,8 @@ class TestGetFundingHistory:
         """Test fetching funding history."""
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[
-            {"coin": "SOL", "fundingRate": -0.0001, "time": 1700000000000},
-            {"coin": "SOL", "fundingRate": -0.00008, "time": 1700028800000},
+            {"coin": "SOL", "fundingRate": -0.0001, "time": _hours_ago(10)},
+            {"coin": "SOL", "fundingRate": -0.00008, "time": _hours_ago(2)},
         ])
         
         oracle = HyperliquidFundingOracle(client=client)
@@ -114,7 +121,7 @@ class TestGetFundingHistory:
         """Test that caching works for funding history."""
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[
-            {"coin": "SOL", "fundingRate": -0.0001, "time": 1700000000000},
+            {"coin": "SOL", "fundingRate": -0.0001, "time": _hours_ago(10)},
         ])
         
         oracle = HyperliquidFundingOracle(client=client)
@@ -131,11 +138,13 @@ class TestGetFundingHistory:
     
     @pytest.mark.asyncio
     async def test_clear_cache(self):
-        """Test clearing the cache."""
+        """Test clearing an oracle's own cache."""
+        from bot.venues.hyperliquid.funding_cache import FundingHistoryCache
+
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[])
         
-        oracle = HyperliquidFundingOracle(client=client)
+        oracle = HyperliquidFundingOracle(client=client, history_cache=FundingHistoryCache())
         
         # Populate cache
         await oracle.get_funding_history("SOL", hours=24)
@@ -148,6 +157,18 @@ class TestGetFundingHistory:
         
         assert client.get_funding_history.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_clear_cache_keeps_shared_history(self):
+        """Test that one oracle clearing its cache doesn't wipe the shared history."""
+        client = MagicMock(spec=HyperliquidClient)
+        client.get_funding_history = AsyncMock(return_value=[])
+
+        await HyperliquidFundingOracle(client=client).get_funding_history("SOL", hours=24)
+        HyperliquidFundingOracle(client=client).clear_cache()
+        await HyperliquidFundingOracle(client=client).get_funding_history("SOL", hours=24)
+
+        client.get_funding_history.assert_called_once()
+
 
 class TestFundingRateProperties:
     """Tests for FundingRate dataclass properties."""
@@ -250,6 +271,29 @@ class TestPredictNextFunding:
             await oracle.predict_next_funding("SOL")
 
 
+    @pytest.mark.asyncio
+    async def test_predict_uses_streamed_ctx(self):
+        """A fresh streamed asset context replaces the REST request."""
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        client = MagicMock(spec=HyperliquidClient)
+        client.get_meta_and_asset_contexts = AsyncMock()
+        store = MarketDataStore()
+        store.on_message("activeAssetCtx", {"coin": "SOL", "ctx": {
+            "funding": "-0.00002", "markPx": "99.0", "oraclePx": "100.0", "premium": "-0.009",
+        }})
+        oracle = HyperliquidFundingOracle(
+            client=client, market_data=MarketDataFeed(ws=MagicMock(), store=store),
+        )
+
+        prediction = await oracle.predict_next_funding("SOL")
+        current = await oracle.get_current_funding_rate("SOL")
+
+        assert prediction.premium == -0.01
+        assert current.funding_rate == -0.00002
+        client.get_meta_and_asset_contexts.assert_not_called()
+
+
 class TestCalculateFundingVolatility:
     """Tests for volatility calculation."""
     
@@ -258,9 +302,9 @@ class TestCalculateFundingVolatility:
         """Test volatility calculation."""
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[
-            {"coin": "SOL", "fundingRate": -0.0001, "time": 1700000000000},
-            {"coin": "SOL", "fundingRate": -0.00012, "time": 1700028800000},
-            {"coin": "SOL", "fundingRate": -0.00008, "time": 1700057600000},
+            {"coin": "SOL", "fundingRate": -0.0001, "time": _hours_ago(10)},
+            {"coin": "SOL", "fundingRate": -0.00012, "time": _hours_ago(2)},
+            {"coin": "SOL", "fundingRate": -0.00008, "time": _hours_ago(1)},
         ])
         
         oracle = HyperliquidFundingOracle(client=client)
@@ -275,7 +319,7 @@ class TestCalculateFundingVolatility:
         """Test volatility with insufficient data."""
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[
-            {"coin": "SOL", "fundingRate": -0.0001, "time": 1700000000000},
+            {"coin": "SOL", "fundingRate": -0.0001, "time": _hours_ago(10)},
         ])
         
         oracle = HyperliquidFundingOracle(client=client)
@@ -290,8 +334,8 @@ class TestCalculateFundingVolatility:
         """Test volatility when mean is zero."""
         client = MagicMock(spec=HyperliquidClient)
         client.get_funding_history = AsyncMock(return_value=[
-            {"coin": "SOL", "fundingRate": 0.0, "time": 1700000000000},
-            {"coin": "SOL", "fundingRate": 0.0, "time": 1700028800000},
+            {"coin": "SOL", "fundingRate": 0.0, "time": _hours_ago(10)},
+            {"coin": "SOL", "fundingRate": 0.0, "time": _hours_ago(2)},
         ])
         
         oracle = HyperliquidFundingOracle(client=client)
@@ -0,0 +1,146 @@
+"""
+Tests for the shared Hyperliquid funding-history cache.
+
+These tests verify:
+- History is shared across oracle instances
+- Stale coins fetch only the tail since the last stored entry
+- Freshness within the hour and the minimum refresh interval
+- Postgres load/persist is used when a database is attached
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bot.venues.hyperliquid.funding_cache import (
+    HOUR_MS,
+    FundingHistoryCache,
+    get_funding_history_cache,
+)
+from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
+
+NOW_HOUR = 480_000  # arbitrary epoch hour
+NOW_MS = NOW_HOUR * HOUR_MS + 5 * 60 * 1000  # 5 minutes past the hour
+
+
+def _entries(start_hour, count, rate=-0.0001):
+    """Create fundingHistory entries, one per hour starting at start_hour."""
+    return [
+        {"coin": "SOL", "fundingRate": str(rate), "time": (start_hour + i) * HOUR_MS + 42}
+        for i in range(count)
+    ]
+
+
+def _make_client(entries):
+    """Create a mock client returning entries within the requested range."""
+    client = MagicMock()
+
+    async def get_funding_history(coin, start_ms, end_ms):
+        return [e for e in entries if start_ms <= e["time"] <= end_ms]
+
+    client.get_funding_history = AsyncMock(side_effect=get_funding_history)
+    return client
+
+
+class TestSharedCache:
+    """Tests for cross-instance sharing and tail-only refresh."""
+
+    @pytest.mark.asyncio
+    async def test_shared_across_oracle_instances(self):
+        """Test that a new oracle reuses history fetched by another."""
+        client = MagicMock()
+        client.get_funding_history = AsyncMock(return_value=[])
+
+        await HyperliquidFundingOracle(client).get_funding_history("SOL")
+        await HyperliquidFundingOracle(client).get_funding_history("SOL")
+
+        assert client.get_funding_history.await_count == 1
+        assert HyperliquidFundingOracle(client).history is get_funding_history_cache()
+
+    @pytest.mark.asyncio
+    async def test_fresh_within_current_hour(self):
+        """Test that a coin with this hour's entry is not refetched."""
+        client = _make_client(_entries(NOW_HOUR - 167, 168))
+        cache = FundingHistoryCache()
+
+        await cache.get(client, "SOL", now_ms=NOW_MS)
+        await cache.get(client, "SOL", now_ms=NOW_MS + 30 * 60 * 1000)
+
+        assert client.get_funding_history.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_next_hour_fetches_only_tail(self):
+        """Test that after the hour rolls over only new entries are requested."""
+        entries = _entries(NOW_HOUR - 167, 169)
+        client = _make_client(entries)
+        cache = FundingHistoryCache()
+
+        await cache.get(client, "SOL", now_ms=NOW_MS)
+        history = await cache.get(client, "SOL", now_ms=NOW_MS + HOUR_MS)
+
+        tail_call = client.get_funding_history.await_args_list[-1]
+        assert tail_call.args[1] == entries[167]["time"] + 1
+        assert cache.fetched_entries == 169
+        assert len(history) == 168
+
+    @pytest.mark.asyncio
+    async def test_min_refresh_interval_when_venue_lags(self):
+        """Test that a missing new hour is not re-polled on every call."""
+        client = _make_client(_entries(NOW_HOUR - 168, 168))  # no entry this hour
+        cache = FundingHistoryCache()
+
+        await cache.get(client, "SOL", now_ms=NOW_MS)
+        await cache.get(client, "SOL", now_ms=NOW_MS + 10 * 1000)
+        await cache.get(client, "SOL", now_ms=NOW_MS + 2 * 60 * 1000)
+
+        assert client.get_funding_history.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_longer_window_backfills(self):
+        """Test that asking for more hours than held triggers a full fetch."""
+        client = _make_client(_entries(NOW_HOUR - 335, 336))
+        cache = FundingHistoryCache()
+
+        await cache.get(client, "SOL", hours=24, now_ms=NOW_MS)
+        history = await cache.get(client, "SOL", hours=168, now_ms=NOW_MS)
+
+        assert client.get_funding_history.await_count == 2
+        assert len(history) == 168
+
+
+class TestPersistence:
+    """Tests for Postgres-backed persistence."""
+
+    @pytest.mark.asyncio
+    async def test_restart_loads_rows_and_fetches_tail(self):
+        """Test that persisted history avoids a full-week refetch."""
+        stored = _entries(NOW_HOUR - 167, 167)  # everything but this hour
+        db = MagicMock()
+        db.fetchall = AsyncMock(return_value=[
+            {"time_ms": e["time"], "funding_rate": float(e["fundingRate"])}
+            for e in stored
+        ])
+        db.executemany = AsyncMock()
+        db.execute = AsyncMock()
+        client = _make_client(stored + _entries(NOW_HOUR, 1))
+        cache = FundingHistoryCache(db=db)
+
+        history = await cache.get(client, "SOL", now_ms=NOW_MS)
+
+        assert client.get_funding_history.await_count == 1
+        assert client.get_funding_history.await_args.args[1] == stored[-1]["time"] + 1
+        assert len(history) == 168
+        persisted = db.executemany.await_args.args[1]
+        assert persisted == [("SOL", NOW_HOUR * HOUR_MS + 42, -0.0001)]
+
+    @pytest.mark.asyncio
+    async def test_db_errors_are_best_effort(self):
+        """Test that persistence failures don't fail the read."""
+        db = MagicMock()
+        db.fetchall = AsyncMock(side_effect=RuntimeError("db down"))
+        db.executemany = AsyncMock(side_effect=RuntimeError("db down"))
+        client = _make_client(_entries(NOW_HOUR - 1, 2))
+        cache = FundingHistoryCache(db=db)
+
+        history = await cache.get(client, "SOL", now_ms=NOW_MS)
+
+        assert len(history) == 2
@@ -0,0 +1,156 @@
+"""
+Tests for the Hyperliquid funding-history store.
+
+These tests verify:
+- Backfill and hourly tail-only syncing (via the shared history cache)
+- Window shifting across hour boundaries
+- Vectorized volatility matches the per-coin oracle calculation
+- Coins dropped from the tracked set are released
+"""
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from bot.venues.hyperliquid.funding_oracle import HyperliquidFundingOracle
+from bot.venues.hyperliquid.funding_store import HOUR_MS, FundingHistoryStore
+
+NOW_HOUR = 480_000  # arbitrary epoch hour
+NOW_MS = NOW_HOUR * HOUR_MS + 5 * 60 * 1000  # 5 minutes past the hour
+
+
+def _history(coin_rates, start_hour, offset_ms=42):
+    """Create fundingHistory entries, one per hour starting at start_hour."""
+    return [
+        {"time": (start_hour + i) * HOUR_MS + offset_ms, "fundingRate": str(rate)}
+        for i, rate in enumerate(coin_rates)
+    ]
+
+
+def _make_client(histories):
+    """Create a mock client serving fixed per-coin histories filtered by time."""
+    client = MagicMock()
+
+    async def get_funding_history(coin, start_ms, end_ms):
+        return [
+            e for e in histories.get(coin, [])
+            if start_ms <= e["time"] <= end_ms
+        ]
+
+    client.get_funding_history = AsyncMock(side_effect=get_funding_history)
+    return client
+
+
+class TestSync:
+    """Tests for backfill and incremental sync."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_then_no_requests_within_hour(self):
+        """Test that a second sync in the same hour issues no requests."""
+        start = NOW_HOUR - 167
+        client = _make_client({"SOL": _history([-0.0001] * 168, start)})
+        store = FundingHistoryStore(client)
+
+        first = await store.sync(["SOL"], now_ms=NOW_MS)
+        second = await store.sync(["SOL"], now_ms=NOW_MS + 10 * 60 * 1000)
+
+        assert first == 1
+        assert second == 0
+        assert np.count_nonzero(~np.isnan(store.rates("SOL"))) == 168
+
+    @pytest.mark.asyncio
+    async def test_next_hour_fetches_tail_only(self):
+        """Test that crossing an hour fetches only entries after the cursor."""
+        start = NOW_HOUR - 167
+        rates = [-0.0001] * 168 + [-0.0005]
+        client = _make_client({"SOL": _history(rates, start)})
+        store = FundingHistoryStore(client)
+
+        await store.sync(["SOL"], now_ms=NOW_MS)
+        await store.sync(["SOL"], now_ms=NOW_MS + HOUR_MS)
+
+        # Second fetch asks only for entries after the last stored one
+        last_call = client.get_funding_history.await_args_list[-1]
+        assert client.get_funding_history.await_count == 2
+        assert last_call.args[1] > NOW_HOUR * HOUR_MS
+        row = store.rates("SOL")
+        assert row[-1] == -0.0005
+        assert row[-2] == -0.0001
+        assert np.count_nonzero(~np.isnan(row)) == 168
+
+    @pytest.mark.asyncio
+    async def test_failed_backfill_retried(self):
+        """Test that a coin whose fetch failed is retried on the next sync."""
+        client = MagicMock()
+        client.get_funding_history = AsyncMock(
+            side_effect=[RuntimeError("429"), _history([-0.0001, -0.0002], NOW_HOUR - 1)]
+        )
+        store = FundingHistoryStore(client)
+
+        await store.sync(["SOL"], now_ms=NOW_MS)
+        assert store.volatilities() == {}
+
+        requests = await store.sync(["SOL"], now_ms=NOW_MS)
+        assert requests == 1
+        assert "SOL" in store.volatilities()
+
+    @pytest.mark.asyncio
+    async def test_untracked_coins_dropped(self):
+        """Test that coins no longer requested are removed from the matrix."""
+        start = NOW_HOUR - 1
+        client = _make_client({
+            "SOL": _history([-0.0001, -0.0002], start),
+            "ETH": _history([0.0001, 0.0002], start),
+        })
+        store = FundingHistoryStore(client)
+
+        await store.sync(["SOL", "ETH"], now_ms=NOW_MS)
+        requests = await store.sync(["SOL"], now_ms=NOW_MS)
+
+        assert requests == 0
+        assert store.coins == ["SOL"]
+        assert list(store.volatilities()) == ["SOL"]
+
+
+class TestVolatilities:
+    """Tests for the vectorized coefficient of variation."""
+
+    @pytest.mark.asyncio
+    async def test_matches_oracle_calculation(self):
+        """Test that vectorized CV equals the oracle's per-coin result."""
+        from bot.venues.hyperliquid.funding_cache import FundingHistoryCache
+
+        # The oracle reads relative to the wall clock
+        now_ms = int(time.time() * 1000)
+        rng = np.random.default_rng(7)
+        start = now_ms // HOUR_MS - 167
+        histories = {
+            coin: _history(rng.normal(-0.0001, 0.00005, 168).tolist(), start)
+            for coin in ("SOL", "ETH", "BTC")
+        }
+        store = FundingHistoryStore(_make_client(histories))
+        await store.sync(histories, now_ms=now_ms)
+
+        vols = store.volatilities()
+
+        for coin, entries in histories.items():
+            oracle_client = MagicMock()
+            oracle_client.get_funding_history = AsyncMock(return_value=entries)
+            oracle = HyperliquidFundingOracle(
+                oracle_client, history_cache=FundingHistoryCache(),
+            )
+            expected = await oracle.calculate_funding_volatility(coin)
+            assert vols[coin] == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.asyncio
+    async def test_insufficient_or_zero_history_is_zero(self):
+        """Test that one data point or all-zero rates give 0.0 like the oracle."""
+        client = _make_client({
+            "SOL": _history([-0.0001], NOW_HOUR),
+            "ETH": _history([0.0, 0.0, 0.0], NOW_HOUR - 2),
+        })
+        store = FundingHistoryStore(client)
+        await store.sync(["SOL", "ETH"], now_ms=NOW_MS)
+
+        assert store.volatilities() == {"SOL": 0.0, "ETH": 0.0}
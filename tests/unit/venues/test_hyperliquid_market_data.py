@@ -0,0 +1,188 @@
+"""Tests for the streamed Hyperliquid market data store and feed."""
+import asyncio
+
+import pytest
+
+from bot.venues.hyperliquid import market_data as market_data_module
+from bot.venues.hyperliquid.market_data import (
+    MarketDataFeed,
+    MarketDataStore,
+    active_market_data_feed,
+    book_key,
+    close_market_data_feed,
+    get_market_data_feed,
+    user_key,
+)
+from bot.venues.hyperliquid.websocket import HyperliquidWebSocket
+from tests.unit.venues.hl_ws_server import FakeHyperliquidWsServer
+
+WALLET = "0xAbC0000000000000000000000000000000000001"
+
+BOOK_FRAME = {"channel": "l2Book", "data": {"coin": "SOL", "time": 1739000000000, "levels": [
+    [{"px": "142.30", "sz": "120.5", "n": 4}, {"px": "142.29", "sz": "310.0", "n": 7}],
+    [{"px": "142.33", "sz": "95.2", "n": 3}, {"px": "142.34", "sz": "402.8", "n": 9}],
+]}}
+
+ORDER_FRAME = {"channel": "orderUpdates", "data": [{
+    "order": {"coin": "SOL", "side": "A", "limitPx": "139.0", "sz": "0.0", "oid": 77, "origSz": "10.0"},
+    "status": "filled", "statusTimestamp": 1739000000100,
+}]}
+
+FILLS_FRAME = {"channel": "userFills", "data": {"user": WALLET.lower(), "fills": [
+    {"coin": "SOL", "px": "142.29", "sz": "4.0", "side": "A", "time": 1739000000090, "oid": 77, "tid": 1},
+    {"coin": "SOL", "px": "142.27", "sz": "6.0", "side": "A", "time": 1739000000095, "oid": 77, "tid": 2},
+]}}
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+def _age(store, seconds):
+    """Backdate every stored value by ``seconds``."""
+    if store._mids_at is not None:
+        store._mids_at -= seconds
+    for table in (store._ctxs, store._books):
+        for coin, (value, at) in list(table.items()):
+            table[coin] = (value, at - seconds)
+
+
+class TestStore:
+
+    def test_latest_mid_and_staleness(self):
+        store = MarketDataStore()
+        store.on_message("allMids", {"mids": {"SOL": "142.1", "BTC": "97000"}})
+        store.on_message("allMids", {"mids": {"SOL": "142.3"}})
+
+        assert store.get_mid("SOL") == 142.3
+        assert store.get_mid("BTC") == 97000.0
+        assert store.get_mid("ETH") is None
+
+        _age(store, store.MIDS_MAX_AGE + 1)
+        assert store.get_mid("SOL") is None
+        assert store.get_mids() is None
+
+    def test_funding_rate_from_asset_ctx(self):
+        store = MarketDataStore()
+        store.on_message("activeAssetCtx", {"coin": "SOL", "ctx": {"funding": "-0.0000375"}})
+
+        rate = store.get_funding_rate("SOL")
+
+        assert rate.funding_rate == -0.0000375
+        assert rate.annualized_rate == pytest.approx(-0.0000375 * 24 * 365)
+        assert set(store.get_funding_rates()) == {"SOL"}
+
+        _age(store, store.CTX_MAX_AGE + 1)
+        assert store.get_funding_rate("SOL") is None
+        assert store.get_funding_rates() == {}
+
+    def test_book_orders_and_fills(self):
+        store = MarketDataStore()
+        store.on_message("l2Book", BOOK_FRAME["data"])
+        store.on_message("orderUpdates", ORDER_FRAME["data"])
+        store.on_message("userFills", FILLS_FRAME["data"])
+
+        assert store.get_l2_book("SOL")["levels"][0][0]["px"] == "142.30"
+        assert store.get_order(77)["status"] == "filled"
+        assert len(store.get_fills(WALLET)) == 2
+        assert store.get_fills(WALLET, oid=78) == []
+
+    def test_order_store_bounded(self):
+        store = MarketDataStore()
+        store.MAX_ORDERS = 2
+        for oid in (1, 2, 3):
+            store.on_message("orderUpdates", [{"order": {"oid": oid}, "status": "open"}])
+
+        assert store.get_order(1) is None
+        assert store.get_order(3) is not None
+
+    def test_user_listeners_skip_fill_snapshot(self):
+        store = MarketDataStore()
+        events = []
+        store.add_user_listener(lambda channel, data: events.append(channel))
+
+        store.on_message("userFills", {**FILLS_FRAME["data"], "isSnapshot": True})
+        store.on_message("userFills", FILLS_FRAME["data"])
+        store.on_message("orderUpdates", ORDER_FRAME["data"])
+
+        assert events == ["userFills", "orderUpdates"]
+        # Snapshot fills are still stored
+        assert len(store.get_fills(WALLET)) == 4
+
+    @pytest.mark.asyncio
+    async def test_wait_for_update(self):
+        store = MarketDataStore()
+
+        assert await store.wait_for_update([book_key("SOL")], timeout=0.01) is False
+
+        waiter = asyncio.ensure_future(
+            store.wait_for_update([book_key("SOL"), user_key(WALLET)], timeout=2)
+        )
+        await asyncio.sleep(0)
+        store.on_message("userFills", FILLS_FRAME["data"])
+
+        assert await waiter is True
+        assert store._waiters == {}
+
+
+class TestFeed:
+
+    @pytest.mark.asyncio
+    async def test_store_fed_from_replayed_stream(self):
+        server = FakeHyperliquidWsServer(frames=[
+            *FakeHyperliquidWsServer().frames, BOOK_FRAME, FILLS_FRAME,
+        ])
+        url = await server.start()
+        feed = MarketDataFeed(ws=HyperliquidWebSocket(url=url))
+        try:
+            await feed.start()
+            await feed.track_asset("SOL")
+            await feed.track_book("SOL")
+            await feed.track_user(WALLET.lower())
+            await _wait_for(lambda: feed.store.get_fills(WALLET))
+        finally:
+            await feed.stop()
+            await server.stop()
+
+        assert feed.store.get_mid("SOL") == 142.105
+        assert feed.store.get_funding_rate("SOL").funding_rate == -0.0000375
+        assert feed.store.get_l2_book("SOL")["coin"] == "SOL"
+        assert {"type": "userFills", "user": WALLET.lower()} in server.subscriptions_received()
+
+    @pytest.mark.asyncio
+    async def test_user_streams_refcounted(self):
+        feed = MarketDataFeed(ws=HyperliquidWebSocket(url="ws://unused"))
+
+        await feed.track_user(WALLET)
+        await feed.track_user(WALLET.lower())
+        assert len(feed.ws.subscriptions) == 2
+
+        await feed.release_user(WALLET)
+        assert len(feed.ws.subscriptions) == 2
+        await feed.release_user(WALLET)
+        assert feed.ws.subscriptions == []
+
+        # Unpaired releases are ignored
+        await feed.release_user(WALLET)
+        await feed.track_book("SOL")
+        await feed.release_book("SOL")
+        await feed.release_book("SOL")
+        assert feed.tracked("book:SOL") == 0
+        assert feed.ws.subscriptions == []
+
+    @pytest.mark.asyncio
+    async def test_singleton_active_only_when_started(self):
+        feed = get_market_data_feed()
+        try:
+            assert get_market_data_feed() is feed
+            assert active_market_data_feed() is None
+            feed._started = True
+            assert active_market_data_feed() is feed
+        finally:
+            feed._started = False
+            await close_market_data_feed()
+        assert market_data_module._feed is None
@@ -12,7 +12,7 @@ def mock_privy_client():
         signer = Mock()
         # Return a 65-byte hex signature (r[32] + s[32] + v[1])
         sig = "0x" + "ab" * 32 + "cd" * 32 + "1b"
-        signer.sign_typed_data_v4 = Mock(return_value=sig)
+        signer.sign_typed_data_v4_async = AsyncMock(return_value=sig)
         mock_cls.return_value = signer
         yield signer
 
@@ -77,15 +77,15 @@ class TestHyperliquidSigner:
         assert "v" in signed.signature
 
         # Verify Privy was called with Agent type (phantom agent)
-        mock_privy_client.sign_typed_data_v4.assert_called_once()
-        call_kwargs = mock_privy_client.sign_typed_data_v4.call_args.kwargs
+        mock_privy_client.sign_typed_data_v4_async.assert_called_once()
+        call_kwargs = mock_privy_client.sign_typed_data_v4_async.call_args.kwargs
         assert call_kwargs["primary_type"] == "Agent"
         assert call_kwargs["domain"]["name"] == "Exchange"
 
     @pytest.mark.asyncio
     async def test_sign_order_error(self, mock_privy_client, mock_settings):
         """Test error handling when Privy fails."""
-        mock_privy_client.sign_typed_data_v4.side_effect = Exception("Privy error")
+        mock_privy_client.sign_typed_data_v4_async.side_effect = Exception("Privy error")
 
         signer = HyperliquidSigner()
 
@@ -140,7 +140,7 @@ class TestSignUsdClassTransfer:
         assert signed.action["hyperliquidChain"] == "Mainnet"
 
         # User-signed actions use different domain
-        call_kwargs = mock_privy_client.sign_typed_data_v4.call_args.kwargs
+        call_kwargs = mock_privy_client.sign_typed_data_v4_async.call_args.kwargs
         assert call_kwargs["domain"]["name"] == "HyperliquidSignTransaction"
         assert call_kwargs["domain"]["chainId"] == 42161
 
@@ -491,3 +491,351 @@ class TestTransferSpotToPerp:
     def test_deposit_usdc_no_longer_exists(self):
         """Verify the old deposit_usdc name no longer exists."""
         assert not hasattr(HyperliquidTrader, "deposit_usdc")
+
+
+class TestStreamedPrice:
+    """Prices come from the market data store while it is fresh."""
+
+    @staticmethod
+    def _feed(mids):
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        store.on_message("allMids", {"mids": mids})
+        return MarketDataFeed(ws=MagicMock(), store=store)
+
+    @pytest.mark.asyncio
+    async def test_fresh_stream_skips_rest(self):
+        client = MagicMock(spec=HyperliquidClient)
+        client.get_all_mids = AsyncMock(return_value={"SOL": 99.0})
+        trader = HyperliquidTrader(client=client, market_data=self._feed({"SOL": "100.5"}))
+
+        assert await trader._get_current_price("SOL") == 100.5
+        client.get_all_mids.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_stream_falls_back_to_rest(self):
+        client = MagicMock(spec=HyperliquidClient)
+        client.get_all_mids = AsyncMock(return_value={"SOL": 99.0})
+        feed = self._feed({"SOL": "100.5"})
+        feed.store._mids_at -= feed.store.MIDS_MAX_AGE + 1
+        trader = HyperliquidTrader(client=client, market_data=feed)
+
+        assert await trader._get_current_price("SOL") == 99.0
+        client.get_all_mids.assert_awaited_once()
+
+
+def _filled(oid, total_sz, avg_px):
+    return {"status": "ok", "response": {"data": {"statuses": [
+        {"filled": {"oid": oid, "totalSz": str(total_sz), "avgPx": str(avg_px)}},
+    ]}}}
+
+
+def _fill_trader(market_data=None):
+    client = MagicMock(spec=HyperliquidClient)
+    signer = MagicMock()
+    signer.sign_order = AsyncMock(return_value=_mock_signed_action())
+    trader = HyperliquidTrader(
+        client=client, signer=signer, wallet_address="0x" + "a" * 40,
+        market_data=market_data,
+    )
+    trader._resolve_asset_index = AsyncMock(return_value=5)
+    trader._get_current_price = AsyncMock(return_value=100.0)
+    trader.get_deposited_balance = AsyncMock(return_value=10_000.0)
+    return trader
+
+
+class TestFillDrivenExecution:
+    """Tests for open_short/close_short fill tracking."""
+
+    @pytest.mark.asyncio
+    async def test_open_short_returns_vwap(self):
+        trader = _fill_trader()
+        trader.client.exchange = AsyncMock(side_effect=[
+            _filled(1, 4.0, 99.0), _filled(2, 6.0, 99.5),
+        ])
+
+        result = await trader.open_short("SOL", "10.0", retry_interval=0)
+
+        assert result.success is True
+        assert float(result.filled_sz) == 10.0
+        assert float(result.avg_px) == pytest.approx(99.3)
+        assert result.order_id == "2"
+        # Second attempt only asks for the remainder
+        assert trader.signer.sign_order.await_args_list[1].kwargs["sz"] == "6.0000"
+
+    @pytest.mark.asyncio
+    async def test_close_short_fills_remainder(self):
+        trader = _fill_trader()
+        trader.client.exchange = AsyncMock(side_effect=[
+            _filled(1, 3.0, 101.0),
+            {"status": "err", "response": "busy"},
+            _filled(2, 7.0, 102.0),
+        ])
+
+        result = await trader.close_short("SOL", "10.0", retry_interval=0)
+
+        assert result.success is True
+        assert result.remaining_sz is None
+        assert float(result.avg_px) == pytest.approx(101.7)
+        assert trader.client.exchange.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_partial_fill_after_retries(self):
+        trader = _fill_trader()
+        trader.client.exchange = AsyncMock(side_effect=[
+            _filled(1, 2.0, 100.0),
+            {"status": "err", "response": "x"},
+            {"status": "err", "response": "x"},
+            {"status": "err", "response": "x"},
+        ])
+
+        result = await trader.close_short("SOL", "10.0", max_retries=3, retry_interval=0)
+
+        assert result.success is True
+        assert float(result.remaining_sz) == 8.0
+        assert "partial fill" in result.error
+        # The progressing first fill does not use up a retry
+        assert trader.client.exchange.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_no_wait_after_last_attempt(self):
+        trader = _fill_trader()
+        trader.MAX_CHILD_ORDERS = 2
+        trader._wait_for_market = AsyncMock()
+        trader.client.exchange = AsyncMock(side_effect=[
+            _filled(i, 1.0, 100.0) for i in range(3)
+        ])
+
+        result = await trader.close_short("SOL", "10.0", max_retries=1, retry_interval=0)
+
+        assert float(result.filled_sz) == 3.0
+        assert trader.client.exchange.await_count == 3
+        assert trader._wait_for_market.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lost_response_counted_from_streamed_fills(self):
+        """A fill whose response was lost is not bought twice."""
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        feed = MarketDataFeed(ws=MagicMock(), store=store)
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+
+        async def lost(payload):
+            store.on_message("userFills", {"user": trader.wallet_address, "fills": [
+                {"coin": "SOL", "px": "100.5", "sz": "10.0", "side": "B",
+                 "time": 10 ** 13, "oid": 9, "tid": 1},
+            ]})
+            raise TimeoutError("exchange timed out")
+
+        trader.client.exchange = AsyncMock(side_effect=lost)
+
+        result = await trader.close_short("SOL", "10.0", retry_interval=0)
+
+        assert result.success is True
+        assert float(result.avg_px) == 100.5
+        assert trader.client.exchange.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_unsent_order_does_not_claim_streamed_fills(self):
+        """A failure before the order was sent counts no foreign fills."""
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        feed = MarketDataFeed(ws=MagicMock(), store=store)
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+        trader.MIN_REPRICE_INTERVAL = 0
+        # Fill from another order on the same wallet
+        store.on_message("userFills", {"user": trader.wallet_address, "fills": [
+            {"coin": "SOL", "px": "100.5", "sz": "4.0", "side": "B",
+             "time": 10 ** 13, "oid": 77, "tid": 1},
+        ]})
+        trader.signer.sign_order = AsyncMock(
+            side_effect=[RuntimeError("signer unavailable"), _mock_signed_action()],
+        )
+        trader.client.exchange = AsyncMock(return_value=_filled(1, 10.0, 100.0))
+
+        result = await trader.close_short("SOL", "10.0", retry_interval=0)
+
+        assert float(result.filled_sz) == 10.0
+        assert trader.signer.sign_order.await_args_list[1].kwargs["sz"] == "10.0000"
+
+    @pytest.mark.asyncio
+    async def test_streams_released_after_fill(self):
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        feed = MarketDataFeed(ws=MagicMock(), store=MarketDataStore())
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+        trader.client.exchange = AsyncMock(side_effect=Exception("exchange down"))
+
+        await trader.open_short("SOL", "10.0", max_retries=1, retry_interval=0)
+
+        unsubscribed = [c.args[0]["type"] for c in feed.ws.unsubscribe.await_args_list]
+        assert sorted(unsubscribed) == ["l2Book", "orderUpdates", "userFills"]
+        assert feed.tracked("book:SOL") == 0
+        assert feed.tracked("user:" + trader.wallet_address) == 0
+
+    @pytest.mark.asyncio
+    async def test_limit_priced_from_live_book(self):
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        store.on_message("l2Book", {"coin": "SOL", "levels": [
+            [{"px": "99.9", "sz": "50.0", "n": 3}],
+            [{"px": "100.1", "sz": "50.0", "n": 3}],
+        ]})
+        feed = MarketDataFeed(ws=MagicMock(), store=store)
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+        trader.client.exchange = AsyncMock(return_value=_filled(1, 10.0, 99.9))
+
+        result = await trader.open_short("SOL", "10.0")
+
+        assert float(result.avg_px) == 99.9
+        # Best bid less the buffer, not mid - 2%
+        assert trader.signer.sign_order.await_args.kwargs["limit_px"] == "99.8"
+
+    @pytest.mark.asyncio
+    async def test_retry_wakes_on_book_update(self):
+        import asyncio
+
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        feed = MarketDataFeed(ws=MagicMock(), store=store)
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+        trader.MIN_REPRICE_INTERVAL = 0
+        trader.client.exchange = AsyncMock(side_effect=[
+            {"status": "err", "response": "x"}, _filled(1, 10.0, 99.0),
+        ])
+
+        async def book_update():
+            await asyncio.sleep(0.01)
+            store.on_message("l2Book", {"coin": "SOL", "levels": [[], []]})
+
+        asyncio.get_running_loop().create_task(book_update())
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await trader.close_short("SOL", "10.0", retry_interval=5.0)
+
+        assert result.success is True
+        assert loop.time() - started < 1.0
+
+
+class TestOrderSlicing:
+    """Tests for depth-bounded child orders."""
+
+    @staticmethod
+    def _feed_with_book(bids, asks):
+        from bot.venues.hyperliquid.market_data import MarketDataFeed, MarketDataStore
+
+        store = MarketDataStore()
+        store.on_message("l2Book", {"coin": "SOL", "levels": [
+            [{"px": str(px), "sz": str(sz), "n": 1} for px, sz in bids],
+            [{"px": str(px), "sz": str(sz), "n": 1} for px, sz in asks],
+        ]})
+        feed = MarketDataFeed(ws=MagicMock(), store=store)
+        feed.ws.subscribe = AsyncMock()
+        feed.ws.unsubscribe = AsyncMock()
+        return feed
+
+    @pytest.mark.asyncio
+    async def test_sell_children_bounded_by_bid_depth(self):
+        feed = self._feed_with_book(
+            bids=[(99.9, 30.0), (98.0, 200.0)], asks=[(100.1, 30.0)],
+        )
+        trader = _fill_trader(market_data=feed)
+        trader.MIN_REPRICE_INTERVAL = 0
+        trader.client.exchange = AsyncMock(side_effect=[
+            _filled(1, 30.0, 99.9), _filled(2, 30.0, 99.9), _filled(3, 20.0, 99.9),
+        ])
+
+        result = await trader.open_short("SOL", "80.0", retry_interval=0)
+
+        sizes = [c.kwargs["sz"] for c in trader.signer.sign_order.await_args_list]
+        assert sizes == ["30.0000", "30.0000", "20.0000"]
+        assert float(result.filled_sz) == 80.0
+
+    @pytest.mark.asyncio
+    async def test_plan_order_from_rest_book(self):
+        trader = _fill_trader()
+        trader.client.get_l2_book = AsyncMock(return_value={"coin": "SOL", "levels": [
+            [{"px": "99.9", "sz": "10.0", "n": 1}, {"px": "99.0", "sz": "1000.0", "n": 1}],
+            [{"px": "100.1", "sz": "10.0", "n": 1}],
+        ]})
+
+        plan = await trader.plan_order("SOL", is_buy=False, notional_usd=5000.0)
+
+        assert len(plan.slices) == 5
+        assert plan.child_size == pytest.approx(10.0)
+        assert plan.single_impact > plan.expected_impact
+
+
+class TestPrepareOrder:
+    """Pre-staging before the hedge leg."""
+
+    @pytest.mark.asyncio
+    async def test_tracks_book_and_sets_leverage(self):
+        feed = MagicMock()
+        feed.track_book = AsyncMock()
+        feed.track_user = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+        trader.update_leverage = AsyncMock(return_value=True)
+
+        assert await trader.prepare_order("SOL", leverage=3) is True
+        trader._resolve_asset_index.assert_awaited_once_with("SOL")
+        feed.track_book.assert_awaited_once_with("SOL")
+        feed.track_user.assert_awaited_once_with("0x" + "a" * 40)
+        trader.update_leverage.assert_awaited_once_with(coin="SOL", leverage=3, is_cross=True)
+
+    @pytest.mark.asyncio
+    async def test_release_order_drops_prestaged_streams(self):
+        feed = MagicMock()
+        feed.track_book = AsyncMock()
+        feed.track_user = AsyncMock()
+        feed.release_book = AsyncMock()
+        feed.release_user = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+
+        await trader.prepare_order("SOL")
+        await trader.release_order("SOL")
+        await trader.release_order("SOL")
+
+        feed.release_book.assert_awaited_once_with("SOL")
+        feed.release_user.assert_awaited_once_with("0x" + "a" * 40)
+
+    @pytest.mark.asyncio
+    async def test_cancel_mid_prestage_releases_only_taken_refs(self):
+        """A cancel inside track_book leaves the user stream untaken."""
+        import asyncio
+
+        feed = MagicMock()
+        feed.track_book = AsyncMock(side_effect=asyncio.CancelledError)
+        feed.track_user = AsyncMock()
+        feed.release_book = AsyncMock()
+        feed.release_user = AsyncMock()
+        trader = _fill_trader(market_data=feed)
+
+        await trader.prepare_order("SOL")
+        await trader.release_order("SOL")
+
+        feed.track_user.assert_not_called()
+        feed.release_book.assert_awaited_once_with("SOL")
+        feed.release_user.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_leverage_reported(self):
+        trader = _fill_trader()
+        trader.update_leverage = AsyncMock(side_effect=Exception("rejected"))
+
+        assert await trader.prepare_order("SOL", leverage=3) is False
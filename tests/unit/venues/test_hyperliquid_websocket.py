@@ -0,0 +1,159 @@
+"""Tests for the Hyperliquid websocket client against a local replay server."""
+import asyncio
+
+import pytest
+
+from bot.venues.hyperliquid.websocket import HyperliquidWebSocket
+from tests.unit.venues.hl_ws_server import FakeHyperliquidWsServer
+
+
+async def _wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+@pytest.fixture
+async def server():
+    server = FakeHyperliquidWsServer()
+    url = await server.start()
+    server.url = url
+    yield server
+    await server.stop()
+
+
+class TestSubscriptions:
+
+    @pytest.mark.asyncio
+    async def test_replayed_frames_dispatched_by_channel(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        received = []
+        ws.add_listener(lambda channel, data: received.append((channel, data)))
+        await ws.subscribe({"type": "allMids"})
+        await ws.subscribe({"type": "activeAssetCtx", "coin": "SOL"})
+        await ws.start()
+        try:
+            await _wait_for(lambda: len(received) == 5)
+        finally:
+            await ws.stop()
+
+        channels = [c for c, _ in received]
+        assert channels == [
+            "allMids", "activeAssetCtx", "allMids", "activeAssetCtx", "allMids",
+        ]
+        assert received[-1][1]["mids"]["SOL"] == "142.105"
+        # subscriptionResponse acks are not dispatched
+        assert ws.messages == 5
+
+    @pytest.mark.asyncio
+    async def test_only_subscribed_channels_received(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        received = []
+        ws.add_listener(lambda channel, data: received.append(channel))
+        await ws.subscribe({"type": "allMids"})
+        await ws.start()
+        try:
+            await _wait_for(lambda: len(received) == 3)
+            await asyncio.sleep(0.05)
+        finally:
+            await ws.stop()
+
+        assert set(received) == {"allMids"}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_while_connected_is_sent_once(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        await ws.start()
+        try:
+            assert await ws.wait_connected(timeout=2)
+            await ws.subscribe({"type": "allMids"})
+            await ws.subscribe({"type": "allMids"})
+            await _wait_for(lambda: len(server.subscriptions_received()) == 1)
+            await asyncio.sleep(0.02)
+        finally:
+            await ws.stop()
+
+        assert server.subscriptions_received() == [{"type": "allMids"}]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_during_replay_is_sent(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        await ws.subscribe({"type": "allMids"})
+        send = ws._send
+
+        async def send_then_subscribe(payload):
+            await send(payload)
+            if payload["subscription"] == {"type": "allMids"}:
+                # Lands while the connection is replaying (not yet connected)
+                await ws.subscribe({"type": "activeAssetCtx", "coin": "SOL"})
+
+        ws._send = send_then_subscribe
+        await ws.start()
+        try:
+            await _wait_for(lambda: len(server.subscriptions_received()) == 2)
+        finally:
+            await ws.stop()
+
+        assert server.subscriptions_received() == [
+            {"type": "allMids"}, {"type": "activeAssetCtx", "coin": "SOL"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_listener_error_does_not_stop_dispatch(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        received = []
+
+        def broken(channel, data):
+            raise RuntimeError("boom")
+
+        ws.add_listener(broken)
+        ws.add_listener(lambda channel, data: received.append(channel))
+        await ws.subscribe({"type": "allMids"})
+        await ws.start()
+        try:
+            await _wait_for(lambda: len(received) == 3)
+        finally:
+            await ws.stop()
+
+
+class TestConnection:
+
+    @pytest.mark.asyncio
+    async def test_reconnect_replays_subscriptions(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        ws.RECONNECT_MIN = 0.01
+        await ws.subscribe({"type": "allMids"})
+        await ws.start()
+        try:
+            assert await ws.wait_connected(timeout=2)
+            await server.drop_connections()
+            await _wait_for(lambda: server.connections == 2 and ws.connected)
+            await _wait_for(lambda: len(server.subscriptions_received()) == 2)
+        finally:
+            await ws.stop()
+
+        assert ws.reconnects >= 1
+        assert server.subscriptions_received() == [{"type": "allMids"}] * 2
+
+    @pytest.mark.asyncio
+    async def test_ping_sent_when_client_idle(self, server):
+        ws = HyperliquidWebSocket(url=server.url)
+        ws.PING_INTERVAL = 0.02
+        await ws.start()
+        try:
+            await _wait_for(
+                lambda: any(m.get("method") == "ping" for m in server.received)
+            )
+        finally:
+            await ws.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_before_connect(self):
+        ws = HyperliquidWebSocket(url="http://127.0.0.1:9/ws")
+        ws.RECONNECT_MIN = 0.01
+        await ws.start()
+        await asyncio.sleep(0.02)
+        await ws.stop()
+        assert not ws.connected
@@ -12,8 +12,9 @@ Covers:
 - _is_policy_denial / _is_retriable helpers
 - PolicyDeniedError / SigningError dataclass fields
 """
+import asyncio
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -22,6 +23,7 @@ from bot.venues.privy_signer import (
     PrivyWalletSigner,
     SigningCircuitBreaker,
     SigningError,
+    SigningMetrics,
     _is_policy_denial,
     _is_retriable,
 )
@@ -457,6 +459,186 @@ class TestCircuitBreakerIntegration:
         assert _circuit_breaker._consecutive_failures == 0
 
 
+# ---------------------------------------------------------------------------
+# Async (thread-pool) signing path
+# ---------------------------------------------------------------------------
+
+class TestAsyncSigning:
+
+    @pytest.fixture(autouse=True)
+    def _closed_circuit(self):
+        from bot.venues.privy_signer import _circuit_breaker
+        _circuit_breaker.record_success()
+        yield
+        _circuit_breaker.record_success()
+
+    @pytest.mark.asyncio
+    async def test_sign_typed_data_async_matches_sync_request(self):
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_response = MagicMock()
+        mock_response.data.signature = "0xsig"
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.return_value = mock_response
+        signer._client = mock_client
+
+        result = await signer.sign_typed_data_v4_async(
+            domain={"name": "Exchange"},
+            types={"Agent": [{"name": "source", "type": "string"}]},
+            value={"source": "a"},
+            primary_type="Agent",
+        )
+
+        assert result == "0xsig"
+        args, kwargs = mock_client.wallets.rpc.call_args
+        assert args == ("wid",)
+        assert kwargs["method"] == "eth_signTypedData_v4"
+        assert kwargs["params"]["typed_data"]["primary_type"] == "Agent"
+
+    @pytest.mark.asyncio
+    async def test_sign_solana_async_passes_chain_type(self):
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_response = MagicMock()
+        mock_response.data.signed_transaction = "c2lnbmVk"
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.return_value = mock_response
+        signer._client = mock_client
+
+        result = await signer.sign_solana_transaction_async("dW5zaWduZWQ=")
+
+        assert result == "c2lnbmVk"
+        assert mock_client.wallets.rpc.call_args.kwargs["chain_type"] == "solana"
+
+    @pytest.mark.asyncio
+    async def test_rpc_runs_off_the_event_loop(self):
+        """A slow RPC must not stall other coroutines."""
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_response = MagicMock()
+        mock_response.data.signed_transaction = "0xok"
+
+        def slow_rpc(*args, **kwargs):
+            time.sleep(0.2)
+            return mock_response
+
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.side_effect = slow_rpc
+        signer._client = mock_client
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        try:
+            result = await signer.sign_eth_transaction_async({"to": "0x1", "value": 0})
+        finally:
+            task.cancel()
+
+        assert result == "0xok"
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    @patch("bot.venues.privy_signer.asyncio.sleep", new_callable=AsyncMock)
+    async def test_transient_error_retries_with_async_backoff(self, mock_sleep):
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_response = MagicMock()
+        mock_response.data.signed_transaction = "0xok"
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.side_effect = [
+            Exception("503 Service Temporarily Unavailable"),
+            mock_response,
+        ]
+        signer._client = mock_client
+
+        with patch("bot.venues.privy_signer.time.sleep") as blocking_sleep:
+            result = await signer.sign_eth_transaction_async({"to": "0x1", "value": 0})
+
+        assert result == "0xok"
+        assert mock_client.wallets.rpc.call_count == 2
+        mock_sleep.assert_awaited_once_with(1.0)
+        blocking_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_policy_denied_async(self):
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.side_effect = Exception("Request denied by policy")
+        signer._client = mock_client
+
+        with pytest.raises(PolicyDeniedError):
+            await signer.sign_eth_transaction_async({"to": "0x1", "value": 0})
+        assert mock_client.wallets.rpc.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_async(self):
+        from bot.venues.privy_signer import _circuit_breaker
+        for _ in range(_circuit_breaker.threshold):
+            _circuit_breaker.record_failure()
+
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_client = MagicMock()
+        signer._client = mock_client
+
+        with pytest.raises(SigningError, match="circuit breaker is open"):
+            await signer.sign_eth_transaction_async({"to": "0x1", "value": 0})
+        mock_client.wallets.rpc.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_is_recorded_in_metrics(self):
+        from bot.venues.privy_signer import get_signing_metrics
+        metrics = get_signing_metrics()
+        before = metrics.get_latency_summary()["count"]
+
+        signer = PrivyWalletSigner(wallet_id="wid", wallet_address="0xAddr")
+        mock_response = MagicMock()
+        mock_response.data.signed_transaction = "0xok"
+        mock_client = MagicMock()
+        mock_client.wallets.rpc.return_value = mock_response
+        signer._client = mock_client
+
+        await asyncio.gather(*(
+            signer.sign_eth_transaction_async({"to": "0x1", "value": 0})
+            for _ in range(3)
+        ))
+
+        summary = metrics.get_latency_summary()
+        assert summary["count"] == before + 3
+        assert metrics.pending == 0
+
+
+class TestSigningMetricsExecutor:
+
+    def test_queue_depth_and_in_flight(self):
+        metrics = SigningMetrics(max_workers=2)
+        metrics.pending = 5
+        assert metrics.in_flight == 2
+        assert metrics.queue_depth == 3
+
+        metrics.pending = 1
+        assert metrics.in_flight == 1
+        assert metrics.queue_depth == 0
+
+    def test_latency_percentiles(self):
+        metrics = SigningMetrics()
+        for ms in range(1, 101):
+            metrics.record_dispatch(queue_ms=float(ms), rpc_ms=float(ms) * 2)
+
+        summary = metrics.get_latency_summary()
+        assert summary["count"] == 100
+        assert summary["queue_p50_ms"] == 50.0
+        assert summary["queue_p95_ms"] == 95.0
+        assert summary["queue_max_ms"] == 100.0
+        assert summary["rpc_p95_ms"] == 190.0
+
+    def test_empty_summary(self):
+        summary = SigningMetrics().get_latency_summary()
+        assert summary["count"] == 0
+        assert summary["rpc_p50_ms"] == 0.0
+
+
 # ---------------------------------------------------------------------------
 # UserTradingContext wallet_id flow tests
 # ---------------------------------------------------------------------------
@@ -497,6 +679,7 @@ class TestUserTradingContextWalletIdFlow:
             mock_mgr_cls.return_value = MagicMock()
             ctx.get_asgard_manager()
             mock_mgr_cls.assert_called_once_with(
+                client=ANY,
                 solana_wallet_address="SoLAddr",
                 user_id="did:privy:abc",
                 solana_wallet_id="sol_wid",